@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import SentimentAnalysis, PriceData, RegionalPriceStats
+from .models import SentimentAnalysis, PriceData, RegionalPriceStats, ClinicAspectSummary
 
 
 @admin.register(SentimentAnalysis)
@@ -76,4 +76,12 @@ class RegionalPriceStatsAdmin(admin.ModelAdmin):
         ('메타데이터', {
             'fields': ('sample_count', 'last_updated')
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(ClinicAspectSummary)
+class ClinicAspectSummaryAdmin(admin.ModelAdmin):
+    list_display = ('clinic', 'analysis_count', 'confidence_sum', 'updated_at')
+    search_fields = ('clinic__name',)
+    ordering = ('-analysis_count',)
+    readonly_fields = ('updated_at',)
@@ -0,0 +1,19 @@
+"""
+Django 관리 명령어로 치과별 감성 분석 요약 테이블 재계산
+"""
+from django.core.management.base import BaseCommand
+import time
+
+from apps.analysis.models import ClinicAspectSummary
+
+
+class Command(BaseCommand):
+    help = '전체 감성 분석 결과로 치과별 측면 요약 테이블을 다시 계산합니다 (증분 갱신 보정용)'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        count = ClinicAspectSummary.rebuild()
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(f'감성 분석 요약 재계산 완료: {count}개 치과 ({elapsed:.2f}초)')
+        )
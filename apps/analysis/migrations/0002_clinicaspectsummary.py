@@ -0,0 +1,205 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:19
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_summaries(apps, schema_editor):
+    from django.db.models import Count, F, Sum
+
+    SentimentAnalysis = apps.get_model("analysis", "SentimentAnalysis")
+    ClinicAspectSummary = apps.get_model("analysis", "ClinicAspectSummary")
+
+    aspects = {
+        "price": "price_score",
+        "skill": "skill_score",
+        "kindness": "kindness_score",
+        "waiting_time": "waiting_time_score",
+        "facility": "facility_score",
+        "overtreatment": "overtreatment_score",
+    }
+    annotations = {
+        "analysis_count": Count("id"),
+        "confidence_sum": Sum("confidence_score"),
+    }
+    for aspect, field in aspects.items():
+        annotations[f"{aspect}_sum"] = Sum(field)
+        annotations[f"{aspect}_weighted_sum"] = Sum(F(field) * F("confidence_score"))
+
+    rows = (
+        SentimentAnalysis.objects.values("review__clinic_id")
+        .annotate(**annotations)
+        .order_by()
+    )
+    ClinicAspectSummary.objects.bulk_create(
+        [
+            ClinicAspectSummary(clinic_id=row.pop("review__clinic_id"), **row)
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0007_clinic_search_vector_fields"),
+        ("analysis", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClinicAspectSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "analysis_count",
+                    models.IntegerField(default=0, verbose_name="분석 수"),
+                ),
+                (
+                    "confidence_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="신뢰도 합계",
+                    ),
+                ),
+                (
+                    "price_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="가격 점수 합계",
+                    ),
+                ),
+                (
+                    "skill_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="실력 점수 합계",
+                    ),
+                ),
+                (
+                    "kindness_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="친절도 점수 합계",
+                    ),
+                ),
+                (
+                    "waiting_time_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="대기시간 점수 합계",
+                    ),
+                ),
+                (
+                    "facility_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="시설 점수 합계",
+                    ),
+                ),
+                (
+                    "overtreatment_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="과잉진료 점수 합계",
+                    ),
+                ),
+                (
+                    "price_weighted_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="가격 가중 합계",
+                    ),
+                ),
+                (
+                    "skill_weighted_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="실력 가중 합계",
+                    ),
+                ),
+                (
+                    "kindness_weighted_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="친절도 가중 합계",
+                    ),
+                ),
+                (
+                    "waiting_time_weighted_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="대기시간 가중 합계",
+                    ),
+                ),
+                (
+                    "facility_weighted_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="시설 가중 합계",
+                    ),
+                ),
+                (
+                    "overtreatment_weighted_sum",
+                    models.DecimalField(
+                        decimal_places=4,
+                        default=0,
+                        max_digits=14,
+                        verbose_name="과잉진료 가중 합계",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "clinic",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="aspect_summary",
+                        to="clinics.clinic",
+                        verbose_name="치과",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "치과 감성 분석 요약",
+                "verbose_name_plural": "치과 감성 분석 요약들",
+                "db_table": "analysis_clinic_aspect_summary",
+            },
+        ),
+        migrations.RunPython(populate_summaries, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,24 @@
-from django.db import models
+from decimal import Decimal
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
 from apps.reviews.models import Review
 from apps.clinics.models import Clinic
+from apps.clinics.conditional import invalidate_clinic_versions, mark_clinics_changed
+from apps.clinics.ingest import current_batch
+
+# 감성 분석 측면 (요약 필드 접두어 -> SentimentAnalysis 필드)
+ASPECTS = {
+    'price': 'price_score',
+    'skill': 'skill_score',
+    'kindness': 'kindness_score',
+    'waiting_time': 'waiting_time_score',
+    'facility': 'facility_score',
+    'overtreatment': 'overtreatment_score',
+}
 
 
 class SentimentAnalysis(models.Model):
@@ -118,4 +136,216 @@ class RegionalPriceStats(models.Model):
         ]
     
     def __str__(self):
-        return f"{self.district} - {self.treatment_type}: 평균 {self.avg_price:,.0f}원"
\ No newline at end of file
+        return f"{self.district} - {self.treatment_type}: 평균 {self.avg_price:,.0f}원"
+
+
+class ClinicAspectSummary(models.Model):
+    """
+    치과별 감성 분석 요약 모델 (측면별 누적 합계)
+    
+    SentimentAnalysis 저장/삭제 시 증분으로 갱신되므로 평균은 행 하나로 계산된다.
+    """
+    clinic = models.OneToOneField(
+        Clinic, on_delete=models.CASCADE, related_name='aspect_summary', verbose_name='치과'
+    )
+    
+    analysis_count = models.IntegerField(default=0, verbose_name='분석 수')
+    confidence_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='신뢰도 합계')
+    
+    # 측면별 점수 합계
+    price_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='가격 점수 합계')
+    skill_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='실력 점수 합계')
+    kindness_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='친절도 점수 합계')
+    waiting_time_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='대기시간 점수 합계')
+    facility_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='시설 점수 합계')
+    overtreatment_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='과잉진료 점수 합계')
+    
+    # 측면별 신뢰도 가중 합계 (점수 x 신뢰도)
+    price_weighted_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='가격 가중 합계')
+    skill_weighted_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='실력 가중 합계')
+    kindness_weighted_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='친절도 가중 합계')
+    waiting_time_weighted_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='대기시간 가중 합계')
+    facility_weighted_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='시설 가중 합계')
+    overtreatment_weighted_sum = models.DecimalField(max_digits=14, decimal_places=4, default=0, verbose_name='과잉진료 가중 합계')
+    
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    
+    class Meta:
+        db_table = 'analysis_clinic_aspect_summary'
+        verbose_name = '치과 감성 분석 요약'
+        verbose_name_plural = '치과 감성 분석 요약들'
+    
+    def __str__(self):
+        return f"{self.clinic_id} - 감성 분석 요약 ({self.analysis_count}건)"
+    
+    def averages(self):
+        """측면별 평균 점수 (-1 ~ 1, 분석이 없으면 None)"""
+        if self.analysis_count <= 0:
+            return dict.fromkeys(ASPECTS)
+        return {
+            aspect: float(getattr(self, f'{aspect}_sum')) / self.analysis_count
+            for aspect in ASPECTS
+        }
+    
+    def weighted_averages(self):
+        """측면별 신뢰도 가중 평균 점수 (-1 ~ 1, 분석이 없으면 None)"""
+        if self.confidence_sum <= 0:
+            return dict.fromkeys(ASPECTS)
+        return {
+            aspect: float(getattr(self, f'{aspect}_weighted_sum') / self.confidence_sum)
+            for aspect in ASPECTS
+        }
+    
+    @property
+    def average_confidence(self):
+        if self.analysis_count <= 0:
+            return None
+        return float(self.confidence_sum) / self.analysis_count
+    
+    @staticmethod
+    def contribution(analysis, sign=1):
+        """감성 분석 한 건이 요약 필드에 더하는 값"""
+        confidence = Decimal(analysis.confidence_score or 0)
+        values = {
+            'analysis_count': sign,
+            'confidence_sum': sign * confidence,
+        }
+        for aspect, field in ASPECTS.items():
+            score = Decimal(getattr(analysis, field) or 0)
+            values[f'{aspect}_sum'] = sign * score
+            values[f'{aspect}_weighted_sum'] = sign * score * confidence
+        return values
+    
+    @classmethod
+    def apply_delta(cls, clinic_id, delta, create=True):
+        """
+        요약 행에 변화량을 원자적으로 더함 (행이 없으면 생성)
+        
+        Args:
+            clinic_id: 치과 id
+            delta: 필드별 변화량
+            create: 행이 없을 때 생성 여부
+        """
+        delta = {field: value for field, value in delta.items() if value}
+        if not delta:
+            return
+        updates = {field: F(field) + value for field, value in delta.items()}
+        invalidate_clinic_versions([clinic_id])
+        if cls.objects.filter(clinic_id=clinic_id).update(**updates) or not create:
+            return
+        try:
+            with transaction.atomic():
+                cls.objects.create(clinic_id=clinic_id, **delta)
+        except IntegrityError:
+            # 동시에 행이 생성된 경우 다시 증분 적용
+            cls.objects.filter(clinic_id=clinic_id).update(**updates)
+    
+    @classmethod
+    def rebuild(cls, clinic_ids=None):
+        """
+        감성 분석으로 요약 테이블 재계산
+        
+        Args:
+            clinic_ids: 재계산할 치과 id 목록 (None이면 전체)
+            
+        Returns:
+            생성된 요약 행 수
+        """
+        annotations = {
+            'analysis_count': Count('id'),
+            'confidence_sum': Sum('confidence_score'),
+        }
+        for aspect, field in ASPECTS.items():
+            annotations[f'{aspect}_sum'] = Sum(field)
+            annotations[f'{aspect}_weighted_sum'] = Sum(F(field) * F('confidence_score'))
+        
+        analyses = SentimentAnalysis.objects.all()
+        summaries = cls.objects.all()
+        if clinic_ids is not None:
+            analyses = analyses.filter(review__clinic_id__in=clinic_ids)
+            summaries = summaries.filter(clinic_id__in=clinic_ids)
+        
+        rows = analyses.values('review__clinic_id').annotate(**annotations).order_by()
+        rebuilt = [
+            cls(clinic_id=row.pop('review__clinic_id'), **row)
+            for row in rows
+        ]
+        
+        changed = set(summaries.values_list('clinic_id', flat=True))
+        changed.update(summary.clinic_id for summary in rebuilt)
+        
+        with transaction.atomic():
+            summaries.delete()
+            cls.objects.bulk_create(rebuilt, batch_size=1000)
+        invalidate_clinic_versions(changed)
+        return len(rebuilt)
+
+
+def _analysis_clinic_id(analysis):
+    """감성 분석의 치과 id (리뷰가 로드되어 있으면 추가 쿼리 없음)"""
+    if SentimentAnalysis.review.is_cached(analysis):
+        return analysis.review.clinic_id
+    return Review.objects.filter(pk=analysis.review_id).values_list('clinic_id', flat=True).first()
+
+
+@receiver(pre_save, sender=SentimentAnalysis)
+def remember_previous_analysis(sender, instance, raw=False, **kwargs):
+    """수정 전 감성 분석 값 보관 (요약 증분 계산용)"""
+    instance._previous_contribution = None
+    if raw or instance.pk is None:
+        return
+    previous = SentimentAnalysis.objects.filter(pk=instance.pk).select_related('review').first()
+    if previous is not None:
+        instance._previous_contribution = (
+            previous.review.clinic_id,
+            ClinicAspectSummary.contribution(previous, sign=-1),
+        )
+
+
+@receiver(post_save, sender=SentimentAnalysis)
+def add_analysis_to_summary(sender, instance, raw=False, **kwargs):
+    """감성 분석 생성/수정 시 치과 요약 증분 갱신"""
+    if raw:
+        return
+    clinic_id = _analysis_clinic_id(instance)
+    if clinic_id is None:
+        return
+    previous = getattr(instance, '_previous_contribution', None)
+    
+    batch = current_batch()
+    if batch is not None:
+        # 대량 적재 중에는 대상 치과만 기록하고 종료 시 치과별로 재계산
+        batch.summary_clinic_ids.add(clinic_id)
+        if previous is not None:
+            batch.summary_clinic_ids.add(previous[0])
+        return
+    
+    delta = ClinicAspectSummary.contribution(instance)
+    if previous is not None:
+        previous_clinic_id, removed = previous
+        if previous_clinic_id == clinic_id:
+            delta = {field: delta[field] + removed[field] for field in delta}
+        else:
+            ClinicAspectSummary.apply_delta(previous_clinic_id, removed, create=False)
+    ClinicAspectSummary.apply_delta(clinic_id, delta)
+
+
+@receiver(post_delete, sender=SentimentAnalysis)
+def remove_analysis_from_summary(sender, instance, **kwargs):
+    """감성 분석 삭제 시 치과 요약 증분 갱신"""
+    clinic_id = _analysis_clinic_id(instance)
+    if clinic_id is None:
+        return
+    batch = current_batch()
+    if batch is not None:
+        batch.summary_clinic_ids.add(clinic_id)
+        return
+    ClinicAspectSummary.apply_delta(
+        clinic_id, ClinicAspectSummary.contribution(instance, sign=-1), create=False
+    )
+
+
+@receiver([post_save, post_delete], sender=PriceData)
+def invalidate_clinic_response_version(sender, instance, **kwargs):
+    """가격 데이터 변경 시 치과 조건부 GET 버전 토큰 삭제"""
+    mark_clinics_changed([instance.clinic_id])
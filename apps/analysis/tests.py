@@ -0,0 +1,99 @@
+from django.test import TestCase
+from decimal import Decimal
+from apps.clinics.models import Clinic
+from apps.reviews.models import Review
+from .models import ClinicAspectSummary, SentimentAnalysis
+
+
+class ClinicAspectSummaryTest(TestCase):
+    """치과별 감성 분석 요약 증분 갱신 테스트"""
+    
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name='요약 치과', address='서울 강남구', district='강남구')
+        self.other = Clinic.objects.create(name='다른 치과', address='서울 서초구', district='서초구')
+        self.count = 0
+    
+    def create_analysis(self, clinic, score, confidence='0.8'):
+        self.count += 1
+        review = Review.objects.create(
+            clinic=clinic, source='naver', original_text='좋아요',
+            reviewer_hash=f'hash{self.count}', external_id=f'summary{self.count}'
+        )
+        return SentimentAnalysis.objects.create(
+            review=review, price_score=Decimal(score), skill_score=Decimal(score),
+            kindness_score=Decimal(score), waiting_time_score=Decimal(score),
+            facility_score=Decimal(score), overtreatment_score=Decimal('-0.5'),
+            model_version='test', confidence_score=Decimal(confidence)
+        )
+    
+    def summary(self, clinic):
+        return ClinicAspectSummary.objects.get(clinic=clinic)
+    
+    def assert_matches_rebuild(self):
+        """증분 결과가 전체 재계산 결과와 같은지 확인"""
+        incremental = {
+            summary.clinic_id: (summary.analysis_count, summary.averages(), summary.weighted_averages())
+            for summary in ClinicAspectSummary.objects.filter(analysis_count__gt=0)
+        }
+        ClinicAspectSummary.rebuild()
+        rebuilt = {
+            summary.clinic_id: (summary.analysis_count, summary.averages(), summary.weighted_averages())
+            for summary in ClinicAspectSummary.objects.all()
+        }
+        self.assertEqual(incremental.keys(), rebuilt.keys())
+        for clinic_id, (count, averages, weighted) in rebuilt.items():
+            self.assertEqual(incremental[clinic_id][0], count)
+            for aspect, value in averages.items():
+                self.assertAlmostEqual(incremental[clinic_id][1][aspect], value, places=4)
+                self.assertAlmostEqual(incremental[clinic_id][2][aspect], weighted[aspect], places=4)
+    
+    def test_create_updates_summary(self):
+        """감성 분석 생성 시 요약 행 생성/누적"""
+        self.create_analysis(self.clinic, '0.5')
+        self.create_analysis(self.clinic, '-0.1')
+        
+        summary = self.summary(self.clinic)
+        self.assertEqual(summary.analysis_count, 2)
+        self.assertAlmostEqual(summary.averages()['skill'], 0.2)
+        self.assertAlmostEqual(summary.average_confidence, 0.8)
+        self.assert_matches_rebuild()
+    
+    def test_update_replaces_contribution(self):
+        """감성 분석 수정 시 이전 값을 빼고 새 값을 더함"""
+        analysis = self.create_analysis(self.clinic, '0.5')
+        self.create_analysis(self.clinic, '0.1')
+        
+        analysis.skill_score = Decimal('-0.3')
+        analysis.confidence_score = Decimal('0.4')
+        analysis.save()
+        
+        summary = self.summary(self.clinic)
+        self.assertEqual(summary.analysis_count, 2)
+        self.assertAlmostEqual(summary.averages()['skill'], -0.1)
+        self.assertAlmostEqual(summary.averages()['price'], 0.3)
+        self.assert_matches_rebuild()
+    
+    def test_delete_removes_contribution(self):
+        """감성 분석/리뷰 삭제 시 요약에서 제외"""
+        analysis = self.create_analysis(self.clinic, '0.5')
+        other = self.create_analysis(self.clinic, '0.1')
+        self.create_analysis(self.other, '0.7')
+        
+        analysis.delete()
+        self.assertEqual(self.summary(self.clinic).analysis_count, 1)
+        self.assertAlmostEqual(self.summary(self.clinic).averages()['skill'], 0.1)
+        
+        other.review.delete()
+        summary = self.summary(self.clinic)
+        self.assertEqual(summary.analysis_count, 0)
+        self.assertIsNone(summary.averages()['skill'])
+        self.assert_matches_rebuild()
+    
+    def test_rebuild_restores_drift(self):
+        """요약 테이블이 어긋나도 재계산으로 복구"""
+        self.create_analysis(self.clinic, '0.5')
+        ClinicAspectSummary.objects.filter(clinic=self.clinic).update(analysis_count=10)
+        
+        self.assertEqual(ClinicAspectSummary.rebuild(), 1)
+        self.assertEqual(self.summary(self.clinic).analysis_count, 1)
+        self.assertAlmostEqual(self.summary(self.clinic).averages()['skill'], 0.5)
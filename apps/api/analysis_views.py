@@ -8,12 +8,14 @@ from django.db.models import Avg, Count, Q
 from collections import Counter
 import re
 
+from apps.clinics.conditional import conditional_clinic_view
 from apps.clinics.models import Clinic
 from apps.reviews.models import Review
-from apps.analysis.models import SentimentAnalysis
+from apps.analysis.models import ClinicAspectSummary, SentimentAnalysis
 
 
 @api_view(['GET'])
+@conditional_clinic_view('clinic_id')
 def clinic_analysis(request, clinic_id):
     """
     특정 치과의 리뷰 분석 결과 API
@@ -45,26 +47,17 @@ def clinic_analysis(request, clinic_id):
         positive_reviews = reviews.filter(original_rating__gte=4).count()
         positive_ratio = round((positive_reviews / total_reviews) * 100, 1)
         
-        # 감성 분석 데이터
-        sentiment_analyses = SentimentAnalysis.objects.filter(
-            review__clinic=clinic
-        )
+        # 감성 분석 요약 (치과당 한 행)
+        summary = ClinicAspectSummary.objects.filter(
+            clinic=clinic, analysis_count__gt=0
+        ).first()
         
-        if sentiment_analyses.exists():
+        if summary:
             # 측면별 평균 점수
-            aspect_scores = sentiment_analyses.aggregate(
-                price=Avg('price_score'),
-                skill=Avg('skill_score'),
-                kindness=Avg('kindness_score'),
-                waiting_time=Avg('waiting_time_score'),
-                facility=Avg('facility_score'),
-                overtreatment=Avg('overtreatment_score')
-            )
+            aspect_scores = summary.averages()
             
             # 신뢰도 평균
-            avg_confidence = sentiment_analyses.aggregate(
-                confidence=Avg('confidence_score')
-            )['confidence']
+            avg_confidence = summary.average_confidence
             
             confidence = round(float(avg_confidence) * 100, 1) if avg_confidence else 0
         else:
@@ -7,6 +7,38 @@ from rest_framework import status
 from django.db.models import Avg, Min, Max, Count
 from apps.analysis.models import PriceData, RegionalPriceStats
 from apps.clinics.models import Clinic
+from apps.clinics.streaming import stream_format, stream_rows, streaming_response
+
+
+def price_comparison_row(price_item):
+    """가격 비교 응답 행 (values() 딕셔너리)"""
+    average_rating = price_item['clinic__average_rating']
+    return {
+        'clinic_id': price_item['clinic_id'],
+        'clinic_name': price_item['clinic__name'],
+        'price': price_item['price'],
+        'address': price_item['clinic__address'],
+        'phone': price_item['clinic__phone'],
+        'has_parking': price_item['clinic__has_parking'],
+        'night_service': price_item['clinic__night_service'],
+        'weekend_service': price_item['clinic__weekend_service'],
+        'average_rating': float(average_rating) if average_rating else None,
+        'total_reviews': price_item['clinic__total_reviews']
+    }
+
+
+def regional_price_stats_row(stat):
+    """지역별 가격 통계 응답 행"""
+    return {
+        'district': stat.district,
+        'treatment_type': stat.treatment_type,
+        'min_price': stat.min_price,
+        'max_price': stat.max_price,
+        'avg_price': float(stat.avg_price),
+        'median_price': stat.median_price,
+        'sample_count': stat.sample_count,
+        'last_updated': stat.last_updated.isoformat()
+    }
 
 
 @api_view(['GET'])
@@ -29,14 +61,7 @@ def price_comparison(request):
             treatment_type=treatment_type,
             is_verified=True,
             is_outlier=False
-        ).select_related('clinic').order_by('price')
-        
-        if not price_data.exists():
-            return Response({
-                'prices': [],
-                'stats': None,
-                'message': '해당 조건의 가격 데이터가 없습니다.'
-            })
+        ).order_by('price', 'id')
         
         # 가격 통계 계산
         stats = price_data.aggregate(
@@ -46,31 +71,39 @@ def price_comparison(request):
             sample_count=Count('id')
         )
         
-        # 치과별 가격 정보
-        prices = []
-        for price_item in price_data:
-            clinic = price_item.clinic
-            prices.append({
-                'clinic_id': clinic.id,
-                'clinic_name': clinic.name,
-                'price': price_item.price,
-                'address': clinic.address,
-                'phone': clinic.phone,
-                'has_parking': clinic.has_parking,
-                'night_service': clinic.night_service,
-                'weekend_service': clinic.weekend_service,
-                'average_rating': float(clinic.average_rating) if clinic.average_rating else None,
-                'total_reviews': clinic.total_reviews
+        if not stats['sample_count']:
+            return Response({
+                'prices': [],
+                'stats': None,
+                'message': '해당 조건의 가격 데이터가 없습니다.'
             })
         
+        stats = {
+            'min_price': stats['min_price'],
+            'max_price': stats['max_price'],
+            'avg_price': float(stats['avg_price']),
+            'sample_count': stats['sample_count']
+        }
+        
+        # 치과별 가격 정보 (필요한 컬럼만 조회)
+        rows = price_data.values(
+            'price', 'clinic_id', 'clinic__name', 'clinic__address', 'clinic__phone',
+            'clinic__has_parking', 'clinic__night_service', 'clinic__weekend_service',
+            'clinic__average_rating', 'clinic__total_reviews'
+        )
+        
+        fmt = stream_format(request)
+        if fmt:
+            return streaming_response(
+                fmt,
+                stream_rows(rows, lambda chunk: [price_comparison_row(item) for item in chunk]),
+                'prices',
+                {'stats': stats}
+            )
+        
         return Response({
-            'prices': prices,
-            'stats': {
-                'min_price': stats['min_price'],
-                'max_price': stats['max_price'],
-                'avg_price': float(stats['avg_price']),
-                'sample_count': stats['sample_count']
-            }
+            'prices': [price_comparison_row(item) for item in rows],
+            'stats': stats
         })
         
     except Exception as e:
@@ -96,18 +129,17 @@ def regional_price_stats(request):
         if treatment_type:
             queryset = queryset.filter(treatment_type=treatment_type)
         
-        stats = []
-        for stat in queryset:
-            stats.append({
-                'district': stat.district,
-                'treatment_type': stat.treatment_type,
-                'min_price': stat.min_price,
-                'max_price': stat.max_price,
-                'avg_price': float(stat.avg_price),
-                'median_price': stat.median_price,
-                'sample_count': stat.sample_count,
-                'last_updated': stat.last_updated.isoformat()
-            })
+        queryset = queryset.order_by('district', 'treatment_type')
+        
+        fmt = stream_format(request)
+        if fmt:
+            return streaming_response(
+                fmt,
+                stream_rows(queryset, lambda chunk: [regional_price_stats_row(stat) for stat in chunk]),
+                'stats'
+            )
+        
+        stats = [regional_price_stats_row(stat) for stat in queryset]
         
         return Response({
             'stats': stats,
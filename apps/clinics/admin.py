@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Clinic
+from .models import Clinic, District, GeocodeCache
 
 
 @admin.register(Clinic)
@@ -30,4 +30,21 @@ class ClinicAdmin(admin.ModelAdmin):
             'fields': ('created_at', 'updated_at', 'search_vector'),
             'classes': ('collapse',)
         }),
-    )
\ No newline at end of file
+    )
+
+
+@admin.register(GeocodeCache)
+class GeocodeCacheAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'query_key', 'found', 'latitude', 'longitude', 'hit_count', 'expires_at')
+    list_filter = ('kind', 'found')
+    search_fields = ('query_key', 'address')
+    ordering = ('-hit_count',)
+    readonly_fields = ('created_at', 'updated_at')
+
+
+@admin.register(District)
+class DistrictAdmin(admin.ModelAdmin):
+    list_display = ('name', 'clinic_count', 'latitude', 'longitude', 'refreshed_at')
+    search_fields = ('name',)
+    ordering = ('name',)
+    readonly_fields = ('refreshed_at',)
@@ -0,0 +1,290 @@
+"""
+치과명/지역구 자동완성 인덱스 모듈
+
+치과명과 지역구를 두 가지 키로 정렬해 프로세스 메모리에 보관한다.
+
+- 자모 키: 음절을 키보드 입력 단위 자모로 분해한 문자열 ("서울" → "ㅅㅓㅇㅜㄹ").
+  입력 중인 음절("성" → "ㅅㅓㅇ")도 접두어로 일치한다.
+- 초성 키: 음절마다 초성만 남긴 문자열 ("서울대학교치과병원" → "ㅅㅇㄷㅎㄱㅊㄱㅂㅇ").
+
+조회는 정렬된 키 배열에서 이진 탐색으로 접두어 구간을 찾는다. 일치하는 키가
+MAX_CANDIDATES개를 넘는 짧은 접두어("ㅅ", "서")는 인덱스를 만들 때 순위 상위
+MAX_CANDIDATES개를 미리 골라 두므로, 결과 수와 무관하게 최대 MAX_CANDIDATES개만 훑는다.
+
+인덱스는 치과 데이터 버전이 바뀐 뒤 처음 조회될 때 다시 만들어진다. 리뷰 수(순위)만
+바뀐 경우에는 RANKING_REFRESH_INTERVAL초에 한 번까지만 다시 만든다. 버전 확인은
+프로세스마다 VERSION_CHECK_INTERVAL초에 한 번이라 입력할 때마다 캐시/DB를 읽지 않는다.
+"""
+import bisect
+import heapq
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from django.db.models import Count
+
+from .versioning import get_clinic_ranking_version, get_clinic_version
+
+logger = logging.getLogger(__name__)
+
+# 기본/최대 결과 수
+DEFAULT_LIMIT = 10
+MAX_LIMIT = 20
+
+# 순위를 매기기 전에 훑는 최대 후보 수
+MAX_CANDIDATES = 200
+
+# 버전 확인 간격 / 리뷰 수만 바뀌었을 때 재생성 최소 간격 (초)
+VERSION_CHECK_INTERVAL = 1.0
+RANKING_REFRESH_INTERVAL = 60.0
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = (
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ',
+    'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+)
+
+# 겹자음/겹모음을 키보드 입력 순서의 자모로 분해
+COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ',
+    'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+
+CONSONANTS = set(CHOSEONG) | {jong for jong in JONGSEONG if jong}
+
+
+def normalize(text: str) -> str:
+    """소문자 변환 + 공백 제거"""
+    return ''.join((text or '').lower().split())
+
+
+def to_jamo(text: str) -> str:
+    """음절을 키보드 입력 단위 자모로 분해 ("닭" → "ㄷㅏㄹㄱ")"""
+    result = []
+    for char in normalize(text):
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            index = code - HANGUL_BASE
+            result.append(CHOSEONG[index // 588])
+            jung = JUNGSEONG[(index % 588) // 28]
+            result.append(COMPOUND_JAMO.get(jung, jung))
+            jong = JONGSEONG[index % 28]
+            result.append(COMPOUND_JAMO.get(jong, jong))
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return ''.join(result)
+
+
+def to_choseong(text: str) -> str:
+    """음절마다 초성만 남김 ("서울대" → "ㅅㅇㄷ")"""
+    result = []
+    for char in normalize(text):
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSEONG[(code - HANGUL_BASE) // 588])
+        else:
+            result.append(char)
+    return ''.join(result)
+
+
+def is_choseong_query(query: str) -> bool:
+    """자음만으로 이루어진 검색어 여부 ("ㅅㅇㄷ")"""
+    query = normalize(query)
+    return bool(query) and any(char in CONSONANTS for char in query) and not any(
+        HANGUL_BASE <= ord(char) <= HANGUL_LAST or char in JUNGSEONG for char in query
+    )
+
+
+class PrefixKeys:
+    """정렬된 (키, 항목 번호, 단어 일치 여부) 배열과 긴 접두어 구간의 상위 후보"""
+
+    def __init__(self, rows: List[Tuple[str, int, bool]], rank: Callable[[int, bool], tuple]):
+        """
+        Args:
+            rows: (키, 항목 번호, 단어 일치 여부) 목록
+            rank: (항목 번호, 단어 일치 여부) -> 정렬 키 (작을수록 앞)
+        """
+        rows.sort()
+        self.keys = [row[0] for row in rows]
+        self.entries = [row[1] for row in rows]
+        self.is_token = [row[2] for row in rows]
+        self.ranks = [rank(row[1], row[2]) for row in rows]
+        # 키가 MAX_CANDIDATES개를 넘는 접두어 -> 순위 상위 MAX_CANDIDATES개 행 번호
+        self.top: Dict[str, List[int]] = {}
+        self._collect_top(0, len(self.keys), 0)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _collect_top(self, lo: int, hi: int, depth: int):
+        """[lo, hi) 구간(앞 depth글자 공통)에서 후보가 많은 접두어의 상위 행 기록"""
+        if hi - lo <= MAX_CANDIDATES:
+            return
+        if depth:
+            self.top[self.keys[lo][:depth]] = heapq.nsmallest(
+                MAX_CANDIDATES, range(lo, hi), key=self.ranks.__getitem__
+            )
+        # 접두어와 같은 키는 구간 맨 앞에 있으므로 건너뛰고 다음 글자별로 나눔
+        i = lo
+        while i < hi and len(self.keys[i]) == depth:
+            i += 1
+        while i < hi:
+            prefix = self.keys[i][:depth + 1]
+            end = bisect.bisect_left(self.keys, prefix[:-1] + chr(ord(prefix[-1]) + 1), i, hi)
+            self._collect_top(i, end, depth + 1)
+            i = end
+
+    def scan(self, prefix: str, matches: Dict[int, bool], limit: int):
+        """
+        접두어가 일치하는 항목을 matches에 추가 (항목 번호 -> 전체 이름 일치 여부)
+
+        후보가 많은 접두어는 미리 골라 둔 상위 행만 훑는다. limit개 항목이 모이면 중단한다.
+        """
+        rows = self.top.get(prefix)
+        if rows is None:
+            start = bisect.bisect_left(self.keys, prefix)
+            rows = range(start, min(start + limit, len(self.keys)))
+        for i in rows:
+            if not self.keys[i].startswith(prefix):
+                break
+            entry = self.entries[i]
+            matches[entry] = matches.get(entry, False) or not self.is_token[i]
+            if len(matches) >= limit:
+                break
+
+
+class AutocompleteIndex:
+    """치과명/지역구 자동완성 인덱스"""
+
+    def __init__(self, entries: List[Dict]):
+        """
+        Args:
+            entries: {'type', 'id', 'name', 'district', 'weight'} 목록
+        """
+        self.entries = entries
+        jamo_rows = []
+        choseong_rows = []
+        for number, entry in enumerate(entries):
+            tokens = entry['name'].split()
+            for key_func, rows in ((to_jamo, jamo_rows), (to_choseong, choseong_rows)):
+                full_key = key_func(entry['name'])
+                if not full_key:
+                    continue
+                rows.append((full_key, number, False))
+                # 두 번째 단어부터도 접두어로 검색 ("서울대학교 치과병원" → "치과")
+                for token in tokens[1:]:
+                    rows.append((key_func(token), number, True))
+        self.jamo = PrefixKeys(jamo_rows, self._rank)
+        self.choseong = PrefixKeys(choseong_rows, self._rank)
+
+    @classmethod
+    def build(cls) -> 'AutocompleteIndex':
+        """DB의 치과명/지역구로 인덱스 생성"""
+        from .models import Clinic
+
+        entries = []
+        rows = Clinic.objects.values_list('id', 'name', 'district', 'total_reviews')
+        for clinic_id, name, district, total_reviews in rows.iterator(chunk_size=5000):
+            if name:
+                entries.append({
+                    'type': 'clinic',
+                    'id': clinic_id,
+                    'name': name,
+                    'district': district,
+                    'weight': total_reviews or 0,
+                })
+
+        districts = Clinic.objects.exclude(district='').values('district').annotate(
+            clinic_count=Count('id')
+        ).order_by()
+        for row in districts:
+            entries.append({
+                'type': 'district',
+                'id': None,
+                'name': row['district'],
+                'district': row['district'],
+                'weight': row['clinic_count'],
+            })
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _rank(self, number: int, is_token: bool) -> tuple:
+        """전체 이름 일치 > 단어 일치, 지역구 > 치과, 가중치 큰 순, 이름순"""
+        entry = self.entries[number]
+        return (is_token, entry['type'] != 'district', -entry['weight'], entry['name'], number)
+
+    def suggest(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Dict]:
+        """
+        검색어로 시작하는 치과명/지역구
+
+        전체 이름 일치 > 단어 일치, 지역구 > 치과, 리뷰 수(지역구는 치과 수) 많은 순으로 정렬한다.
+
+        Args:
+            query: 입력 중인 검색어 (초성만 입력해도 됨)
+            limit: 최대 결과 수
+
+        Returns:
+            {'type', 'id', 'name', 'district'} 목록
+        """
+        limit = max(1, min(limit, MAX_LIMIT))
+        matches: Dict[int, bool] = {}
+
+        jamo_query = to_jamo(query)
+        if not jamo_query:
+            return []
+        self.jamo.scan(jamo_query, matches, MAX_CANDIDATES)
+        if is_choseong_query(query) and len(matches) < MAX_CANDIDATES:
+            self.choseong.scan(normalize(query), matches, MAX_CANDIDATES)
+
+        ranked = sorted(matches.items(), key=lambda item: self._rank(item[0], not item[1]))
+        return [
+            {key: self.entries[number][key] for key in ('type', 'id', 'name', 'district')}
+            for number, _ in ranked[:limit]
+        ]
+
+
+_lock = threading.Lock()
+_index: Optional[AutocompleteIndex] = None
+_index_version = None
+_index_ranking_version = None
+_built_at = 0.0
+_checked_at = 0.0
+
+
+def get_autocomplete_index() -> AutocompleteIndex:
+    """현재 버전의 자동완성 인덱스 반환 (버전이 바뀌었으면 다시 생성)"""
+    global _index, _index_version, _index_ranking_version, _built_at, _checked_at
+
+    now = time.monotonic()
+    if _index is not None and now - _checked_at < VERSION_CHECK_INTERVAL:
+        return _index
+
+    version = get_clinic_version()
+    ranking_version = get_clinic_ranking_version()
+
+    def is_stale():
+        if _index is None or _index_version != version:
+            return True
+        return _index_ranking_version != ranking_version and now - _built_at >= RANKING_REFRESH_INTERVAL
+
+    if not is_stale():
+        _checked_at = now
+        return _index
+
+    with _lock:
+        if is_stale():
+            _index = AutocompleteIndex.build()
+            _index_version = version
+            _index_ranking_version = ranking_version
+            _built_at = now
+            logger.info(f"자동완성 인덱스 생성: {len(_index)}개 (버전 {version}, 순위 버전 {ranking_version})")
+        _checked_at = now
+        return _index
@@ -0,0 +1,261 @@
+"""
+지도 마커 클러스터링용 타일 피라미드 모듈
+
+치과 좌표를 웹 메르카토르 타일 좌표로 변환해 최고 레벨 셀에 모은 뒤, 한 레벨씩
+4개 셀을 합쳐 올라가는 쿼드트리 피라미드를 만든다. 각 레벨은 셀 키 순으로 정렬된
+배열(셀 좌표, 치과 수, 좌표 합, id 합)이라 뷰포트 조회는 이진 탐색 + 범위 마스크로 끝난다.
+
+피라미드는 공간 스냅샷에서 만들어진다. 스냅샷이 다시 생성되면 이전 스냅샷과 비교해 좌표가
+바뀐(추가/이동/삭제) 치과만 각 레벨의 해당 셀에 더하고 빼며, 바뀐 치과가 많을 때만
+처음부터 다시 만든다. 셀마다 합계만 보관하므로 치과가 하나 남은 셀의 id도 id 합으로 알 수 있다.
+"""
+import logging
+import math
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .spatial_index import ClinicSpatialSnapshot, get_spatial_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 피라미드 최고 레벨 (레벨 22 셀 ≈ 10m)
+MAX_LEVEL = 22
+
+# 지도 줌 레벨 한 타일을 2^CELL_SUBDIVISION x 2^CELL_SUBDIVISION 셀로 나누어 클러스터링
+CELL_SUBDIVISION = 2
+MAX_ZOOM = MAX_LEVEL - CELL_SUBDIVISION
+
+# 한 번에 반환할 최대 셀 수 (넘으면 한 단계 낮은 레벨로 조회)
+MAX_CELLS = 2048
+
+# 웹 메르카토르 위도 한계
+MERCATOR_MAX_LAT = 85.05112878
+
+# 좌표가 바뀐 치과가 전체의 이 비율을 넘으면 증분 갱신 대신 다시 생성
+MAX_DELTA_RATIO = 0.1
+
+
+def to_world_xy(lat, lng) -> Tuple[np.ndarray, np.ndarray]:
+    """위도/경도를 [0, 1) 범위의 웹 메르카토르 좌표로 변환"""
+    lat = np.radians(np.clip(np.asarray(lat, dtype=np.float64), -MERCATOR_MAX_LAT, MERCATOR_MAX_LAT))
+    x = (np.asarray(lng, dtype=np.float64) + 180.0) / 360.0
+    y = (1.0 - np.log(np.tan(lat) + 1.0 / np.cos(lat)) / math.pi) / 2.0
+    return np.clip(x, 0.0, 1.0 - 1e-12), np.clip(y, 0.0, 1.0 - 1e-12)
+
+
+def cell_keys(coords: np.ndarray) -> np.ndarray:
+    """(N, 2) 위도/경도 배열의 최고 레벨 셀 키 ((x << MAX_LEVEL) | y)"""
+    x, y = to_world_xy(coords[:, 0], coords[:, 1])
+    scale = 1 << MAX_LEVEL
+    return ((x * scale).astype(np.int64) << MAX_LEVEL) | (y * scale).astype(np.int64)
+
+
+def tile_range(south: float, west: float, north: float, east: float, level: int) -> Tuple[int, int, int, int]:
+    """경계 상자를 덮는 타일 좌표 범위 (x0, y0, x1, y1, 양 끝 포함)"""
+    (x0, x1), (y0, y1) = to_world_xy([north, south], [west, east])
+    scale = 1 << level
+    return int(x0 * scale), int(y0 * scale), int(x1 * scale), int(y1 * scale)
+
+
+class ClusterLevel:
+    """피라미드 한 레벨의 셀 배열 (셀 키 순 정렬)"""
+
+    def __init__(self, level: int, keys: np.ndarray, counts: np.ndarray,
+                 lat_sums: np.ndarray, lng_sums: np.ndarray, id_sums: np.ndarray):
+        self.level = level
+        self.keys = keys
+        self.counts = counts
+        self.lat_sums = lat_sums
+        self.lng_sums = lng_sums
+        self.id_sums = id_sums
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def aggregate(cls, level: int, keys: np.ndarray, counts: np.ndarray, lat_sums: np.ndarray,
+                  lng_sums: np.ndarray, id_sums: np.ndarray) -> 'ClusterLevel':
+        """같은 셀 키의 값을 합산한 레벨"""
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        size = len(unique_keys)
+        return cls(
+            level,
+            unique_keys,
+            np.bincount(inverse, weights=counts, minlength=size).astype(np.int64),
+            np.bincount(inverse, weights=lat_sums, minlength=size),
+            np.bincount(inverse, weights=lng_sums, minlength=size),
+            np.bincount(inverse, weights=id_sums, minlength=size).astype(np.int64),
+        )
+
+    def parent(self) -> 'ClusterLevel':
+        """한 단계 낮은 레벨 (인접 4개 셀 병합)"""
+        level = self.level - 1
+        xs = (self.keys >> self.level) >> 1
+        ys = (self.keys & ((1 << self.level) - 1)) >> 1
+        return ClusterLevel.aggregate(
+            level, (xs << level) | ys, self.counts, self.lat_sums, self.lng_sums, self.id_sums
+        )
+
+    def apply_delta(self, delta: 'ClusterLevel') -> 'ClusterLevel':
+        """
+        셀별 변화량을 반영한 새 레벨 (기존 배열은 조회 중인 요청을 위해 그대로 둠)
+
+        Args:
+            delta: 같은 레벨의 셀별 변화량 (aggregate 결과)
+        """
+        positions = np.searchsorted(self.keys, delta.keys)
+        found = positions < len(self.keys)
+        found[found] = self.keys[positions[found]] == delta.keys[found]
+
+        new = ~found
+        has_new = bool(new.any())
+
+        arrays = []
+        for values, changes in ((self.counts, delta.counts), (self.lat_sums, delta.lat_sums),
+                                (self.lng_sums, delta.lng_sums), (self.id_sums, delta.id_sums)):
+            values = values.copy()
+            values[positions[found]] += changes[found]
+            if has_new:
+                values = np.insert(values, positions[new], changes[new])
+            arrays.append(values)
+        keys = np.insert(self.keys, positions[new], delta.keys[new]) if has_new else self.keys
+
+        # 치과가 모두 빠진 셀 제거
+        keep = arrays[0] > 0
+        if keep.all():
+            return ClusterLevel(self.level, keys, *arrays)
+        return ClusterLevel(self.level, keys[keep], *(values[keep] for values in arrays))
+
+    def query(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """타일 범위 안의 셀 인덱스"""
+        start = np.searchsorted(self.keys, x0 << self.level, side='left')
+        stop = np.searchsorted(self.keys, (x1 + 1) << self.level, side='left')
+        ys = self.keys[start:stop] & ((1 << self.level) - 1)
+        return start + np.nonzero((ys >= y0) & (ys <= y1))[0]
+
+
+class ClusterPyramid:
+    """치과 좌표 타일 피라미드"""
+
+    def __init__(self, levels: List[ClusterLevel]):
+        self.levels = levels
+
+    @classmethod
+    def from_snapshot(cls, snapshot: ClinicSpatialSnapshot) -> 'ClusterPyramid':
+        """공간 스냅샷의 좌표 배열로 피라미드 생성"""
+        coords = snapshot.coords
+        top = ClusterLevel.aggregate(
+            MAX_LEVEL, cell_keys(coords), np.ones(len(coords)),
+            coords[:, 0], coords[:, 1], snapshot.ids
+        )
+
+        levels = [top]
+        for _ in range(MAX_LEVEL):
+            levels.append(levels[-1].parent())
+        levels.reverse()
+        return cls(levels)
+
+    def apply_changes(self, removed_ids: np.ndarray, removed_coords: np.ndarray,
+                      added_ids: np.ndarray, added_coords: np.ndarray) -> 'ClusterPyramid':
+        """
+        빠진/추가된 치과만 각 레벨의 해당 셀에 반영한 새 피라미드
+
+        좌표가 바뀐 치과는 이전 좌표로 빠지고 새 좌표로 추가된다.
+        """
+        coords = np.concatenate((removed_coords, added_coords)).reshape(-1, 2)
+        signs = np.concatenate((-np.ones(len(removed_ids)), np.ones(len(added_ids))))
+        ids = np.concatenate((removed_ids, added_ids)).astype(np.float64)
+        top_keys = cell_keys(coords)
+        xs = top_keys >> MAX_LEVEL
+        ys = top_keys & ((1 << MAX_LEVEL) - 1)
+
+        levels = []
+        for cells in self.levels:
+            shift = MAX_LEVEL - cells.level
+            keys = ((xs >> shift) << cells.level) | (ys >> shift)
+            delta = ClusterLevel.aggregate(
+                cells.level, keys, signs, signs * coords[:, 0], signs * coords[:, 1], signs * ids
+            )
+            levels.append(cells.apply_delta(delta))
+        return ClusterPyramid(levels)
+
+    def clusters(self, south: float, west: float, north: float, east: float,
+                 zoom: int) -> Tuple[int, List[Dict]]:
+        """
+        뷰포트 안의 클러스터 목록
+
+        Args:
+            south, west, north, east: 뷰포트 경계 상자
+            zoom: 지도 줌 레벨
+
+        Returns:
+            (클러스터링에 사용한 셀 레벨, 클러스터 목록)
+        """
+        level = max(0, min(zoom + CELL_SUBDIVISION, MAX_LEVEL))
+        x0, y0, x1, y1 = tile_range(south, west, north, east, level)
+        while level > 0 and (x1 - x0 + 1) * (y1 - y0 + 1) > MAX_CELLS:
+            level -= 1
+            x0, y0, x1, y1 = x0 >> 1, y0 >> 1, x1 >> 1, y1 >> 1
+
+        cells = self.levels[level]
+        indices = cells.query(x0, y0, x1, y1)
+        mask = (1 << level) - 1
+
+        clusters = []
+        for i in indices.tolist():
+            count = int(cells.counts[i])
+            key = int(cells.keys[i])
+            clusters.append({
+                'latitude': round(float(cells.lat_sums[i]) / count, 6),
+                'longitude': round(float(cells.lng_sums[i]) / count, 6),
+                'count': count,
+                'tile': [level, key >> level, key & mask],
+                'clinic_id': int(cells.id_sums[i]) if count == 1 else None,
+            })
+        return level, clusters
+
+
+def snapshot_changes(old: ClinicSpatialSnapshot, new: ClinicSpatialSnapshot):
+    """
+    두 스냅샷 사이에 빠지거나 추가된 치과
+
+    Returns:
+        (빠진 id, 빠진 좌표, 추가된 id, 추가된 좌표) - 좌표가 바뀐 치과는 양쪽에 포함
+    """
+    _, old_index, new_index = np.intersect1d(old.ids, new.ids, assume_unique=True, return_indices=True)
+    same = np.all(old.coords[old_index] == new.coords[new_index], axis=1)
+
+    removed = np.ones(len(old.ids), dtype=bool)
+    removed[old_index[same]] = False
+    added = np.ones(len(new.ids), dtype=bool)
+    added[new_index[same]] = False
+    return old.ids[removed], old.coords[removed], new.ids[added], new.coords[added]
+
+
+_lock = threading.Lock()
+_pyramid: Optional[ClusterPyramid] = None
+_pyramid_snapshot: Optional[ClinicSpatialSnapshot] = None
+
+
+def get_cluster_pyramid() -> ClusterPyramid:
+    """현재 공간 스냅샷의 피라미드 반환 (스냅샷이 바뀌었으면 바뀐 치과만 반영)"""
+    global _pyramid, _pyramid_snapshot
+
+    snapshot = get_spatial_snapshot()
+    if _pyramid is not None and _pyramid_snapshot is snapshot:
+        return _pyramid
+
+    with _lock:
+        if _pyramid is None or _pyramid_snapshot is not snapshot:
+            changes = snapshot_changes(_pyramid_snapshot, snapshot) if _pyramid is not None else None
+            changed = len(changes[0]) + len(changes[2]) if changes else 0
+            if changes is None or changed > MAX_DELTA_RATIO * len(snapshot):
+                _pyramid = ClusterPyramid.from_snapshot(snapshot)
+                logger.info(f"치과 클러스터 피라미드 생성: {len(snapshot)}개")
+            elif changed:
+                _pyramid = _pyramid.apply_changes(*changes)
+                logger.info(f"치과 클러스터 피라미드 갱신: 변경 {changed}건")
+            _pyramid_snapshot = snapshot
+        return _pyramid
@@ -0,0 +1,123 @@
+"""
+치과별 조건부 GET (ETag/Last-Modified)
+
+치과 상세/분석 응답은 치과 행, 리뷰, 가격 데이터, 감성 분석 요약으로 만들어진다.
+이들이 바뀌면 invalidate_clinic_versions()가 같은 트랜잭션에서 치과 행의
+data_updated_at을 갱신하므로, 버전 토큰은 치과 행 하나(기본 키 조회 1회)로 계산된다.
+요청의 If-None-Match/If-Modified-Since가 일치하면 시리얼라이저를 거치지 않고 304를
+반환한다.
+
+캐시가 있으면 토큰을 캐시에 보관해 재방문 요청은 캐시 조회 한 번으로 끝나고, 값을
+보관하지 않는 백엔드(프로덕션의 DummyCache)에서도 쿼리 한 번으로 끝난다. 캐시 삭제는
+변경 트랜잭션이 커밋된 뒤 실행한다. 커밋 전에 지우면 그 사이 다른 요청이 옛 데이터로
+토큰을 다시 계산해 저장하고, 그 토큰이 만료될 때까지 남는다.
+"""
+import hashlib
+import logging
+from functools import wraps
+from typing import Iterable, Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .ingest import current_batch
+
+logger = logging.getLogger(__name__)
+
+CLINIC_VERSION_KEY = 'clinics:response_version:{}'
+CLINIC_VERSION_TIMEOUT = 60 * 60 * 24
+
+# data_updated_at을 한 번에 갱신할 치과 수
+STAMP_BATCH_SIZE = 1000
+
+
+def compute_response_version(clinic_id: int) -> Optional[Tuple[str, int]]:
+    """
+    DB로 치과 버전 토큰 계산 (치과 행 하나만 읽음)
+
+    Returns:
+        (ETag, Last-Modified 타임스탬프) 또는 None (치과가 없는 경우)
+    """
+    from .models import Clinic
+
+    clinic = Clinic.objects.filter(pk=clinic_id).values_list(
+        'updated_at', 'data_updated_at', 'total_reviews', 'average_rating', 'rating_sum'
+    ).first()
+    if clinic is None:
+        return None
+
+    etag = quote_etag(hashlib.sha1(repr(clinic).encode('utf-8')).hexdigest()[:20])
+    last_modified = max(ts for ts in clinic[:2] if ts is not None)
+    return etag, int(last_modified.timestamp())
+
+
+def get_response_version(clinic_id: int) -> Optional[Tuple[str, int]]:
+    """캐시된 치과 버전 토큰 (없으면 계산 후 저장)"""
+    key = CLINIC_VERSION_KEY.format(clinic_id)
+    version = cache.get(key)
+    if version is None:
+        version = compute_response_version(clinic_id)
+        if version is not None:
+            cache.set(key, version, CLINIC_VERSION_TIMEOUT)
+    return version
+
+
+def invalidate_clinic_versions(clinic_ids: Iterable[int]):
+    """
+    치과 버전 토큰 무효화
+
+    data_updated_at은 변경과 같은 트랜잭션에서 갱신하고, 캐시된 토큰은 커밋 후 삭제한다.
+    """
+    from .models import Clinic
+
+    clinic_ids = sorted({clinic_id for clinic_id in clinic_ids if clinic_id is not None})
+    if not clinic_ids:
+        return
+    now = timezone.now()
+    for start in range(0, len(clinic_ids), STAMP_BATCH_SIZE):
+        Clinic.objects.filter(pk__in=clinic_ids[start:start + STAMP_BATCH_SIZE]).update(data_updated_at=now)
+    keys = [CLINIC_VERSION_KEY.format(clinic_id) for clinic_id in clinic_ids]
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def mark_clinics_changed(clinic_ids: Iterable[int]):
+    """치과 응답 데이터 변경 표시 (대량 적재 중이면 종료 시 한 번에 삭제)"""
+    batch = current_batch()
+    if batch is not None:
+        batch.changed_clinic_ids.update(clinic_ids)
+        return
+    invalidate_clinic_versions(clinic_ids)
+
+
+def conditional_clinic_view(clinic_kwarg: str = 'clinic_id'):
+    """
+    치과 버전 토큰으로 조건부 GET을 처리하는 뷰 데코레이터
+
+    Args:
+        clinic_kwarg: 치과 id가 담긴 URL 키워드 인자 이름
+    """
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view_func(request, *args, **kwargs)
+
+            version = get_response_version(kwargs[clinic_kwarg])
+            if version is None:
+                return view_func(request, *args, **kwargs)
+
+            etag, last_modified = version
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
+
+            response = view_func(request, *args, **kwargs)
+            if response.status_code == 200:
+                response['ETag'] = etag
+                response['Last-Modified'] = http_date(last_modified)
+            return response
+        return wrapper
+    return decorator
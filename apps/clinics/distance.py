@@ -0,0 +1,106 @@
+"""
+일괄 거리 계산 모듈
+
+중심점 하나와 여러 좌표 사이의 거리를 NumPy 벡터 연산으로 한 번에 계산한다.
+"""
+import math
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+# 지구 평균 반지름 (km)
+EARTH_RADIUS_KM = 6371.0088
+
+# 평면 근사를 사용해도 오차가 무시할 수준인 최대 반경 (km)
+FLAT_EARTH_MAX_KM = 20.0
+
+METHOD_HAVERSINE = 'haversine'
+METHOD_FLAT = 'flat'
+METHOD_AUTO = 'auto'
+
+
+def to_coordinate_array(points: Iterable[Sequence]) -> np.ndarray:
+    """
+    (위도, 경도) 목록을 (N, 2) float64 배열로 변환
+    """
+    coords = np.asarray(
+        [(float(lat), float(lng)) for lat, lng in points],
+        dtype=np.float64
+    )
+    return coords.reshape(-1, 2)
+
+
+def haversine_distances(center_lat: float, center_lng: float, coords: np.ndarray) -> np.ndarray:
+    """
+    하버사인 공식으로 중심점과 각 좌표 간 거리 계산 (km)
+    """
+    lat1 = math.radians(center_lat)
+    lng1 = math.radians(center_lng)
+    lat2 = np.radians(coords[:, 0])
+    lng2 = np.radians(coords[:, 1])
+
+    a = (
+        np.sin((lat2 - lat1) / 2.0) ** 2 +
+        math.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2.0) ** 2
+    )
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def flat_distances(center_lat: float, center_lng: float, coords: np.ndarray) -> np.ndarray:
+    """
+    등장방형(평면) 근사로 중심점과 각 좌표 간 거리 계산 (km)
+
+    수십 km 이내의 짧은 거리에서는 하버사인과 차이가 거의 없고 더 빠르다.
+    """
+    cos_lat = math.cos(math.radians(center_lat))
+    dlat = np.radians(coords[:, 0] - center_lat)
+    dlng = np.radians(coords[:, 1] - center_lng) * cos_lat
+    return EARTH_RADIUS_KM * np.hypot(dlat, dlng)
+
+
+def select_method(radius_km: Optional[float]) -> str:
+    """반경 크기에 따라 계산 방식 선택"""
+    if radius_km is not None and radius_km <= FLAT_EARTH_MAX_KM:
+        return METHOD_FLAT
+    return METHOD_HAVERSINE
+
+
+def batch_distances(
+    center_lat: float,
+    center_lng: float,
+    coords,
+    method: str = METHOD_HAVERSINE,
+    radius_km: Optional[float] = None
+) -> np.ndarray:
+    """
+    중심점과 여러 좌표 간 거리를 한 번에 계산
+
+    Args:
+        center_lat: 중심점 위도
+        center_lng: 중심점 경도
+        coords: (N, 2) 위도/경도 배열 또는 (위도, 경도) 목록
+        method: 'haversine', 'flat' 또는 'auto'
+        radius_km: method가 'auto'일 때 방식 선택에 사용할 검색 반경
+
+    Returns:
+        거리 배열 (km)
+    """
+    if not isinstance(coords, np.ndarray):
+        coords = to_coordinate_array(coords)
+    if coords.size == 0:
+        return np.empty(0, dtype=np.float64)
+
+    if method == METHOD_AUTO:
+        method = select_method(radius_km)
+
+    if method == METHOD_HAVERSINE:
+        return haversine_distances(center_lat, center_lng, coords)
+    if method == METHOD_FLAT:
+        return flat_distances(center_lat, center_lng, coords)
+    raise ValueError(f"지원하지 않는 거리 계산 방식입니다: {method}")
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """두 지점 간 하버사인 거리 (km)"""
+    coords = np.array([[float(lat2), float(lng2)]], dtype=np.float64)
+    return float(haversine_distances(float(lat1), float(lng1), coords)[0])
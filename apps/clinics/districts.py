@@ -0,0 +1,401 @@
+"""
+오프라인 지역구 판별 모듈
+
+지역구 경계 GeoJSON을 한 번만 메모리에 올려 두고, 경계 상자로 후보를 거른 뒤
+점-다각형 포함 검사로 좌표가 속한 지역구를 찾는다. 경계 파일이 없으면
+지명 사전의 지역구 중심 좌표 중 가장 가까운 곳으로 근사한다. 중심 좌표 근사는 경계
+근처에서 이웃 구를 돌려주므로(성수역 → 광진구) 역지오코딩이 실패했을 때만 쓰고,
+DB에는 저장하지 않는다.
+
+지역구별 중심 좌표/경계 상자/치과 수/반경별 인근 지역구 목록은 District 테이블에
+미리 계산해 두고 refresh_district_table()로 주기적으로 갱신한다.
+"""
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Avg, Count, Max, Min
+
+from .distance import batch_distances
+from .gazetteer import SEOUL_DISTRICT_CENTROIDS
+from .versioning import bump_clinic_version
+
+logger = logging.getLogger(__name__)
+
+# 지역구 이름으로 사용할 GeoJSON 속성 후보
+NAME_PROPERTIES = ('name', 'SIG_KOR_NM', 'district', 'sggnm')
+
+# 인근 지역구 목록을 미리 계산해 둘 반경 (km)
+DEFAULT_NEIGHBOR_RADII_KM = (5, 10, 20)
+
+# 경계 파일이 없을 때 중심 좌표 근사를 허용하는 범위
+SEOUL_BOUNDS = (37.41, 37.72, 126.76, 127.19)  # (최소 위도, 최대 위도, 최소 경도, 최대 경도)
+CENTROID_FALLBACK_MAX_KM = 7.0
+
+
+class DistrictPolygon:
+    """지역구 경계 (다중 다각형, 구멍 포함)"""
+
+    def __init__(self, name: str, polygons: List[List[np.ndarray]]):
+        self.name = name
+        # polygons: [[외곽 링, 구멍 링, ...], ...], 각 링은 (N, 2) 경도/위도 배열
+        self.polygons = polygons
+        points = np.vstack([ring for polygon in polygons for ring in polygon])
+        self.min_lng, self.min_lat = points.min(axis=0)
+        self.max_lng, self.max_lat = points.max(axis=0)
+
+    def bbox_contains(self, lat: float, lng: float) -> bool:
+        return self.min_lat <= lat <= self.max_lat and self.min_lng <= lng <= self.max_lng
+
+    def contains(self, lat: float, lng: float) -> bool:
+        for exterior, *holes in self.polygons:
+            if _point_in_ring(lng, lat, exterior) and not any(
+                _point_in_ring(lng, lat, hole) for hole in holes
+            ):
+                return True
+        return False
+
+
+def _point_in_ring(x: float, y: float, ring: np.ndarray) -> bool:
+    """광선 교차법으로 점이 링 내부에 있는지 검사"""
+    xs = ring[:, 0]
+    ys = ring[:, 1]
+    xj = np.roll(xs, 1)
+    yj = np.roll(ys, 1)
+    crosses = (ys > y) != (yj > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_intersect = (xj - xs) * (y - ys) / (yj - ys) + xs
+    return bool(np.count_nonzero(crosses & (x < x_intersect)) % 2)
+
+
+def _feature_name(properties: Dict) -> Optional[str]:
+    for key in NAME_PROPERTIES:
+        if properties.get(key):
+            return str(properties[key]).strip()
+    return None
+
+
+def _feature_polygons(geometry: Dict) -> List[List[np.ndarray]]:
+    if geometry.get('type') == 'Polygon':
+        raw_polygons = [geometry['coordinates']]
+    elif geometry.get('type') == 'MultiPolygon':
+        raw_polygons = geometry['coordinates']
+    else:
+        return []
+    return [
+        [np.asarray(ring, dtype=np.float64)[:, :2] for ring in polygon]
+        for polygon in raw_polygons
+        if polygon
+    ]
+
+
+class DistrictResolver:
+    """좌표 → 지역구 판별기"""
+
+    def __init__(self, districts: Iterable[DistrictPolygon] = ()):
+        self.districts = list(districts)
+        self.centroid_names = list(SEOUL_DISTRICT_CENTROIDS.keys())
+        self.centroid_coords = np.asarray(
+            list(SEOUL_DISTRICT_CENTROIDS.values()), dtype=np.float64
+        )
+
+    @classmethod
+    def from_geojson(cls, data: Dict) -> 'DistrictResolver':
+        """GeoJSON FeatureCollection으로 판별기 생성"""
+        districts = []
+        for feature in data.get('features', []):
+            name = _feature_name(feature.get('properties') or {})
+            polygons = _feature_polygons(feature.get('geometry') or {})
+            if name and polygons:
+                districts.append(DistrictPolygon(name, polygons))
+        return cls(districts)
+
+    @classmethod
+    def from_file(cls, path) -> 'DistrictResolver':
+        """경계 파일로 판별기 생성 (파일이 없으면 중심 좌표 근사만 사용)"""
+        path = Path(path)
+        if not path.exists():
+            logger.warning(f"지역구 경계 파일 없음, 중심 좌표 근사 사용: {path}")
+            return cls()
+        with path.open(encoding='utf-8') as f:
+            resolver = cls.from_geojson(json.load(f))
+        logger.info(f"지역구 경계 로드: {len(resolver.districts)}개 ({path})")
+        return resolver
+
+    def resolve(self, lat: float, lng: float, approximate: bool = True) -> Optional[str]:
+        """
+        좌표가 속한 지역구 반환
+
+        Args:
+            lat: 위도
+            lng: 경도
+            approximate: 경계 데이터가 없을 때 중심 좌표 근사를 허용할지 여부
+
+        Returns:
+            지역구명 또는 None
+        """
+        lat = float(lat)
+        lng = float(lng)
+
+        if self.districts:
+            for district in self.districts:
+                if district.bbox_contains(lat, lng) and district.contains(lat, lng):
+                    return district.name
+            return None
+
+        return self.nearest_centroid(lat, lng) if approximate else None
+
+    def nearest_centroid(self, lat: float, lng: float) -> Optional[str]:
+        """가장 가까운 지역구 중심 좌표로 근사 (서울 범위 밖이거나 너무 멀면 None)"""
+        lat = float(lat)
+        lng = float(lng)
+        min_lat, max_lat, min_lng, max_lng = SEOUL_BOUNDS
+        if not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+            return None
+        distances = batch_distances(lat, lng, self.centroid_coords, method='flat')
+        index = int(np.argmin(distances))
+        if distances[index] > CENTROID_FALLBACK_MAX_KM:
+            return None
+        return self.centroid_names[index]
+
+
+_lock = threading.Lock()
+_resolver: Optional[DistrictResolver] = None
+
+
+def get_district_resolver() -> DistrictResolver:
+    """프로세스 전역 판별기 반환 (최초 호출 시 한 번만 로드)"""
+    global _resolver
+    if _resolver is None:
+        with _lock:
+            if _resolver is None:
+                _resolver = DistrictResolver.from_file(
+                    getattr(settings, 'DISTRICT_BOUNDARY_FILE', '')
+                )
+    return _resolver
+
+
+def backfill_clinic_districts(
+    overwrite: bool = False,
+    batch_size: int = 1000,
+    resolver: Optional[DistrictResolver] = None
+) -> Tuple[int, int]:
+    """
+    좌표만 있는 치과의 지역구 일괄 채우기
+
+    경계 데이터로 판별한 결과만 저장한다. 경계 데이터가 없으면 중심 좌표 근사 결과를
+    저장하지 않으므로 모든 치과가 판별 실패로 집계된다.
+
+    Args:
+        overwrite: True면 지역구가 이미 있는 치과도 다시 판별
+        batch_size: 한 번에 갱신할 행 수
+        resolver: 사용할 판별기 (기본: 전역 판별기)
+
+    Returns:
+        (갱신된 치과 수, 판별 실패 수)
+    """
+    from .models import Clinic
+
+    resolver = resolver or get_district_resolver()
+    clinics = Clinic.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    if not overwrite:
+        clinics = clinics.filter(district='')
+
+    updated = 0
+    unresolved = 0
+    batch = []
+
+    for clinic in clinics.only('id', 'district', 'latitude', 'longitude').iterator(chunk_size=batch_size):
+        district = resolver.resolve(clinic.latitude, clinic.longitude, approximate=False)
+        if not district:
+            unresolved += 1
+            continue
+        if district != clinic.district:
+            clinic.district = district
+            batch.append(clinic)
+        if len(batch) >= batch_size:
+            Clinic.objects.bulk_update(batch, ['district'])
+            updated += len(batch)
+            batch = []
+
+    if batch:
+        Clinic.objects.bulk_update(batch, ['district'])
+        updated += len(batch)
+
+    # bulk_update는 시그널을 보내지 않으므로 자동완성 인덱스용 버전을 직접 증가
+    if updated:
+        bump_clinic_version()
+
+    return updated, unresolved
+
+
+# 지역구 요약 테이블
+
+
+def neighbor_radii() -> Tuple[float, ...]:
+    """인근 지역구를 미리 계산할 반경 목록"""
+    return tuple(getattr(settings, 'DISTRICT_NEIGHBOR_RADII_KM', DEFAULT_NEIGHBOR_RADII_KM))
+
+
+def radius_key(radius_km: float) -> str:
+    """반경을 neighbors JSON 키로 변환 (10.0 -> "10")"""
+    return f"{float(radius_km):g}"
+
+
+def refresh_district_table(radii: Optional[Iterable[float]] = None) -> int:
+    """
+    치과 데이터로 지역구 요약 테이블 재계산
+
+    지역구별 치과 수/좌표 평균/경계 상자를 한 번의 집계 쿼리로 구하고,
+    중심 좌표 간 거리 행렬로 반경별 인근 지역구 목록을 만든다.
+
+    Args:
+        radii: 인근 지역구를 계산할 반경 목록 (기본: settings.DISTRICT_NEIGHBOR_RADII_KM)
+
+    Returns:
+        저장된 지역구 수
+    """
+    from .models import Clinic, District
+
+    radii = tuple(radii) if radii is not None else neighbor_radii()
+
+    rows = {
+        name: {'name': name, 'latitude': lat, 'longitude': lng, 'clinic_count': 0}
+        for name, (lat, lng) in SEOUL_DISTRICT_CENTROIDS.items()
+    }
+
+    aggregates = (
+        Clinic.objects
+        .exclude(district='')
+        .values('district')
+        .annotate(
+            clinic_count=Count('id'),
+            avg_lat=Avg('latitude'),
+            avg_lng=Avg('longitude'),
+            min_lat=Min('latitude'),
+            max_lat=Max('latitude'),
+            min_lng=Min('longitude'),
+            max_lng=Max('longitude'),
+        )
+    )
+    for agg in aggregates:
+        name = agg['district'].strip()
+        row = rows.setdefault(name, {'name': name, 'latitude': None, 'longitude': None})
+        row['clinic_count'] = row.get('clinic_count', 0) + agg['clinic_count']
+        if agg['avg_lat'] is not None:
+            row.update({
+                'latitude': agg['avg_lat'],
+                'longitude': agg['avg_lng'],
+                'min_latitude': agg['min_lat'],
+                'max_latitude': agg['max_lat'],
+                'min_longitude': agg['min_lng'],
+                'max_longitude': agg['max_lng'],
+            })
+
+    # 좌표를 알 수 없는 지역구는 제외
+    rows = [row for row in rows.values() if row['latitude'] is not None]
+    if not rows:
+        return 0
+
+    coords = np.asarray(
+        [(float(row['latitude']), float(row['longitude'])) for row in rows], dtype=np.float64
+    )
+    for index, row in enumerate(rows):
+        distances = batch_distances(coords[index, 0], coords[index, 1], coords)
+        order = np.argsort(distances, kind='stable')
+        row['neighbors'] = {
+            radius_key(radius): [
+                rows[j]['name'] for j in order
+                if j != index and distances[j] <= radius
+            ]
+            for radius in radii
+        }
+        row['latitude'] = round(float(row['latitude']), 6)
+        row['longitude'] = round(float(row['longitude']), 6)
+
+    with transaction.atomic():
+        District.objects.all().delete()
+        District.objects.bulk_create([District(**row) for row in rows])
+
+    logger.info(f"지역구 요약 테이블 갱신: {len(rows)}개")
+    return len(rows)
+
+
+def find_district(name: str):
+    """
+    지역구 요약 행 조회 (정확히 일치하지 않으면 부분 일치)
+
+    Args:
+        name: 지역구명 (예: "강남구", "강남")
+
+    Returns:
+        District 또는 None
+    """
+    from .models import District
+
+    name = (name or '').strip()
+    if not name:
+        return None
+
+    district = District.objects.filter(name=name).first()
+    if district is not None:
+        return district
+
+    for district in District.objects.all():
+        if name in district.name or district.name in name:
+            return district
+    return None
+
+
+def district_center(name: str) -> Optional[Tuple[float, float]]:
+    """
+    지역구 중심 좌표 반환 (요약 테이블이 비어 있으면 지명 사전 사용)
+    """
+    district = find_district(name)
+    if district is not None:
+        return district.center
+
+    name = (name or '').strip()
+    if not name:
+        return None
+    if name in SEOUL_DISTRICT_CENTROIDS:
+        return SEOUL_DISTRICT_CENTROIDS[name]
+    for key, coords in SEOUL_DISTRICT_CENTROIDS.items():
+        if name in key or key in name:
+            return coords
+    return None
+
+
+def nearby_districts(name: str, radius_km: float) -> Optional[List[str]]:
+    """
+    기준 지역구 반경 내 인근 지역구 목록 (거리순, 기준 지역구 제외)
+
+    미리 계산된 반경이면 저장된 목록을, 아니면 요약 테이블의 중심 좌표로 계산한다.
+
+    Returns:
+        인근 지역구 목록, 기준 지역구가 테이블에 없으면 None
+    """
+    from .models import District
+
+    base = find_district(name)
+    if base is None:
+        return None
+
+    key = radius_key(radius_km)
+    if key in base.neighbors:
+        return list(base.neighbors[key])
+
+    others = list(District.objects.exclude(pk=base.pk).values_list('name', 'latitude', 'longitude'))
+    if not others:
+        return []
+    coords = np.asarray([(float(lat), float(lng)) for _, lat, lng in others], dtype=np.float64)
+    distances = batch_distances(*base.center, coords)
+    return [
+        others[j][0] for j in np.argsort(distances, kind='stable')
+        if distances[j] <= radius_km
+    ]
@@ -0,0 +1,212 @@
+"""
+서울 지역구/행정동 오프라인 지명 사전
+
+지역구·동 수준의 주소 조회를 네트워크 호출 없이 처리하기 위한 대표 좌표 모음.
+좌표는 각 지역의 대략적인 중심점이다.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# 서울시 자치구 중심 좌표
+SEOUL_DISTRICT_CENTROIDS: Dict[str, Tuple[float, float]] = {
+    '강남구': (37.5173, 127.0473),
+    '강동구': (37.5301, 127.1238),
+    '강북구': (37.6398, 127.0256),
+    '강서구': (37.5509, 126.8495),
+    '관악구': (37.4784, 126.9516),
+    '광진구': (37.5384, 127.0822),
+    '구로구': (37.4955, 126.8876),
+    '금천구': (37.4569, 126.8955),
+    '노원구': (37.6544, 127.0565),
+    '도봉구': (37.6688, 127.0471),
+    '동대문구': (37.5744, 127.0396),
+    '동작구': (37.5124, 126.9393),
+    '마포구': (37.5663, 126.9019),
+    '서대문구': (37.5791, 126.9368),
+    '서초구': (37.4837, 127.0324),
+    '성동구': (37.5634, 127.0365),
+    '성북구': (37.5894, 127.0167),
+    '송파구': (37.5145, 127.1059),
+    '양천구': (37.5169, 126.8664),
+    '영등포구': (37.5264, 126.8962),
+    '용산구': (37.5384, 126.9654),
+    '은평구': (37.6176, 126.9227),
+    '종로구': (37.5735, 126.9788),
+    '중구': (37.5640, 126.9970),
+    '중랑구': (37.6063, 127.0925),
+}
+
+# 주요 행정동 중심 좌표 ((지역구, 동) -> 좌표)
+SEOUL_DONG_CENTROIDS: Dict[Tuple[str, str], Tuple[float, float]] = {
+    ('강남구', '역삼동'): (37.5006, 127.0366),
+    ('강남구', '삼성동'): (37.5140, 127.0565),
+    ('강남구', '대치동'): (37.4996, 127.0628),
+    ('강남구', '논현동'): (37.5115, 127.0281),
+    ('강남구', '신사동'): (37.5240, 127.0228),
+    ('강남구', '압구정동'): (37.5301, 127.0286),
+    ('강남구', '청담동'): (37.5246, 127.0476),
+    ('강남구', '도곡동'): (37.4886, 127.0465),
+    ('강남구', '개포동'): (37.4784, 127.0637),
+    ('강동구', '천호동'): (37.5430, 127.1380),
+    ('강동구', '길동'): (37.5370, 127.1410),
+    ('강동구', '암사동'): (37.5500, 127.1280),
+    ('강북구', '미아동'): (37.6190, 127.0270),
+    ('강북구', '수유동'): (37.6370, 127.0200),
+    ('강서구', '화곡동'): (37.5410, 126.8400),
+    ('강서구', '등촌동'): (37.5510, 126.8640),
+    ('강서구', '마곡동'): (37.5600, 126.8270),
+    ('관악구', '신림동'): (37.4840, 126.9297),
+    ('관악구', '봉천동'): (37.4820, 126.9420),
+    ('광진구', '자양동'): (37.5347, 127.0826),
+    ('광진구', '구의동'): (37.5417, 127.0860),
+    ('광진구', '화양동'): (37.5465, 127.0710),
+    ('구로구', '구로동'): (37.4950, 126.8870),
+    ('구로구', '신도림동'): (37.5090, 126.8910),
+    ('금천구', '가산동'): (37.4780, 126.8840),
+    ('금천구', '독산동'): (37.4700, 126.8970),
+    ('노원구', '상계동'): (37.6600, 127.0700),
+    ('노원구', '중계동'): (37.6450, 127.0760),
+    ('노원구', '공릉동'): (37.6250, 127.0730),
+    ('도봉구', '창동'): (37.6520, 127.0470),
+    ('도봉구', '방학동'): (37.6660, 127.0350),
+    ('동대문구', '회기동'): (37.5900, 127.0550),
+    ('동대문구', '청량리동'): (37.5800, 127.0450),
+    ('동대문구', '장안동'): (37.5700, 127.0700),
+    ('동작구', '사당동'): (37.4836, 126.9816),
+    ('동작구', '노량진동'): (37.5130, 126.9420),
+    ('동작구', '흑석동'): (37.5080, 126.9630),
+    ('마포구', '서교동'): (37.5528, 126.9199),
+    ('마포구', '합정동'): (37.5495, 126.9137),
+    ('마포구', '공덕동'): (37.5446, 126.9515),
+    ('마포구', '연남동'): (37.5627, 126.9236),
+    ('마포구', '상암동'): (37.5779, 126.8910),
+    ('마포구', '망원동'): (37.5563, 126.9036),
+    ('서대문구', '신촌동'): (37.5600, 126.9400),
+    ('서대문구', '홍제동'): (37.5890, 126.9430),
+    ('서초구', '서초동'): (37.4918, 127.0106),
+    ('서초구', '반포동'): (37.5047, 127.0039),
+    ('서초구', '방배동'): (37.4812, 126.9975),
+    ('서초구', '양재동'): (37.4700, 127.0365),
+    ('서초구', '잠원동'): (37.5134, 127.0117),
+    ('성동구', '성수동'): (37.5445, 127.0560),
+    ('성동구', '행당동'): (37.5590, 127.0360),
+    ('성북구', '길음동'): (37.6070, 127.0230),
+    ('성북구', '돈암동'): (37.5920, 127.0170),
+    ('송파구', '잠실동'): (37.5080, 127.0830),
+    ('송파구', '문정동'): (37.4860, 127.1223),
+    ('송파구', '가락동'): (37.4970, 127.1185),
+    ('송파구', '방이동'): (37.5130, 127.1150),
+    ('송파구', '석촌동'): (37.5030, 127.1040),
+    ('양천구', '목동'): (37.5340, 126.8750),
+    ('양천구', '신정동'): (37.5180, 126.8560),
+    ('영등포구', '여의도동'): (37.5219, 126.9245),
+    ('영등포구', '영등포동'): (37.5160, 126.9070),
+    ('영등포구', '당산동'): (37.5340, 126.8980),
+    ('용산구', '이태원동'): (37.5345, 126.9946),
+    ('용산구', '한남동'): (37.5345, 127.0060),
+    ('용산구', '이촌동'): (37.5206, 126.9720),
+    ('은평구', '불광동'): (37.6100, 126.9300),
+    ('은평구', '응암동'): (37.5990, 126.9200),
+    ('종로구', '혜화동'): (37.5862, 127.0017),
+    ('종로구', '삼청동'): (37.5860, 126.9820),
+    ('종로구', '평창동'): (37.6120, 126.9750),
+    ('중구', '명동'): (37.5636, 126.9834),
+    ('중구', '을지로동'): (37.5660, 126.9920),
+    ('중구', '신당동'): (37.5601, 127.0169),
+    ('중랑구', '면목동'): (37.5830, 127.0840),
+    ('중랑구', '상봉동'): (37.5960, 127.0860),
+}
+
+# 주소 앞에 붙는 광역 단위 표기
+REGION_PREFIXES = {'대한민국', '서울', '서울시', '서울특별시'}
+
+# 동 이름 -> 해당 동이 있는 지역구 목록
+_DONG_INDEX: Dict[str, List[str]] = {}
+for (_district, _dong) in SEOUL_DONG_CENTROIDS:
+    _DONG_INDEX.setdefault(_dong, []).append(_district)
+
+
+@dataclass(frozen=True)
+class GazetteerMatch:
+    """지명 사전 조회 결과"""
+    latitude: float
+    longitude: float
+    district: str
+    dong: Optional[str] = None
+
+    @property
+    def level(self) -> str:
+        return 'dong' if self.dong else 'district'
+
+
+def normalize_address(address: str) -> str:
+    """
+    주소 문자열 정규화 (캐시 키로 사용)
+
+    공백/구두점 정리 및 '서울특별시', '서울시' 표기를 '서울'로 통일한다.
+    """
+    text = re.sub(r'[,()\[\]]', ' ', address or '')
+    tokens = []
+    for token in text.split():
+        if token in REGION_PREFIXES:
+            token = '서울'
+        tokens.append(token)
+    return ' '.join(tokens)
+
+
+def _resolve_district(token: str) -> Optional[str]:
+    if token in SEOUL_DISTRICT_CENTROIDS:
+        return token
+    if f"{token}구" in SEOUL_DISTRICT_CENTROIDS:
+        return f"{token}구"
+    return None
+
+
+def lookup(address: str) -> Optional[GazetteerMatch]:
+    """
+    지역구/동 수준 주소를 지명 사전으로 조회
+
+    도로명, 번지 등 더 구체적인 정보가 포함된 주소는 None을 반환한다.
+
+    Args:
+        address: 주소 문자열 (예: "서울 강남구", "강남구 역삼동", "역삼동")
+
+    Returns:
+        GazetteerMatch 또는 None
+    """
+    tokens = [t for t in normalize_address(address).split() if t != '서울']
+    if not tokens or len(tokens) > 2:
+        return None
+
+    district = None
+    dong = None
+
+    if len(tokens) == 2:
+        district = _resolve_district(tokens[0])
+        dong = tokens[1]
+        if district is None or (district, dong) not in SEOUL_DONG_CENTROIDS:
+            return None
+    else:
+        district = _resolve_district(tokens[0])
+        if district is None:
+            # 동 이름만 주어진 경우 (지역구가 하나로 특정될 때만)
+            districts = _DONG_INDEX.get(tokens[0], [])
+            if len(districts) != 1:
+                return None
+            district, dong = districts[0], tokens[0]
+
+    if dong:
+        lat, lng = SEOUL_DONG_CENTROIDS[(district, dong)]
+    else:
+        lat, lng = SEOUL_DISTRICT_CENTROIDS[district]
+
+    return GazetteerMatch(latitude=lat, longitude=lng, district=district, dong=dong)
+
+
+def district_centroid(district: str) -> Optional[Tuple[float, float]]:
+    """지역구 중심 좌표 반환"""
+    resolved = _resolve_district(district.strip()) if district else None
+    if resolved is None:
+        return None
+    return SEOUL_DISTRICT_CENTROIDS[resolved]
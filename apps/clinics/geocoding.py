@@ -0,0 +1,226 @@
+"""
+지오코딩 캐시 서비스
+
+조회 순서: 프로세스 메모리 LRU → 오프라인 지명 사전 → DB 캐시 테이블 → 외부 지오코더
+외부 지오코더 호출이 예외로 끝난 경우에는 결과를 캐시하지 않는다.
+"""
+import logging
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import timedelta
+from typing import Callable, Dict, Optional, Tuple
+
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from . import gazetteer
+from .models import GeocodeCache
+
+logger = logging.getLogger(__name__)
+
+# 조회 결과를 찾지 못했음을 나타내는 메모리 캐시 값
+_NOT_FOUND = object()
+
+
+class GeocodeCacheService:
+    """지오코딩 결과 캐시"""
+
+    # 결과 보관 기간
+    FOUND_TTL = timedelta(days=90)
+    NOT_FOUND_TTL = timedelta(days=1)
+
+    # 메모리 LRU 최대 항목 수 및 보관 시간 (초)
+    MEMORY_SIZE = 4096
+    MEMORY_TTL_SECONDS = 3600
+
+    # 역지오코딩 좌표 반올림 자릿수 (소수점 4자리 ≈ 11m)
+    REVERSE_PRECISION = 4
+
+    def __init__(self):
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = Counter()
+
+    # 키 생성
+
+    @staticmethod
+    def forward_key(address: str) -> str:
+        """주소 조회 키 (정규화된 주소)"""
+        return gazetteer.normalize_address(address)[:500]
+
+    def reverse_key(self, lat: float, lng: float) -> str:
+        """좌표 조회 키 (반올림된 좌표 셀)"""
+        precision = self.REVERSE_PRECISION
+        return f"{round(float(lat), precision):.{precision}f},{round(float(lng), precision):.{precision}f}"
+
+    # 공개 API
+
+    def geocode(
+        self,
+        address: str,
+        fetch: Callable[[str], Optional[Tuple[float, float]]]
+    ) -> Optional[Tuple[float, float]]:
+        """
+        주소를 좌표로 변환 (캐시 우선)
+
+        Args:
+            address: 주소 문자열
+            fetch: 캐시에 없을 때 호출할 외부 지오코딩 함수
+
+        Returns:
+            (위도, 경도) 튜플 또는 None
+        """
+        key = self.forward_key(address)
+        if not key:
+            return None
+
+        cached = self._memory_get(('forward', key))
+        if cached is not None:
+            self._record('memory_hits')
+            return None if cached is _NOT_FOUND else cached
+
+        match = gazetteer.lookup(key)
+        if match:
+            self._record('gazetteer_hits')
+            result = (match.latitude, match.longitude)
+            self._memory_set(('forward', key), result)
+            return result
+
+        row = self._db_get('forward', key)
+        if row is not None:
+            self._record('db_hits')
+            result = (float(row.latitude), float(row.longitude)) if row.found else None
+            self._memory_set(('forward', key), result)
+            return result
+
+        self._record('misses')
+        result = fetch(address)
+        self._db_set('forward', key, result is not None, defaults={
+            'latitude': round(result[0], 6) if result else None,
+            'longitude': round(result[1], 6) if result else None,
+        })
+        self._memory_set(('forward', key), result)
+        return result
+
+    def reverse(
+        self,
+        lat: float,
+        lng: float,
+        fetch: Callable[[float, float], Optional[str]]
+    ) -> Optional[str]:
+        """
+        좌표를 주소로 변환 (캐시 우선)
+
+        Args:
+            lat: 위도
+            lng: 경도
+            fetch: 캐시에 없을 때 호출할 외부 역지오코딩 함수
+
+        Returns:
+            주소 문자열 또는 None
+        """
+        key = self.reverse_key(lat, lng)
+
+        cached = self._memory_get(('reverse', key))
+        if cached is not None:
+            self._record('memory_hits')
+            return None if cached is _NOT_FOUND else cached
+
+        row = self._db_get('reverse', key)
+        if row is not None:
+            self._record('db_hits')
+            result = row.address if row.found else None
+            self._memory_set(('reverse', key), result)
+            return result
+
+        self._record('misses')
+        result = fetch(lat, lng)
+        self._db_set('reverse', key, result is not None, defaults={
+            'address': result or '',
+        })
+        self._memory_set(('reverse', key), result)
+        return result
+
+    def get_stats(self) -> Dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            memory_size = len(self._memory)
+
+        lookups = sum(stats.values())
+        hits = lookups - stats.get('misses', 0)
+        return {
+            'lookups': lookups,
+            'hits': hits,
+            'misses': stats.get('misses', 0),
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            'memory_hits': stats.get('memory_hits', 0),
+            'gazetteer_hits': stats.get('gazetteer_hits', 0),
+            'db_hits': stats.get('db_hits', 0),
+            'memory_entries': memory_size,
+            'db_entries': GeocodeCache.objects.filter(expires_at__gt=timezone.now()).count(),
+        }
+
+    def clear_memory(self):
+        """메모리 캐시 및 통계 초기화"""
+        with self._lock:
+            self._memory.clear()
+            self._stats.clear()
+
+    @staticmethod
+    def purge_expired() -> int:
+        """만료된 캐시 행 삭제"""
+        return GeocodeCache.objects.filter(expires_at__lte=timezone.now()).delete()[0]
+
+    # 내부 구현
+
+    def _record(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _memory_get(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires <= time.monotonic():
+                del self._memory[key]
+                return None
+            self._memory.move_to_end(key)
+            return value
+
+    def _memory_set(self, key, value):
+        with self._lock:
+            self._memory[key] = (
+                _NOT_FOUND if value is None else value,
+                time.monotonic() + self.MEMORY_TTL_SECONDS
+            )
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_SIZE:
+                self._memory.popitem(last=False)
+
+    def _db_get(self, kind: str, key: str) -> Optional[GeocodeCache]:
+        row = GeocodeCache.objects.filter(
+            kind=kind,
+            query_key=key,
+            expires_at__gt=timezone.now()
+        ).first()
+        if row is not None:
+            GeocodeCache.objects.filter(pk=row.pk).update(hit_count=F('hit_count') + 1)
+        return row
+
+    def _db_set(self, kind: str, key: str, found: bool, defaults: Dict):
+        ttl = self.FOUND_TTL if found else self.NOT_FOUND_TTL
+        values = {
+            'found': found,
+            'expires_at': timezone.now() + ttl,
+            **defaults,
+        }
+        try:
+            GeocodeCache.objects.update_or_create(kind=kind, query_key=key, defaults=values)
+        except IntegrityError:
+            # 동시에 같은 키를 저장한 경우 먼저 저장된 결과를 유지
+            logger.debug(f"지오코딩 캐시 동시 저장 무시: {kind} {key}")
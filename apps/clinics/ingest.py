@@ -0,0 +1,116 @@
+"""
+대량 적재 모드
+
+리뷰/치과/감성 분석을 한 건씩 저장하면 post_save 리시버가 행마다 검색 벡터
+UPDATE, 치과 통계 갱신, 감성 분석 요약 갱신, 데이터 버전 증가를 수행한다.
+bulk_ingest() 안에서는 리시버가 대상 id만 기록하고, 블록을 빠져나갈 때
+집합 단위 UPDATE와 치과별 통계 재계산을 한 번씩 실행한다.
+
+    with bulk_ingest():
+        for data in review_data_list:
+            Review.objects.create(...)
+"""
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 집합 단위 UPDATE 한 번에 포함할 id 수
+FLUSH_BATCH_SIZE = 1000
+
+_state = threading.local()
+
+
+def _chunks(ids: Iterable[int], size: int) -> Iterator[List[int]]:
+    ids = sorted(ids)
+    for start in range(0, len(ids), size):
+        yield ids[start:start + size]
+
+
+class IngestBatch:
+    """대량 적재 중 미뤄둔 후처리 대상"""
+
+    def __init__(self):
+        self.clinic_vector_ids = set()
+        self.review_vector_ids = set()
+        self.stats_clinic_ids = set()
+        self.summary_clinic_ids = set()
+        self.changed_clinic_ids = set()
+        self.clinic_version_changed = False
+
+    def __bool__(self):
+        return bool(
+            self.clinic_vector_ids or self.review_vector_ids or self.stats_clinic_ids
+            or self.summary_clinic_ids or self.changed_clinic_ids or self.clinic_version_changed
+        )
+
+    def flush(self, batch_size: int = FLUSH_BATCH_SIZE):
+        """미뤄둔 검색 벡터/통계/요약/버전 갱신 실행"""
+        if not self:
+            return
+
+        from apps.analysis.models import ClinicAspectSummary
+        from apps.reviews.models import Review, review_search_vector
+        from .conditional import invalidate_clinic_versions
+        from .models import Clinic, clinic_search_vector
+        from .search_index import search_vector_updates
+        from .versioning import bump_clinic_version
+
+        for ids in _chunks(self.clinic_vector_ids, batch_size):
+            Clinic.objects.filter(pk__in=ids).update(**search_vector_updates(clinic_search_vector()))
+        for ids in _chunks(self.review_vector_ids, batch_size):
+            Review.objects.filter(pk__in=ids).update(**search_vector_updates(review_search_vector()))
+        for ids in _chunks(self.stats_clinic_ids, batch_size):
+            Clinic.reconcile_review_stats(clinic_ids=ids, batch_size=batch_size)
+        for ids in _chunks(self.summary_clinic_ids, batch_size):
+            ClinicAspectSummary.rebuild(clinic_ids=ids)
+        if self.clinic_version_changed:
+            bump_clinic_version()
+        invalidate_clinic_versions(
+            self.changed_clinic_ids | self.stats_clinic_ids | self.summary_clinic_ids
+        )
+
+        logger.info(
+            f"대량 적재 후처리 완료: 치과 벡터 {len(self.clinic_vector_ids)}개, "
+            f"리뷰 벡터 {len(self.review_vector_ids)}개, 통계 {len(self.stats_clinic_ids)}개 치과, "
+            f"감성 분석 요약 {len(self.summary_clinic_ids)}개 치과"
+        )
+
+
+def current_batch() -> Optional[IngestBatch]:
+    """현재 스레드에서 진행 중인 대량 적재 (없으면 None)"""
+    return getattr(_state, 'batch', None)
+
+
+@contextmanager
+def bulk_ingest(batch_size: int = FLUSH_BATCH_SIZE):
+    """
+    리뷰/치과 리시버의 행 단위 후처리를 미루고 블록 종료 시 일괄 실행
+
+    중첩해서 사용하면 가장 바깥 블록이 끝날 때 한 번만 실행한다. 트랜잭션 안에서
+    사용할 때는 후처리도 같은 트랜잭션에 포함되도록 bulk_ingest를 안쪽에 둔다.
+
+    Args:
+        batch_size: 집합 단위 UPDATE 한 번에 포함할 id 수
+    """
+    batch = current_batch()
+    if batch is not None:
+        yield batch
+        return
+
+    batch = IngestBatch()
+    _state.batch = batch
+    try:
+        yield batch
+    except BaseException:
+        _state.batch = None
+        # 블록 중간에 실패해도 이미 저장된 행은 후처리
+        try:
+            batch.flush(batch_size)
+        except Exception as e:
+            logger.error(f"대량 적재 후처리 실패: {e}")
+        raise
+    _state.batch = None
+    batch.flush(batch_size)
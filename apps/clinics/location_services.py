@@ -3,12 +3,17 @@
 """
 from typing import List, Tuple, Optional, Dict
 from decimal import Decimal
-from geopy.distance import geodesic
+import heapq
 from geopy.geocoders import Nominatim
 from django.db.models import Q
 import logging
 
-from .models import Clinic
+from .models import Clinic, District
+from .distance import distance_km
+from .districts import get_district_resolver, nearby_districts
+from .gazetteer import SEOUL_DISTRICT_CENTROIDS
+from .spatial_index import get_spatial_snapshot
+from .geocoding import GeocodeCacheService
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +23,7 @@ class LocationService:
     
     def __init__(self):
         self.geocoder = Nominatim(user_agent="dental-ai-system")
+        self.geocode_cache = GeocodeCacheService()
     
     def get_clinics_by_radius(
         self, 
@@ -38,33 +44,14 @@ class LocationService:
         Returns:
             거리 정보가 포함된 치과 목록
         """
-        center_point = (center_lat, center_lng)
+        # KD-트리 스냅샷에서 반경 내 치과 id를 거리순으로 조회
+        matches = get_spatial_snapshot().within_radius(center_lat, center_lng, radius_km)
         
-        # 모든 치과 조회 (위치 정보가 있는 것만)
-        clinics = Clinic.objects.filter(
-            latitude__isnull=False,
-            longitude__isnull=False
-        )
-        
-        clinics_with_distance = []
-        
-        for clinic in clinics:
-            clinic_point = (float(clinic.latitude), float(clinic.longitude))
-            distance = geodesic(center_point, clinic_point).kilometers
-            
-            if distance <= radius_km:
-                clinics_with_distance.append({
-                    'clinic': clinic,
-                    'distance_km': round(distance, 2),
-                    'distance_m': round(distance * 1000),
-                })
-        
-        # 거리순 정렬
-        clinics_with_distance.sort(key=lambda x: x['distance_km'])
-        
-        # 제한 적용
+        # 제한 적용 (필요한 행만 조회)
         if limit:
-            clinics_with_distance = clinics_with_distance[:limit]
+            matches = matches[:limit]
+        
+        clinics_with_distance = self._hydrate(self._located_clinics(), matches)
         
         logger.info(f"반경 {radius_km}km 내 {len(clinics_with_distance)}개 치과 발견")
         
@@ -102,21 +89,8 @@ class LocationService:
         
         # 사용자 위치가 제공된 경우 거리 계산
         if center_lat and center_lng:
-            center_point = (center_lat, center_lng)
-            
-            for clinic in clinics:
-                clinic_point = (float(clinic.latitude), float(clinic.longitude))
-                distance = geodesic(center_point, clinic_point).kilometers
-                
-                if distance <= radius_km:
-                    clinics_with_distance.append({
-                        'clinic': clinic,
-                        'distance_km': round(distance, 2),
-                        'distance_m': round(distance * 1000),
-                    })
-            
-            # 거리순 정렬
-            clinics_with_distance.sort(key=lambda x: x['distance_km'])
+            matches = get_spatial_snapshot().within_radius(center_lat, center_lng, radius_km)
+            clinics_with_distance = self._hydrate(clinics, matches)
         else:
             # 위치 정보가 없으면 거리 없이 반환
             for clinic in clinics:
@@ -132,6 +106,109 @@ class LocationService:
         
         return clinics_with_distance
     
+    def get_nearest_clinics(
+        self,
+        center_lat: float,
+        center_lng: float,
+        k: int = 10,
+        max_radius_km: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        가장 가까운 k개 치과 검색
+        
+        Args:
+            center_lat: 중심점 위도
+            center_lng: 중심점 경도
+            k: 결과 수
+            max_radius_km: 최대 거리 (선택)
+            
+        Returns:
+            거리 정보가 포함된 치과 목록 (거리순)
+        """
+        matches = get_spatial_snapshot().nearest(center_lat, center_lng, k)
+        
+        if max_radius_km is not None:
+            matches = [(clinic_id, d) for clinic_id, d in matches if d <= max_radius_km]
+        
+        return self._hydrate(self._located_clinics(), matches)
+    
+    def get_nearest_clinics_page(
+        self,
+        center_lat: float,
+        center_lng: float,
+        k: int,
+        radius_km: float,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Tuple[List[Dict], Optional[Tuple[float, int]]]:
+        """
+        반경 내 가까운 치과 k개를 거리 커서 기준으로 조회
+        
+        Args:
+            center_lat: 중심점 위도
+            center_lng: 중심점 경도
+            k: 페이지 크기
+            radius_km: 검색 반경 (km)
+            after: 이전 페이지 마지막 항목의 (거리 km, 치과 id)
+            
+        Returns:
+            (거리 정보가 포함된 치과 목록, 다음 페이지 커서 또는 None)
+        """
+        matches = get_spatial_snapshot().within_radius(center_lat, center_lng, radius_km)
+        
+        candidates = ((distance, clinic_id) for clinic_id, distance in matches)
+        if after is not None:
+            after = tuple(after)
+            candidates = (item for item in candidates if item > after)
+        
+        # 커서 이후 (거리, id) 순으로 k+1개만 힙에 유지 (다음 페이지 존재 여부 확인용 1개 포함)
+        top = heapq.nsmallest(k + 1, candidates)
+        has_more = len(top) > k
+        top = top[:k]
+        
+        clinics_with_distance = self._hydrate(
+            self._located_clinics(),
+            [(clinic_id, distance) for distance, clinic_id in top]
+        )
+        
+        next_after = top[-1] if has_more else None
+        return clinics_with_distance, next_after
+    
+    def _located_clinics(self):
+        """위치 정보가 있는 치과 쿼리셋"""
+        return Clinic.objects.filter(
+            latitude__isnull=False,
+            longitude__isnull=False
+        )
+    
+    def _hydrate(self, clinics, matches: List[Tuple[int, float]]) -> List[Dict]:
+        """
+        스냅샷 검색 결과 (치과 id, 거리)에 해당하는 행만 조회
+        
+        Args:
+            clinics: 추가 조건이 적용된 치과 쿼리셋
+            matches: 거리순 (치과 id, 거리 km) 목록
+            
+        Returns:
+            거리 정보가 포함된 치과 목록 (matches 순서 유지)
+        """
+        if not matches:
+            return []
+        
+        clinic_map = clinics.in_bulk([clinic_id for clinic_id, _ in matches])
+        
+        clinics_with_distance = []
+        for clinic_id, distance in matches:
+            clinic = clinic_map.get(clinic_id)
+            if clinic is None:
+                continue
+            clinics_with_distance.append({
+                'clinic': clinic,
+                'distance_km': round(distance, 2),
+                'distance_m': round(distance * 1000),
+            })
+        
+        return clinics_with_distance
+    
     def geocode_address(self, address: str) -> Optional[Tuple[float, float]]:
         """
         주소를 좌표로 변환
@@ -143,9 +220,7 @@ class LocationService:
             (위도, 경도) 튜플 또는 None
         """
         try:
-            location = self.geocoder.geocode(address, timeout=10)
-            if location:
-                return (location.latitude, location.longitude)
+            return self.geocode_cache.geocode(address, self._fetch_geocode)
         except Exception as e:
             logger.error(f"주소 지오코딩 실패: {address} - {e}")
         
@@ -163,14 +238,26 @@ class LocationService:
             주소 문자열 또는 None
         """
         try:
-            location = self.geocoder.reverse((lat, lng), timeout=10)
-            if location:
-                return location.address
+            return self.geocode_cache.reverse(lat, lng, self._fetch_reverse)
         except Exception as e:
             logger.error(f"좌표 역지오코딩 실패: ({lat}, {lng}) - {e}")
         
         return None
     
+    def _fetch_geocode(self, address: str) -> Optional[Tuple[float, float]]:
+        """외부 지오코더로 주소 조회 (캐시 미스 시)"""
+        location = self.geocoder.geocode(address, timeout=10)
+        if location:
+            return (location.latitude, location.longitude)
+        return None
+    
+    def _fetch_reverse(self, lat: float, lng: float) -> Optional[str]:
+        """외부 지오코더로 좌표 조회 (캐시 미스 시)"""
+        location = self.geocoder.reverse((lat, lng), timeout=10)
+        if location:
+            return location.address
+        return None
+    
     def get_district_from_coordinates(self, lat: float, lng: float) -> Optional[str]:
         """
         좌표에서 지역구 추출
@@ -182,6 +269,12 @@ class LocationService:
         Returns:
             지역구명 또는 None
         """
+        # 경계 데이터가 있으면 오프라인으로 판별 (네트워크 호출 없음)
+        resolver = get_district_resolver()
+        district = resolver.resolve(lat, lng, approximate=False)
+        if district:
+            return district
+
         address = self.reverse_geocode(lat, lng)
         if address:
             # 한국 주소에서 구 단위 추출
@@ -193,7 +286,10 @@ class LocationService:
                     if part.endswith('구'):
                         return part
         
-        return None
+        # 경계 데이터도 역지오코딩 결과도 없을 때만 지역구 중심 좌표로 근사
+        if resolver.districts:
+            return None
+        return resolver.nearest_centroid(lat, lng)
     
     def calculate_distance(
         self, 
@@ -210,9 +306,7 @@ class LocationService:
         Returns:
             거리 (km)
         """
-        point1 = (lat1, lng1)
-        point2 = (lat2, lng2)
-        return geodesic(point1, point2).kilometers
+        return distance_km(lat1, lng1, lat2, lng2)
     
     def get_nearby_districts(self, district: str, radius_km: float = 20.0) -> List[str]:
         """
@@ -225,46 +319,11 @@ class LocationService:
         Returns:
             인근 지역구 목록
         """
-        # 기준 지역구의 치과들로부터 대표 좌표 계산
-        base_clinics = Clinic.objects.filter(
-            district__icontains=district,
-            latitude__isnull=False,
-            longitude__isnull=False
-        )
-        
-        if not base_clinics.exists():
+        # 지역구 요약 테이블에 미리 계산된 인근 지역구 목록 사용
+        neighbors = nearby_districts(district, radius_km)
+        if neighbors is None:
             return [district]
-        
-        # 평균 좌표 계산
-        total_lat = sum(float(c.latitude) for c in base_clinics)
-        total_lng = sum(float(c.longitude) for c in base_clinics)
-        avg_lat = total_lat / len(base_clinics)
-        avg_lng = total_lng / len(base_clinics)
-        
-        # 모든 지역구의 치과들 확인
-        all_districts = Clinic.objects.values_list('district', flat=True).distinct()
-        nearby_districts = [district]  # 기준 지역구 포함
-        
-        for other_district in all_districts:
-            if other_district == district:
-                continue
-                
-            other_clinics = Clinic.objects.filter(
-                district=other_district,
-                latitude__isnull=False,
-                longitude__isnull=False
-            ).first()
-            
-            if other_clinics:
-                distance = self.calculate_distance(
-                    avg_lat, avg_lng,
-                    float(other_clinics.latitude), float(other_clinics.longitude)
-                )
-                
-                if distance <= radius_km:
-                    nearby_districts.append(other_district)
-        
-        return nearby_districts
+        return [district] + [name for name in neighbors if name != district]
 
 
 class LocationUtils:
@@ -302,17 +361,10 @@ class LocationUtils:
     
     @staticmethod
     def get_district_center_coordinates() -> Dict[str, Tuple[float, float]]:
-        """주요 지역구 중심 좌표"""
-        return {
-            '강남구': (37.5173, 127.0473),
-            '서초구': (37.4837, 127.0324),
-            '송파구': (37.5145, 127.1059),
-            '강서구': (37.5509, 126.8495),
-            '마포구': (37.5663, 126.9019),
-            '종로구': (37.5735, 126.9788),
-            '중구': (37.5641, 126.9979),
-            '용산구': (37.5384, 126.9654),
-        }
+        """지역구 중심 좌표"""
+        districts = District.objects.values_list('name', 'latitude', 'longitude')
+        centers = {name: (float(lat), float(lng)) for name, lat, lng in districts}
+        return centers or dict(SEOUL_DISTRICT_CENTROIDS)
 
 
 # 전역 서비스 인스턴스
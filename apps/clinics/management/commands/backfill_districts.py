@@ -0,0 +1,56 @@
+"""
+Django 관리 명령어로 좌표 기반 지역구 일괄 채우기
+"""
+from django.core.management.base import BaseCommand
+import time
+
+from apps.clinics.districts import DistrictResolver, backfill_clinic_districts, get_district_resolver
+
+
+class Command(BaseCommand):
+    help = '좌표만 있고 지역구가 비어 있는 치과의 지역구를 오프라인 경계 데이터로 채웁니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--overwrite',
+            action='store_true',
+            help='지역구가 이미 있는 치과도 다시 판별합니다'
+        )
+        parser.add_argument(
+            '--boundary-file',
+            type=str,
+            default=None,
+            help='사용할 지역구 경계 GeoJSON 파일 (기본값: settings.DISTRICT_BOUNDARY_FILE)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 갱신할 행 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        if options['boundary_file']:
+            resolver = DistrictResolver.from_file(options['boundary_file'])
+        else:
+            resolver = get_district_resolver()
+
+        if not resolver.districts:
+            self.stdout.write(
+                self.style.ERROR('경계 데이터가 없습니다. 중심 좌표 근사 결과는 저장하지 않으므로 --boundary-file을 지정하세요')
+            )
+            return
+
+        start = time.perf_counter()
+        updated, unresolved = backfill_clinic_districts(
+            overwrite=options['overwrite'],
+            batch_size=options['batch_size'],
+            resolver=resolver
+        )
+        elapsed = time.perf_counter() - start
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'지역구 갱신 완료: {updated}개 (판별 실패 {unresolved}개, {elapsed:.2f}초)'
+            )
+        )
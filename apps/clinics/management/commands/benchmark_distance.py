@@ -0,0 +1,79 @@
+"""
+Django 관리 명령어로 거리 계산 성능 비교
+"""
+from django.core.management.base import BaseCommand
+from geopy.distance import geodesic
+import random
+import time
+
+from apps.clinics.distance import batch_distances, to_coordinate_array, METHOD_HAVERSINE, METHOD_FLAT
+
+
+class Command(BaseCommand):
+    help = 'geopy geodesic 반복 계산과 NumPy 일괄 거리 계산의 성능을 비교합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--points',
+            type=int,
+            default=10000,
+            help='비교에 사용할 좌표 수 (기본값: 10000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='반복 횟수 (기본값: 5)'
+        )
+
+    def handle(self, *args, **options):
+        points = options['points']
+        repeat = options['repeat']
+
+        # 서울 시청 기준 약 ±15km 범위의 임의 좌표
+        center = (37.5665, 126.9780)
+        rng = random.Random(42)
+        coords = [
+            (center[0] + rng.uniform(-0.15, 0.15), center[1] + rng.uniform(-0.15, 0.15))
+            for _ in range(points)
+        ]
+        array = to_coordinate_array(coords)
+
+        self.stdout.write(f"📏 좌표 {points}개, {repeat}회 반복")
+
+        geodesic_time = self._measure(
+            lambda: [geodesic(center, point).kilometers for point in coords], repeat
+        )
+        haversine_time = self._measure(
+            lambda: batch_distances(center[0], center[1], array, method=METHOD_HAVERSINE), repeat
+        )
+        flat_time = self._measure(
+            lambda: batch_distances(center[0], center[1], array, method=METHOD_FLAT), repeat
+        )
+
+        # 정확도 비교 (geodesic 대비 최대 오차)
+        reference = [geodesic(center, point).kilometers for point in coords]
+        haversine = batch_distances(center[0], center[1], array, method=METHOD_HAVERSINE)
+        flat = batch_distances(center[0], center[1], array, method=METHOD_FLAT)
+        haversine_error = max(abs(a - b) for a, b in zip(reference, haversine.tolist()))
+        flat_error = max(abs(a - b) for a, b in zip(reference, flat.tolist()))
+
+        self.stdout.write(f"- geodesic 반복: {geodesic_time * 1000:.2f}ms")
+        self.stdout.write(
+            f"- NumPy 하버사인: {haversine_time * 1000:.2f}ms "
+            f"(x{geodesic_time / haversine_time:.0f}, 최대 오차 {haversine_error * 1000:.1f}m)"
+        )
+        self.stdout.write(
+            f"- NumPy 평면 근사: {flat_time * 1000:.2f}ms "
+            f"(x{geodesic_time / flat_time:.0f}, 최대 오차 {flat_error * 1000:.1f}m)"
+        )
+        self.stdout.write(self.style.SUCCESS('✅ 거리 계산 벤치마크 완료'))
+
+    def _measure(self, func, repeat):
+        """최소 실행 시간 측정 (초)"""
+        best = float('inf')
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - started)
+        return best
@@ -7,6 +7,7 @@ from decimal import Decimal
 import random
 from datetime import timedelta
 
+from apps.clinics.ingest import bulk_ingest
 from apps.clinics.models import Clinic
 from apps.reviews.models import Review
 from apps.analysis.models import SentimentAnalysis, PriceData
@@ -39,15 +40,17 @@ class Command(BaseCommand):
             Clinic.objects.all().delete()
             self.stdout.write("✅ 기존 데이터 삭제 완료")
 
-        # 실제 치과 데이터 생성
-        self.create_real_clinics()
-        
-        # 추가 치과 데이터 생성
-        clinic_count = options['clinics']
-        self.create_additional_clinics(clinic_count)
-        
-        # 리뷰 및 분석 데이터 생성
-        self.create_reviews_and_analysis()
+        # 검색 벡터/치과 통계/감성 분석 요약은 생성이 끝난 뒤 일괄 갱신
+        with bulk_ingest():
+            # 실제 치과 데이터 생성
+            self.create_real_clinics()
+            
+            # 추가 치과 데이터 생성
+            clinic_count = options['clinics']
+            self.create_additional_clinics(clinic_count)
+            
+            # 리뷰 및 분석 데이터 생성
+            self.create_reviews_and_analysis()
         
         self.stdout.write(
             self.style.SUCCESS(
@@ -252,13 +255,5 @@ class Command(BaseCommand):
                 )
                 
                 total_reviews += 1
-            
-            # 치과 통계 업데이트
-            reviews = Review.objects.filter(clinic=clinic)
-            clinic.total_reviews = reviews.count()
-            clinic.average_rating = Decimal(str(round(
-                sum(r.original_rating for r in reviews) / reviews.count(), 2
-            )))
-            clinic.save()
         
         self.stdout.write(f"✅ {total_reviews}개 리뷰 및 분석 데이터 생성 완료")
\ No newline at end of file
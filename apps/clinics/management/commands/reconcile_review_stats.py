@@ -0,0 +1,27 @@
+"""
+Django 관리 명령어로 치과 리뷰 통계 보정
+"""
+from django.core.management.base import BaseCommand
+import time
+
+from apps.clinics.models import Clinic
+
+
+class Command(BaseCommand):
+    help = '증분 갱신된 치과 리뷰 통계(리뷰 수, 평점 합계, 평균 평점)를 실제 리뷰 집계와 맞춥니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 읽고 갱신할 행 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        corrected = Clinic.reconcile_review_stats(batch_size=options['batch_size'])
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(f'치과 리뷰 통계 보정 완료: {corrected}개 ({elapsed:.2f}초)')
+        )
@@ -0,0 +1,23 @@
+"""
+Django 관리 명령어로 지역구 요약 테이블 갱신
+"""
+from django.core.management.base import BaseCommand
+
+from apps.clinics.districts import refresh_district_table
+
+
+class Command(BaseCommand):
+    help = '치과 데이터로 지역구 중심 좌표/치과 수/인근 지역구 목록을 다시 계산합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--radii',
+            type=float,
+            nargs='+',
+            default=None,
+            help='인근 지역구를 계산할 반경 목록 km (기본값: settings.DISTRICT_NEIGHBOR_RADII_KM)'
+        )
+
+    def handle(self, *args, **options):
+        count = refresh_district_table(radii=options['radii'])
+        self.stdout.write(self.style.SUCCESS(f'지역구 요약 테이블 갱신 완료: {count}개'))
@@ -0,0 +1,47 @@
+"""
+Django 관리 명령어로 치과/리뷰 검색 벡터 일괄 갱신
+"""
+from django.core.management.base import BaseCommand
+import time
+
+from apps.clinics.models import Clinic
+from apps.clinics.search_index import REFRESH_BATCH_SIZE
+from apps.reviews.models import Review
+
+
+class Command(BaseCommand):
+    help = '오래된 치과/리뷰 검색 벡터를 pk 구간별 UPDATE로 일괄 갱신합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--target',
+            choices=['all', 'clinics', 'reviews'],
+            default='all',
+            help='갱신 대상 (기본값: all)'
+        )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='오래되지 않은 행도 모두 다시 색인합니다'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=REFRESH_BATCH_SIZE,
+            help=f'UPDATE 한 번에 처리할 pk 구간 크기 (기본값: {REFRESH_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        models = {'clinics': Clinic, 'reviews': Review}
+        targets = list(models) if options['target'] == 'all' else [options['target']]
+
+        for target in targets:
+            start = time.perf_counter()
+            updated = models[target].refresh_search_vectors(
+                full=options['full'],
+                batch_size=options['batch_size']
+            )
+            elapsed = time.perf_counter() - start
+            self.stdout.write(
+                self.style.SUCCESS(f'{target} 검색 벡터 갱신 완료: {updated}개 ({elapsed:.2f}초)')
+            )
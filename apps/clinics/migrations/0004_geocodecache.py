@@ -0,0 +1,82 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0002_clinic_business_hours_clinic_description_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GeocodeCache",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("forward", "주소 → 좌표"),
+                            ("reverse", "좌표 → 주소"),
+                        ],
+                        max_length=10,
+                        verbose_name="조회 종류",
+                    ),
+                ),
+                ("query_key", models.CharField(max_length=500, verbose_name="조회 키")),
+                ("found", models.BooleanField(default=True, verbose_name="결과 있음")),
+                (
+                    "latitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=6,
+                        max_digits=9,
+                        null=True,
+                        verbose_name="위도",
+                    ),
+                ),
+                (
+                    "longitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=6,
+                        max_digits=9,
+                        null=True,
+                        verbose_name="경도",
+                    ),
+                ),
+                ("address", models.TextField(blank=True, verbose_name="주소")),
+                ("hit_count", models.IntegerField(default=0, verbose_name="조회 수")),
+                ("expires_at", models.DateTimeField(verbose_name="만료일")),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "지오코딩 캐시",
+                "verbose_name_plural": "지오코딩 캐시들",
+                "db_table": "clinics_geocode_cache",
+                "indexes": [
+                    models.Index(
+                        fields=["expires_at"], name="clinics_geo_expires_24f252_idx"
+                    )
+                ],
+                "unique_together": {("kind", "query_key")},
+            },
+        ),
+    ]
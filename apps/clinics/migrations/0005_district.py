@@ -0,0 +1,105 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0004_geocodecache"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="District",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=50, unique=True, verbose_name="지역구명"
+                    ),
+                ),
+                (
+                    "latitude",
+                    models.DecimalField(
+                        decimal_places=6, max_digits=9, verbose_name="중심 위도"
+                    ),
+                ),
+                (
+                    "longitude",
+                    models.DecimalField(
+                        decimal_places=6, max_digits=9, verbose_name="중심 경도"
+                    ),
+                ),
+                (
+                    "min_latitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=6,
+                        max_digits=9,
+                        null=True,
+                        verbose_name="최소 위도",
+                    ),
+                ),
+                (
+                    "max_latitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=6,
+                        max_digits=9,
+                        null=True,
+                        verbose_name="최대 위도",
+                    ),
+                ),
+                (
+                    "min_longitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=6,
+                        max_digits=9,
+                        null=True,
+                        verbose_name="최소 경도",
+                    ),
+                ),
+                (
+                    "max_longitude",
+                    models.DecimalField(
+                        blank=True,
+                        decimal_places=6,
+                        max_digits=9,
+                        null=True,
+                        verbose_name="최대 경도",
+                    ),
+                ),
+                (
+                    "clinic_count",
+                    models.IntegerField(default=0, verbose_name="치과 수"),
+                ),
+                (
+                    "neighbors",
+                    models.JSONField(
+                        blank=True, default=dict, verbose_name="인근 지역구"
+                    ),
+                ),
+                (
+                    "refreshed_at",
+                    models.DateTimeField(auto_now=True, verbose_name="갱신일"),
+                ),
+            ],
+            options={
+                "verbose_name": "지역구",
+                "verbose_name_plural": "지역구들",
+                "db_table": "clinics_district",
+                "ordering": ["name"],
+            },
+        ),
+    ]
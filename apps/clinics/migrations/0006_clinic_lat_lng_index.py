@@ -0,0 +1,19 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0005_district"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="clinic",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="clinics_cli_latitud_edfefe_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:20
+
+from django.db import migrations
+
+
+def refresh_search_vectors(apps, schema_editor):
+    from apps.clinics.models import clinic_search_vector
+
+    Clinic = apps.get_model("clinics", "Clinic")
+    Clinic.objects.update(search_vector=clinic_search_vector())
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm이 없는 환경에서는 건너뛰고 부분 일치 검색만 사용
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS clinics_clinic_name_trgm_idx "
+            "ON clinics_clinic USING gin (name gin_trgm_ops)"
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute("DROP INDEX IF EXISTS clinics_clinic_name_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0006_clinic_lat_lng_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_search_vectors, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
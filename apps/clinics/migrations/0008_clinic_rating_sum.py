@@ -0,0 +1,68 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:22
+
+from django.db import migrations, models
+
+
+def populate_rating_stats(apps, schema_editor):
+    from decimal import ROUND_HALF_UP, Decimal
+
+    from django.db.models import Count, Sum
+
+    Clinic = apps.get_model("clinics", "Clinic")
+    Review = apps.get_model("reviews", "Review")
+
+    rows = (
+        Review.objects.filter(is_processed=True, is_duplicate=False)
+        .values("clinic_id")
+        .annotate(
+            total=Count("id"),
+            rating_sum=Sum("original_rating"),
+            rating_count=Count("original_rating"),
+        )
+        .order_by()
+    )
+
+    batch = []
+    for row in rows:
+        rating_sum = row["rating_sum"] or 0
+        average = None
+        if row["rating_count"]:
+            average = (Decimal(rating_sum) / row["rating_count"]).quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+        batch.append(
+            Clinic(
+                id=row["clinic_id"],
+                total_reviews=row["total"],
+                rating_sum=rating_sum,
+                rating_count=row["rating_count"],
+                average_rating=average,
+            )
+        )
+    Clinic.objects.bulk_update(
+        batch,
+        ["total_reviews", "rating_sum", "rating_count", "average_rating"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0007_clinic_search_vector_fields"),
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clinic",
+            name="rating_count",
+            field=models.IntegerField(default=0, verbose_name="평점 있는 리뷰 수"),
+        ),
+        migrations.AddField(
+            model_name="clinic",
+            name="rating_sum",
+            field=models.IntegerField(default=0, verbose_name="평점 합계"),
+        ),
+        migrations.RunPython(populate_rating_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:10
+
+from django.db import migrations, models
+
+
+def create_version_row(apps, schema_editor):
+    ClinicDataVersion = apps.get_model("clinics", "ClinicDataVersion")
+    ClinicDataVersion.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0009_clinic_search_indexed_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClinicDataVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("version", models.BigIntegerField(default=0, verbose_name="버전")),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+            ],
+            options={
+                "verbose_name": "치과 데이터 버전",
+                "verbose_name_plural": "치과 데이터 버전",
+                "db_table": "clinics_data_version",
+            },
+        ),
+        migrations.RunPython(create_version_row, migrations.RunPython.noop),
+    ]
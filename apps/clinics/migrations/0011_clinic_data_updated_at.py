@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-17 14:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0010_clinicdataversion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="clinic",
+            name="data_updated_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="응답 데이터 수정일"
+            ),
+        ),
+    ]
@@ -1,9 +1,35 @@
+from decimal import Decimal, ROUND_HALF_UP
+
 from django.db import models
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import Cast, NullIf
 from django.contrib.postgres.search import SearchVectorField, SearchVector
 from django.contrib.postgres.indexes import GinIndex
-from django.db.models.signals import post_save
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
+from .conditional import invalidate_clinic_versions, mark_clinics_changed
+from .ingest import current_batch
+from .search_index import REFRESH_BATCH_SIZE, refresh_search_vectors, search_vector_updates
+from .versioning import bump_clinic_ranking_version, bump_clinic_version
+
+# 변경 시 프로세스 로컬 인덱스(공간 스냅샷, 자동완성)를 다시 만들어야 하는 필드
+INDEXED_FIELDS = {'latitude', 'longitude', 'name', 'district'}
+
+# 전문 검색 설정 (한국어는 형태소 분석 없이 공백 단위 토큰 사용)
+SEARCH_CONFIG = 'simple'
+
+
+def clinic_search_vector():
+    """치과 검색 벡터 식 (이름 > 전문분야 > 지역구/주소 > 설명 순 가중치)"""
+    return (
+        SearchVector('name', weight='A', config=SEARCH_CONFIG) +
+        SearchVector('specialties', weight='B', config=SEARCH_CONFIG) +
+        SearchVector('district', weight='C', config=SEARCH_CONFIG) +
+        SearchVector('address', weight='C', config=SEARCH_CONFIG) +
+        SearchVector('description', weight='D', config=SEARCH_CONFIG)
+    )
+
 
 class Clinic(models.Model):
     """
@@ -24,6 +50,8 @@ class Clinic(models.Model):
     # 통계 정보
     total_reviews = models.IntegerField(default=0, verbose_name='총 리뷰 수')
     average_rating = models.DecimalField(max_digits=3, decimal_places=2, null=True, blank=True, verbose_name='평균 평점')
+    rating_sum = models.IntegerField(default=0, verbose_name='평점 합계')
+    rating_count = models.IntegerField(default=0, verbose_name='평점 있는 리뷰 수')
     
     # 검증 상태
     is_verified = models.BooleanField(default=False, verbose_name='검증됨')
@@ -41,6 +69,10 @@ class Clinic(models.Model):
     
     # 검색을 위한 벡터 필드
     search_vector = SearchVectorField(null=True, blank=True)
+    search_indexed_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name='검색 색인일')
+    
+    # 상세/분석 응답에 쓰이는 데이터(치과, 리뷰, 가격, 감성 요약) 변경 시각 (조건부 GET용)
+    data_updated_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name='응답 데이터 수정일')
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
@@ -53,37 +85,281 @@ class Clinic(models.Model):
             GinIndex(fields=['search_vector']),
             models.Index(fields=['district']),
             models.Index(fields=['total_reviews']),
+            models.Index(fields=['latitude', 'longitude']),
         ]
     
     def __str__(self):
         return f"{self.name} ({self.district})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 로드 시점의 인덱스 대상 필드 값 보관 (저장 시 버전 증가 여부 판단용)
+        if INDEXED_FIELDS <= set(field_names):
+            instance._indexed_state = instance.indexed_state()
+        return instance
+    
+    def indexed_state(self):
+        """프로세스 로컬 인덱스에 쓰이는 필드 값 (좌표/이름/지역구)"""
+        return tuple(getattr(self, field) for field in sorted(INDEXED_FIELDS))
+    
     def update_search_vector(self):
-        """검색 벡터 업데이트"""
-        self.search_vector = SearchVector('name', weight='A') + \
-                           SearchVector('address', weight='B') + \
-                           SearchVector('district', weight='C')
-        self.save(update_fields=['search_vector'])
+        """검색 벡터 업데이트 (대량 적재 중이면 종료 시 일괄 갱신)"""
+        batch = current_batch()
+        if batch is not None:
+            batch.clinic_vector_ids.add(self.pk)
+            return
+        updates = search_vector_updates(clinic_search_vector())
+        Clinic.objects.filter(pk=self.pk).update(**updates)
+        self.search_vector = updates['search_vector']
+        self.search_indexed_at = updates['search_indexed_at']
+    
+    @classmethod
+    def refresh_search_vectors(cls, full=False, batch_size=REFRESH_BATCH_SIZE):
+        """
+        오래된 검색 벡터 일괄 갱신 (pk 구간별 UPDATE)
+        
+        Args:
+            full: True면 전체 재색인
+            batch_size: pk 구간 크기
+            
+        Returns:
+            갱신된 치과 수
+        """
+        return refresh_search_vectors(cls.objects.all(), clinic_search_vector(), full, batch_size)
 
     def update_review_stats(self):
-        """리뷰 통계 업데이트"""
+        """리뷰 통계 전체 재계산 (처리 완료 + 중복 아님 리뷰 기준)"""
+        from apps.reviews.models import Review
+        stats = Review.objects.filter(
+            clinic=self, is_processed=True, is_duplicate=False
+        ).aggregate(
+            total=Count('id'),
+            rating_sum=Sum('original_rating'),
+            rating_count=Count('original_rating')
+        )
+        
+        if self.total_reviews != stats['total']:
+            bump_clinic_ranking_version()
+        self.total_reviews = stats['total']
+        self.rating_sum = stats['rating_sum'] or 0
+        self.rating_count = stats['rating_count']
+        self.average_rating = self.calculate_average_rating(self.rating_sum, self.rating_count)
+        
+        self.save(update_fields=['total_reviews', 'rating_sum', 'rating_count', 'average_rating'])
+    
+    @staticmethod
+    def calculate_average_rating(rating_sum, rating_count):
+        """평점 합계/개수로 평균 평점 계산 (소수 둘째 자리 반올림)"""
+        if not rating_count:
+            return None
+        return (Decimal(rating_sum) / rating_count).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    
+    @classmethod
+    def apply_review_delta(cls, clinic_id, count=0, rating_sum=0, rating_count=0):
+        """
+        리뷰 상태 변화분을 치과 통계에 원자적으로 반영 (재집계 없이 UPDATE 1회)
+        
+        Args:
+            clinic_id: 치과 id
+            count: 통계 대상 리뷰 수 변화량
+            rating_sum: 평점 합계 변화량
+            rating_count: 평점 있는 리뷰 수 변화량
+        """
+        if not (count or rating_sum or rating_count):
+            return
+        
+        decimal = DecimalField(max_digits=14, decimal_places=4)
+        new_sum = F('rating_sum') + rating_sum
+        new_count = F('rating_count') + rating_count
+        cls.objects.filter(pk=clinic_id).update(
+            total_reviews=F('total_reviews') + count,
+            rating_sum=new_sum,
+            rating_count=new_count,
+            # UPDATE 식 안의 컬럼은 갱신 전 값이므로 변화량을 더한 값으로 평균 계산
+            average_rating=Cast(new_sum, decimal) / NullIf(Cast(new_count, decimal), 0)
+        )
+        invalidate_clinic_versions([clinic_id])
+        if count:
+            bump_clinic_ranking_version()
+    
+    @classmethod
+    def reconcile_review_stats(cls, clinic_ids=None, batch_size=1000):
+        """
+        증분 갱신된 리뷰 통계를 실제 리뷰 집계와 비교해 어긋난 치과만 보정
+        
+        Args:
+            clinic_ids: 보정할 치과 id 목록 (None이면 전체)
+            batch_size: 한 번에 읽고 갱신할 행 수
+            
+        Returns:
+            보정된 치과 수
+        """
         from apps.reviews.models import Review
-        reviews = Review.objects.filter(clinic=self, is_processed=True, is_duplicate=False)
+        reviews = Review.objects.filter(is_processed=True, is_duplicate=False)
+        clinics = cls.objects.all()
+        if clinic_ids is not None:
+            reviews = reviews.filter(clinic_id__in=clinic_ids)
+            clinics = clinics.filter(pk__in=clinic_ids)
         
-        self.total_reviews = reviews.count()
-        if self.total_reviews > 0:
-            # 평균 평점 계산 (원본 평점이 있는 경우만)
-            rated_reviews = reviews.filter(original_rating__isnull=False)
-            if rated_reviews.exists():
-                self.average_rating = rated_reviews.aggregate(
-                    avg_rating=models.Avg('original_rating')
-                )['avg_rating']
+        rows = reviews.values('clinic_id').annotate(
+            total=Count('id'),
+            rating_sum=Sum('original_rating'),
+            rating_count=Count('original_rating')
+        ).order_by()
+        actual = {
+            row['clinic_id']: (row['total'], row['rating_sum'] or 0, row['rating_count'])
+            for row in rows
+        }
         
-        self.save(update_fields=['total_reviews', 'average_rating'])
+        fields = ['total_reviews', 'rating_sum', 'rating_count', 'average_rating']
+        clinics = clinics.only('id', *fields).order_by('id')
+        drifted = []
+        ranking_changed = False
+        for clinic in clinics.iterator(chunk_size=batch_size):
+            total, rating_sum, rating_count = actual.get(clinic.id, (0, 0, 0))
+            average = cls.calculate_average_rating(rating_sum, rating_count)
+            if (clinic.total_reviews, clinic.rating_sum, clinic.rating_count, clinic.average_rating) == \
+                    (total, rating_sum, rating_count, average):
+                continue
+            ranking_changed = ranking_changed or clinic.total_reviews != total
+            clinic.total_reviews = total
+            clinic.rating_sum = rating_sum
+            clinic.rating_count = rating_count
+            clinic.average_rating = average
+            drifted.append(clinic)
+        
+        cls.objects.bulk_update(drifted, fields, batch_size=batch_size)
+        invalidate_clinic_versions(clinic.id for clinic in drifted)
+        if ranking_changed:
+            bump_clinic_ranking_version()
+        return len(drifted)
+
 
+class District(models.Model):
+    """
+    지역구 요약 모델 (치과 데이터로부터 주기적으로 재계산)
+    """
+    name = models.CharField(max_length=50, unique=True, verbose_name='지역구명')
+    
+    # 중심 좌표 (치과 좌표 평균, 치과가 없으면 지명 사전 좌표)
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, verbose_name='중심 위도')
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, verbose_name='중심 경도')
+    
+    # 치과 좌표 경계 상자
+    min_latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True, verbose_name='최소 위도')
+    max_latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True, verbose_name='최대 위도')
+    min_longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True, verbose_name='최소 경도')
+    max_longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True, verbose_name='최대 경도')
+    
+    clinic_count = models.IntegerField(default=0, verbose_name='치과 수')
+    
+    # 반경별 인근 지역구 목록 ({"10": ["서초구", ...]}, 거리순)
+    neighbors = models.JSONField(default=dict, blank=True, verbose_name='인근 지역구')
+    
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name='갱신일')
+    
+    class Meta:
+        db_table = 'clinics_district'
+        verbose_name = '지역구'
+        verbose_name_plural = '지역구들'
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+    
+    @property
+    def center(self):
+        return (float(self.latitude), float(self.longitude))
+
+
+class ClinicDataVersion(models.Model):
+    """
+    치과 데이터 버전 (단일 행)
+    
+    공간 스냅샷/클러스터/자동완성 같은 프로세스 로컬 인덱스의 재생성 기준.
+    평소에는 캐시의 값을 읽고 이 행은 캐시가 비었을 때만 읽는다. 치과 변경이 커밋된 뒤 증가한다.
+    """
+    SINGLETON_ID = 1
+    # 리뷰 수 등 순위용 값의 버전 행
+    RANKING_ID = 2
+    
+    version = models.BigIntegerField(default=0, verbose_name='버전')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    
+    class Meta:
+        db_table = 'clinics_data_version'
+        verbose_name = '치과 데이터 버전'
+        verbose_name_plural = '치과 데이터 버전'
+    
+    def __str__(self):
+        return f"치과 데이터 버전 {self.version}"
+
+
+class GeocodeCache(models.Model):
+    """
+    지오코딩 결과 캐시 모델
+    """
+    KIND_CHOICES = [
+        ('forward', '주소 → 좌표'),
+        ('reverse', '좌표 → 주소'),
+    ]
+    
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name='조회 종류')
+    query_key = models.CharField(max_length=500, verbose_name='조회 키')  # 정규화된 주소 또는 반올림 좌표
+    
+    # 조회 결과
+    found = models.BooleanField(default=True, verbose_name='결과 있음')
+    latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True, verbose_name='위도')
+    longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True, verbose_name='경도')
+    address = models.TextField(blank=True, verbose_name='주소')
+    
+    # 사용 통계
+    hit_count = models.IntegerField(default=0, verbose_name='조회 수')
+    
+    expires_at = models.DateTimeField(verbose_name='만료일')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+    
+    class Meta:
+        db_table = 'clinics_geocode_cache'
+        verbose_name = '지오코딩 캐시'
+        verbose_name_plural = '지오코딩 캐시들'
+        unique_together = ['kind', 'query_key']
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_kind_display()}: {self.query_key}"
 
 @receiver(post_save, sender=Clinic)
 def update_clinic_search_vector(sender, instance, created, **kwargs):
     """치과 저장 시 검색 벡터 자동 업데이트"""
     if created or not instance.search_vector:
-        instance.update_search_vector()
\ No newline at end of file
+        instance.update_search_vector()
+
+
+@receiver([post_save, post_delete], sender=Clinic)
+def bump_clinic_data_version(sender, instance, **kwargs):
+    """치과 좌표/이름/지역구 변경 시 데이터 버전 증가 (값이 그대로인 전체 저장은 무시)"""
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None and not INDEXED_FIELDS & set(update_fields):
+        return
+    if kwargs['signal'] is post_save:
+        state = instance.indexed_state()
+        unchanged = not kwargs['created'] and getattr(instance, '_indexed_state', None) == state
+        instance._indexed_state = state
+        if unchanged:
+            return
+    batch = current_batch()
+    if batch is not None:
+        batch.clinic_version_changed = True
+        return
+    bump_clinic_version()
+
+
+@receiver([post_save, post_delete], sender=Clinic)
+def invalidate_clinic_response_version(sender, instance, **kwargs):
+    """치과 저장/삭제 시 조건부 GET 버전 토큰 삭제"""
+    mark_clinics_changed([instance.pk])
@@ -0,0 +1,198 @@
+"""
+커서 기반 페이지네이션 유틸리티
+"""
+import base64
+import datetime
+import decimal
+import json
+from typing import Dict, List, Optional, Sequence
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+
+
+class InvalidCursor(ValueError):
+    """잘못된 커서 토큰"""
+
+
+def encode_cursor(values: Sequence) -> str:
+    """
+    정렬 키 값 목록을 불투명한 커서 토큰으로 인코딩
+    """
+    raw = json.dumps(list(values), separators=(',', ':'), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: Optional[str], length: int) -> Optional[list]:
+    """
+    커서 토큰을 정렬 키 값 목록으로 디코딩
+
+    Args:
+        token: 커서 토큰 (없으면 None 반환)
+        length: 기대하는 값 개수
+
+    Raises:
+        InvalidCursor: 토큰 형식이 올바르지 않은 경우
+    """
+    if not token:
+        return None
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError) as e:
+        raise InvalidCursor(f"잘못된 커서입니다: {token}") from e
+
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursor(f"잘못된 커서입니다: {token}")
+    return values
+
+
+def keyset_filter(fields: Sequence[str], values: Sequence) -> Q:
+    """
+    정렬 키가 커서 값보다 뒤에 오는 행을 고르는 조건
+
+    (a, b, c) > (1, 2, 3) 형태의 사전식 비교를 Q 조합으로 만든다.
+    '-'로 시작하는 필드는 내림차순으로 비교한다.
+
+    Args:
+        fields: order_by에 사용한 필드 목록 (예: ['latitude', 'longitude', 'id'])
+        values: 마지막 행의 정렬 키 값
+    """
+    condition = None
+    for field, value in reversed(list(zip(fields, values))):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        after = Q(**{f"{name}__{lookup}": value})
+        condition = after if condition is None else after | (Q(**{name: value}) & condition)
+    return condition or Q()
+
+
+def cursor_value(value):
+    """정렬 키 값을 JSON으로 인코딩 가능한 값으로 변환"""
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+def estimate_count(queryset: QuerySet) -> int:
+    """
+    쿼리 플래너의 예상 행 수 (COUNT 없이 근사치)
+    """
+    sql, params = queryset.query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+class KeysetPagination(BasePagination):
+    """
+    정렬 키 기반 커서 페이지네이션
+
+    쿼리셋의 order_by 필드(+ id)를 정렬 키로 사용하므로 OFFSET 없이 어느 페이지든
+    첫 페이지와 같은 비용으로 조회한다. 정렬 필드는 NULL이 없어야 한다.
+    전체 개수는 count=exact(정확) 또는 count=estimate(플래너 추정)일 때만 계산한다.
+
+    응답: {count, next_cursor, has_more, page_size, results} (count는 요청하지 않으면 null)
+
+    page_query_param을 지정하면 커서 없이 그 파라미터(?page=N)로 온 요청은 기존
+    페이지 번호(OFFSET) 방식으로 응답한다: {count, next, previous, next_cursor, results}.
+    next_cursor로 다음 페이지부터 커서 방식으로 이어서 조회할 수 있다.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    count_query_param = 'count'
+    page_query_param = None
+    tiebreaker = 'id'
+
+    def get_ordering(self, queryset: QuerySet) -> List[str]:
+        ordering = [str(field) for field in queryset.query.order_by]
+        if not any(field.lstrip('-') in (self.tiebreaker, 'pk') for field in ordering):
+            ordering.append(self.tiebreaker)
+        return ordering
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            page_size = self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.ordering = self.get_ordering(queryset)
+        self.page_size_value = self.get_page_size(request)
+        self.page_paginator = None
+
+        queryset = queryset.order_by(*self.ordering)
+        if self.page_query_param and self.page_query_param in request.query_params \
+                and not request.query_params.get(self.cursor_query_param):
+            return self.paginate_by_page_number(queryset, request, view)
+
+        self.count = self.get_count(queryset, request)
+        try:
+            after = decode_cursor(request.query_params.get(self.cursor_query_param), len(self.ordering))
+            if after:
+                queryset = queryset.filter(keyset_filter(self.ordering, after))
+            rows = list(queryset[:self.page_size_value + 1])
+        except (InvalidCursor, DjangoValidationError, TypeError, ValueError):
+            raise ValidationError({self.cursor_query_param: '잘못된 커서입니다.'})
+
+        self.has_more = len(rows) > self.page_size_value
+        rows = rows[:self.page_size_value]
+        self.next_cursor = self.cursor_for(rows[-1]) if self.has_more else None
+        return rows
+
+    def paginate_by_page_number(self, queryset: QuerySet, request, view=None) -> list:
+        """페이지 번호(OFFSET) 방식 조회 (잘못된 페이지는 PageNumberPagination과 같이 404)"""
+        paginator = PageNumberPagination()
+        paginator.page_size = self.page_size_value
+        paginator.page_query_param = self.page_query_param
+        rows = paginator.paginate_queryset(queryset, request, view)
+        self.page_paginator = paginator
+        self.count = paginator.page.paginator.count
+        self.has_more = paginator.page.has_next()
+        self.next_cursor = self.cursor_for(rows[-1]) if rows and self.has_more else None
+        return rows
+
+    def cursor_for(self, row) -> str:
+        """행 다음부터 조회하는 커서"""
+        return encode_cursor([cursor_value(getattr(row, field.lstrip('-'))) for field in self.ordering])
+
+    def get_count(self, queryset: QuerySet, request) -> Optional[int]:
+        mode = request.query_params.get(self.count_query_param, '')
+        if mode == 'exact':
+            return queryset.count()
+        if mode == 'estimate':
+            return estimate_count(queryset)
+        return None
+
+    def get_page_metadata(self) -> Dict:
+        """함수형 뷰 응답에 포함할 페이지 정보"""
+        return {
+            'count': self.count,
+            'next_cursor': self.next_cursor,
+            'has_more': self.has_more,
+            'page_size': self.page_size_value,
+        }
+
+    def get_paginated_response(self, data):
+        if self.page_paginator is not None:
+            paginator = self.page_paginator
+            return Response({
+                'count': self.count,
+                'next': paginator.get_next_link(),
+                'previous': paginator.get_previous_link(),
+                'next_cursor': self.next_cursor,
+                'results': data,
+            })
+        return Response({**self.get_page_metadata(), 'results': data})
@@ -0,0 +1,107 @@
+"""
+치과 전문 검색 모듈
+
+search_vector(GIN 인덱스)에 접두어 tsquery로 검색하고 SearchRank로 정렬한다.
+결과가 없으면 한국어 부분 단어(예: "임플" → "강남임플란트치과")를 위해
+치과명 부분 일치 + 트라이그램 유사도로 다시 찾는다. 두 조건 모두 치과명
+gin_trgm_ops 인덱스(clinics_clinic_name_trgm_idx)를 사용하는 연산자(LIKE, %>)로 거르고,
+유사도 순위는 걸러진 행에만 계산한다.
+"""
+import logging
+import re
+from typing import Optional
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F, FloatField, Q, QuerySet, Value
+from django.db.models.functions import Cast
+
+from .models import SEARCH_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 검색어 토큰 (tsquery 특수문자 제외)
+TOKEN_PATTERN = re.compile(r'\w+')
+
+_trigram_available: Optional[bool] = None
+
+
+def build_search_query(query: str) -> Optional[SearchQuery]:
+    """
+    검색어를 접두어 일치 tsquery로 변환 ("강남 임플" → '강남:* & 임플:*')
+
+    Returns:
+        SearchQuery 또는 None (검색 가능한 토큰이 없는 경우)
+    """
+    tokens = TOKEN_PATTERN.findall(query or '')
+    if not tokens:
+        return None
+    raw = ' & '.join(f"{token}:*" for token in tokens)
+    return SearchQuery(raw, search_type='raw', config=SEARCH_CONFIG)
+
+
+def trigram_available() -> bool:
+    """pg_trgm 확장 설치 여부 (프로세스당 한 번 확인)"""
+    global _trigram_available
+    if _trigram_available is None:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            _trigram_available = cursor.fetchone() is not None
+        if not _trigram_available:
+            logger.warning("pg_trgm 확장이 없어 부분 일치 검색만 사용합니다")
+    return _trigram_available
+
+
+def full_text_search(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    search_vector 전문 검색 (rank 주석 포함)
+
+    rank는 커서 비교가 정확하도록 배정밀도로 변환한다.
+    """
+    search_query = build_search_query(query)
+    if search_query is None:
+        return queryset.none()
+    return queryset.filter(search_vector=search_query).annotate(
+        rank=Cast(SearchRank(F('search_vector'), search_query), FloatField())
+    )
+
+
+def fuzzy_search(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    치과명 부분 일치/트라이그램 유사도 검색 (rank 주석 포함)
+
+    name LIKE '%검색어%' 또는 검색어 <% name (word_similarity가
+    pg_trgm.word_similarity_threshold 이상)인 치과만 남긴다.
+    """
+    query = (query or '').strip()
+    if not query:
+        return queryset.none()
+
+    if not trigram_available():
+        return queryset.filter(name__icontains=query).annotate(
+            rank=Value(0.0, output_field=FloatField())
+        )
+
+    # 주석 값으로 거르면 인덱스를 쓰지 못하므로 인덱스 연산자로 먼저 거름
+    return queryset.filter(
+        Q(name__contains=query) | Q(name__trigram_word_similar=query)
+    ).annotate(
+        rank=Cast(TrigramWordSimilarity(query, 'name'), FloatField())
+    )
+
+
+def search_clinics(queryset: QuerySet, query: str) -> QuerySet:
+    """
+    치과 검색 (전문 검색 결과가 없으면 부분 일치 검색)
+
+    Args:
+        queryset: 검색 대상 치과 쿼리셋 (지역/치료 필터 적용 후)
+        query: 검색어
+
+    Returns:
+        rank 주석이 붙은 쿼리셋
+    """
+    results = full_text_search(queryset, query)
+    if results.exists():
+        return results
+    return fuzzy_search(queryset, query)
@@ -0,0 +1,67 @@
+"""
+검색 벡터 일괄 갱신
+
+search_vector를 행마다 save()로 갱신하지 않고, pk 구간 단위 UPDATE 한 번으로
+구간 안의 오래된 행을 모두 갱신한다. 갱신 시각은 search_indexed_at에 기록하며,
+updated_at이 그보다 늦은 행(벡터 갱신 후 다시 저장된 행)을 오래된 행으로 본다.
+"""
+import logging
+from typing import Dict
+
+from django.db.models import F, Max, Min, Q, QuerySet
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+# pk 구간 하나의 크기 (UPDATE 한 번에 처리할 최대 행 수)
+REFRESH_BATCH_SIZE = 5000
+
+
+def stale_search_filter() -> Q:
+    """검색 벡터가 없거나 마지막 색인 이후 수정된 행"""
+    return (
+        Q(search_vector__isnull=True) |
+        Q(search_indexed_at__isnull=True) |
+        Q(updated_at__gt=F('search_indexed_at'))
+    )
+
+
+def search_vector_updates(vector) -> Dict:
+    """
+    검색 벡터 UPDATE 값
+
+    색인 시각은 DB의 NOW()(트랜잭션 시작 시각) 대신 현재 시각을 사용해,
+    같은 트랜잭션에서 먼저 저장된 행이 계속 오래된 행으로 남지 않게 한다.
+    """
+    return {'search_vector': vector, 'search_indexed_at': timezone.now()}
+
+
+def refresh_search_vectors(queryset: QuerySet, vector, full: bool = False,
+                           batch_size: int = REFRESH_BATCH_SIZE) -> int:
+    """
+    검색 벡터를 pk 구간별 집합 UPDATE로 갱신
+
+    Args:
+        queryset: 갱신 대상 쿼리셋
+        vector: 컬럼 기반 검색 벡터 식
+        full: True면 오래되지 않은 행도 모두 다시 색인
+        batch_size: pk 구간 크기
+
+    Returns:
+        갱신된 행 수
+    """
+    bounds = queryset.aggregate(low=Min('pk'), high=Max('pk'))
+    if bounds['low'] is None:
+        return 0
+
+    if not full:
+        queryset = queryset.filter(stale_search_filter())
+
+    updated = 0
+    for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+        updated += queryset.filter(
+            pk__gte=start, pk__lt=start + batch_size
+        ).update(**search_vector_updates(vector))
+
+    logger.info(f"{queryset.model._meta.verbose_name} 검색 벡터 갱신: {updated}개")
+    return updated
@@ -1,6 +1,97 @@
+from typing import Dict, Iterable
+
+from django.db.models import Avg, Count, Max
 from rest_framework import serializers
 from .models import Clinic
 
+# 감성 분석 점수 (응답 키 -> ClinicAspectSummary 측면)
+ASPECT_FIELDS = {
+    'price': 'price',
+    'skill': 'skill',
+    'kindness': 'kindness',
+    'waiting': 'waiting_time',
+    'facility': 'facility',
+    'overtreatment': 'overtreatment',
+}
+
+
+def to_aspect_scores(averages: Dict) -> Dict:
+    """-1~1 범위 평균 점수를 1~5 범위로 변환 (값이 없으면 3.0)"""
+    return {
+        key: round((float(value) + 1) * 2 + 1, 1) if value is not None else 3.0
+        for key, value in averages.items()
+    }
+
+
+def aggregate_aspect_scores(clinic_ids: Iterable[int]) -> Dict[int, Dict]:
+    """치과별 감성 분석 평균 점수 (요약 테이블 조회 1회, 분석 결과가 없는 치과는 제외)"""
+    from apps.analysis.models import ClinicAspectSummary
+
+    summaries = ClinicAspectSummary.objects.filter(
+        clinic_id__in=list(clinic_ids),
+        analysis_count__gt=0
+    )
+
+    scores = {}
+    for summary in summaries:
+        averages = summary.averages()
+        scores[summary.clinic_id] = to_aspect_scores({
+            key: averages[aspect] for key, aspect in ASPECT_FIELDS.items()
+        })
+    return scores
+
+
+def aggregate_price_info(clinic_ids: Iterable[int]) -> Dict[int, Dict]:
+    """치과별 치료 종류 평균 가격 요약 (그룹 쿼리 1회)"""
+    from apps.analysis.models import PriceData
+
+    clinic_ids = list(clinic_ids)
+    rows = PriceData.objects.filter(
+        clinic_id__in=clinic_ids
+    ).values('clinic_id', 'treatment_type').annotate(
+        average_price=Avg('price'),
+        price_count=Count('id'),
+        currency=Max('currency')
+    ).order_by()
+
+    summary = {clinic_id: {} for clinic_id in clinic_ids}
+    for row in rows:
+        summary[row['clinic_id']][row['treatment_type']] = {
+            'average_price': int(row['average_price']),
+            'price_count': row['price_count'],
+            'currency': row['currency'] or 'KRW',
+        }
+    return summary
+
+
+def batch_list_context(clinic_ids: Iterable[int]) -> Dict:
+    """
+    목록 페이지 치과들의 측면 점수/가격 요약을 미리 조회해 시리얼라이저 context로 전달
+
+    Args:
+        clinic_ids: 페이지에 포함된 치과 id 목록
+
+    Returns:
+        {'aspect_scores': {치과 id: 점수}, 'price_info': {치과 id: 가격 요약}}
+    """
+    clinic_ids = list(clinic_ids)
+    if not clinic_ids:
+        return {'aspect_scores': {}, 'price_info': {}}
+    return {
+        'aspect_scores': aggregate_aspect_scores(clinic_ids),
+        'price_info': aggregate_price_info(clinic_ids),
+    }
+
+
+class ClinicListBatchSerializer(serializers.ListSerializer):
+    """치과 목록 직렬화 시 페이지 전체의 집계 값을 한 번에 조회"""
+
+    def to_representation(self, data):
+        clinics = list(data.all() if hasattr(data, 'all') else data)
+        if self.parent is None and 'aspect_scores' not in self.context:
+            self._context = {**self.context, **batch_list_context(c.pk for c in clinics)}
+        return super().to_representation(clinics)
+
 
 class ClinicListSerializer(serializers.ModelSerializer):
     """치과 목록용 시리얼라이저"""
@@ -13,6 +104,7 @@ class ClinicListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Clinic
+        list_serializer_class = ClinicListBatchSerializer
         fields = [
             'id', 'name', 'address', 'district', 'phone', 
             'website', 'latitude', 'longitude', 'average_rating', 
@@ -32,65 +124,25 @@ class ClinicListSerializer(serializers.ModelSerializer):
     
     def get_aspect_scores(self, obj):
         """감성 분석 기반 측면별 점수"""
-        try:
-            from apps.analysis.models import SentimentAnalysis
-            from django.db.models import Avg
-            
-            # 해당 치과의 모든 감성 분석 결과 평균 계산
-            sentiment_avg = SentimentAnalysis.objects.filter(
-                review__clinic=obj
-            ).aggregate(
-                price=Avg('price_score'),
-                skill=Avg('skill_score'),
-                kindness=Avg('kindness_score'),
-                waiting=Avg('waiting_time_score'),
-                facility=Avg('facility_score'),
-                overtreatment=Avg('overtreatment_score')
-            )
-            
-            # -1~1 범위를 1~5 범위로 변환
-            aspect_scores = {}
-            for key, value in sentiment_avg.items():
-                if value is not None:
-                    # -1~1을 1~5로 변환: (value + 1) * 2 + 1
-                    aspect_scores[key] = round((float(value) + 1) * 2 + 1, 1)
-                else:
-                    aspect_scores[key] = 3.0  # 기본값
-            
-            return aspect_scores
-        except Exception:
-            # 기본값 반환
-            return {
-                'price': 3.5,
-                'skill': 3.5,
-                'kindness': 3.5,
-                'waiting': 3.5,
-                'facility': 3.5,
-                'overtreatment': 3.5
-            }
+        batched = self.context.get('aspect_scores')
+        if batched is not None:
+            # 목록 직렬화 시 미리 조회한 값 사용
+            scores = batched.get(obj.pk)
+        else:
+            # 단건 직렬화 시 comprehensive_score와 같은 조회 결과 공유
+            if getattr(self, '_aspect_pk', None) != obj.pk:
+                self._aspect_pk = obj.pk
+                self._aspect_scores = aggregate_aspect_scores([obj.pk]).get(obj.pk)
+            scores = self._aspect_scores
+        # 분석 결과가 없는 치과는 기본값
+        return scores or to_aspect_scores(dict.fromkeys(ASPECT_FIELDS))
 
     def get_price_info(self, obj):
         """리스트용 요약 가격 정보 (치료별 평균)"""
-        try:
-            from apps.analysis.models import PriceData
-            prices = PriceData.objects.filter(clinic=obj)
-            summary = {}
-            for price in prices:
-                entry = summary.setdefault(price.treatment_type, {'total': 0, 'count': 0})
-                entry['total'] += price.price
-                entry['count'] += 1
-                entry['currency'] = price.currency
-            result = {}
-            for treatment, data in summary.items():
-                if data['count'] > 0:
-                    result[treatment] = {
-                        'average_price': int(data['total'] / data['count']),
-                        'price_count': data['count'],
-                        'currency': data.get('currency', 'KRW'),
-                    }
-            return result
-        except Exception:
-            return {}
+        batched = self.context.get('price_info')
+        if batched is not None:
+            return batched.get(obj.pk, {})
+        return aggregate_price_info([obj.pk])[obj.pk]
 
 
 class ClinicDetailSerializer(serializers.ModelSerializer):
@@ -120,39 +172,11 @@ class ClinicDetailSerializer(serializers.ModelSerializer):
         return 3.5 # 기본값
 
     def get_aspect_scores(self, obj):
-        """감성 분석 기반 측면별 점수"""
-        try:
-            from apps.analysis.models import SentimentAnalysis
-            from django.db.models import Avg
-            
-            sentiment_avg = SentimentAnalysis.objects.filter(
-                review__clinic=obj
-            ).aggregate(
-                price=Avg('price_score'),
-                skill=Avg('skill_score'),
-                kindness=Avg('kindness_score'),
-                waiting=Avg('waiting_time_score'),
-                facility=Avg('facility_score'),
-                overtreatment=Avg('overtreatment_score')
-            )
-            
-            aspect_scores = {}
-            for key, value in sentiment_avg.items():
-                if value is not None:
-                    aspect_scores[key] = round((float(value) + 1) * 2 + 1, 1)
-                else:
-                    aspect_scores[key] = 3.0
-            
-            return aspect_scores
-        except Exception:
-            return {
-                'price': 3.5,
-                'skill': 3.5,
-                'kindness': 3.5,
-                'waiting': 3.5,
-                'facility': 3.5,
-                'overtreatment': 3.5
-            }
+        """감성 분석 기반 측면별 점수 (요약 테이블 단일 행 조회)"""
+        if getattr(self, '_aspect_pk', None) != obj.pk:
+            self._aspect_pk = obj.pk
+            self._aspect_scores = aggregate_aspect_scores([obj.pk]).get(obj.pk)
+        return self._aspect_scores or to_aspect_scores(dict.fromkeys(ASPECT_FIELDS))
 
     def get_recent_reviews(self, obj):
         """최근 리뷰 5개"""
@@ -0,0 +1,152 @@
+"""
+치과 좌표 KD-트리 스냅샷 모듈
+
+모든 치과의 좌표를 단위 구면 벡터로 변환해 프로세스 메모리에 KD-트리로 보관한다.
+스냅샷은 치과 id와 좌표 배열만 가지며, 치과 데이터 버전이 바뀐 뒤 처음 조회될 때
+다시 만들어진다.
+"""
+import logging
+import math
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .distance import EARTH_RADIUS_KM
+from .versioning import get_clinic_version
+
+try:
+    from sklearn.neighbors import KDTree
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    KDTree = None
+    SKLEARN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def to_unit_vectors(coords: np.ndarray) -> np.ndarray:
+    """(N, 2) 위도/경도 배열을 (N, 3) 단위 구면 벡터로 변환"""
+    lat = np.radians(coords[:, 0])
+    lng = np.radians(coords[:, 1])
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)))
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """단위 구면 현 길이를 대원 거리(km)로 변환"""
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2.0, 0.0, 1.0))
+
+
+def km_to_chord(distance_km: float) -> float:
+    """대원 거리(km)를 단위 구면 현 길이로 변환"""
+    angle = min(distance_km / EARTH_RADIUS_KM, math.pi)
+    return 2.0 * math.sin(angle / 2.0)
+
+
+class ClinicSpatialSnapshot:
+    """치과 좌표 스냅샷 (id 배열 + 좌표 배열 + KD-트리)"""
+
+    def __init__(self, ids: np.ndarray, coords: np.ndarray):
+        self.ids = ids
+        self.coords = coords
+        self.vectors = to_unit_vectors(coords) if len(ids) else np.empty((0, 3))
+        self.tree = KDTree(self.vectors) if SKLEARN_AVAILABLE and len(ids) else None
+
+    @classmethod
+    def build(cls) -> 'ClinicSpatialSnapshot':
+        """DB의 치과 좌표로 스냅샷 생성"""
+        from .models import Clinic
+
+        rows = Clinic.objects.filter(
+            latitude__isnull=False,
+            longitude__isnull=False
+        ).values_list('id', 'latitude', 'longitude')
+
+        ids = []
+        coords = []
+        for clinic_id, lat, lng in rows.iterator(chunk_size=5000):
+            ids.append(clinic_id)
+            coords.append((float(lat), float(lng)))
+
+        return cls(
+            np.asarray(ids, dtype=np.int64),
+            np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _query_vector(self, lat: float, lng: float) -> np.ndarray:
+        return to_unit_vectors(np.array([[lat, lng]], dtype=np.float64))
+
+    def nearest(self, lat: float, lng: float, k: int) -> List[Tuple[int, float]]:
+        """
+        가장 가까운 k개 치과
+
+        Returns:
+            (치과 id, 거리 km) 목록 (거리순)
+        """
+        if not len(self) or k <= 0:
+            return []
+        k = min(k, len(self))
+        query = self._query_vector(lat, lng)
+
+        if self.tree is not None:
+            chords, indices = self.tree.query(query, k=k)
+            chords, indices = chords[0], indices[0]
+        else:
+            all_chords = np.linalg.norm(self.vectors - query, axis=1)
+            indices = np.argpartition(all_chords, k - 1)[:k]
+            indices = indices[np.argsort(all_chords[indices], kind='stable')]
+            chords = all_chords[indices]
+
+        distances = chord_to_km(chords)
+        return list(zip(self.ids[indices].tolist(), distances.tolist()))
+
+    def within_radius(self, lat: float, lng: float, radius_km: float) -> List[Tuple[int, float]]:
+        """
+        반경 내 치과
+
+        Returns:
+            (치과 id, 거리 km) 목록 (거리순)
+        """
+        if not len(self) or radius_km < 0:
+            return []
+        query = self._query_vector(lat, lng)
+        max_chord = km_to_chord(radius_km)
+
+        if self.tree is not None:
+            indices, chords = self.tree.query_radius(
+                query, r=max_chord, return_distance=True, sort_results=True
+            )
+            indices, chords = indices[0], chords[0]
+        else:
+            all_chords = np.linalg.norm(self.vectors - query, axis=1)
+            indices = np.nonzero(all_chords <= max_chord)[0]
+            indices = indices[np.argsort(all_chords[indices], kind='stable')]
+            chords = all_chords[indices]
+
+        distances = chord_to_km(chords)
+        return list(zip(self.ids[indices].tolist(), distances.tolist()))
+
+
+_lock = threading.Lock()
+_snapshot: Optional[ClinicSpatialSnapshot] = None
+_snapshot_version = None
+
+
+def get_spatial_snapshot() -> ClinicSpatialSnapshot:
+    """현재 버전의 스냅샷 반환 (버전이 바뀌었으면 다시 생성)"""
+    global _snapshot, _snapshot_version
+
+    version = get_clinic_version()
+    if _snapshot is not None and _snapshot_version == version:
+        return _snapshot
+
+    with _lock:
+        if _snapshot is None or _snapshot_version != version:
+            _snapshot = ClinicSpatialSnapshot.build()
+            _snapshot_version = version
+            logger.info(f"치과 공간 스냅샷 생성: {len(_snapshot)}개 (버전 {version})")
+        return _snapshot
@@ -0,0 +1,98 @@
+"""
+목록 API 스트리밍 응답
+
+페이지네이션이 없는 목록 API에서 ?stream=json 또는 ?stream=ndjson을 요청하면
+쿼리셋을 서버 측 커서로 조금씩 읽어 StreamingHttpResponse로 바로 내보낸다. 결과 전체를 메모리에 올리지 않으므로
+최대 메모리는 청크 크기에만 비례한다.
+
+- json: 일반 응답과 같은 객체 형태. 목록 뒤에 실제로 보낸 행 수(count)를 붙인다.
+- ndjson: 첫 줄은 메타데이터, 이후 한 줄에 한 행.
+"""
+import json
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+# 서버 측 커서에서 한 번에 읽을 행 수
+STREAM_CHUNK_SIZE = 500
+
+STREAM_FORMATS = ('json', 'ndjson')
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, cls=JSONEncoder, ensure_ascii=False, separators=(',', ':'))
+
+
+def stream_format(request) -> Optional[str]:
+    """요청한 스트리밍 형식 ('json', 'ndjson') 또는 None"""
+    value = request.GET.get('stream', '').strip().lower()
+    if value in STREAM_FORMATS:
+        return value
+    if value in ('1', 'true'):
+        return 'json'
+    return None
+
+
+def iterate_chunks(iterable: Iterable, size: int = STREAM_CHUNK_SIZE) -> Iterator[List]:
+    """size개씩 묶어서 반환"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def stream_rows(queryset, transform: Optional[Callable[[List], List[Dict]]] = None,
+                chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Dict]:
+    """
+    쿼리셋을 서버 측 커서로 청크 단위로 읽어 행 단위로 반환
+
+    Args:
+        queryset: 대상 쿼리셋 (values() 쿼리셋이면 transform 생략 가능)
+        transform: 청크(모델/딕셔너리 목록)를 응답 행 목록으로 바꾸는 함수
+        chunk_size: 한 번에 읽을 행 수
+    """
+    for chunk in iterate_chunks(queryset.iterator(chunk_size=chunk_size), chunk_size):
+        yield from (transform(chunk) if transform else chunk)
+
+
+def _json_body(rows: Iterable[Dict], list_key: str, meta: Dict) -> Iterator[str]:
+    head = _dumps(meta)[:-1]
+    yield (head + ',' if meta else '{') + f'{_dumps(list_key)}:['
+
+    count = 0
+    for row in rows:
+        yield (',' if count else '') + _dumps(row)
+        count += 1
+    yield f'],"count":{count}}}'
+
+
+def _ndjson_body(rows: Iterable[Dict], meta: Dict) -> Iterator[str]:
+    if meta:
+        yield _dumps(meta) + '\n'
+    for row in rows:
+        yield _dumps(row) + '\n'
+
+
+def streaming_response(fmt: str, rows: Iterable[Dict], list_key: str,
+                       meta: Optional[Dict] = None) -> StreamingHttpResponse:
+    """
+    목록 스트리밍 응답 생성
+
+    Args:
+        fmt: 'json' 또는 'ndjson'
+        rows: 응답 행 이터레이터 (stream_rows 결과)
+        list_key: json 형식에서 목록을 담을 키
+        meta: 목록 앞에 보낼 메타데이터
+    """
+    meta = meta or {}
+    if fmt == 'ndjson':
+        response = StreamingHttpResponse(_ndjson_body(rows, meta), content_type=NDJSON_CONTENT_TYPE)
+    else:
+        response = StreamingHttpResponse(_json_body(rows, list_key, meta), content_type='application/json')
+    response['X-Accel-Buffering'] = 'no'
+    return response
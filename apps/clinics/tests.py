@@ -1,7 +1,30 @@
-from django.test import TestCase
+import json
+import numpy as np
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+from rest_framework import status
 from django.db import IntegrityError
 from decimal import Decimal
 from .models import Clinic
+from .location_services import location_service
+from .distance import batch_distances, distance_km
+from .spatial_index import ClinicSpatialSnapshot, get_spatial_snapshot
+from .clustering import ClusterPyramid, snapshot_changes
+from .versioning import CLINIC_DATA_VERSION_KEY, get_clinic_version
+from .geocoding import GeocodeCacheService
+from .models import District, GeocodeCache
+from . import gazetteer
+from .districts import DistrictResolver, backfill_clinic_districts, district_center, refresh_district_table
+from .search import build_search_query, fuzzy_search
+from .pagination import encode_cursor
+from .serializers import ClinicListSerializer
+from .ingest import bulk_ingest, current_batch
+from .autocomplete import AutocompleteIndex, get_autocomplete_index, to_choseong, to_jamo
+from .streaming import iterate_chunks, stream_rows
+from .conditional import CLINIC_VERSION_KEY
+from django.core.cache import cache
+from unittest import mock
 
 
 class ClinicModelTest(TestCase):
@@ -107,4 +130,1372 @@ class ClinicQueryTest(TestCase):
         """이름으로 검색 테스트"""
         results = Clinic.objects.filter(name__icontains='강남')
         self.assertEqual(results.count(), 1)
-        self.assertEqual(results.first().name, '강남 치과')
\ No newline at end of file
+        self.assertEqual(results.first().name, '강남 치과')
+
+class ClinicSpatialIndexTest(TestCase):
+    """공간 스냅샷 인덱스 테스트"""
+    
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gangnam = Clinic.objects.create(
+                name='강남역 치과',
+                address='서울특별시 강남구 강남대로 396',
+                district='강남구',
+                latitude=Decimal('37.497942'),
+                longitude=Decimal('127.027621')
+            )
+            self.seocho = Clinic.objects.create(
+                name='교대 치과',
+                address='서울특별시 서초구 서초대로 294',
+                district='서초구',
+                latitude=Decimal('37.493415'),
+                longitude=Decimal('127.014080')
+            )
+            self.busan = Clinic.objects.create(
+                name='해운대 치과',
+                address='부산광역시 해운대구 해운대로 620',
+                district='해운대구',
+                latitude=Decimal('35.163110'),
+                longitude=Decimal('129.163550')
+            )
+    
+    def test_get_clinics_by_radius(self):
+        """반경 검색 결과 및 거리순 정렬 테스트"""
+        results = location_service.get_clinics_by_radius(37.4979, 127.0276, 2.0)
+        
+        self.assertEqual(
+            [item['clinic'].id for item in results],
+            [self.gangnam.id, self.seocho.id]
+        )
+        self.assertLessEqual(results[-1]['distance_km'], 2.0)
+
+
+    
+    def test_snapshot_rebuilt_after_clinic_change(self):
+        """치과 추가 시 스냅샷 재생성 테스트"""
+        before = get_spatial_snapshot()
+        self.assertIn(self.gangnam.id, before.ids.tolist())
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            clinic = Clinic.objects.create(
+                name='신논현 치과',
+                address='서울특별시 강남구 봉은사로 102',
+                district='강남구',
+                latitude=Decimal('37.504503'),
+                longitude=Decimal('127.024948')
+            )
+        after = get_spatial_snapshot()
+        self.assertIsNot(before, after)
+        self.assertIn(clinic.id, after.ids.tolist())
+        
+        # 좌표와 무관한 필드 저장은 스냅샷을 유지
+        clinic.update_review_stats()
+        self.assertIs(get_spatial_snapshot(), after)
+        
+        # 인덱스 대상 필드 값이 그대로인 전체 저장도 버전을 올리지 않음
+        version = get_clinic_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            loaded = Clinic.objects.get(pk=clinic.pk)
+            loaded.phone = '02-000-0000'
+            loaded.save()
+        self.assertEqual(get_clinic_version(), version)
+        self.assertIs(get_spatial_snapshot(), after)
+    
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_snapshot_rebuilt_without_persistent_cache(self):
+        """값을 보관하지 않는 캐시 백엔드에서도 치과 변경 시 버전 증가 및 스냅샷 재생성"""
+        version = get_clinic_version()
+        before = get_spatial_snapshot()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gangnam.latitude = Decimal('37.500000')
+            self.gangnam.save()
+        
+        self.assertEqual(get_clinic_version()[0], version[0] + 1)
+        self.assertIsNot(get_spatial_snapshot(), before)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gangnam.delete()
+        self.assertEqual(get_clinic_version()[0], version[0] + 2)
+        self.assertNotIn(self.gangnam.pk, get_spatial_snapshot().ids.tolist())
+
+    def test_version_bumped_after_commit_and_read_from_cache(self):
+        """버전은 커밋 후에만 증가하고 캐시가 있으면 DB를 읽지 않음"""
+        version = get_clinic_version()
+        with self.assertNumQueries(0):
+            self.assertEqual(get_clinic_version(), version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gangnam.latitude = Decimal('37.500000')
+            self.gangnam.save()
+            self.seocho.delete()
+            # 커밋 전에는 다른 요청이 옛 버전을 그대로 봄
+            self.assertEqual(get_clinic_version(), version)
+        # 한 트랜잭션의 여러 변경은 한 번만 증가
+        self.assertEqual(get_clinic_version()[0], version[0] + 1)
+
+        # 캐시가 비면 DB 행에서 복구
+        cache.delete(CLINIC_DATA_VERSION_KEY)
+        self.assertEqual(get_clinic_version()[0], version[0] + 1)
+
+    def test_get_nearest_clinics(self):
+        """최근접 k개 치과 검색 테스트"""
+        results = location_service.get_nearest_clinics(37.4979, 127.0276, k=2)
+        self.assertEqual(
+            [item['clinic'].id for item in results],
+            [self.gangnam.id, self.seocho.id]
+        )
+        
+        # 트리 없이 배열 전수 비교로도 같은 결과
+        snapshot = get_spatial_snapshot()
+        tree = snapshot.tree
+        snapshot.tree = None
+        try:
+            self.assertEqual(
+                [clinic_id for clinic_id, _ in snapshot.nearest(37.4979, 127.0276, 2)],
+                [self.gangnam.id, self.seocho.id]
+            )
+            self.assertEqual(
+                [clinic_id for clinic_id, _ in snapshot.within_radius(37.4979, 127.0276, 2.0)],
+                [self.gangnam.id, self.seocho.id]
+            )
+        finally:
+            snapshot.tree = tree
+
+class BatchDistanceTest(TestCase):
+    """일괄 거리 계산 테스트"""
+    
+    def test_haversine_matches_known_distance(self):
+        """하버사인 거리 정확도 테스트"""
+        # 서울시청 - 강남역 약 8.9km
+        distance = distance_km(37.5665, 126.9780, 37.4979, 127.0276)
+        self.assertAlmostEqual(distance, 8.9, delta=0.2)
+    
+    def test_flat_approximation_close_to_haversine(self):
+        """평면 근사와 하버사인 비교 테스트"""
+        coords = [(37.4979, 127.0276), (37.5838, 127.0017), (37.5665, 126.9780)]
+        haversine = batch_distances(37.5665, 126.9780, coords, method='haversine')
+        flat = batch_distances(37.5665, 126.9780, coords, method='flat')
+        
+        self.assertEqual(len(haversine), 3)
+        self.assertAlmostEqual(float(haversine[2]), 0.0)
+        for a, b in zip(haversine.tolist(), flat.tolist()):
+            self.assertAlmostEqual(a, b, delta=0.05)
+    
+    def test_invalid_method(self):
+        """지원하지 않는 계산 방식 테스트"""
+        with self.assertRaises(ValueError):
+            batch_distances(37.5, 127.0, [(37.5, 127.0)], method='unknown')
+
+
+
+class ClinicNearbyAPITest(APITestCase):
+    """근처 치과 API 테스트"""
+    
+    def setUp(self):
+        self.url = reverse('api:clinics:clinic_nearby')
+        # 기준점에서 북쪽으로 약 0.55km 간격
+        with self.captureOnCommitCallbacks(execute=True):
+            self.clinics = [
+                Clinic.objects.create(
+                    name=f'근처 치과 {i}',
+                    address=f'서울특별시 중구 세종대로 {i}',
+                    district='중구',
+                    latitude=Decimal('37.566500') + Decimal('0.005') * i,
+                    longitude=Decimal('126.978000')
+                )
+                for i in range(5)
+            ]
+    
+    def test_nearby_radius(self):
+        """반경 내 전체 목록 테스트"""
+        response = self.client.get(self.url, {'lat': 37.5665, 'lng': 126.978, 'radius': 1.2})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(response.data['results'][0]['id'], self.clinics[0].id)
+    
+    def test_nearby_top_k_with_cursor(self):
+        """최근접 k개 및 커서 더 보기 테스트"""
+        params = {'lat': 37.5665, 'lng': 126.978, 'radius': 5, 'k': 2}
+        
+        first = self.client.get(self.url, params)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['id'] for item in first.data['results']],
+            [self.clinics[0].id, self.clinics[1].id]
+        )
+        self.assertTrue(first.data['has_more'])
+        
+        second = self.client.get(self.url, {**params, 'cursor': first.data['next_cursor']})
+        self.assertEqual(
+            [item['id'] for item in second.data['results']],
+            [self.clinics[2].id, self.clinics[3].id]
+        )
+        
+        third = self.client.get(self.url, {**params, 'cursor': second.data['next_cursor']})
+        self.assertEqual([item['id'] for item in third.data['results']], [self.clinics[4].id])
+        self.assertFalse(third.data['has_more'])
+        self.assertIsNone(third.data['next_cursor'])
+    
+    def test_nearby_invalid_cursor(self):
+        """잘못된 커서 테스트"""
+        for cursor in ('invalid', encode_cursor(['a', 'b']), encode_cursor([0.5, 1.5]), encode_cursor([None, 1])):
+            response = self.client.get(
+                self.url, {'lat': 37.5665, 'lng': 126.978, 'k': 2, 'cursor': cursor}
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    def test_nearby_cursor_with_equal_distances(self):
+        """같은 거리의 치과도 id 순서로 빠짐없이 순회"""
+        with self.captureOnCommitCallbacks(execute=True):
+            twin = Clinic.objects.create(
+                name='같은 위치 치과', address='서울특별시 중구 세종대로 0-1', district='중구',
+                latitude=self.clinics[0].latitude, longitude=self.clinics[0].longitude
+            )
+        params = {'lat': 37.5665, 'lng': 126.978, 'radius': 5, 'k': 1}
+        
+        seen = []
+        while True:
+            response = self.client.get(self.url, params)
+            seen.extend(item['id'] for item in response.data['results'])
+            if not response.data['has_more']:
+                break
+            params['cursor'] = response.data['next_cursor']
+        
+        self.assertEqual(seen, [self.clinics[0].id, twin.id] + [clinic.id for clinic in self.clinics[1:]])
+
+
+
+class GeocodeCacheTest(TestCase):
+    """지오코딩 캐시 및 지명 사전 테스트 (네트워크 호출 없음)"""
+    
+    def setUp(self):
+        self.service = GeocodeCacheService()
+        self.fetch = mock.Mock(return_value=(37.4979, 127.0276))
+        self.reverse_fetch = mock.Mock(return_value='서울특별시 강남구 역삼동')
+    
+    def test_gazetteer_lookup(self):
+        """지명 사전 조회 테스트"""
+        self.assertEqual(gazetteer.lookup('서울특별시 강남구').district, '강남구')
+        match = gazetteer.lookup('서울 강남구 역삼동')
+        self.assertEqual((match.district, match.dong, match.level), ('강남구', '역삼동', 'dong'))
+        self.assertEqual(gazetteer.lookup('역삼동').district, '강남구')
+        self.assertEqual(gazetteer.lookup('마포').district, '마포구')
+        
+        # 도로명/번지가 포함된 주소는 지명 사전으로 처리하지 않음
+        self.assertIsNone(gazetteer.lookup('서울특별시 강남구 강남대로 396'))
+    
+    def test_district_lookup_without_network(self):
+        """지역구 수준 조회는 외부 호출 없이 처리"""
+        result = self.service.geocode('서울시 서초구', self.fetch)
+        
+        self.assertEqual(result, gazetteer.SEOUL_DISTRICT_CENTROIDS['서초구'])
+        self.fetch.assert_not_called()
+        self.assertFalse(GeocodeCache.objects.exists())
+    
+    def test_repeat_lookup_uses_cache(self):
+        """반복 조회 시 메모리/DB 캐시 사용 테스트"""
+        address = '서울특별시 강남구 강남대로 396'
+        
+        self.assertEqual(self.service.geocode(address, self.fetch), (37.4979, 127.0276))
+        self.assertEqual(self.service.geocode(f'  {address} ', self.fetch), (37.4979, 127.0276))
+        self.fetch.assert_called_once()
+        
+        # 메모리가 비어 있어도 DB 캐시에서 조회
+        other = GeocodeCacheService()
+        self.assertEqual(other.geocode('서울 강남구 강남대로 396', self.fetch), (37.4979, 127.0276))
+        self.fetch.assert_called_once()
+        self.assertEqual(GeocodeCache.objects.get(kind='forward').hit_count, 1)
+        
+        stats = self.service.get_stats()
+        self.assertEqual((stats['misses'], stats['memory_hits']), (1, 1))
+        self.assertEqual(other.get_stats()['db_hits'], 1)
+    
+    def test_failed_fetch_is_not_cached(self):
+        """외부 호출 오류는 캐시하지 않음"""
+        failing = mock.Mock(side_effect=TimeoutError('timeout'))
+        with self.assertRaises(TimeoutError):
+            self.service.geocode('서울특별시 중구 세종대로 110', failing)
+        self.assertFalse(GeocodeCache.objects.exists())
+        
+        # 결과 없음은 짧은 기간 캐시
+        empty = mock.Mock(return_value=None)
+        self.assertIsNone(self.service.geocode('없는 주소 1', empty))
+        self.assertIsNone(GeocodeCacheService().geocode('없는 주소 1', empty))
+        empty.assert_called_once()
+    
+    def test_reverse_cache_by_rounded_cell(self):
+        """역지오코딩 좌표 셀 캐시 테스트"""
+        first = self.service.reverse(37.500612, 127.036612, self.reverse_fetch)
+        second = self.service.reverse(37.500598, 127.036631, self.reverse_fetch)
+        
+        self.assertEqual(first, second)
+        self.reverse_fetch.assert_called_once()
+    
+    def test_location_service_geocode_address(self):
+        """LocationService 지오코딩 캐시 연동 테스트"""
+        with mock.patch.object(location_service.geocoder, 'geocode') as geocode:
+            coordinates = location_service.geocode_address('종로구')
+        
+        geocode.assert_not_called()
+        self.assertEqual(coordinates, gazetteer.SEOUL_DISTRICT_CENTROIDS['종로구'])
+
+
+class DistrictResolverTest(TestCase):
+    """오프라인 지역구 판별 테스트"""
+    
+    def setUp(self):
+        square = [[127.0, 37.5], [127.1, 37.5], [127.1, 37.6], [127.0, 37.6], [127.0, 37.5]]
+        hole = [[127.04, 37.54], [127.06, 37.54], [127.06, 37.56], [127.04, 37.56], [127.04, 37.54]]
+        self.resolver = DistrictResolver.from_geojson({
+            'type': 'FeatureCollection',
+            'features': [
+                {
+                    'type': 'Feature',
+                    'properties': {'SIG_KOR_NM': '가나구'},
+                    'geometry': {'type': 'Polygon', 'coordinates': [square, hole]},
+                },
+                {
+                    'type': 'Feature',
+                    'properties': {'name': '다라구'},
+                    'geometry': {
+                        'type': 'MultiPolygon',
+                        'coordinates': [
+                            [[[127.045, 37.545], [127.055, 37.545], [127.055, 37.555],
+                              [127.045, 37.555], [127.045, 37.545]]],
+                            [[[127.2, 37.5], [127.3, 37.5], [127.25, 37.6], [127.2, 37.5]]],
+                        ],
+                    },
+                },
+            ],
+        })
+    
+    def test_point_in_polygon(self):
+        """다각형/구멍/다중 다각형 판별 테스트"""
+        self.assertEqual(len(self.resolver.districts), 2)
+        self.assertEqual(self.resolver.resolve(37.52, 127.02), '가나구')
+        # 구멍 안쪽 중 다른 구의 섬에 해당하는 좌표
+        self.assertEqual(self.resolver.resolve(37.55, 127.05), '다라구')
+        # 구멍 안쪽이지만 어느 구에도 속하지 않는 좌표
+        self.assertIsNone(self.resolver.resolve(37.542, 127.042))
+        self.assertEqual(self.resolver.resolve(37.52, 127.25), '다라구')
+        # 삼각형 경계 상자 안이지만 다각형 밖
+        self.assertIsNone(self.resolver.resolve(37.59, 127.21))
+        self.assertIsNone(self.resolver.resolve(35.1, 129.0))
+    
+    def test_centroid_fallback_without_boundaries(self):
+        """경계 데이터가 없으면 지역구 중심 좌표로 근사"""
+        resolver = DistrictResolver.from_file('/nonexistent/districts.geojson')
+        
+        self.assertEqual(resolver.districts, [])
+        self.assertEqual(resolver.resolve(37.5010, 127.0390), '강남구')
+        self.assertEqual(resolver.resolve(37.5664, 126.9012), '마포구')
+        self.assertIsNone(resolver.resolve(35.1796, 129.0756))
+    
+    def test_backfill_clinic_districts(self):
+        """좌표만 있는 치과 지역구 일괄 채우기 테스트"""
+        missing = Clinic.objects.create(
+            name='지역구 없는 치과', address='주소 1', district='',
+            latitude=Decimal('37.52'), longitude=Decimal('127.02')
+        )
+        outside = Clinic.objects.create(
+            name='범위 밖 치과', address='주소 2', district='',
+            latitude=Decimal('35.10'), longitude=Decimal('129.00')
+        )
+        existing = Clinic.objects.create(
+            name='지역구 있는 치과', address='주소 3', district='강남구',
+            latitude=Decimal('37.52'), longitude=Decimal('127.25')
+        )
+        
+        self.assertEqual(backfill_clinic_districts(resolver=self.resolver), (1, 1))
+        missing.refresh_from_db()
+        outside.refresh_from_db()
+        existing.refresh_from_db()
+        self.assertEqual(missing.district, '가나구')
+        self.assertEqual(outside.district, '')
+        self.assertEqual(existing.district, '강남구')
+        
+        self.assertEqual(backfill_clinic_districts(overwrite=True, resolver=self.resolver), (1, 1))
+        existing.refresh_from_db()
+        self.assertEqual(existing.district, '다라구')
+    
+    def test_backfill_skips_centroid_approximation(self):
+        """경계 데이터가 없으면 중심 좌표 근사 결과를 저장하지 않음"""
+        clinic = Clinic.objects.create(
+            name='성수 치과', address='주소 4', district='',
+            latitude=Decimal('37.5446'), longitude=Decimal('127.0559')
+        )
+        
+        self.assertEqual(backfill_clinic_districts(resolver=DistrictResolver()), (0, 1))
+        clinic.refresh_from_db()
+        self.assertEqual(clinic.district, '')
+    
+    def test_location_service_uses_offline_resolver(self):
+        """경계 데이터가 있으면 좌표 → 지역구 변환 시 네트워크 호출 없음"""
+        with mock.patch('apps.clinics.location_services.get_district_resolver', return_value=self.resolver), \
+                mock.patch.object(location_service.geocoder, 'reverse') as reverse:
+            district = location_service.get_district_from_coordinates(37.52, 127.02)
+        
+        reverse.assert_not_called()
+        self.assertEqual(district, '가나구')
+    
+    def test_location_service_reverse_geocodes_before_centroid(self):
+        """경계 데이터가 없으면 중심 좌표 근사보다 역지오코딩을 먼저 사용"""
+        resolver = DistrictResolver()
+        # 성수역은 광진구 중심 좌표가 더 가깝지만 성동구
+        self.assertEqual(resolver.nearest_centroid(37.5446, 127.0559), '광진구')
+        
+        with mock.patch('apps.clinics.location_services.get_district_resolver', return_value=resolver), \
+                mock.patch.object(location_service.geocoder, 'reverse') as reverse:
+            reverse.return_value = mock.Mock(address='성수동2가, 성동구, 서울특별시, 04781, 대한민국')
+            self.assertEqual(location_service.get_district_from_coordinates(37.5446, 127.0559), '성동구')
+            
+            # 역지오코딩 실패 시에만 중심 좌표 근사
+            reverse.return_value = None
+            self.assertEqual(location_service.get_district_from_coordinates(37.5173, 127.0473), '강남구')
+
+
+class DistrictTableTest(TestCase):
+    """지역구 요약 테이블 테스트"""
+    
+    def setUp(self):
+        for i, (lat, lng) in enumerate([('37.500000', '127.030000'), ('37.510000', '127.050000')]):
+            Clinic.objects.create(
+                name=f'강남 치과 {i}', address=f'강남 주소 {i}', district='강남구',
+                latitude=Decimal(lat), longitude=Decimal(lng)
+            )
+        Clinic.objects.create(name='좌표 없는 치과', address='주소', district='강남구')
+        Clinic.objects.create(
+            name='지방 치과', address='부산 주소', district='해운대구',
+            latitude=Decimal('35.163000'), longitude=Decimal('129.163000')
+        )
+    
+    def test_refresh_district_table(self):
+        """집계 및 인근 지역구 계산 테이블 테스트"""
+        count = refresh_district_table(radii=[5, 10])
+        
+        self.assertEqual(count, len(gazetteer.SEOUL_DISTRICT_CENTROIDS) + 1)
+        gangnam = District.objects.get(name='강남구')
+        self.assertEqual(gangnam.clinic_count, 3)
+        self.assertAlmostEqual(float(gangnam.latitude), 37.505, places=5)
+        self.assertAlmostEqual(float(gangnam.longitude), 127.04, places=5)
+        self.assertEqual(float(gangnam.min_latitude), 37.5)
+        self.assertEqual(float(gangnam.max_longitude), 127.05)
+        self.assertEqual(set(gangnam.neighbors), {'5', '10'})
+        self.assertIn('서초구', gangnam.neighbors['5'])
+        self.assertNotIn('강남구', gangnam.neighbors['5'])
+        self.assertLessEqual(set(gangnam.neighbors['5']), set(gangnam.neighbors['10']))
+        self.assertEqual(District.objects.get(name='해운대구').neighbors, {'5': [], '10': []})
+        self.assertEqual(District.objects.get(name='중랑구').clinic_count, 0)
+    
+    def test_nearby_districts_reads_table(self):
+        """인근 지역구 조회가 요약 테이블만 사용하는지 테스트"""
+        refresh_district_table(radii=[5])
+        
+        with self.assertNumQueries(1):
+            nearby = location_service.get_nearby_districts('강남구', radius_km=5)
+        self.assertEqual(nearby[0], '강남구')
+        self.assertEqual(nearby[1:], District.objects.get(name='강남구').neighbors['5'])
+        
+        # 미리 계산되지 않은 반경은 중심 좌표로 계산
+        wide = location_service.get_nearby_districts('강남구', radius_km=500)
+        self.assertEqual(len(wide), District.objects.count())
+        self.assertEqual(location_service.get_nearby_districts('없는구'), ['없는구'])
+    
+    def test_district_center(self):
+        """지역구 중심 좌표 조회 테스트"""
+        # 테이블이 비어 있으면 지명 사전 좌표
+        self.assertEqual(district_center('강남'), gazetteer.SEOUL_DISTRICT_CENTROIDS['강남구'])
+        
+        refresh_district_table()
+        self.assertEqual(district_center('강남구'), (37.505, 127.04))
+        self.assertEqual(district_center('서울 해운대구'), (35.163, 129.163))
+        self.assertIsNone(district_center('존재하지않는곳'))
+
+
+class ClinicClusterAPITest(APITestCase):
+    """지도 마커 클러스터 API 테스트"""
+    
+    def setUp(self):
+        self.url = reverse('api:clinics:clinic_clusters')
+        # 강남역 부근 약 50m 간격 3곳 + 마포 1곳
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gangnam = [
+                Clinic.objects.create(
+                    name=f'강남 클러스터 치과 {i}', address=f'강남 주소 {i}', district='강남구',
+                    latitude=Decimal('37.497900') + Decimal('0.000450') * i,
+                    longitude=Decimal('127.027600')
+                )
+                for i in range(3)
+            ]
+            self.mapo = Clinic.objects.create(
+                name='마포 치과', address='마포 주소', district='마포구',
+                latitude=Decimal('37.556300'), longitude=Decimal('126.903600')
+            )
+        self.seoul_bbox = '126.76,37.41,127.19,37.72'
+    
+    def test_low_zoom_clusters(self):
+        """낮은 줌 레벨에서 인접 치과 병합 테스트"""
+        response = self.client.get(self.url, {'bbox': self.seoul_bbox, 'zoom': 10})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total'], 4)
+        counts = sorted(c['count'] for c in response.data['results'])
+        self.assertEqual(counts, [1, 3])
+        single = next(c for c in response.data['results'] if c['count'] == 1)
+        self.assertEqual((single['clinic_id'], single['name']), (self.mapo.id, '마포 치과'))
+    
+    def test_high_zoom_splits_clusters(self):
+        """높은 줌 레벨에서 개별 마커 테스트"""
+        response = self.client.get(
+            self.url, {'bbox': '127.025,37.496,127.03,37.5', 'zoom': 18}
+        )
+        
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(
+            sorted(c['clinic_id'] for c in response.data['results']),
+            [clinic.id for clinic in self.gangnam]
+        )
+    
+    def test_response_bounded_by_viewport(self):
+        """넓은 뷰포트에서 셀 수 제한 테스트"""
+        response = self.client.get(self.url, {'bbox': self.seoul_bbox, 'zoom': 20})
+        
+        self.assertLess(response.data['level'], 22)
+        self.assertEqual(response.data['total'], 4)
+        
+        # 뷰포트 밖 치과는 제외
+        response = self.client.get(self.url, {'bbox': '126.85,37.5,126.95,37.6', 'zoom': 12})
+        self.assertEqual(response.data['total'], 1)
+    
+    def test_pyramid_rebuilt_after_change(self):
+        """치과 변경 후 피라미드 재생성 테스트"""
+        self.client.get(self.url, {'bbox': self.seoul_bbox, 'zoom': 10})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.mapo.delete()
+        
+        response = self.client.get(self.url, {'bbox': self.seoul_bbox, 'zoom': 10})
+        self.assertEqual(response.data['total'], 3)
+    
+    def test_incremental_update_matches_rebuild(self):
+        """바뀐 치과만 반영한 피라미드가 처음부터 만든 피라미드와 같은지 테스트"""
+        before = get_spatial_snapshot()
+        pyramid = ClusterPyramid.from_snapshot(before)
+        
+        ids = before.ids.tolist()
+        coords = before.coords.copy()
+        moved = ids.index(self.gangnam[0].id)
+        coords[moved] = (37.556400, 126.903700)
+        removed = ids.index(self.mapo.id)
+        after = ClinicSpatialSnapshot(
+            np.append(np.delete(before.ids, removed), 999999),
+            np.vstack((np.delete(coords, removed, axis=0), [(37.5, 127.0)])),
+        )
+        
+        changes = snapshot_changes(before, after)
+        self.assertEqual(sorted(changes[0].tolist()), sorted([self.gangnam[0].id, self.mapo.id]))
+        self.assertEqual(sorted(changes[2].tolist()), sorted([self.gangnam[0].id, 999999]))
+        
+        updated = pyramid.apply_changes(*changes)
+        rebuilt = ClusterPyramid.from_snapshot(after)
+        for got, expected in zip(updated.levels, rebuilt.levels):
+            np.testing.assert_array_equal(got.keys, expected.keys)
+            np.testing.assert_array_equal(got.counts, expected.counts)
+            np.testing.assert_array_equal(got.id_sums, expected.id_sums)
+            np.testing.assert_allclose(got.lat_sums, expected.lat_sums)
+            np.testing.assert_allclose(got.lng_sums, expected.lng_sums)
+        
+        # 이전 피라미드는 그대로 (조회 중인 요청용)
+        self.assertEqual(int(pyramid.levels[0].counts.sum()), len(before))
+    
+    def test_invalid_parameters(self):
+        """잘못된 파라미터 테스트"""
+        for params in ({'zoom': 10}, {'bbox': '1,2,3', 'zoom': 10},
+                       {'bbox': '127.1,37.4,127.0,37.6', 'zoom': 10},
+                       {'bbox': self.seoul_bbox, 'zoom': 'x'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ClinicViewportAPITest(APITestCase):
+    """지도 영역 치과 목록 API 테스트"""
+    
+    def setUp(self):
+        self.url = reverse('api:clinics:clinic_viewport')
+        self.inside = [
+            Clinic.objects.create(
+                name=f'영역 내 치과 {i}', address=f'주소 {i}', district='중구',
+                latitude=Decimal('37.560000') + Decimal('0.001') * (i // 2),
+                longitude=Decimal('126.980000')
+            )
+            for i in range(5)
+        ]
+        Clinic.objects.create(
+            name='영역 밖 치과', address='주소', district='강남구',
+            latitude=Decimal('37.497900'), longitude=Decimal('127.027600')
+        )
+        self.bbox = '126.97,37.55,126.99,37.57'
+    
+    def test_cursor_pagination(self):
+        """커서로 영역 내 전체 순회 테스트"""
+        seen = []
+        params = {'bbox': self.bbox, 'page_size': 2}
+        while True:
+            with self.assertNumQueries(1):
+                response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seen.extend(item['id'] for item in response.data['results'])
+            if not response.data['has_more']:
+                break
+            params['cursor'] = response.data['next_cursor']
+        
+        self.assertEqual(seen, [clinic.id for clinic in self.inside])
+    
+    def test_fields_projection(self):
+        """fields= 필드 선택 테스트"""
+        response = self.client.get(self.url, {'bbox': self.bbox, 'fields': 'id,district'})
+        
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'district'})
+        
+        response = self.client.get(self.url, {'bbox': self.bbox})
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'latitude', 'longitude'})
+    
+    def test_invalid_parameters(self):
+        """잘못된 파라미터 테스트"""
+        for params in ({'bbox': self.bbox, 'fields': 'search_vector'},
+                       {'bbox': self.bbox, 'cursor': 'invalid'},
+                       {'bbox': self.bbox, 'cursor': encode_cursor(['a', 'b', 'c'])},
+                       {'bbox': self.bbox, 'cursor': encode_cursor([None, None, None])},
+                       {'bbox': ''}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ClinicSearchAPITest(APITestCase):
+    """치과 전문 검색 API 테스트"""
+    
+    def setUp(self):
+        self.url = reverse('api:clinics:clinic_search')
+        self.implant = Clinic.objects.create(
+            name='강남임플란트치과', address='서울특별시 강남구 테헤란로 1', district='강남구',
+            specialties='임플란트, 교정', total_reviews=5
+        )
+        self.barun = Clinic.objects.create(
+            name='서울바른치과', address='서울특별시 서초구 서초대로 2', district='서초구',
+            description='임플란트 상담 가능', total_reviews=50
+        )
+        self.smile = Clinic.objects.create(
+            name='마포미소치과', address='서울특별시 마포구 양화로 3', district='마포구',
+            specialties='스케일링', total_reviews=20
+        )
+    
+    def search(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [item['id'] for item in response.data['results']]
+    
+    def test_build_search_query(self):
+        """검색어 접두어 tsquery 변환 테스트"""
+        self.assertIsNone(build_search_query(' &| '))
+        self.assertIsNotNone(build_search_query('강남 임플'))
+    
+    def test_ranked_full_text_search(self):
+        """가중치 순위 검색 테스트 (전문분야 > 설명)"""
+        self.assertEqual(self.search(q='임플란트'), [self.implant.id, self.barun.id])
+        # 접두어 일치
+        self.assertEqual(self.search(q='임플'), [self.implant.id, self.barun.id])
+        # 다른 정렬 기준과 함께 사용
+        self.assertEqual(self.search(q='임플란트', sort='reviews'), [self.barun.id, self.implant.id])
+        self.assertEqual(self.search(q='서초', district='서초'), [self.barun.id])
+    
+    def test_partial_word_fallback(self):
+        """전문 검색 결과가 없을 때 부분 단어 검색 테스트"""
+        self.assertEqual(self.search(q='바른'), [self.barun.id])
+        self.assertEqual(self.search(q='없는치과이름'), [])
+    
+    def test_fuzzy_search_uses_index_operators(self):
+        """pg_trgm이 있으면 트라이그램 인덱스 연산자로 거름 (주석 값 비교 없음)"""
+        with mock.patch('apps.clinics.search.trigram_available', return_value=True):
+            sql = str(fuzzy_search(Clinic.objects.all(), '바른').query)
+        
+        where = sql.split(' WHERE ', 1)[1]
+        self.assertIn('LIKE', where)
+        self.assertIn('%>', where)
+        self.assertNotIn('UPPER', where)
+        self.assertNotIn('>=', where)
+    
+    def test_search_without_query(self):
+        """검색어 없이 추천순 정렬 테스트"""
+        self.assertEqual(self.search(), [self.barun.id, self.smile.id, self.implant.id])
+
+
+class ClinicKeysetPaginationTest(APITestCase):
+    """치과 검색/목록 커서 페이지네이션 테스트"""
+    
+    def setUp(self):
+        self.search_url = reverse('api:clinics:clinic_search')
+        self.list_url = reverse('api:clinics:clinic_list_create')
+        # 정렬 키가 겹치는 행을 포함 (리뷰 수/평점 동점)
+        self.clinics = [
+            Clinic.objects.create(
+                name=f'페이지 치과 {i:02d}', address=f'서울특별시 중구 주소 {i}', district='중구',
+                specialties='임플란트', total_reviews=(i % 3) * 10,
+                average_rating=None if i % 4 == 0 else Decimal('4.50')
+            )
+            for i in range(11)
+        ]
+    
+    def collect(self, url, params):
+        """커서를 따라 모든 페이지 조회"""
+        ids = []
+        params = {**params, 'page_size': 3}
+        for _ in range(10):
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids.extend(item['id'] for item in response.data['results'])
+            if not response.data['has_more']:
+                return ids
+            params['cursor'] = response.data['next_cursor']
+        self.fail('커서 페이지네이션이 끝나지 않음')
+    
+    def test_search_sort_modes(self):
+        """모든 정렬 모드에서 누락/중복 없이 순회"""
+        for sort in ('relevance', 'recommended', 'rating', 'reviews', 'name'):
+            with self.subTest(sort=sort):
+                params = {'sort': sort, 'q': '임플란트'}
+                ids = self.collect(self.search_url, params)
+                self.assertEqual(sorted(ids), sorted(c.id for c in self.clinics))
+                
+                # 한 번에 조회한 순서와 동일
+                full = self.client.get(self.search_url, {**params, 'page_size': 50})
+                self.assertEqual(ids, [item['id'] for item in full.data['results']])
+    
+    def test_search_count_modes(self):
+        """전체 개수는 요청 시에만 계산"""
+        response = self.client.get(self.search_url, {'page_size': 3})
+        self.assertIsNone(response.data['count'])
+        
+        response = self.client.get(self.search_url, {'page_size': 3, 'count': 'exact'})
+        self.assertEqual(response.data['count'], 11)
+        
+        response = self.client.get(self.search_url, {'page_size': 3, 'count': 'estimate'})
+        self.assertIsInstance(response.data['count'], int)
+    
+    def test_search_legacy_page_mode(self):
+        """페이지 번호 방식 호환 및 커서 전환 테스트"""
+        first = self.client.get(self.search_url, {'page': 1, 'page_size': 4, 'sort': 'reviews'})
+        self.assertEqual(first.data['count'], 11)
+        self.assertEqual(first.data['total_pages'], 3)
+        
+        second = self.client.get(self.search_url, {'page': 2, 'page_size': 4, 'sort': 'reviews'})
+        by_cursor = self.client.get(
+            self.search_url,
+            {'cursor': first.data['next_cursor'], 'page_size': 4, 'sort': 'reviews'}
+        )
+        self.assertEqual(
+            [item['id'] for item in second.data['results']],
+            [item['id'] for item in by_cursor.data['results']]
+        )
+    
+    def test_list_view_cursor(self):
+        """치과 목록 API 커서 페이지네이션 테스트"""
+        ids = self.collect(self.list_url, {'ordering': 'total_reviews'})
+        expected = Clinic.objects.order_by('total_reviews', 'id').values_list('id', flat=True)
+        self.assertEqual(ids, list(expected))
+        
+        ids = self.collect(self.list_url, {})
+        self.assertEqual(sorted(ids), sorted(c.id for c in self.clinics))
+    
+    def test_list_view_page_number(self):
+        """치과 목록 API 기존 페이지 번호 방식 호환 테스트"""
+        params = {'ordering': 'total_reviews', 'page_size': 4}
+        expected = list(Clinic.objects.order_by('total_reviews', 'id').values_list('id', flat=True))
+        
+        first = self.client.get(self.list_url, {**params, 'page': 1})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data['count'], 11)
+        self.assertIsNone(first.data['previous'])
+        self.assertIn('page=2', first.data['next'])
+        self.assertEqual([item['id'] for item in first.data['results']], expected[:4])
+        
+        second = self.client.get(self.list_url, {**params, 'page': 2})
+        self.assertEqual([item['id'] for item in second.data['results']], expected[4:8])
+        
+        # 페이지 번호 응답의 커서로 이어서 조회
+        by_cursor = self.client.get(self.list_url, {**params, 'cursor': first.data['next_cursor']})
+        self.assertEqual(
+            [item['id'] for item in by_cursor.data['results']],
+            [item['id'] for item in second.data['results']]
+        )
+        
+        last = self.client.get(self.list_url, {**params, 'page': 3})
+        self.assertIsNone(last.data['next'])
+        self.assertIsNone(last.data['next_cursor'])
+        
+        response = self.client.get(self.list_url, {**params, 'page': 99})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_invalid_cursor(self):
+        """잘못된 커서 테스트"""
+        # 형식 오류, 정렬 키 개수 불일치, 정렬 키 타입 불일치
+        for cursor in ('invalid', encode_cursor(['a', 1]), encode_cursor(['abc', 'x', 'y'])):
+            response = self.client.get(self.search_url, {'cursor': cursor, 'sort': 'reviews'})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        
+        response = self.client.get(self.list_url, {'cursor': 'invalid'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ClinicListSerializerQueryTest(APITestCase):
+    """치과 목록 직렬화 쿼리 수 회귀 테스트"""
+    
+    def setUp(self):
+        from apps.analysis.models import PriceData, SentimentAnalysis
+        from apps.reviews.models import Review
+        
+        self.url = reverse('api:clinics:clinic_list_create')
+        for i in range(15):
+            clinic = Clinic.objects.create(
+                name=f'쿼리 치과 {i}', address=f'주소 {i}', district='중구'
+            )
+            if i % 3 == 0:
+                continue  # 분석/가격 데이터가 없는 치과
+            review = Review.objects.create(
+                clinic=clinic, source='naver', original_text='좋아요',
+                reviewer_hash=f'hash{i}', external_id=f'ext{i}'
+            )
+            SentimentAnalysis.objects.create(
+                review=review, price_score=Decimal('0.5'), skill_score=Decimal('0.5'),
+                kindness_score=Decimal('0.5'), waiting_time_score=Decimal('0.5'),
+                facility_score=Decimal('0.5'), overtreatment_score=Decimal('-0.5'),
+                model_version='test', confidence_score=Decimal('0.9')
+            )
+            for price in (30000, 40000):
+                PriceData.objects.create(
+                    clinic=clinic, review=review, treatment_type='scaling', price=price,
+                    extraction_confidence=Decimal('0.9'), extraction_method='regex'
+                )
+    
+    def test_list_page_constant_queries(self):
+        """페이지 크기와 무관하게 쿼리 수 고정 (치과 1 + 감성 분석 1 + 가격 1)"""
+        for page_size in (5, 15):
+            with self.subTest(page_size=page_size):
+                with self.assertNumQueries(3):
+                    response = self.client.get(self.url, {'page_size': page_size})
+                self.assertEqual(len(response.data['results']), page_size)
+    
+    def test_batched_matches_single(self):
+        """일괄 직렬화 결과가 단건 직렬화 결과와 동일"""
+        clinics = list(Clinic.objects.order_by('id'))
+        batched = ClinicListSerializer(clinics, many=True).data
+        
+        for clinic, data in zip(clinics, batched):
+            single = ClinicListSerializer(clinic).data
+            self.assertEqual(data['aspect_scores'], single['aspect_scores'])
+            self.assertEqual(data['comprehensive_score'], single['comprehensive_score'])
+            self.assertEqual(data['price_info'], single['price_info'])
+        
+        self.assertEqual(
+            batched[1]['price_info'],
+            {'scaling': {'average_price': 35000, 'price_count': 2, 'currency': 'KRW'}}
+        )
+        self.assertEqual(batched[1]['aspect_scores']['price'], 4.0)
+        self.assertEqual(batched[0]['aspect_scores']['price'], 3.0)
+        self.assertEqual(batched[0]['price_info'], {})
+
+
+class ClinicReviewStatsTest(TestCase):
+    """치과 리뷰 통계 증분 갱신 테스트"""
+    
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name='통계 치과', address='서울 강남구', district='강남구')
+        self.other = Clinic.objects.create(name='다른 치과', address='서울 서초구', district='서초구')
+        self.count = 0
+    
+    def create_review(self, clinic=None, rating=5, **kwargs):
+        from apps.reviews.models import Review
+        self.count += 1
+        return Review.objects.create(
+            clinic=clinic or self.clinic, source='naver', original_text='좋아요',
+            original_rating=rating, reviewer_hash=f'hash{self.count}',
+            external_id=f'stats{self.count}', **kwargs
+        )
+    
+    def assert_stats(self, clinic, total, average):
+        clinic.refresh_from_db()
+        self.assertEqual(clinic.total_reviews, total)
+        self.assertEqual(clinic.average_rating, Decimal(average) if average else None)
+        
+        # 증분 결과가 전체 재계산 결과와 같은지 확인
+        self.assertEqual(Clinic.reconcile_review_stats(), 0)
+    
+    def test_processed_reviews_counted(self):
+        """처리 완료 리뷰만 통계에 반영"""
+        self.create_review(rating=5, is_processed=True)
+        self.create_review(rating=4, is_processed=True)
+        self.create_review(rating=1)
+        self.create_review(rating=None, is_processed=True)
+        self.assert_stats(self.clinic, 3, '4.50')
+    
+    def test_state_transitions(self):
+        """처리 완료/중복/평점/치과 변경 시 변화분만 반영"""
+        review = self.create_review(rating=3)
+        self.create_review(rating=4, is_processed=True)
+        self.assert_stats(self.clinic, 1, '4.00')
+        
+        review.is_processed = True
+        review.save()
+        self.assert_stats(self.clinic, 2, '3.50')
+        
+        review.original_rating = 5
+        review.save(update_fields=['original_rating'])
+        self.assert_stats(self.clinic, 2, '4.50')
+        
+        review.clinic = self.other
+        review.save()
+        self.assert_stats(self.clinic, 1, '4.00')
+        self.assert_stats(self.other, 1, '5.00')
+        
+        review.is_duplicate = True
+        review.save()
+        self.assert_stats(self.other, 0, None)
+    
+    def test_delete_removes_review(self):
+        """리뷰 삭제 시 통계에서 제외"""
+        review = self.create_review(rating=2, is_processed=True)
+        self.create_review(rating=4, is_processed=True)
+        
+        from apps.reviews.models import Review
+        Review.objects.get(pk=review.pk).delete()
+        self.assert_stats(self.clinic, 1, '4.00')
+    
+    def test_bulk_transitions(self):
+        """일괄 처리 완료/중복 표시도 치과 통계에 반영"""
+        from apps.reviews.services import ReviewService
+        first = self.create_review(rating=5)
+        second = self.create_review(rating=2)
+        
+        ReviewService.mark_reviews_as_processed([first.pk, second.pk])
+        self.assert_stats(self.clinic, 2, '3.50')
+        
+        # 이미 처리 완료된 리뷰를 다시 표시해도 중복 반영되지 않음
+        ReviewService.mark_reviews_as_processed([first.pk])
+        ReviewService.mark_reviews_as_duplicate([second.pk])
+        self.assert_stats(self.clinic, 1, '5.00')
+    
+    def test_reconcile_corrects_drift(self):
+        """어긋난 통계는 보정 작업으로 복구"""
+        self.create_review(rating=4, is_processed=True)
+        Clinic.objects.filter(pk=self.clinic.pk).update(total_reviews=7, rating_sum=1)
+        
+        self.assertEqual(Clinic.reconcile_review_stats(), 1)
+        self.assert_stats(self.clinic, 1, '4.00')
+    
+    def test_save_without_stats_fields_skips_update(self):
+        """통계와 무관한 필드만 저장하면 치과 통계를 갱신하지 않음"""
+        review = self.create_review(rating=4, is_processed=True)
+        # 리뷰 UPDATE + 조건부 GET용 치과 data_updated_at 갱신
+        with self.assertNumQueries(2):
+            review.save(update_fields=['processed_text'])
+
+
+class BulkIngestTest(TestCase):
+    """대량 적재 모드 테스트"""
+    
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name='적재 치과', address='서울 강남구', district='강남구')
+    
+    def create_review(self, index, rating=4, **kwargs):
+        from apps.reviews.models import Review
+        return Review.objects.create(
+            clinic=self.clinic, source='naver', original_text=f'친절한 치과 {index}',
+            original_rating=rating, reviewer_hash=f'hash{index}',
+            external_id=f'ingest{index}', is_processed=True, **kwargs
+        )
+    
+    def test_receivers_deferred_until_exit(self):
+        """블록 안에서는 행마다 INSERT만 하고 종료 시 일괄 갱신"""
+        from apps.reviews.models import Review
+        
+        with bulk_ingest():
+            with self.assertNumQueries(1):
+                first = self.create_review(1, rating=5)
+            for i in range(2, 6):
+                self.create_review(i, rating=3)
+            
+            self.clinic.refresh_from_db()
+            self.assertEqual(self.clinic.total_reviews, 0)
+            self.assertIsNone(Review.objects.get(pk=first.pk).search_vector)
+        
+        self.assertIsNone(current_batch())
+        self.clinic.refresh_from_db()
+        self.assertEqual(self.clinic.total_reviews, 5)
+        self.assertEqual(self.clinic.average_rating, Decimal('3.40'))
+        self.assertFalse(Review.objects.filter(clinic=self.clinic, search_vector__isnull=True).exists())
+        self.assertEqual(Clinic.reconcile_review_stats(), 0)
+    
+    def test_clinics_and_analyses_deferred(self):
+        """치과 검색 벡터와 감성 분석 요약도 종료 시 갱신"""
+        from apps.analysis.models import ClinicAspectSummary, SentimentAnalysis
+        
+        with bulk_ingest():
+            clinic = Clinic.objects.create(name='신규 적재 치과', address='서울 마포구', district='마포구')
+            self.assertIsNone(Clinic.objects.get(pk=clinic.pk).search_vector)
+            
+            review = self.create_review(1)
+            SentimentAnalysis.objects.create(
+                review=review, price_score=Decimal('0.4'), skill_score=Decimal('0.4'),
+                kindness_score=Decimal('0.4'), waiting_time_score=Decimal('0.4'),
+                facility_score=Decimal('0.4'), overtreatment_score=Decimal('0.4'),
+                model_version='test', confidence_score=Decimal('0.5')
+            )
+            self.assertFalse(ClinicAspectSummary.objects.exists())
+        
+        self.assertIsNotNone(Clinic.objects.get(pk=clinic.pk).search_vector)
+        summary = ClinicAspectSummary.objects.get(clinic=self.clinic)
+        self.assertEqual(summary.analysis_count, 1)
+        self.assertAlmostEqual(summary.averages()['skill'], 0.4)
+    
+    def test_nested_blocks_flush_once(self):
+        """중첩 블록은 가장 바깥 블록 종료 시 한 번만 갱신"""
+        with bulk_ingest() as outer:
+            with bulk_ingest() as inner:
+                self.assertIs(inner, outer)
+                self.create_review(1)
+            self.clinic.refresh_from_db()
+            self.assertEqual(self.clinic.total_reviews, 0)
+        
+        self.clinic.refresh_from_db()
+        self.assertEqual(self.clinic.total_reviews, 1)
+    
+    def test_flush_on_error(self):
+        """블록이 예외로 끝나도 이미 저장된 행은 후처리"""
+        with self.assertRaises(RuntimeError):
+            with bulk_ingest():
+                self.create_review(1)
+                raise RuntimeError('중단')
+        
+        self.assertIsNone(current_batch())
+        self.clinic.refresh_from_db()
+        self.assertEqual(self.clinic.total_reviews, 1)
+
+
+class SearchVectorRefreshTest(TestCase):
+    """검색 벡터 일괄 갱신 테스트"""
+    
+    def setUp(self):
+        self.clinics = [
+            Clinic.objects.create(name=f'색인치과{i}', address='서울 중구', district='중구')
+            for i in range(5)
+        ]
+    
+    def matches(self, query):
+        from .search import full_text_search
+        return list(full_text_search(Clinic.objects.all(), query).values_list('id', flat=True))
+    
+    def test_new_rows_indexed(self):
+        """생성 시 색인되어 갱신 대상이 없음"""
+        self.assertEqual(self.matches('색인치과3'), [self.clinics[3].id])
+        self.assertEqual(Clinic.refresh_search_vectors(), 0)
+    
+    def test_refresh_only_stale_rows(self):
+        """색인 이후 수정된 행만 다시 색인"""
+        clinic = self.clinics[1]
+        clinic.name = '새이름치과'
+        clinic.save()
+        Clinic.objects.filter(pk=self.clinics[2].pk).update(search_vector=None)
+        
+        self.assertEqual(Clinic.refresh_search_vectors(batch_size=2), 2)
+        self.assertEqual(self.matches('새이름치과'), [clinic.id])
+        self.assertEqual(Clinic.refresh_search_vectors(), 0)
+        
+        # 전체 재색인
+        self.assertEqual(Clinic.refresh_search_vectors(full=True, batch_size=2), 5)
+    
+    def test_refresh_reviews(self):
+        """리뷰 검색 벡터 일괄 갱신"""
+        from apps.reviews.models import Review
+        review = Review.objects.create(
+            clinic=self.clinics[0], source='naver', original_text='친절해요',
+            reviewer_hash='hash', external_id='vector1'
+        )
+        self.assertEqual(Review.refresh_search_vectors(), 0)
+        
+        Review.objects.filter(pk=review.pk).update(search_vector=None)
+        self.assertEqual(Review.refresh_search_vectors(), 1)
+        self.assertTrue(Review.objects.filter(search_vector='친절해요').exists())
+
+
+class ClinicAutocompleteTest(APITestCase):
+    """치과명/지역구 자동완성 테스트"""
+    
+    def setUp(self):
+        self.url = reverse('api:clinics:clinic_autocomplete')
+        # 테스트마다 데이터가 바뀌므로 조회할 때마다 버전 확인
+        patcher = mock.patch('apps.clinics.autocomplete.VERSION_CHECK_INTERVAL', 0)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.snu = Clinic.objects.create(
+                name='서울대학교치과병원', address='서울 종로구', district='종로구', total_reviews=100
+            )
+            self.seoul = Clinic.objects.create(
+                name='서울 바른치과', address='서울 서초구', district='서초구', total_reviews=10
+            )
+            self.gangnam = Clinic.objects.create(
+                name='강남 미소치과', address='서울 강남구', district='강남구', total_reviews=5
+            )
+    
+    def suggest(self, q, **params):
+        response = self.client.get(self.url, {'q': q, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [(item['type'], item['name']) for item in response.data['results']]
+    
+    def test_jamo_keys(self):
+        """자모/초성 분해 테스트"""
+        self.assertEqual(to_jamo('서울'), 'ㅅㅓㅇㅜㄹ')
+        self.assertEqual(to_jamo('닭 과'), 'ㄷㅏㄹㄱㄱㅗㅏ')
+        self.assertEqual(to_choseong('서울대 Dental'), 'ㅅㅇㄷdental')
+    
+    def test_prefix_and_choseong(self):
+        """접두어/초성/입력 중인 음절 검색 테스트"""
+        self.assertEqual(self.suggest('ㅅㅇㄷ'), [('clinic', '서울대학교치과병원')])
+        # 리뷰 수 많은 순
+        self.assertEqual(self.suggest('서울'), [('clinic', '서울대학교치과병원'), ('clinic', '서울 바른치과')])
+        # "서울"을 입력하는 중간 상태 ("성")
+        self.assertEqual(len(self.suggest('성')), 2)
+        # 두 번째 단어 접두어
+        self.assertEqual(self.suggest('미소'), [('clinic', '강남 미소치과')])
+        # 지역구가 먼저
+        self.assertEqual(self.suggest('강남'), [('district', '강남구'), ('clinic', '강남 미소치과')])
+        self.assertEqual(self.suggest(''), [])
+        self.assertEqual(self.suggest('서울', limit=1), [('clinic', '서울대학교치과병원')])
+    
+    def test_index_rebuilt_after_rename(self):
+        """치과명 변경 시 인덱스 재생성 테스트"""
+        before = get_autocomplete_index()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.gangnam.name = '역삼 미소치과'
+            self.gangnam.save(update_fields=['name'])
+        
+        after = get_autocomplete_index()
+        self.assertIsNot(before, after)
+        self.assertEqual(self.suggest('역삼'), [('clinic', '역삼 미소치과')])
+        
+        # 이름과 무관한 필드 저장은 인덱스 유지
+        self.gangnam.update_review_stats()
+        self.assertIs(get_autocomplete_index(), after)
+    
+    def test_candidate_scan_bounded(self):
+        """후보가 많아도 결과 수가 제한되는지 테스트"""
+        index = AutocompleteIndex([
+            {'type': 'clinic', 'id': i, 'name': f'치과{i}', 'district': '중구', 'weight': i}
+            for i in range(1000)
+        ])
+        results = index.suggest('ㅊ', limit=50)
+        self.assertEqual(len(results), 20)
+        # 키 순서(치과0, 치과1, 치과10, ...)가 아닌 가중치 순 상위 결과
+        self.assertEqual(
+            [item['name'] for item in results[:3]], ['치과999', '치과998', '치과997']
+        )
+        self.assertEqual(index.suggest('치과99', limit=1)[0]['name'], '치과999')
+
+    def test_ranking_refreshed_after_review_change(self):
+        """리뷰 수 변경 시 순위 갱신 (재생성 간격이 지난 뒤)"""
+        self.assertEqual(self.suggest('서울')[0], ('clinic', '서울대학교치과병원'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Clinic.apply_review_delta(self.seoul.id, count=500)
+
+        with mock.patch('apps.clinics.autocomplete.RANKING_REFRESH_INTERVAL', 3600):
+            self.assertEqual(self.suggest('서울')[0], ('clinic', '서울대학교치과병원'))
+        with mock.patch('apps.clinics.autocomplete.RANKING_REFRESH_INTERVAL', 0):
+            self.assertEqual(self.suggest('서울')[0], ('clinic', '서울 바른치과'))
+
+
+class ClinicConditionalGetTest(APITestCase):
+    """치과 상세/분석 조건부 GET 테스트"""
+    
+    def setUp(self):
+        self.clinic = Clinic.objects.create(name='조건부 치과', address='서울 중구', district='중구')
+        self.detail_url = reverse('api:clinics:clinic_detail', args=[self.clinic.pk])
+        self.analysis_url = reverse('api:clinic_analysis', args=[self.clinic.pk])
+    
+    def test_detail_not_modified(self):
+        """ETag/Last-Modified 일치 시 캐시 조회만으로 304"""
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        etag = response['ETag']
+        last_modified = response['Last-Modified']
+        
+        with self.assertNumQueries(0):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        response = self.client.get(self.detail_url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_not_modified_without_persistent_cache(self):
+        """값을 보관하지 않는 캐시에서도 치과 행 조회 한 번으로 304, 변경 후에는 200"""
+        from apps.reviews.models import Review
+        
+        etag = self.client.get(self.detail_url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        Review.objects.create(
+            clinic=self.clinic, source='naver', original_text='친절해요',
+            reviewer_hash='hash', external_id='conditional3'
+        )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_review_change_invalidates(self):
+        """리뷰/가격 데이터가 바뀌면 새 ETag로 200"""
+        from apps.analysis.models import PriceData
+        from apps.reviews.models import Review
+        
+        etag = self.client.get(self.detail_url)['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            review = Review.objects.create(
+                clinic=self.clinic, source='naver', original_text='친절해요',
+                reviewer_hash='hash', external_id='conditional1', is_processed=True
+            )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        
+        etag = response['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            PriceData.objects.create(
+                clinic=self.clinic, review=review, treatment_type='scaling', price=30000,
+                extraction_confidence=Decimal('0.9'), extraction_method='regex'
+            )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    def test_invalidation_waits_for_commit(self):
+        """토큰 삭제는 커밋 전에는 실행되지 않음"""
+        from apps.reviews.models import Review
+        
+        self.client.get(self.detail_url)
+        key = CLINIC_VERSION_KEY.format(self.clinic.id)
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Review.objects.create(
+                clinic=self.clinic, source='naver', original_text='친절해요',
+                reviewer_hash='hash', external_id='conditional2', is_processed=True
+            )
+            self.assertIsNotNone(cache.get(key))
+        self.assertTrue(callbacks)
+        self.assertIsNone(cache.get(key))
+    
+    def test_analysis_not_modified(self):
+        """분석 API 조건부 GET"""
+        response = self.client.get(self.analysis_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        response = self.client.get(self.analysis_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    
+    def test_recommendation_detail_view(self):
+        """추천 앱 치과 상세 API 조건부 GET"""
+        from rest_framework.test import APIRequestFactory
+        from apps.recommendations.views import ClinicDetailAPIView
+        
+        view = ClinicDetailAPIView.as_view()
+        factory = APIRequestFactory()
+        response = view(factory.get('/'), clinic_id=self.clinic.pk)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        
+        response = view(factory.get('/', HTTP_IF_NONE_MATCH=response['ETag']), clinic_id=self.clinic.pk)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+    
+    def test_missing_clinic(self):
+        """없는 치과는 조건부 처리 없이 404"""
+        response = self.client.get(reverse('api:clinics:clinic_detail', args=[self.clinic.pk + 1000]))
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class StreamingListTest(APITestCase):
+    """목록 API 스트리밍 응답 테스트"""
+    
+    def setUp(self):
+        self.clinics = [
+            Clinic.objects.create(
+                name=f'스트림 치과 {i}', address=f'서울 강남구 역삼동 {i}', district='강남구',
+                total_reviews=i
+            )
+            for i in range(5)
+        ]
+        self.url = reverse('api:clinics:clinic_by_district_location')
+    
+    def _body(self, response):
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+    
+    def test_stream_rows_chunks(self):
+        """청크 단위로 읽어도 모든 행을 순서대로 반환"""
+        self.assertEqual([len(chunk) for chunk in iterate_chunks(range(5), 2)], [2, 2, 1])
+        
+        queryset = Clinic.objects.order_by('id').values_list('id', flat=True)
+        self.assertEqual(list(stream_rows(queryset, chunk_size=2)), [c.id for c in self.clinics])
+    
+    def test_district_json_stream(self):
+        """?stream=json이면 일반 응답과 같은 형태"""
+        expected = self.client.get(self.url, {'district': '강남구'}).json()
+        
+        response = self.client.get(self.url, {'district': '강남구', 'stream': 'json'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        data = json.loads(self._body(response))
+        
+        self.assertEqual(data['count'], 5)
+        self.assertEqual(data['district'], '강남구')
+        self.assertEqual(data['results'], expected['results'])
+    
+    def test_district_ndjson_stream(self):
+        """?stream=ndjson이면 메타데이터 한 줄 + 행마다 한 줄"""
+        response = self.client.get(self.url, {'district': '강남구', 'stream': 'ndjson'})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = self._body(response).splitlines()
+        self.assertEqual(json.loads(lines[0]), {'district': '강남구', 'location': ''})
+        rows = [json.loads(line) for line in lines[1:]]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]['name'], '스트림 치과 4')
+    
+    def test_empty_stream(self):
+        """결과가 없어도 올바른 JSON"""
+        response = self.client.get(self.url, {'district': '없는구', 'stream': '1'})
+        data = json.loads(self._body(response))
+        self.assertEqual(data['results'], [])
+        self.assertEqual(data['count'], 0)
+    
+    def test_price_comparison_stream(self):
+        """가격 비교 스트리밍은 통계를 먼저 보내고 가격 목록을 이어서 보냄"""
+        from apps.analysis.models import PriceData, RegionalPriceStats
+        
+        for i, clinic in enumerate(self.clinics):
+            PriceData.objects.create(
+                clinic=clinic, treatment_type='scaling', price=30000 + i * 1000,
+                extraction_confidence=Decimal('0.9'), extraction_method='regex', is_verified=True
+            )
+        url = reverse('api:price_comparison')
+        params = {'district': '강남구', 'treatment_type': 'scaling'}
+        expected = self.client.get(url, params).json()
+        
+        data = json.loads(self._body(self.client.get(url, {**params, 'stream': 'json'})))
+        self.assertEqual(data['stats'], expected['stats'])
+        self.assertEqual(data['prices'], expected['prices'])
+        self.assertEqual([row['price'] for row in data['prices']], [30000, 31000, 32000, 33000, 34000])
+        
+        RegionalPriceStats.objects.create(
+            district='강남구', treatment_type='scaling', min_price=30000, max_price=34000,
+            avg_price=Decimal('32000'), median_price=32000, sample_count=5
+        )
+        lines = self._body(self.client.get(reverse('api:regional_price_stats'), {'stream': 'ndjson'})).splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(json.loads(lines[0])['sample_count'], 5)
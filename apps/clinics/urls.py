@@ -10,11 +10,15 @@ urlpatterns = [
     
     # 검색 및 필터링
     path('search/', views.clinic_search, name='clinic_search'),
+    path('autocomplete/', views.clinic_autocomplete, name='clinic_autocomplete'),
     path('nearby/', views.clinic_nearby, name='clinic_nearby'),
+    path('clusters/', views.clinic_clusters, name='clinic_clusters'),
+    path('viewport/', views.clinic_viewport, name='clinic_viewport'),
     path('by-district/', views.clinic_by_district_and_location, name='clinic_by_district_location'),
     
     # 위치 서비스
     path('geocode/', views.geocode_address, name='geocode_address'),
+    path('geocode/stats/', views.geocode_stats, name='geocode_stats'),
     path('reverse-geocode/', views.reverse_geocode, name='reverse_geocode'),
     path('nearby-districts/', views.nearby_districts, name='nearby_districts'),
     path('seoul-districts/', views.seoul_districts, name='seoul_districts'),
@@ -0,0 +1,107 @@
+"""
+치과 데이터 버전 카운터
+
+치과 좌표/이름 등 프로세스 로컬 인덱스의 원본 데이터가 바뀌면 버전을 올리고, 각 프로세스는
+버전이 달라졌을 때만 인덱스를 다시 만든다.
+
+버전은 캐시에서 읽는다. DB 행(ClinicDataVersion)은 캐시가 비었을 때(만료, 재시작,
+값을 보관하지 않는 백엔드)만 읽는 원본이다. 증가는 변경한 트랜잭션이 커밋된 뒤
+(on_commit) 짧은 별도 UPDATE로 실행하므로, 치과를 쓰는 트랜잭션들이 이 행의 잠금을 잡은 채
+서로를 기다리지 않고 커밋 전에 다른 프로세스가 새 버전으로 옛 데이터를 읽는 일도 없다.
+
+리뷰 수처럼 순위에만 쓰이는 값은 별도의 순위 버전(같은 테이블의 다른 행)으로 관리해,
+리뷰가 들어올 때마다 좌표/이름 기반 인덱스까지 다시 만들지 않도록 한다.
+
+번호와 증가 시각을 함께 버전으로 쓴다. 번호만 쓰면 행이 초기화됐을 때(테스트 롤백 등)
+다른 데이터에 같은 번호가 다시 붙을 수 있다.
+"""
+from typing import Optional, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+CLINIC_DATA_VERSION_KEY = 'clinics:data_version'
+# 리뷰 수처럼 순위에만 쓰이는 값의 버전 (좌표/이름 인덱스는 다시 만들지 않음)
+CLINIC_RANKING_VERSION_KEY = 'clinics:ranking_version'
+
+
+def _load_version(row_id: int) -> Tuple[int, Optional[object]]:
+    """DB 행에서 버전 읽기"""
+    from .models import ClinicDataVersion
+    row = ClinicDataVersion.objects.filter(pk=row_id).values_list('version', 'updated_at').first()
+    return row or (0, None)
+
+
+def _read_version(key: str, row_id: int) -> Tuple[int, Optional[object]]:
+    """캐시의 버전 반환 (없으면 DB 행에서 읽어 캐시에 저장)"""
+    version = cache.get(key)
+    if version is None:
+        version = _load_version(row_id)
+        # set이 아닌 add: 그 사이 증가한 버전을 옛 값으로 덮어쓰지 않도록
+        cache.add(key, version, None)
+    return tuple(version)
+
+
+def _increment_version(key: str, row_id: int):
+    """DB 행의 버전을 올리고 캐시에 반영"""
+    from .models import ClinicDataVersion
+    now = timezone.now()
+    with transaction.atomic():
+        updated = ClinicDataVersion.objects.filter(pk=row_id).update(
+            version=F('version') + 1, updated_at=now
+        )
+        if not updated:
+            ClinicDataVersion.objects.get_or_create(pk=row_id, defaults={'version': 1})
+    cache.set(key, _load_version(row_id), None)
+
+
+def _increment_clinic_version():
+    """치과 데이터 버전 증가 (커밋 후 콜백)"""
+    from .models import ClinicDataVersion
+    _increment_version(CLINIC_DATA_VERSION_KEY, ClinicDataVersion.SINGLETON_ID)
+
+
+def _increment_ranking_version():
+    """치과 순위 버전 증가 (커밋 후 콜백)"""
+    from .models import ClinicDataVersion
+    _increment_version(CLINIC_RANKING_VERSION_KEY, ClinicDataVersion.RANKING_ID)
+
+
+def _on_commit_once(func):
+    """커밋 후 func 실행 예약 (같은 트랜잭션에서 여러 번 호출해도 한 번만 실행)"""
+    connection = transaction.get_connection()
+    if connection.in_atomic_block and any(
+        getattr(callback, 'pending', None) is func for _, callback, *_ in connection.run_on_commit
+    ):
+        return
+
+    def callback():
+        callback.pending = None
+        func()
+
+    callback.pending = func
+    transaction.on_commit(callback)
+
+
+def get_clinic_version() -> Tuple[int, Optional[object]]:
+    """현재(커밋된) 치과 데이터 버전 반환 (번호, 증가 시각)"""
+    from .models import ClinicDataVersion
+    return _read_version(CLINIC_DATA_VERSION_KEY, ClinicDataVersion.SINGLETON_ID)
+
+
+def get_clinic_ranking_version() -> Tuple[int, Optional[object]]:
+    """현재(커밋된) 치과 순위(리뷰 수) 버전 반환 (번호, 증가 시각)"""
+    from .models import ClinicDataVersion
+    return _read_version(CLINIC_RANKING_VERSION_KEY, ClinicDataVersion.RANKING_ID)
+
+
+def bump_clinic_version():
+    """치과 데이터 버전 증가 (호출한 트랜잭션이 커밋된 뒤 실행, 롤백되면 취소)"""
+    _on_commit_once(_increment_clinic_version)
+
+
+def bump_clinic_ranking_version():
+    """치과 순위 버전 증가 (호출한 트랜잭션이 커밋된 뒤 실행, 롤백되면 취소)"""
+    _on_commit_once(_increment_ranking_version)
@@ -2,10 +2,11 @@ from rest_framework import generics, status, filters
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from django.db.models import Q, Count, Avg, Value, DecimalField, IntegerField
 from django.db.models.functions import Coalesce
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.decorators import method_decorator
 from .models import Clinic
 from .serializers import (
     ClinicListSerializer, 
@@ -13,18 +14,68 @@ from .serializers import (
     ClinicCreateSerializer,
     ClinicUpdateSerializer
 )
-from .location_services import location_service, LocationUtils
+from .location_services import location_service
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+    keyset_filter,
+    cursor_value,
+    InvalidCursor,
+    KeysetPagination
+)
+from .clustering import get_cluster_pyramid, MAX_ZOOM
+from .search import search_clinics
+from .autocomplete import get_autocomplete_index, DEFAULT_LIMIT
+from .conditional import conditional_clinic_view
+from .streaming import stream_format, stream_rows, streaming_response
+
+
+# 최근접 k개 모드의 최대 페이지 크기
+MAX_NEARBY_K = 100
+
+# 뷰포트 조회 페이지 크기 및 fields= 로 선택 가능한 필드
+VIEWPORT_PAGE_SIZE = 100
+VIEWPORT_MAX_PAGE_SIZE = 500
+VIEWPORT_ORDERING = ('latitude', 'longitude', 'id')
+VIEWPORT_DEFAULT_FIELDS = ('id', 'name', 'latitude', 'longitude')
+# 검색 정렬 모드별 정렬 키 (마지막은 항상 id)
+SEARCH_ORDERINGS = {
+    'relevance': ('-rank', '-total_reviews', 'id'),
+    'recommended': ('-total_reviews', '-avg_rating_filled', 'id'),
+    'rating': ('-avg_rating_filled', '-total_reviews', 'id'),
+    'reviews': ('-total_reviews', '-avg_rating_filled', 'id'),
+    'name': ('name', 'id'),
+}
+
+VIEWPORT_FIELDS = (
+    'id', 'name', 'address', 'district', 'phone', 'latitude', 'longitude',
+    'average_rating', 'total_reviews', 'is_verified',
+    'has_parking', 'night_service', 'weekend_service',
+)
 
 
-class ClinicPagination(PageNumberPagination):
-    """치과 목록 페이지네이션"""
+class ClinicPagination(KeysetPagination):
+    """치과 목록 커서 페이지네이션 (?page=N 요청은 기존 페이지 번호 응답으로 처리)"""
+    page_size = 20
+    max_page_size = 100
+    page_query_param = 'page'
+
+
+class SearchPagination(KeysetPagination):
+    """치과 검색 커서 페이지네이션"""
     page_size = 20
-    page_size_query_param = 'page_size'
     max_page_size = 100
 
 
 class ClinicListCreateView(generics.ListCreateAPIView):
-    """치과 목록 조회 및 생성"""
+    """
+    치과 목록 조회 및 생성
+
+    목록은 커서 페이지네이션으로 응답한다: {count, next_cursor, has_more, page_size, results}.
+    count는 ?count=exact|estimate일 때만 채워지고 기본값은 null이다. 다음 페이지는
+    ?cursor=<next_cursor>로 조회한다. 기존 ?page=N 요청은 이전과 같은
+    {count, next, previous, results}에 next_cursor를 더해 응답한다.
+    """
     queryset = Clinic.objects.all()
     
     # 정렬에 사용할 기본 지표 주입 (NULL일 때 0으로 처리)
@@ -54,7 +105,8 @@ class ClinicListCreateView(generics.ListCreateAPIView):
         return ClinicListSerializer
     
     def get_queryset(self):
-        queryset = Clinic.objects.select_related().prefetch_related('reviews')
+        # 목록 시리얼라이저는 리뷰를 직접 읽지 않으므로 prefetch 하지 않음
+        queryset = Clinic.objects.all()
         
         # 지역 필터링
         district = self.request.query_params.get('district')
@@ -77,13 +129,7 @@ class ClinicListCreateView(generics.ListCreateAPIView):
         
         return queryset
     
-    def perform_create(self, serializer):
-        """치과 생성 시 추가 로직"""
-        clinic = serializer.save()
-        # 검색 벡터 업데이트
-        clinic.update_search_vector()
-
-
+@method_decorator(conditional_clinic_view('pk'), name='get')
 class ClinicDetailView(generics.RetrieveUpdateDestroyAPIView):
     """치과 상세 정보 조회, 수정, 삭제"""
     queryset = Clinic.objects.all()
@@ -112,20 +158,16 @@ def clinic_search(request):
     query = request.GET.get('q', '').strip()
     district = request.GET.get('district', '').strip()
     treatment = request.GET.get('treatment', '').strip()
-    sort = request.GET.get('sort', 'recommended').strip()
-    page = int(request.GET.get('page', 1))
-    page_size = int(request.GET.get('page_size', 20))
-    
-    queryset = Clinic.objects.all()
+    sort = request.GET.get('sort', 'relevance' if query else 'recommended').strip()
     
-    # 텍스트 검색
-    if query:
-        queryset = queryset.filter(
-            Q(name__icontains=query) |
-            Q(address__icontains=query) |
-            Q(specialties__icontains=query) |
-            Q(description__icontains=query)
+    # 평점이 없는 치과는 0점으로 정렬 (커서 비교를 위해 NULL 제거)
+    queryset = Clinic.objects.annotate(
+        avg_rating_filled=Coalesce(
+            'average_rating',
+            Value(0),
+            output_field=DecimalField(max_digits=3, decimal_places=2)
         )
+    )
     
     # 지역 필터
     if district:
@@ -136,35 +178,86 @@ def clinic_search(request):
         # specialties 필드에서 검색
         queryset = queryset.filter(specialties__icontains=treatment)
     
-    # 정렬
-    if sort == 'recommended':
-        queryset = queryset.order_by('-total_reviews_filled', '-avg_rating_filled')
-    elif sort == 'rating':
-        queryset = queryset.order_by('-avg_rating_filled', '-total_reviews_filled')
-    elif sort == 'reviews':
-        queryset = queryset.order_by('-total_reviews_filled', '-avg_rating_filled')
-    elif sort == 'name':
-        queryset = queryset.order_by('name')
-    else:
-        queryset = queryset.order_by('-total_reviews', '-average_rating')
-    
-    # 페이지네이션
+    # 텍스트 검색 (search_vector 전문 검색, 결과가 없으면 부분 일치)
+    if query:
+        queryset = search_clinics(queryset, query)
+    elif sort == 'relevance':
+        sort = 'recommended'
+    
+    # 정렬 (정렬 키 마지막에 id를 두어 커서가 항상 한 행을 가리키도록 함)
+    if sort not in SEARCH_ORDERINGS:
+        sort = 'recommended'
+    queryset = queryset.order_by(*SEARCH_ORDERINGS[sort])
+    
+    # 기존 페이지 번호 방식 (page 파라미터가 있고 커서가 없을 때)
+    if 'page' in request.GET and not request.GET.get('cursor'):
+        return _clinic_search_by_page(request, queryset, query, district, treatment, sort)
+    
+    # 커서 페이지네이션 (깊은 페이지도 첫 페이지와 같은 비용)
+    paginator = SearchPagination()
+    clinics = paginator.paginate_queryset(queryset, request)
+    serializer = ClinicListSerializer(clinics, many=True)
+    
+    return Response({
+        'results': serializer.data,
+        **paginator.get_page_metadata(),
+        'query': query,
+        'district': district,
+        'treatment': treatment,
+        'sort': sort
+    })
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def clinic_autocomplete(request):
+    """치과명/지역구 자동완성 API (접두어 및 초성 검색)"""
+    query = request.GET.get('q', '').strip()
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        return Response({
+            'error': 'limit 값을 올바르게 입력해주세요.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    results = get_autocomplete_index().suggest(query, limit) if query else []
+    return Response({
+        'query': query,
+        'results': results,
+        'count': len(results)
+    })
+
+
+def _clinic_search_by_page(request, queryset, query, district, treatment, sort):
+    """페이지 번호 방식 검색 결과 (OFFSET 사용)"""
+    page = int(request.GET.get('page', 1))
+    page_size = int(request.GET.get('page_size', 20))
+    
     total_count = queryset.count()
     start = (page - 1) * page_size
     end = start + page_size
-    queryset = queryset[start:end]
+    clinics = list(queryset[start:end])
     
-    serializer = ClinicListSerializer(queryset, many=True)
+    serializer = ClinicListSerializer(clinics, many=True)
     
     # 페이지네이션 정보 계산
     has_next = end < total_count
     has_previous = page > 1
     
+    # 다음 페이지부터 커서 방식으로 이어서 조회할 수 있도록 커서 제공
+    next_cursor = None
+    if has_next and clinics:
+        next_cursor = encode_cursor([
+            cursor_value(getattr(clinics[-1], field.lstrip('-')))
+            for field in SEARCH_ORDERINGS[sort]
+        ])
+    
     return Response({
         'results': serializer.data,
         'count': total_count,
         'next': f"?page={page + 1}" if has_next else None,
         'previous': f"?page={page - 1}" if has_previous else None,
+        'next_cursor': next_cursor,
         'page': page,
         'page_size': page_size,
         'total_pages': (total_count + page_size - 1) // page_size,
@@ -174,6 +267,7 @@ def clinic_search(request):
         'sort': sort
     })
 
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def clinic_nearby(request):
@@ -195,22 +289,17 @@ def clinic_nearby(request):
             'error': '올바른 위도와 경도 값을 입력해주세요.'
         }, status=status.HTTP_400_BAD_REQUEST)
     
-    # 근처 치과 검색 (간단한 거리 계산)
-    queryset = Clinic.objects.all()
-    nearby_clinics = []
+    # 최근접 k개 모드 (거리 커서로 더 보기 지원)
+    if request.GET.get('k'):
+        return _clinic_nearby_top_k(request, lat, lng, radius)
     
-    for clinic in queryset:
-        if clinic.latitude and clinic.longitude:
-            distance = LocationUtils.calculate_distance(
-                lat, lng, clinic.latitude, clinic.longitude
-            )
-            if distance <= radius:
-                clinic_data = ClinicListSerializer(clinic).data
-                clinic_data['distance'] = round(distance, 2)
-                nearby_clinics.append(clinic_data)
+    # 근처 치과 검색 (공간 스냅샷에서 거리순으로 조회)
+    nearby_clinics = []
     
-    # 거리순 정렬
-    nearby_clinics.sort(key=lambda x: x['distance'])
+    for item in location_service.get_clinics_by_radius(lat, lng, radius):
+        clinic_data = ClinicListSerializer(item['clinic']).data
+        clinic_data['distance'] = item['distance_km']
+        nearby_clinics.append(clinic_data)
     
     return Response({
         'results': nearby_clinics,
@@ -220,6 +309,152 @@ def clinic_nearby(request):
     })
 
 
+def _clinic_nearby_top_k(request, lat, lng, radius):
+    """가까운 치과 k개만 직렬화하여 반환"""
+    try:
+        k = int(request.GET.get('k'))
+        after = decode_cursor(request.GET.get('cursor'), 2)
+        if after is not None:
+            # 커서는 (거리 km, 치과 id)
+            distance, clinic_id = after
+            if isinstance(distance, bool) or not isinstance(distance, (int, float)) \
+                    or isinstance(clinic_id, bool) or not isinstance(clinic_id, int):
+                raise InvalidCursor(f"잘못된 커서입니다: {after}")
+            after = (float(distance), clinic_id)
+    except (ValueError, InvalidCursor):
+        return Response({
+            'error': '올바른 k와 cursor 값을 입력해주세요.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    k = max(1, min(k, MAX_NEARBY_K))
+    
+    items, next_after = location_service.get_nearest_clinics_page(
+        lat, lng, k, radius, after=after
+    )
+    
+    serializer = ClinicListSerializer([item['clinic'] for item in items], many=True)
+    results = serializer.data
+    for clinic_data, item in zip(results, items):
+        clinic_data['distance'] = item['distance_km']
+    
+    return Response({
+        'results': results,
+        'count': len(results),
+        'next_cursor': encode_cursor(next_after) if next_after else None,
+        'has_more': next_after is not None,
+        'center': {'lat': lat, 'lng': lng},
+        'radius': radius,
+        'k': k
+    })
+
+
+def parse_bbox(value):
+    """
+    bbox 파라미터 파싱 ("서쪽 경도,남쪽 위도,동쪽 경도,북쪽 위도")
+    
+    Returns:
+        (south, west, north, east)
+    
+    Raises:
+        ValueError: 형식이나 범위가 올바르지 않은 경우
+    """
+    west, south, east, north = (float(part) for part in value.split(','))
+    if not (-90 <= south < north <= 90 and -180 <= west < east <= 180):
+        raise ValueError(f"잘못된 bbox: {value}")
+    return south, west, north, east
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def clinic_clusters(request):
+    """지도 마커 클러스터 API (뷰포트 셀별 치과 수)"""
+    try:
+        south, west, north, east = parse_bbox(request.GET.get('bbox', ''))
+        zoom = int(request.GET.get('zoom', ''))
+    except ValueError:
+        return Response({
+            'error': 'bbox(서,남,동,북)와 zoom 파라미터를 올바르게 입력해주세요.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    zoom = max(0, min(zoom, MAX_ZOOM))
+    level, clusters = get_cluster_pyramid().clusters(south, west, north, east, zoom)
+    
+    # 치과 하나뿐인 클러스터는 이름을 함께 반환
+    single_ids = [c['clinic_id'] for c in clusters if c['clinic_id'] is not None]
+    names = dict(Clinic.objects.filter(id__in=single_ids).values_list('id', 'name')) if single_ids else {}
+    for cluster in clusters:
+        if cluster['clinic_id'] is not None:
+            cluster['name'] = names.get(cluster['clinic_id'], '')
+    
+    return Response({
+        'results': clusters,
+        'count': len(clusters),
+        'total': sum(c['count'] for c in clusters),
+        'bbox': [west, south, east, north],
+        'zoom': zoom,
+        'level': level
+    })
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def clinic_viewport(request):
+    """지도 영역(bbox) 내 치과 목록 API (위도/경도 복합 인덱스 범위 조회)"""
+    try:
+        south, west, north, east = parse_bbox(request.GET.get('bbox', ''))
+        page_size = int(request.GET.get('page_size', VIEWPORT_PAGE_SIZE))
+        after = decode_cursor(request.GET.get('cursor'), len(VIEWPORT_ORDERING))
+    except (ValueError, InvalidCursor):
+        return Response({
+            'error': 'bbox(서,남,동,북), page_size, cursor 값을 올바르게 입력해주세요.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    fields = [f.strip() for f in request.GET.get('fields', '').split(',') if f.strip()]
+    fields = fields or list(VIEWPORT_DEFAULT_FIELDS)
+    invalid = [f for f in fields if f not in VIEWPORT_FIELDS]
+    if invalid:
+        return Response({
+            'error': f"지원하지 않는 필드입니다: {', '.join(invalid)}",
+            'available_fields': VIEWPORT_FIELDS
+        }, status=status.HTTP_400_BAD_REQUEST)
+    
+    page_size = max(1, min(page_size, VIEWPORT_MAX_PAGE_SIZE))
+    
+    queryset = Clinic.objects.filter(
+        latitude__range=(south, north),
+        longitude__range=(west, east)
+    ).order_by(*VIEWPORT_ORDERING)
+    try:
+        if after:
+            queryset = queryset.filter(keyset_filter(VIEWPORT_ORDERING, after))
+        
+        # 정렬 키는 커서 생성을 위해 항상 조회
+        rows = list(queryset.values(*dict.fromkeys([*fields, *VIEWPORT_ORDERING]))[:page_size + 1])
+    except (DjangoValidationError, TypeError, ValueError):
+        # 형식은 맞지만 값이 잘못된 커서 (조작된 토큰)
+        return Response({
+            'error': '잘못된 커서입니다.'
+        }, status=status.HTTP_400_BAD_REQUEST)
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor([str(last[key]) for key in VIEWPORT_ORDERING])
+    
+    results = [{field: row[field] for field in fields} for row in rows]
+    
+    return Response({
+        'results': results,
+        'count': len(results),
+        'next_cursor': next_cursor,
+        'has_more': has_more,
+        'bbox': [west, south, east, north],
+        'fields': fields
+    })
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def clinic_by_district_and_location(request):
@@ -238,13 +473,26 @@ def clinic_by_district_and_location(request):
             Q(district__icontains=location)
         )
     
-    queryset = queryset.order_by('-total_reviews', '-average_rating')
+    queryset = queryset.order_by('-total_reviews', '-average_rating', 'id')
+    
+    # 스트리밍 모드: 서버 측 커서로 청크마다 직렬화 (청크당 집계 쿼리 2회)
+    fmt = stream_format(request)
+    if fmt:
+        rows = stream_rows(
+            queryset,
+            lambda chunk: ClinicListSerializer(chunk, many=True).data
+        )
+        return streaming_response(fmt, rows, 'results', {
+            'district': district,
+            'location': location
+        })
     
     serializer = ClinicListSerializer(queryset, many=True)
+    results = serializer.data
     
     return Response({
-        'results': serializer.data,
-        'count': queryset.count(),
+        'results': results,
+        'count': len(results),
         'district': district,
         'location': location
     })
@@ -279,6 +527,13 @@ def geocode_address(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def geocode_stats(request):
+    """지오코딩 캐시 적중/미스 통계"""
+    return Response(location_service.geocode_cache.get_stats())
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def reverse_geocode(request):
@@ -17,7 +17,11 @@ class RecommendationRequestSerializer(serializers.Serializer):
     """
     추천 요청 시리얼라이저
     """
-    district = serializers.CharField(max_length=100, help_text="지역구 (예: 강남구)")
+    district = serializers.CharField(
+        max_length=100,
+        required=False,
+        help_text="지역구 (예: 강남구, user_location이 있으면 생략 가능)"
+    )
     treatment_type = serializers.CharField(
         max_length=100, 
         required=False, 
@@ -40,6 +44,14 @@ class RecommendationRequestSerializer(serializers.Serializer):
             raise serializers.ValidationError("유효한 지역구를 입력해주세요")
         return value.strip()
     
+    def validate(self, attrs):
+        """
+        지역구 또는 사용자 위치 중 하나는 필수
+        """
+        if not attrs.get('district') and not attrs.get('user_location'):
+            raise serializers.ValidationError("district 또는 user_location 중 하나는 필요합니다")
+        return attrs
+    
     def validate_treatment_type(self, value):
         """
         치료 종류 유효성 검증
@@ -7,10 +7,10 @@ from decimal import Decimal
 from django.db.models import Q, Avg, Count, F
 from django.core.cache import cache
 from django.utils import timezone
-from geopy.distance import geodesic
 
 from apps.clinics.models import Clinic
 from apps.clinics.location_services import location_service, LocationUtils
+from apps.clinics.spatial_index import get_spatial_snapshot
 from apps.reviews.models import Review
 from apps.analysis.models import SentimentAnalysis, PriceData
 from .models import RecommendationLog, ClinicScore
@@ -112,16 +112,13 @@ class RecommendationEngine:
         # 사용자 위치가 제공된 경우 반경 내 치과 추가 필터링
         if user_location:
             user_lat, user_lng = user_location
-            filtered_clinics = []
             
-            for clinic in clinics:
-                if clinic.latitude and clinic.longitude:
-                    clinic_location = (float(clinic.latitude), float(clinic.longitude))
-                    distance = geodesic(user_location, clinic_location).kilometers
-                    
-                    if distance <= self.SEARCH_RADIUS_KM:
-                        clinic.distance = distance  # 거리 정보 추가
-                        filtered_clinics.append(clinic)
+            # 공간 스냅샷(LocationService와 같은 인덱스)으로 반경 내 치과 id와 거리 조회
+            distances = dict(get_spatial_snapshot().within_radius(user_lat, user_lng, self.SEARCH_RADIUS_KM))
+            
+            filtered_clinics = list(clinics.filter(pk__in=list(distances)))
+            for clinic in filtered_clinics:
+                clinic.distance = distances[clinic.id]  # 거리 정보 추가
             
             return filtered_clinics
         
@@ -245,7 +242,7 @@ class RecommendationEngine:
         치과 종합 점수 계산
         """
         try:
-            # 감성 분석 데이터 조회
+            # 감성 분석 데이터 조회 (전처리 완료 리뷰만, 요약 테이블은 전체 분석을 합산하므로 사용하지 않음)
             sentiment_data = SentimentAnalysis.objects.filter(
                 review__clinic=clinic,
                 review__is_processed=True
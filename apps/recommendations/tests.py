@@ -2,7 +2,9 @@
 추천 시스템 테스트
 """
 from decimal import Decimal
+from unittest.mock import patch
 from django.test import TestCase
+from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 
@@ -12,6 +14,7 @@ from apps.analysis.models import SentimentAnalysis, PriceData
 from .models import RecommendationLog, ClinicScore
 from .services import RecommendationEngine
 from .utils import LocationUtils, PriceAnalyzer, RecommendationValidator
+from .serializers import RecommendationRequestSerializer
 
 User = get_user_model()
 
@@ -242,6 +245,34 @@ class RecommendationEngineTest(TestCase):
         self.assertEqual(log.response_time_ms, 1500)
 
 
+class LocationFilterTest(TestCase):
+    """
+    사용자 위치 반경 필터링 테스트
+    """
+    
+    def test_filter_clinics_by_location(self):
+        """
+        공간 스냅샷으로 반경 내 지역구 치과만 남기고 거리 정보 추가
+        """
+        near = Clinic.objects.create(
+            name="역삼 치과", address="서울특별시 강남구 역삼동", district="강남구",
+            latitude=Decimal('37.500612'), longitude=Decimal('127.036612')
+        )
+        Clinic.objects.create(
+            name="수서 치과", address="서울특별시 강남구 수서동", district="강남구",
+            latitude=Decimal('37.487400'), longitude=Decimal('127.101900')
+        )
+        Clinic.objects.create(
+            name="서초 치과", address="서울특별시 서초구 서초동", district="서초구",
+            latitude=Decimal('37.497900'), longitude=Decimal('127.027600')
+        )
+        
+        clinics = RecommendationEngine()._filter_clinics_by_location("강남구", (37.4979, 127.0276))
+        
+        self.assertEqual([clinic.id for clinic in clinics], [near.id])
+        self.assertLess(clinics[0].distance, 1.0)
+
+
 class LocationUtilsTest(TestCase):
     """
     위치 유틸리티 테스트
@@ -404,4 +435,106 @@ class RecommendationValidatorTest(TestCase):
         valid_recs = RecommendationValidator.filter_valid_recommendations(recommendations)
         
         self.assertEqual(len(valid_recs), 1)
-        self.assertEqual(valid_recs[0]['clinic_name'], '유효치과')
\ No newline at end of file
+        self.assertEqual(valid_recs[0]['clinic_name'], '유효치과')
+
+class RecommendationRequestSerializerTest(TestCase):
+    """
+    추천 요청 시리얼라이저 테스트
+    """
+    
+    def test_location_without_district(self):
+        """
+        지역구 없이 사용자 위치만으로 요청 가능
+        """
+        serializer = RecommendationRequestSerializer(data={
+            'user_location': {'latitude': 37.5173, 'longitude': 127.0473}
+        })
+        
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertNotIn('district', serializer.validated_data)
+    
+    def test_district_or_location_required(self):
+        """
+        지역구와 사용자 위치가 모두 없으면 오류
+        """
+        serializer = RecommendationRequestSerializer(data={'treatment_type': '스케일링'})
+        
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('non_field_errors', serializer.errors)
+
+
+class RecommendationDistrictResolutionTest(TestCase):
+    """
+    좌표만 주어진 추천 요청의 지역구 판별 테스트
+    """
+    
+    @patch('apps.clinics.location_services.LocationService.reverse_geocode')
+    def test_reverse_geocode_used_before_centroid(self, mock_reverse):
+        """
+        경계 데이터가 없으면 중심 좌표 근사 대신 역지오코딩 결과의 지역구 사용
+        """
+        # 서초구 중심보다 강남구 중심에 더 가까운 서초구 경계 근처 좌표
+        mock_reverse.return_value = "서초동, 서초구, 서울특별시, 대한민국"
+        
+        with patch(
+            'apps.recommendations.views.recommendation_engine.get_recommendations',
+            return_value=[]
+        ) as mock_recommend:
+            response = self.client.post(
+                reverse('api:recommendations:recommend'),
+                {'user_location': {'latitude': 37.4950, 'longitude': 127.0300}},
+                content_type='application/json'
+            )
+        
+        self.assertEqual(response.status_code, 200)
+        mock_reverse.assert_called_once()
+        self.assertEqual(mock_recommend.call_args.kwargs['district'], "서초구")
+
+
+class ClinicScoreProcessedReviewTest(TestCase):
+    """
+    치과 점수 계산 대상 리뷰 테스트
+    """
+    
+    def setUp(self):
+        self.engine = RecommendationEngine()
+        self.clinic = Clinic.objects.create(
+            name="전처리치과",
+            address="서울시 강남구 역삼동 1",
+            district="강남구"
+        )
+    
+    def _create_analyses(self, count, is_processed):
+        start = Review.objects.filter(clinic=self.clinic).count()
+        for i in range(start, start + count):
+            review = Review.objects.create(
+                clinic=self.clinic,
+                source='naver',
+                original_text=f"리뷰 {i}",
+                external_id=f"review_{i}",
+                is_processed=is_processed,
+                reviewer_hash=f"hash_{i}"
+            )
+            SentimentAnalysis.objects.create(
+                review=review,
+                price_score=Decimal('0.5'),
+                skill_score=Decimal('0.5'),
+                kindness_score=Decimal('0.5'),
+                waiting_time_score=Decimal('0.5'),
+                facility_score=Decimal('0.5'),
+                overtreatment_score=Decimal('0.5'),
+                model_version='test',
+                confidence_score=Decimal('0.9')
+            )
+    
+    def test_unprocessed_reviews_not_counted(self):
+        """
+        전처리되지 않은 리뷰의 감성 분석은 최소 리뷰 수와 분석 건수에 포함하지 않음
+        """
+        self._create_analyses(5, is_processed=True)
+        self._create_analyses(self.engine.MIN_REVIEWS, is_processed=False)
+        self.assertIsNone(self.engine._calculate_clinic_score(self.clinic))
+        
+        self._create_analyses(self.engine.MIN_REVIEWS, is_processed=True)
+        clinic_score = self.engine._calculate_clinic_score(self.clinic)
+        self.assertEqual(clinic_score.total_reviews_analyzed, self.engine.MIN_REVIEWS + 5)
@@ -9,6 +9,7 @@ from django.core.cache import cache
 from django.db import models
 
 from apps.clinics.models import Clinic
+from apps.clinics.districts import district_center
 from apps.analysis.models import PriceData
 
 logger = logging.getLogger(__name__)
@@ -24,45 +25,8 @@ class LocationUtils:
         """
         지역구의 중심 좌표 반환
         """
-        # 주요 지역구 중심 좌표 (서울 기준)
-        district_centers = {
-            '강남구': (37.5173, 127.0473),
-            '강동구': (37.5301, 127.1238),
-            '강북구': (37.6398, 127.0256),
-            '강서구': (37.5509, 126.8495),
-            '관악구': (37.4784, 126.9516),
-            '광진구': (37.5384, 127.0822),
-            '구로구': (37.4955, 126.8876),
-            '금천구': (37.4569, 126.8955),
-            '노원구': (37.6544, 127.0565),
-            '도봉구': (37.6688, 127.0471),
-            '동대문구': (37.5744, 127.0396),
-            '동작구': (37.5124, 126.9393),
-            '마포구': (37.5663, 126.9019),
-            '서대문구': (37.5791, 126.9368),
-            '서초구': (37.4837, 127.0324),
-            '성동구': (37.5634, 127.0365),
-            '성북구': (37.5894, 127.0167),
-            '송파구': (37.5145, 127.1059),
-            '양천구': (37.5169, 126.8664),
-            '영등포구': (37.5264, 126.8962),
-            '용산구': (37.5384, 126.9654),
-            '은평구': (37.6176, 126.9227),
-            '종로구': (37.5735, 126.9788),
-            '중구': (37.5640, 126.9970),
-            '중랑구': (37.6063, 127.0925),
-        }
-        
-        # 정확한 매칭 시도
-        if district in district_centers:
-            return district_centers[district]
-        
-        # 부분 매칭 시도
-        for key, coords in district_centers.items():
-            if district in key or key in district:
-                return coords
-        
-        return None
+        # 지역구 요약 테이블 (비어 있으면 지명 사전 좌표)
+        return district_center(district)
     
     @staticmethod
     def calculate_distance_score(distance_km: float) -> float:
@@ -15,6 +15,9 @@ from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
 from rest_framework.views import APIView
 
+from apps.clinics.conditional import conditional_clinic_view
+from apps.clinics.location_services import location_service
+
 from .services import recommendation_engine
 from .utils import LocationUtils, RecommendationValidator
 from .serializers import RecommendationRequestSerializer, RecommendationResponseSerializer
@@ -42,7 +45,7 @@ class RecommendationAPIView(APIView):
         
         POST /api/recommend/
         {
-            "district": "강남구",
+            "district": "강남구",  // user_location이 있으면 생략 가능
             "treatment_type": "스케일링",  // 선택적
             "user_location": {  // 선택적
                 "latitude": 37.5173,
@@ -65,7 +68,7 @@ class RecommendationAPIView(APIView):
             validated_data = serializer.validated_data
             
             # 파라미터 추출
-            district = validated_data['district']
+            district = validated_data.get('district')
             treatment_type = validated_data.get('treatment_type')
             limit = validated_data.get('limit', 10)
             
@@ -75,6 +78,16 @@ class RecommendationAPIView(APIView):
                 loc_data = validated_data['user_location']
                 user_location = (loc_data['latitude'], loc_data['longitude'])
             
+            # 지역구가 없으면 좌표로 판별 (경계 데이터 → 역지오코딩 순, 경계 근처에서 틀리는
+            # 중심 좌표 근사는 둘 다 없을 때만 사용)
+            if not district:
+                district = location_service.get_district_from_coordinates(*user_location)
+                if not district:
+                    return Response({
+                        'error': '입력 데이터가 올바르지 않습니다',
+                        'details': {'user_location': ['지원하지 않는 지역의 좌표입니다']}
+                    }, status=status.HTTP_400_BAD_REQUEST)
+            
             # 추천 실행
             recommendations = recommendation_engine.get_recommendations(
                 district=district,
@@ -152,6 +165,7 @@ class ClinicDetailAPIView(APIView):
     치과 상세 정보 API
     """
     
+    @method_decorator(conditional_clinic_view('clinic_id'))
     def get(self, request, clinic_id):
         """
         치과 상세 정보 조회
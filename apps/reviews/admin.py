@@ -1,5 +1,6 @@
 from django.contrib import admin
 from .models import Review
+from .services import ReviewService
 
 
 @admin.register(Review)
@@ -32,7 +33,7 @@ class ReviewAdmin(admin.ModelAdmin):
     actions = ['mark_as_processed', 'mark_as_flagged', 'mark_as_duplicate']
     
     def mark_as_processed(self, request, queryset):
-        queryset.update(is_processed=True)
+        ReviewService.mark_reviews_as_processed(list(queryset.values_list('id', flat=True)))
     mark_as_processed.short_description = "선택된 리뷰를 처리 완료로 표시"
     
     def mark_as_flagged(self, request, queryset):
@@ -40,5 +41,5 @@ class ReviewAdmin(admin.ModelAdmin):
     mark_as_flagged.short_description = "선택된 리뷰를 플래그로 표시"
     
     def mark_as_duplicate(self, request, queryset):
-        queryset.update(is_duplicate=True)
+        ReviewService.mark_reviews_as_duplicate(list(queryset.values_list('id', flat=True)))
     mark_as_duplicate.short_description = "선택된 리뷰를 중복으로 표시"
\ No newline at end of file
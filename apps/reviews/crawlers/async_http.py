@@ -0,0 +1,251 @@
+"""
+비동기 HTTP 크롤링 엔진
+
+Selenium 크롤러는 치과 하나를 브라우저로 열고 페이지마다 time.sleep으로 기다리므로
+워커 하나가 한 번에 한 치과만 처리한다. 이 엔진은 플레이스 페이지 뒤의 JSON/HTML
+엔드포인트를 aiohttp 커넥션 풀로 직접 호출해 여러 치과를 동시에 수집한다.
+
+- 호스트별 동시 연결 수: TCPConnector(limit_per_host)
+- 호스트별 초당 요청 수: HostRateLimiter
+- 429/5xx/연결 오류는 지수 백오프로 재시도
+
+소스별 요청/파싱은 ReviewSource를 상속해 구현하고, 결과는 기존 ReviewData로 반환한다.
+ORM은 비동기 컨텍스트에서 사용할 수 없으므로 엔진에는 치과 모델 대신
+CrawlTarget(치과 id, 외부 장소 id)을 넘긴다.
+
+    engine = AsyncCrawlEngine(NaverPlaceApiSource())
+    results = engine.crawl([CrawlTarget(1, '12345678')], max_reviews=50)
+"""
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - 선택 의존성
+    aiohttp = None
+
+from .base import ReviewData
+
+logger = logging.getLogger(__name__)
+
+# 엔진 기본 설정
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_PER_HOST_CONCURRENCY = 8
+DEFAULT_PER_HOST_RATE = 10.0
+DEFAULT_TIMEOUT = 15
+DEFAULT_RETRIES = 2
+RETRY_BACKOFF = 0.5
+
+# 재시도할 HTTP 상태 코드
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def page_count(total: int, page_size: int) -> int:
+    """리뷰 total개에 필요한 페이지 수"""
+    return -(-total // page_size)
+
+
+@dataclass
+class CrawlTarget:
+    """크롤링 대상 치과 (비동기 컨텍스트에 넘길 최소 정보)"""
+    clinic_id: int
+    place_id: str
+
+
+@dataclass
+class PageRequest:
+    """엔드포인트 요청 한 건"""
+    url: str
+    method: str = 'GET'
+    params: Optional[Dict] = None
+    json: Optional[object] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class PageResult:
+    """페이지 파싱 결과"""
+    reviews: List[ReviewData]
+    total: Optional[int] = None
+    has_next: bool = False
+
+
+@dataclass
+class CrawlResult:
+    """치과 하나의 수집 결과"""
+    clinic_id: int
+    reviews: List[ReviewData] = field(default_factory=list)
+    requests: int = 0
+    error: Optional[str] = None
+
+
+class ReviewSource(ABC):
+    """비동기 엔진이 호출할 리뷰 엔드포인트 정의"""
+
+    # 한 페이지에 요청할 리뷰 수
+    page_size = 10
+
+    @abstractmethod
+    def get_source_name(self) -> str:
+        """리뷰 소스 이름 (Review.source 값)"""
+        pass
+
+    @abstractmethod
+    def build_request(self, target: CrawlTarget, page: int) -> PageRequest:
+        """page번째(1부터) 리뷰 페이지 요청 생성"""
+        pass
+
+    @abstractmethod
+    def parse(self, target: CrawlTarget, page: int, payload) -> PageResult:
+        """
+        응답 파싱
+
+        Args:
+            payload: JSON 응답이면 디코딩된 객체, 아니면 본문 문자열
+        """
+        pass
+
+
+class HostRateLimiter:
+    """호스트별 초당 요청 수 제한 (요청 시작 간격을 1/rate초 이상으로 유지)"""
+
+    def __init__(self, rate: Optional[float] = DEFAULT_PER_HOST_RATE):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, host: str):
+        """host에 다음 요청을 보낼 수 있을 때까지 대기"""
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class AsyncCrawlEngine:
+    """aiohttp 커넥션 풀 기반 다중 치과 리뷰 수집기"""
+
+    def __init__(self, source: ReviewSource, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY,
+                 per_host_rate: Optional[float] = DEFAULT_PER_HOST_RATE,
+                 timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES):
+        """
+        Args:
+            source: 요청/파싱을 정의한 리뷰 소스
+            max_connections: 전체 동시 연결 수
+            per_host_concurrency: 호스트별 동시 연결 수
+            per_host_rate: 호스트별 초당 요청 수 (None이면 제한 없음)
+            timeout: 요청 하나의 제한 시간(초)
+            retries: 429/5xx/연결 오류 시 재시도 횟수
+        """
+        if aiohttp is None:
+            raise ImportError('비동기 크롤러를 사용하려면 aiohttp를 설치해야 합니다')
+
+        self.source = source
+        self.max_connections = max_connections
+        self.per_host_concurrency = per_host_concurrency
+        self.per_host_rate = per_host_rate
+        self.timeout = timeout
+        self.retries = retries
+
+    def crawl(self, targets: Iterable[CrawlTarget], max_reviews: int = 100) -> Dict[int, CrawlResult]:
+        """동기 코드(Celery 태스크 등)에서 여러 치과 수집"""
+        return asyncio.run(self.crawl_many(list(targets), max_reviews))
+
+    async def crawl_many(self, targets: List[CrawlTarget], max_reviews: int = 100) -> Dict[int, CrawlResult]:
+        """여러 치과를 동시에 수집 (치과별 결과, 실패한 치과는 error에 기록)"""
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.per_host_concurrency,
+            ttl_dns_cache=300
+        )
+        limiter = HostRateLimiter(self.per_host_rate)
+        started = time.monotonic()
+
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as session:
+            results = await asyncio.gather(*(
+                self.crawl_target(session, limiter, target, max_reviews) for target in targets
+            ))
+
+        elapsed = time.monotonic() - started
+        total_requests = sum(result.requests for result in results)
+        logger.info(
+            f"비동기 크롤링 완료 ({self.source.get_source_name()}): 치과 {len(targets)}개, "
+            f"요청 {total_requests}회, 리뷰 {sum(len(r.reviews) for r in results)}개, {elapsed:.2f}초"
+        )
+        return {result.clinic_id: result for result in results}
+
+    async def crawl_target(self, session, limiter: HostRateLimiter, target: CrawlTarget,
+                           max_reviews: int) -> CrawlResult:
+        """
+        치과 하나 수집
+
+        첫 페이지에서 전체 리뷰 수를 알면 나머지 페이지를 동시에 요청하고,
+        모르면 has_next를 따라 순서대로 요청한다.
+        """
+        result = CrawlResult(clinic_id=target.clinic_id)
+        try:
+            first = await self._fetch_page(session, limiter, target, 1, result)
+            pages = [first]
+
+            last_page = page_count(max_reviews, self.source.page_size)
+            if first.total is not None:
+                last_page = min(last_page, page_count(first.total, self.source.page_size))
+                pages.extend(await asyncio.gather(*(
+                    self._fetch_page(session, limiter, target, page, result)
+                    for page in range(2, last_page + 1)
+                )))
+            else:
+                page = 1
+                while pages[-1].has_next and page < last_page:
+                    page += 1
+                    pages.append(await self._fetch_page(session, limiter, target, page, result))
+
+            result.reviews = [review for page_result in pages for review in page_result.reviews][:max_reviews]
+
+        except Exception as e:
+            logger.error(f"비동기 크롤링 실패: 치과 ID {target.clinic_id} - {e}")
+            result.error = str(e) or e.__class__.__name__
+
+        return result
+
+    async def _fetch_page(self, session, limiter: HostRateLimiter, target: CrawlTarget,
+                          page: int, result: CrawlResult) -> PageResult:
+        request = self.source.build_request(target, page)
+        payload = await self._request(session, limiter, request, result)
+        return self.source.parse(target, page, payload)
+
+    async def _request(self, session, limiter: HostRateLimiter, request: PageRequest, result: CrawlResult):
+        host = urlparse(request.url).netloc
+        for attempt in range(self.retries + 1):
+            await limiter.wait(host)
+            result.requests += 1
+            try:
+                async with session.request(
+                    request.method, request.url, params=request.params,
+                    json=request.json, headers=request.headers
+                ) as response:
+                    if response.status in RETRY_STATUSES and attempt < self.retries:
+                        logger.warning(f"요청 재시도 ({response.status}): {request.url}")
+                    else:
+                        response.raise_for_status()
+                        if 'json' in response.content_type:
+                            return await response.json()
+                        return await response.text()
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    raise
+                logger.warning(f"요청 재시도 ({e.__class__.__name__}): {request.url}")
+
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
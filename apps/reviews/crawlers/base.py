@@ -7,14 +7,19 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import time
-import hashlib
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
+from apps.clinics.ingest import bulk_ingest
 from apps.clinics.models import Clinic
 from apps.reviews.models import Review
-from utils.text_processing import anonymize_personal_info, create_reviewer_hash, clean_text
+from utils.text_processing import anonymize_personal_info, create_content_hash, create_reviewer_hash, clean_text
 
 logger = logging.getLogger(__name__)
 
+# 리뷰 INSERT 한 번에 포함할 행 수
+SAVE_BATCH_SIZE = 500
+
 
 @dataclass
 class ReviewData:
@@ -45,63 +50,125 @@ class BaseCrawler(ABC):
         """리뷰 크롤링 메인 메서드"""
         pass
     
-    def save_reviews(self, clinic: Clinic, review_data_list: List[ReviewData]) -> Tuple[int, int]:
+    def save_reviews(self, clinic: Clinic, review_data_list: List[ReviewData],
+                     batch_size: int = SAVE_BATCH_SIZE) -> Tuple[int, int]:
         """
-        크롤링된 리뷰 데이터를 데이터베이스에 저장
+        크롤링된 리뷰 데이터를 데이터베이스에 일괄 저장
+        
+        목록 전체를 익명화/해시한 뒤 기존 리뷰(external_id, 본문 해시)를 한 번에 조회해
+        중복을 거르고, 남은 리뷰를 bulk_create로 저장한다. 동시에 저장된 리뷰와
+        (clinic, external_id, source)가 겹치면 ignore_conflicts로 건너뛰고 중복으로 센다.
+        
+        Args:
+            clinic: 대상 치과
+            review_data_list: 크롤링된 리뷰 목록
+            batch_size: INSERT 한 번에 포함할 리뷰 수
+            
         Returns: (저장된 리뷰 수, 중복 리뷰 수)
         """
-        saved_count = 0
-        duplicate_count = 0
+        if not review_data_list:
+            return 0, 0
         
+        source = self.get_source_name()
+        candidates = []
         for review_data in review_data_list:
             try:
-                # 개인정보 익명화
-                cleaned_text = self.anonymize_review_text(review_data.text)
-                
-                # 중복 체크
-                if self.is_duplicate_review(clinic, review_data):
-                    duplicate_count += 1
-                    continue
-                
-                # 리뷰 저장
-                review = Review.objects.create(
-                    clinic=clinic,
-                    source=self.get_source_name(),
-                    original_text=cleaned_text,
-                    processed_text='',  # 나중에 전처리 단계에서 처리
-                    original_rating=review_data.rating,
-                    review_date=review_data.date or timezone.now(),
-                    reviewer_hash=create_reviewer_hash(
-                        review_data.reviewer_name or '', 
-                        str(review_data.date) if review_data.date else ''
-                    ),
-                    external_id=review_data.external_id or '',
-                    is_processed=False,
-                    is_duplicate=False,
-                    is_flagged=False
-                )
-                
-                saved_count += 1
-                logger.info(f"리뷰 저장 완료: {clinic.name} - {review.id}")
-                
+                candidates.append((review_data, self.build_review(clinic, review_data)))
             except Exception as e:
-                logger.error(f"리뷰 저장 실패: {clinic.name} - {e}")
+                logger.error(f"리뷰 변환 실패: {clinic.name} - {e}")
                 self.error_count += 1
         
+        # 기존 리뷰와 external_id/본문 해시가 같은 리뷰는 중복 (IN 조회 한 번)
+        external_ids = {review.external_id for _, review in candidates if review.external_id}
+        content_hashes = {}
+        for review_data, review in candidates:
+            # 익명화 전/후 본문 중 하나라도 같으면 중복
+            content_hashes[id(review)] = {review.content_hash, create_content_hash(review_data.text)} - {''}
+        existing = Review.objects.filter(clinic=clinic, source=source).filter(
+            Q(external_id__in=external_ids) |
+            Q(content_hash__in=set().union(*content_hashes.values()))
+        ).values_list('id', 'external_id', 'content_hash')
+        existing_pks = set()
+        seen_ids = set()
+        seen_hashes = set()
+        for pk, external_id, content_hash in existing:
+            existing_pks.add(pk)
+            if external_id in external_ids:
+                seen_ids.add(external_id)
+            seen_hashes.add(content_hash)
+        
+        new_reviews = []
+        for _, review in candidates:
+            hashes = content_hashes[id(review)]
+            if (review.external_id and review.external_id in seen_ids) or hashes & seen_hashes:
+                continue
+            if review.external_id:
+                seen_ids.add(review.external_id)
+            seen_hashes.update(hashes)
+            new_reviews.append(review)
+        
+        saved_count = 0
+        if new_reviews:
+            try:
+                with transaction.atomic(), bulk_ingest() as batch:
+                    Review.objects.bulk_create(new_reviews, batch_size=batch_size, ignore_conflicts=True)
+                    
+                    # ignore_conflicts에서는 pk가 채워지지 않으므로 방금 넣은 (external_id, 본문 해시)로
+                    # 다시 조회하고, 저장 전에 이미 있던 리뷰는 제외
+                    saved_ids = list(Review.objects.filter(
+                        clinic=clinic, source=source,
+                        external_id__in={review.external_id for review in new_reviews},
+                        content_hash__in={review.content_hash for review in new_reviews}
+                    ).exclude(pk__in=existing_pks).values_list('id', flat=True))
+                    saved_count = len(saved_ids)
+                    
+                    # bulk_create는 post_save를 보내지 않으므로 후처리 대상을 직접 기록
+                    batch.review_vector_ids.update(saved_ids)
+                    batch.changed_clinic_ids.add(clinic.id)
+            except Exception as e:
+                logger.error(f"리뷰 일괄 저장 실패: {clinic.name} - {e}")
+                self.error_count += len(new_reviews)
+                return 0, len(candidates) - len(new_reviews)
+        
+        duplicate_count = len(candidates) - saved_count
+        logger.info(f"리뷰 저장 완료: {clinic.name} - 저장 {saved_count}개, 중복 {duplicate_count}개")
         return saved_count, duplicate_count
     
+    def build_review(self, clinic: Clinic, review_data: ReviewData) -> Review:
+        """
+        크롤링 데이터를 저장 전 Review 인스턴스로 변환 (개인정보 익명화 포함)
+        
+        bulk_create는 save()를 거치지 않으므로 본문 해시도 여기서 계산한다.
+        """
+        original_text = self.anonymize_review_text(review_data.text)
+        return Review(
+            clinic=clinic,
+            source=self.get_source_name(),
+            original_text=original_text,
+            content_hash=create_content_hash(original_text),
+            processed_text='',  # 나중에 전처리 단계에서 처리
+            original_rating=review_data.rating,
+            review_date=review_data.date or timezone.now(),
+            reviewer_hash=create_reviewer_hash(
+                review_data.reviewer_name or '',
+                str(review_data.date) if review_data.date else ''
+            ),
+            external_id=review_data.external_id or '',
+            is_processed=False,
+            is_duplicate=False,
+            is_flagged=False
+        )
+    
     def anonymize_review_text(self, text: str) -> str:
         """리뷰 텍스트 개인정보 익명화"""
         if not text:
             return ''
         
-        # 기본 텍스트 정제
-        cleaned = clean_text(text)
-        
-        # 개인정보 익명화
-        anonymized = anonymize_personal_info(cleaned)
+        # 개인정보 익명화 (정제 시 '@' 등이 지워지므로 먼저 수행)
+        anonymized = anonymize_personal_info(text)
         
-        return anonymized
+        # 기본 텍스트 정제
+        return clean_text(anonymized)
     
     def is_duplicate_review(self, clinic: Clinic, review_data: ReviewData) -> bool:
         """중복 리뷰 체크"""
@@ -115,19 +182,18 @@ class BaseCrawler(ABC):
             if exists:
                 return True
         
-        # 텍스트 유사도 기반 중복 체크 (간단한 해시 비교)
-        text_hash = hashlib.md5(review_data.text.encode('utf-8')).hexdigest()
-        similar_reviews = Review.objects.filter(
+        # 정규화된 본문 해시 비교 (익명화 전/후 본문, 인덱스 조회)
+        content_hashes = {
+            create_content_hash(review_data.text),
+            create_content_hash(self.anonymize_review_text(review_data.text)),
+        } - {''}
+        if not content_hashes:
+            return False
+        return Review.objects.filter(
             clinic=clinic,
-            source=self.get_source_name()
-        )
-        
-        for review in similar_reviews:
-            existing_hash = hashlib.md5(review.original_text.encode('utf-8')).hexdigest()
-            if text_hash == existing_hash:
-                return True
-        
-        return False
+            source=self.get_source_name(),
+            content_hash__in=content_hashes
+        ).exists()
     
     def add_delay(self):
         """크롤링 간 지연 시간 추가"""
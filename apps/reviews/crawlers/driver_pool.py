@@ -0,0 +1,373 @@
+"""
+헤드리스 브라우저 드라이버 풀
+
+치과마다 ChromeDriverManager().install()과 Chrome 기동을 반복하면 페이지를 열기
+전에 수 초가 걸린다. 네이버/구글 크롤러가 공유하는 프로세스 단위 풀에서 드라이버를
+빌려 쓰고 돌려주며, 다음 경우에만 드라이버를 새로 만든다.
+
+- 상태 확인(스크립트 실행)에 실패한 경우
+- 페이지를 max_pages번 이상 연 경우
+- JS 힙 사용량이 max_memory_mb를 넘은 경우
+
+교체되는 드라이버의 쿠키는 도메인별로 보관했다가 새 드라이버가 같은 도메인을
+처음 열 때 복원해 로그인/동의 상태 같은 세션을 이어 쓴다.
+
+    with get_driver_pool(headless=True).session() as driver:
+        driver.get(url)
+"""
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# 풀 기본 설정
+DEFAULT_MAX_SIZE = 2
+DEFAULT_MAX_PAGES = 200
+DEFAULT_MAX_MEMORY_MB = 512
+DEFAULT_ACQUIRE_TIMEOUT = 300
+
+# 마지막 사용 후 이 시간(초)이 지난 드라이버는 빌려주기 전에 상태 확인
+HEALTH_CHECK_INTERVAL = 30
+
+CHROME_ARGUMENTS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    '--lang=ko-KR',
+    '--disable-blink-features=AutomationControlled',
+]
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+class DriverPoolTimeout(Exception):
+    """대기 시간 안에 드라이버를 빌리지 못함"""
+    pass
+
+
+def chrome_driver_path() -> str:
+    """ChromeDriver 경로 (프로세스당 한 번만 설치/확인)"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def create_chrome_driver(headless: bool = True):
+    """크롤링용 Chrome WebDriver 생성"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+
+    driver = webdriver.Chrome(service=Service(chrome_driver_path()), options=chrome_options)
+
+    # 자동화 감지 방지
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+
+    driver.implicitly_wait(10)
+    logger.info("Chrome WebDriver 초기화 완료")
+    return driver
+
+
+def js_heap_mb(driver) -> Optional[float]:
+    """드라이버의 JS 힙 사용량 (MB, 측정할 수 없으면 None)"""
+    used = driver.execute_script(
+        "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null"
+    )
+    return used / (1024 * 1024) if used else None
+
+
+def _domain(url: str) -> str:
+    return urlparse(url).hostname or ''
+
+
+class PooledDriver:
+    """
+    풀에서 빌린 드라이버
+
+    get()으로 연 페이지 수를 세고 쿠키를 복원하며, 나머지 속성은 실제 드라이버에
+    그대로 위임하므로 크롤러 코드는 WebDriver처럼 사용한다.
+    """
+
+    def __init__(self, pool: 'DriverPool', driver):
+        self._pool = pool
+        self._driver = driver
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.pages = 0
+        self.restored_domains = set()
+        self.broken = False
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+    @property
+    def driver(self):
+        """실제 WebDriver"""
+        return self._driver
+
+    def get(self, url: str):
+        """
+        페이지 열기 (처음 여는 도메인이면 보관된 쿠키 복원)
+
+        WebDriver는 현재 페이지 도메인의 쿠키만 추가할 수 있으므로 먼저 페이지를 연 뒤
+        쿠키를 복원하고, 복원한 쿠키가 있으면 같은 페이지를 다시 열어 쿠키가 적용된
+        응답을 받는다.
+        """
+        self._driver.get(url)
+        self.pages += 1
+        domain = _domain(url)
+        if domain and domain not in self.restored_domains:
+            self.restored_domains.add(domain)
+            if self._pool.restore_cookies(self, domain):
+                self._driver.get(url)
+                self.pages += 1
+
+    def is_healthy(self) -> bool:
+        """스크립트 실행으로 브라우저 응답 확인"""
+        try:
+            return self._driver.execute_script('return 1') == 1
+        except Exception as e:
+            logger.warning(f"WebDriver 상태 확인 실패: {e}")
+            return False
+
+    def quit(self):
+        """풀에서 빌린 드라이버는 종료하지 않고 반납 (pool.release 사용)"""
+        self._pool.release(self)
+
+
+class DriverPool:
+    """헤드리스 브라우저 드라이버 풀"""
+
+    def __init__(self, factory: Callable[[], object], max_size: int = DEFAULT_MAX_SIZE,
+                 max_pages: int = DEFAULT_MAX_PAGES, max_memory_mb: Optional[float] = DEFAULT_MAX_MEMORY_MB,
+                 memory_probe: Callable[[object], Optional[float]] = js_heap_mb,
+                 health_check_interval: float = HEALTH_CHECK_INTERVAL):
+        """
+        Args:
+            factory: 새 드라이버를 만드는 함수
+            max_size: 동시에 유지할 최대 드라이버 수
+            max_pages: 드라이버 하나로 열 최대 페이지 수 (넘으면 교체)
+            max_memory_mb: 반납 시 JS 힙 사용량 상한 (None이면 확인하지 않음)
+            memory_probe: 드라이버 메모리 사용량(MB) 측정 함수
+            health_check_interval: 이 시간(초) 이상 쉬었던 드라이버는 빌려주기 전에 상태 확인
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb
+        self.memory_probe = memory_probe
+        self.health_check_interval = health_check_interval
+
+        self._condition = threading.Condition()
+        self._idle: List[PooledDriver] = []
+        self._in_use = set()
+        self._creating = 0
+        self._cookies: Dict[str, List[Dict]] = {}
+        self._closed = False
+        self.created_count = 0
+        self.recycled_count = 0
+
+    @property
+    def size(self) -> int:
+        """현재 유지 중인 드라이버 수 (대기 + 사용 중)"""
+        with self._condition:
+            return len(self._idle) + len(self._in_use) + self._creating
+
+    def acquire(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT) -> PooledDriver:
+        """
+        드라이버 빌리기 (여유가 없으면 반납될 때까지 대기)
+
+        Raises:
+            DriverPoolTimeout: timeout 안에 빌리지 못한 경우
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError('종료된 드라이버 풀입니다')
+                if self._idle:
+                    pooled = self._idle.pop()
+                    self._in_use.add(pooled)
+                    create = False
+                elif len(self._in_use) + self._creating < self.max_size:
+                    pooled = None
+                    create = True
+                    # 생성 중에도 자리를 차지하도록 표시
+                    self._creating += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverPoolTimeout(f'{timeout}초 안에 드라이버를 빌리지 못했습니다')
+                    self._condition.wait(remaining)
+                    continue
+
+            if create:
+                return self._create()
+
+            idle_for = time.monotonic() - pooled.last_used
+            if idle_for < self.health_check_interval or pooled.is_healthy():
+                pooled.last_used = time.monotonic()
+                return pooled
+
+            # 응답 없는 드라이버는 버리고 다시 시도
+            self._discard(pooled)
+
+    def release(self, pooled: PooledDriver, broken: bool = False):
+        """
+        드라이버 반납
+
+        Args:
+            pooled: acquire()로 빌린 드라이버
+            broken: True면 재사용하지 않고 종료
+        """
+        with self._condition:
+            if pooled not in self._in_use:
+                return
+
+        pooled.last_used = time.monotonic()
+        reason = self._recycle_reason(pooled, broken)
+        if reason:
+            logger.info(f"WebDriver 교체: {reason} (페이지 {pooled.pages}개)")
+            self.save_cookies(pooled)
+            with self._condition:
+                self.recycled_count += 1
+            self._discard(pooled)
+            return
+
+        with self._condition:
+            self._in_use.discard(pooled)
+            if self._closed:
+                self._quit(pooled)
+            else:
+                self._idle.append(pooled)
+            self._condition.notify()
+
+    @contextmanager
+    def session(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT):
+        """빌린 드라이버를 블록이 끝나면 반납 (예외 시 상태 확인 후 반납)"""
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled
+        except BaseException:
+            self.release(pooled, broken=not pooled.is_healthy())
+            raise
+        self.release(pooled)
+
+    def save_cookies(self, pooled: PooledDriver):
+        """현재 페이지 도메인의 쿠키 보관 (드라이버 교체 후 복원용)"""
+        try:
+            domain = _domain(pooled.driver.current_url)
+            cookies = pooled.driver.get_cookies()
+        except Exception:
+            return
+        if domain and cookies:
+            with self._condition:
+                self._cookies[domain] = cookies
+
+    def restore_cookies(self, pooled: PooledDriver, domain: str) -> int:
+        """보관된 도메인 쿠키를 드라이버에 복원 (복원한 쿠키 수 반환)"""
+        with self._condition:
+            cookies = list(self._cookies.get(domain, ()))
+        restored = 0
+        for cookie in cookies:
+            try:
+                pooled.driver.add_cookie(cookie)
+                restored += 1
+            except Exception as e:
+                logger.debug(f"쿠키 복원 실패: {domain} - {e}")
+        return restored
+
+    def close(self):
+        """대기 중인 드라이버 종료 (사용 중인 드라이버는 반납 시 종료)"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+
+    def _create(self) -> PooledDriver:
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._creating -= 1
+                self._condition.notify()
+            logger.error("WebDriver 생성 실패")
+            raise
+
+        pooled = PooledDriver(self, driver)
+        with self._condition:
+            self._creating -= 1
+            self._in_use.add(pooled)
+            self.created_count += 1
+        return pooled
+
+    def _recycle_reason(self, pooled: PooledDriver, broken: bool) -> Optional[str]:
+        if broken or pooled.broken:
+            return '오류'
+        if self.max_pages and pooled.pages >= self.max_pages:
+            return '최대 페이지 수 도달'
+        if self.max_memory_mb:
+            try:
+                memory = self.memory_probe(pooled.driver)
+            except Exception:
+                return '메모리 확인 실패'
+            if memory is not None and memory > self.max_memory_mb:
+                return f'메모리 {memory:.0f}MB 초과'
+        return None
+
+    def _discard(self, pooled: PooledDriver):
+        with self._condition:
+            self._in_use.discard(pooled)
+            self._condition.notify()
+        self._quit(pooled)
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 실패: {e}")
+
+
+_pools: Dict[bool, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(headless: bool = True) -> DriverPool:
+    """크롤러가 공유하는 프로세스 단위 드라이버 풀"""
+    with _pools_lock:
+        pool = _pools.get(headless)
+        if pool is None:
+            pool = DriverPool(lambda: create_chrome_driver(headless))
+            _pools[headless] = pool
+        return pool
+
+
+@atexit.register
+def close_driver_pools():
+    """프로세스 종료 시 모든 드라이버 풀 종료"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,124 @@
+"""
+네이버 플레이스 GraphQL 대체 서버
+
+테스트와 벤치마크에서 실제 네이버 대신 호출하는 로컬 서버. fixtures/의
+getVisitorReviews 응답 항목을 요청한 page/size로 나눠 돌려주며, 리뷰 id에는
+businessId를 붙여 치과마다 다른 리뷰가 되게 한다.
+
+별도 스레드의 이벤트 루프에서 실행되므로 동기 코드(Django 테스트)에서도 사용할 수 있다.
+
+    with running_fixture_server(latency=0.05) as server:
+        source = NaverPlaceApiSource(graphql_url=server.graphql_url)
+"""
+import asyncio
+import json
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aiohttp import web
+
+FIXTURE_PATH = Path(__file__).resolve().parent / 'fixtures' / 'naver_visitor_reviews.json'
+
+
+def load_fixture_items(path: Path = FIXTURE_PATH) -> List[Dict]:
+    """고정 리뷰 항목 목록"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['items']
+
+
+class FixtureServer:
+    """getVisitorReviews 응답을 흉내 내는 로컬 서버"""
+
+    def __init__(self, latency: float = 0.0, items: Optional[List[Dict]] = None):
+        """
+        Args:
+            latency: 응답마다 추가할 지연 시간(초)
+            items: 응답할 리뷰 항목 (기본값은 고정 데이터 파일)
+        """
+        self.latency = latency
+        self.items = items if items is not None else load_fixture_items()
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failures: List[int] = []
+        self.url = None
+
+        self._loop = None
+        self._runner = None
+        self._thread = None
+
+    @property
+    def graphql_url(self) -> str:
+        return f'{self.url}/graphql'
+
+    def fail_next(self, *statuses: int):
+        """다음 요청들에 주어진 상태 코드로 응답 (재시도 확인용)"""
+        self.failures.extend(statuses)
+
+    async def handle_graphql(self, request):
+        self.request_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.failures:
+                return web.Response(status=self.failures.pop(0))
+
+            operation = (await request.json())[0]
+            review_input = operation['variables']['input']
+            page, size = review_input['page'], review_input['size']
+            items = [
+                dict(item, id=f"{review_input['businessId']}-{item['id']}")
+                for item in self.items[(page - 1) * size:page * size]
+            ]
+            return web.json_response([{
+                'data': {'visitorReviews': {'items': items, 'total': len(self.items)}}
+            }])
+        finally:
+            self.in_flight -= 1
+
+    def start(self):
+        """별도 스레드에서 서버 시작 (빈 포트 사용)"""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._start())
+            started.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_post('/graphql', self.handle_graphql)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', 0)
+        await site.start()
+        host, port = site._server.sockets[0].getsockname()[:2]
+        self.url = f'http://{host}:{port}'
+
+    def stop(self):
+        """서버 종료"""
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@contextmanager
+def running_fixture_server(latency: float = 0.0, items: Optional[List[Dict]] = None):
+    """블록 동안 대체 서버 실행"""
+    server = FixtureServer(latency=latency, items=items)
+    server.start()
+    try:
+        yield server
+    finally:
+        server.stop()
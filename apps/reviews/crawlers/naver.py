@@ -6,17 +6,14 @@ from datetime import datetime
 import re
 import time
 import logging
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from bs4 import BeautifulSoup
 from apps.clinics.models import Clinic
 from .base import BaseCrawler, ReviewData
+from .driver_pool import get_driver_pool
 
 logger = logging.getLogger(__name__)
 
@@ -33,39 +30,13 @@ class NaverPlaceCrawler(BaseCrawler):
         return 'naver'
     
     def _setup_driver(self):
-        """Selenium WebDriver 설정"""
-        chrome_options = Options()
-        
-        if self.headless:
-            chrome_options.add_argument('--headless')
-        
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        try:
-            # ChromeDriverManager를 사용하여 자동으로 드라이버 다운로드 및 설정
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # 자동화 감지 방지
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            self.driver.implicitly_wait(10)
-            logger.info("Chrome WebDriver 초기화 완료")
-        except Exception as e:
-            logger.error(f"WebDriver 초기화 실패: {e}")
-            raise
+        """공유 드라이버 풀에서 WebDriver 빌리기 (브라우저 기동은 풀이 처음 한 번만)"""
+        self.driver = get_driver_pool(self.headless).acquire()
     
     def _teardown_driver(self):
-        """WebDriver 정리"""
+        """WebDriver를 풀에 반납 (오류로 응답하지 않는 드라이버는 교체)"""
         if self.driver:
-            self.driver.quit()
+            get_driver_pool(self.headless).release(self.driver)
             self.driver = None
     
     def crawl_reviews(self, clinic: Clinic, max_reviews: int = 100) -> List[ReviewData]:
@@ -96,6 +67,8 @@ class NaverPlaceCrawler(BaseCrawler):
         except Exception as e:
             logger.error(f"네이버 플레이스 크롤링 실패: {clinic.name} - {e}")
             self.error_count += 1
+            if self.driver is not None and not self.driver.is_healthy():
+                self.driver.broken = True
         
         finally:
             self._teardown_driver()
@@ -0,0 +1,191 @@
+"""
+네이버 플레이스 HTTP 리뷰 크롤러
+
+플레이스 리뷰 탭이 호출하는 GraphQL 엔드포인트(getVisitorReviews)를 비동기 엔진으로
+직접 호출한다. 브라우저를 띄우지 않으므로 여러 치과를 한 워커에서 동시에 수집할 수
+있다. naver_place_id가 없는 치과는 검색이 필요하므로 Selenium 크롤러(naver.py)가
+처리한다.
+"""
+import logging
+import re
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from django.utils import timezone
+
+from apps.clinics.models import Clinic
+from .async_http import AsyncCrawlEngine, CrawlResult, CrawlTarget, PageRequest, PageResult, ReviewSource
+from .base import BaseCrawler, ReviewData
+
+logger = logging.getLogger(__name__)
+
+NAVER_GRAPHQL_URL = 'https://api.place.naver.com/graphql'
+NAVER_REVIEW_PAGE_URL = 'https://pcmap.place.naver.com/hospital/{}/review/visitor'
+
+# 너무 짧은 리뷰 제외 기준 (Selenium 크롤러와 동일)
+MIN_REVIEW_LENGTH = 10
+
+VISITOR_REVIEWS_QUERY = (
+    'query getVisitorReviews($input: VisitorReviewsInput) {'
+    ' visitorReviews(input: $input) {'
+    ' items { id rating author { nickname } body created visited }'
+    ' total } }'
+)
+
+# 작성일 표기: '24.3.5.화' 또는 올해 리뷰는 '3.5.화'
+CREATED_DATE_PATTERN = re.compile(r'^(?:(\d{2})\.)?(\d{1,2})\.(\d{1,2})')
+
+
+def parse_created_date(value: Optional[str], today=None) -> Optional[datetime]:
+    """네이버 리뷰 작성일 문자열을 datetime으로 변환"""
+    if not value:
+        return None
+    match = CREATED_DATE_PATTERN.match(value.strip())
+    if not match:
+        return None
+
+    today = today or timezone.localdate()
+    year = 2000 + int(match.group(1)) if match.group(1) else today.year
+    try:
+        return timezone.make_aware(datetime(year, int(match.group(2)), int(match.group(3))))
+    except ValueError:
+        return None
+
+
+class NaverPlaceApiSource(ReviewSource):
+    """네이버 플레이스 방문자 리뷰 GraphQL 엔드포인트"""
+
+    page_size = 10
+
+    def __init__(self, graphql_url: str = NAVER_GRAPHQL_URL):
+        """
+        Args:
+            graphql_url: GraphQL 엔드포인트 (테스트에서는 로컬 대체 서버 주소)
+        """
+        self.graphql_url = graphql_url
+
+    def get_source_name(self) -> str:
+        return 'naver'
+
+    def build_request(self, target: CrawlTarget, page: int) -> PageRequest:
+        return PageRequest(
+            url=self.graphql_url,
+            method='POST',
+            json=[{
+                'operationName': 'getVisitorReviews',
+                'variables': {
+                    'input': {
+                        'businessId': target.place_id,
+                        'businessType': 'hospital',
+                        'page': page,
+                        'size': self.page_size,
+                        'includeContent': True,
+                    }
+                },
+                'query': VISITOR_REVIEWS_QUERY,
+            }],
+            headers={'Referer': NAVER_REVIEW_PAGE_URL.format(target.place_id)}
+        )
+
+    def parse(self, target: CrawlTarget, page: int, payload) -> PageResult:
+        if isinstance(payload, list):
+            payload = payload[0] if payload else {}
+        if payload.get('errors'):
+            raise ValueError(f"GraphQL 오류: {payload['errors'][0].get('message')}")
+
+        visitor_reviews = (payload.get('data') or {}).get('visitorReviews') or {}
+        items = visitor_reviews.get('items') or []
+        total = visitor_reviews.get('total')
+
+        reviews = [review for review in map(self.parse_item, items) if review]
+        return PageResult(
+            reviews=reviews,
+            total=total,
+            has_next=total is not None and page * self.page_size < total
+        )
+
+    def parse_item(self, item: Dict) -> Optional[ReviewData]:
+        """리뷰 항목 하나를 ReviewData로 변환"""
+        text = (item.get('body') or '').strip()
+        if len(text) < MIN_REVIEW_LENGTH:
+            return None
+
+        rating = item.get('rating')
+        return ReviewData(
+            text=text,
+            rating=int(rating) if rating else None,
+            date=parse_created_date(item.get('created')),
+            reviewer_name=(item.get('author') or {}).get('nickname'),
+            external_id=f"naver_{item['id']}" if item.get('id') else None
+        )
+
+
+class NaverPlaceHttpCrawler(BaseCrawler):
+    """비동기 엔진을 사용하는 네이버 플레이스 크롤러"""
+
+    def __init__(self, source: Optional[NaverPlaceApiSource] = None, **engine_options):
+        """
+        Args:
+            source: 엔드포인트 정의 (기본값은 실제 네이버 엔드포인트)
+            engine_options: AsyncCrawlEngine 설정 (per_host_concurrency, per_host_rate 등)
+        """
+        super().__init__(delay_seconds=0)
+        self.engine = AsyncCrawlEngine(source or NaverPlaceApiSource(), **engine_options)
+
+    def get_source_name(self) -> str:
+        return 'naver'
+
+    def crawl_reviews(self, clinic: Clinic, max_reviews: int = 100) -> List[ReviewData]:
+        """치과 하나의 리뷰 수집"""
+        result = self.crawl_many([clinic], max_reviews).get(clinic.id)
+        if result is None:
+            logger.warning(f"네이버 플레이스 ID가 없습니다: {clinic.name}")
+            return []
+        if result.error:
+            self.error_count += 1
+        return result.reviews
+
+    def crawl_many(self, clinics: Iterable[Clinic], max_reviews: int = 100) -> Dict[int, CrawlResult]:
+        """여러 치과의 리뷰를 동시에 수집 (naver_place_id가 없는 치과는 제외)"""
+        targets = [
+            CrawlTarget(clinic.id, clinic.naver_place_id)
+            for clinic in clinics if clinic.naver_place_id
+        ]
+        if not targets:
+            return {}
+        return self.engine.crawl(targets, max_reviews)
+
+    def crawl_and_save(self, clinics: Iterable[Clinic], max_reviews: int = 100) -> List[Dict]:
+        """
+        여러 치과를 동시에 수집한 뒤 치과별로 저장
+
+        Returns:
+            CrawlerManager.crawl_clinic_reviews와 같은 형태의 치과별 결과 목록
+        """
+        clinics = list(clinics)
+        crawl_results = self.crawl_many(clinics, max_reviews)
+
+        results = []
+        for clinic in clinics:
+            result = crawl_results.get(clinic.id)
+            if result is None or result.error:
+                results.append({
+                    'status': 'error',
+                    'clinic_id': clinic.id,
+                    'source': self.get_source_name(),
+                    'error_message': result.error if result else '네이버 플레이스 ID가 없습니다'
+                })
+                continue
+
+            saved_count, duplicate_count = self.save_reviews(clinic, result.reviews)
+            self.log_crawling_stats(clinic, len(result.reviews), saved_count, duplicate_count)
+            results.append({
+                'status': 'success',
+                'clinic_id': clinic.id,
+                'source': self.get_source_name(),
+                'total_reviews': len(result.reviews),
+                'saved_reviews': saved_count,
+                'duplicate_reviews': duplicate_count,
+                'requests': result.requests
+            })
+        return results
@@ -0,0 +1,35 @@
+"""
+Django 관리 명령어로 리뷰 본문 해시 채우기
+"""
+from django.core.management.base import BaseCommand
+import time
+
+from apps.reviews.models import Review
+
+
+class Command(BaseCommand):
+    help = '완전 중복 탐지용 리뷰 본문 해시(content_hash)를 계산해 채웁니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='이미 해시가 있는 리뷰도 다시 계산 (정규화 규칙 변경 시)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='한 번에 읽고 갱신할 행 수 (기본값: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        updated = Review.backfill_content_hashes(
+            full=options['full'],
+            batch_size=options['batch_size']
+        )
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(f'리뷰 본문 해시 갱신 완료: {updated}개 ({elapsed:.2f}초)')
+        )
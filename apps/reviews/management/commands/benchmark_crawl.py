@@ -0,0 +1,104 @@
+"""
+Django 관리 명령어로 크롤링 처리량 비교
+"""
+from django.core.management.base import BaseCommand
+import time
+
+from apps.reviews.crawlers.async_http import AsyncCrawlEngine, CrawlTarget, page_count
+from apps.reviews.crawlers.fixture_server import running_fixture_server
+from apps.reviews.crawlers.naver_http import NaverPlaceApiSource
+
+
+class Command(BaseCommand):
+    help = (
+        '로컬 대체 서버로 비동기 HTTP 크롤러와 순차 HTTP 수집의 처리량을 측정합니다 '
+        '(Selenium 크롤러는 실행하지 않고 페이지당 대기 시간으로 계산한 값만 표시)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--clinics',
+            type=int,
+            default=40,
+            help='수집할 치과 수 (기본값: 40)'
+        )
+        parser.add_argument(
+            '--max-reviews',
+            type=int,
+            default=100,
+            help='치과당 최대 리뷰 수 (기본값: 100)'
+        )
+        parser.add_argument(
+            '--latency',
+            type=float,
+            default=0.2,
+            help='대체 서버 응답 지연(초) (기본값: 0.2)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=8,
+            help='호스트별 동시 연결 수 (기본값: 8)'
+        )
+        parser.add_argument(
+            '--rate',
+            type=float,
+            default=10.0,
+            help='호스트별 초당 요청 수 (기본값: 10)'
+        )
+        parser.add_argument(
+            '--selenium-delay',
+            type=float,
+            default=3.0,
+            help='Selenium 크롤러의 페이지당 대기 시간(초) (기본값: 3, NaverPlaceCrawler 기본값)'
+        )
+
+    def handle(self, *args, **options):
+        targets = [CrawlTarget(clinic_id, str(10000000 + clinic_id)) for clinic_id in range(options['clinics'])]
+
+        with running_fixture_server(latency=options['latency']) as server:
+            source = NaverPlaceApiSource(graphql_url=server.graphql_url)
+            pages = page_count(min(options['max_reviews'], len(server.items)), source.page_size)
+
+            sequential_time = self._run(
+                AsyncCrawlEngine(source, per_host_concurrency=1, per_host_rate=options['rate']),
+                targets, options['max_reviews']
+            )
+            async_time = self._run(
+                AsyncCrawlEngine(source, per_host_concurrency=options['concurrency'], per_host_rate=options['rate']),
+                targets, options['max_reviews']
+            )
+
+        clinics = len(targets)
+        # Selenium 크롤러는 페이지마다 add_delay()를 호출하므로 네트워크와 렌더링을 빼도 이 시간 이상 걸린다
+        selenium_time = clinics * pages * (options['selenium_delay'] + options['latency'])
+        # 호스트별 초당 요청 수 제한으로 정해지는 비동기 수집 시간 하한
+        rate_bound = clinics * pages / options['rate'] if options['rate'] else 0.0
+
+        self.stdout.write(
+            f"🔁 치과 {clinics}개 x {pages}페이지, 응답 지연 {options['latency']}초, "
+            f"호스트별 {options['concurrency']}연결 / 초당 {options['rate']}회"
+        )
+        self.stdout.write("측정값")
+        self.stdout.write(f"- 순차 HTTP: {sequential_time:.2f}초 ({clinics / sequential_time:.2f}개/초)")
+        self.stdout.write(
+            f"- 비동기 HTTP: {async_time:.2f}초 ({clinics / async_time:.2f}개/초, "
+            f"순차 대비 x{sequential_time / async_time:.1f}, 초당 요청 수 제한에 의한 하한 {rate_bound:.2f}초)"
+        )
+        self.stdout.write("계산값 (측정 아님)")
+        self.stdout.write(
+            f"- Selenium: {selenium_time:.2f}초 이상 = 치과 {clinics}개 x {pages}페이지 x "
+            f"(페이지당 대기 {options['selenium_delay']}초 + 응답 지연 {options['latency']}초), "
+            f"브라우저 기동/렌더링 시간 제외"
+        )
+        self.stdout.write(self.style.SUCCESS('✅ 크롤링 벤치마크 완료'))
+
+    def _run(self, engine, targets, max_reviews):
+        started = time.perf_counter()
+        results = engine.crawl(targets, max_reviews)
+        elapsed = time.perf_counter() - started
+
+        errors = [result for result in results.values() if result.error]
+        if errors:
+            self.stdout.write(self.style.WARNING(f"⚠️ 실패한 치과 {len(errors)}개: {errors[0].error}"))
+        return elapsed
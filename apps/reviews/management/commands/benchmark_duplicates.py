@@ -0,0 +1,96 @@
+"""
+Django 관리 명령어로 중복 리뷰 탐지 성능 비교
+"""
+from django.core.management.base import BaseCommand
+import random
+import time
+
+from apps.reviews.near_duplicates import LSHIndex, fingerprint, jaccard, shingles
+
+PHRASES = [
+    '원장님이 친절하세요', '설명을 자세히 해주셨어요', '대기 시간이 짧았어요', '주차가 편해요',
+    '스케일링 받았어요', '가격이 합리적이에요', '과잉진료 없어요', '시설이 깨끗해요',
+    '임플란트 상담 받았습니다', '아이도 무서워하지 않았어요', '간호사분들도 친절해요',
+    '야간 진료가 있어서 좋아요', '예약이 쉬웠어요', '치료 후에도 안 아팠어요', '재방문 의사 있어요',
+]
+
+
+class Command(BaseCommand):
+    help = '누적 리뷰 수에 따른 새 리뷰 1개당 중복 검사 비용을 전수 비교와 MinHash/LSH로 비교합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--history',
+            default='1000,5000,20000',
+            help='누적 리뷰 수 목록 (쉼표 구분, 기본값: 1000,5000,20000)'
+        )
+        parser.add_argument(
+            '--new',
+            type=int,
+            default=100,
+            help='검사할 새 리뷰 수 (기본값: 100)'
+        )
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=0.9,
+            help='유사도 임계값 (기본값: 0.9)'
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(42)
+        syllables = [chr(0xAC00 + rng.randrange(11172)) for _ in range(300)]
+        self.words = [''.join(rng.sample(syllables, rng.randint(2, 4))) for _ in range(3000)]
+        threshold = options['threshold']
+        sizes = [int(size) for size in options['history'].split(',')]
+
+        self.stdout.write(f"🔁 새 리뷰 {options['new']}개, 임계값 {threshold}")
+        for size in sizes:
+            history = [self._review_text(rng) for _ in range(size)]
+            # 새 리뷰 절반은 기존 리뷰를 띄어쓰기만 바꿔 다시 올린 것
+            new_reviews = [
+                history[rng.randrange(size)].replace(' ', '', 1) if i % 2 else self._review_text(rng)
+                for i in range(options['new'])
+            ]
+
+            pairwise_time, pairwise_found = self._pairwise(history, new_reviews, threshold)
+            lsh_time, lsh_found = self._lsh(history, new_reviews, threshold)
+
+            per_review = len(new_reviews)
+            self.stdout.write(
+                f"- 누적 {size}개: 전수 비교 {pairwise_time / per_review * 1000:.3f}ms/건 "
+                f"(중복 {pairwise_found}개), LSH {lsh_time / per_review * 1000:.3f}ms/건 "
+                f"(중복 {lsh_found}개, x{pairwise_time / lsh_time:.0f})"
+            )
+        self.stdout.write(self.style.SUCCESS('✅ 중복 탐지 벤치마크 완료'))
+
+    def _review_text(self, rng):
+        """임의 리뷰 본문 (자주 쓰는 구절 + 임의 단어)"""
+        parts = rng.sample(PHRASES, 2) + rng.sample(self.words, rng.randint(5, 10))
+        rng.shuffle(parts)
+        return ' '.join(parts)
+
+    def _pairwise(self, history, new_reviews, threshold):
+        """새 리뷰마다 누적 리뷰 전체와 비교 (기존 방식)"""
+        history_shingles = [shingles(text) for text in history]
+        started = time.perf_counter()
+        found = 0
+        for text in new_reviews:
+            shingle_set = shingles(text)
+            if any(jaccard(shingle_set, other) >= threshold for other in history_shingles):
+                found += 1
+        return time.perf_counter() - started, found
+
+    def _lsh(self, history, new_reviews, threshold):
+        """새 리뷰마다 LSH 버킷 동료만 비교 (서명 계산 포함)"""
+        index = LSHIndex()
+        for number, text in enumerate(history):
+            shingle_set, _, bands = fingerprint(text)
+            index.add(number, shingle_set, bands)
+        started = time.perf_counter()
+        found = 0
+        for text in new_reviews:
+            shingle_set, _, bands = fingerprint(text)
+            if index.best_match(shingle_set, bands, threshold) is not None:
+                found += 1
+        return time.perf_counter() - started, found
@@ -0,0 +1,62 @@
+"""
+Django 관리 명령어로 스팸 링 보고서 출력
+"""
+from django.core.management.base import BaseCommand
+import json
+import time
+
+from apps.reviews.near_duplicates import MAX_HAMMING_DISTANCE
+from apps.reviews.services import DuplicateDetectionService
+
+
+class Command(BaseCommand):
+    help = '여러 치과에 거의 같은 본문으로 올라온 리뷰 묶음(스팸 링)을 SimHash로 찾아 출력합니다'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-clinics',
+            type=int,
+            default=3,
+            help='스팸 링으로 볼 최소 치과 수 (기본값: 3)'
+        )
+        parser.add_argument(
+            '--max-distance',
+            type=int,
+            default=MAX_HAMMING_DISTANCE,
+            help=f'같은 본문으로 볼 최대 해밍 거리 (기본값/최댓값: {MAX_HAMMING_DISTANCE})'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='출력할 최대 스팸 링 수 (기본값: 20)'
+        )
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='JSON으로 출력'
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        rings = DuplicateDetectionService.spam_ring_report(
+            min_clinics=options['min_clinics'],
+            max_distance=options['max_distance']
+        )
+        elapsed = time.perf_counter() - start
+
+        if options['json']:
+            self.stdout.write(json.dumps(rings[:options['limit']], ensure_ascii=False, default=str, indent=2))
+            return
+
+        self.stdout.write(f"🚨 스팸 링 {len(rings)}개 ({elapsed:.2f}초)")
+        for number, ring in enumerate(rings[:options['limit']], 1):
+            sources = ', '.join(f'{source} {count}' for source, count in ring['sources'].items())
+            self.stdout.write(
+                f"{number}. 치과 {ring['clinic_count']}곳, 리뷰 {ring['review_count']}개, "
+                f"리뷰어 {ring['reviewer_count']}명 ({sources}) "
+                f"{ring['first_seen']:%Y-%m-%d} ~ {ring['last_seen']:%Y-%m-%d}"
+            )
+            self.stdout.write(f"   \"{ring['sample_text']}\"")
+            self.stdout.write(f"   리뷰 ID: {ring['review_ids']}")
+        self.stdout.write(self.style.SUCCESS('✅ 스팸 링 보고서 완료'))
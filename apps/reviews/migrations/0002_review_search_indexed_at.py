@@ -0,0 +1,20 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="search_indexed_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, null=True, verbose_name="검색 색인일"
+            ),
+        ),
+    ]
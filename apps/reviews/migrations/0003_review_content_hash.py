@@ -0,0 +1,44 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:34
+
+from django.db import migrations, models
+
+
+def populate_content_hashes(apps, schema_editor):
+    from utils.text_processing import create_content_hash
+
+    Review = apps.get_model("reviews", "Review")
+
+    rows = Review.objects.order_by("pk").values_list("pk", "original_text")
+    batch = []
+    for pk, original_text in rows.iterator(chunk_size=1000):
+        batch.append(Review(pk=pk, content_hash=create_content_hash(original_text)))
+        if len(batch) >= 1000:
+            Review.objects.bulk_update(batch, ["content_hash"])
+            batch = []
+    if batch:
+        Review.objects.bulk_update(batch, ["content_hash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0002_review_search_indexed_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, verbose_name="본문 해시"
+            ),
+        ),
+        migrations.RunPython(populate_content_hashes, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="review",
+            index=models.Index(
+                fields=["clinic", "source", "content_hash"],
+                name="reviews_rev_clinic__8f8376_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:36
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("clinics", "0009_clinic_search_indexed_at"),
+        ("reviews", "0003_review_content_hash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReviewSignature",
+            fields=[
+                (
+                    "review",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="signature",
+                        serialize=False,
+                        to="reviews.review",
+                        verbose_name="리뷰",
+                    ),
+                ),
+                ("signature", models.BinaryField(verbose_name="MinHash 서명")),
+                (
+                    "bands",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.BigIntegerField(),
+                        blank=True,
+                        default=list,
+                        size=None,
+                        verbose_name="LSH 밴드 키",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "clinic",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="review_signatures",
+                        to="clinics.clinic",
+                        verbose_name="치과",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "리뷰 서명",
+                "verbose_name_plural": "리뷰 서명들",
+                "db_table": "reviews_review_signature",
+                "indexes": [
+                    django.contrib.postgres.indexes.GinIndex(
+                        fields=["bands"], name="reviews_rev_bands_5ddf34_gin"
+                    )
+                ],
+            },
+        ),
+    ]
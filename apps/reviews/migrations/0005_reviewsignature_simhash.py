@@ -0,0 +1,78 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:40
+
+from django.db import migrations, models
+
+
+def populate_simhashes(apps, schema_editor):
+    from apps.reviews.near_duplicates import (
+        SIMHASH_BLOCK_FIELDS,
+        shingles,
+        simhash,
+        simhash_blocks,
+    )
+
+    ReviewSignature = apps.get_model("reviews", "ReviewSignature")
+
+    rows = ReviewSignature.objects.order_by("pk").values_list(
+        "pk", "review__original_text"
+    )
+    batch = []
+    for pk, original_text in rows.iterator(chunk_size=1000):
+        value = simhash(shingles(original_text))
+        if value is None:
+            continue
+        signature = ReviewSignature(pk=pk, simhash=value)
+        for field, block in zip(SIMHASH_BLOCK_FIELDS, simhash_blocks(value)):
+            setattr(signature, field, block)
+        batch.append(signature)
+        if len(batch) >= 1000:
+            ReviewSignature.objects.bulk_update(
+                batch, ["simhash", *SIMHASH_BLOCK_FIELDS]
+            )
+            batch = []
+    if batch:
+        ReviewSignature.objects.bulk_update(batch, ["simhash", *SIMHASH_BLOCK_FIELDS])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0004_reviewsignature"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reviewsignature",
+            name="simhash",
+            field=models.BigIntegerField(blank=True, null=True, verbose_name="SimHash"),
+        ),
+        migrations.AddField(
+            model_name="reviewsignature",
+            name="simhash_0",
+            field=models.IntegerField(
+                blank=True, db_index=True, null=True, verbose_name="SimHash 블록 0"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reviewsignature",
+            name="simhash_1",
+            field=models.IntegerField(
+                blank=True, db_index=True, null=True, verbose_name="SimHash 블록 1"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reviewsignature",
+            name="simhash_2",
+            field=models.IntegerField(
+                blank=True, db_index=True, null=True, verbose_name="SimHash 블록 2"
+            ),
+        ),
+        migrations.AddField(
+            model_name="reviewsignature",
+            name="simhash_3",
+            field=models.IntegerField(
+                blank=True, db_index=True, null=True, verbose_name="SimHash 블록 3"
+            ),
+        ),
+        migrations.RunPython(populate_simhashes, migrations.RunPython.noop),
+    ]
@@ -1,10 +1,26 @@
 from django.db import models
+from django.contrib.postgres.fields import ArrayField
 from django.contrib.postgres.search import SearchVectorField, SearchVector
 from django.contrib.postgres.indexes import GinIndex
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from apps.clinics.models import Clinic
+from apps.clinics.conditional import mark_clinics_changed
+from apps.clinics.ingest import current_batch
+from apps.clinics.search_index import REFRESH_BATCH_SIZE, refresh_search_vectors, search_vector_updates
+from utils.text_processing import create_content_hash
 import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 치과 리뷰 통계에 영향을 주는 필드
+STATS_FIELDS = {'clinic', 'clinic_id', 'is_processed', 'is_duplicate', 'original_rating'}
+
+
+def review_search_vector():
+    """리뷰 검색 벡터 식 (원본 > 전처리 텍스트 순 가중치)"""
+    return SearchVector('original_text', weight='A') + SearchVector('processed_text', weight='B')
 
 
 class Review(models.Model):
@@ -28,6 +44,7 @@ class Review(models.Model):
     original_rating = models.IntegerField(null=True, blank=True, verbose_name='원본 평점')
     review_date = models.DateTimeField(null=True, blank=True, verbose_name='리뷰 작성일')
     reviewer_hash = models.CharField(max_length=64, verbose_name='리뷰어 해시')  # 익명화된 리뷰어 식별자
+    content_hash = models.CharField(max_length=64, blank=True, editable=False, verbose_name='본문 해시')  # 정규화된 원본 텍스트 해시
     
     # 외부 플랫폼 ID
     external_id = models.CharField(max_length=100, blank=True, verbose_name='외부 플랫폼 ID')
@@ -39,6 +56,7 @@ class Review(models.Model):
     
     # PostgreSQL 전문 검색을 위한 벡터 필드
     search_vector = SearchVectorField(null=True, blank=True)
+    search_indexed_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name='검색 색인일')
     
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
     updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
@@ -52,17 +70,56 @@ class Review(models.Model):
             models.Index(fields=['clinic', 'is_processed']),
             models.Index(fields=['source', 'created_at']),
             models.Index(fields=['reviewer_hash']),
+            models.Index(fields=['clinic', 'source', 'content_hash']),
         ]
         unique_together = ['clinic', 'external_id', 'source']  # 중복 방지
     
     def __str__(self):
         return f"{self.clinic.name} - {self.source} ({self.created_at.date()})"
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 로드 시점의 통계 기여분 보관 (저장/삭제 시 변화분 계산용)
+        if {'clinic_id', 'is_processed', 'is_duplicate', 'original_rating'} <= set(field_names):
+            instance._stats_state = instance.stats_contribution()
+        return instance
+    
+    @property
+    def is_counted(self):
+        """치과 리뷰 통계 대상 여부 (처리 완료 + 중복 아님)"""
+        return self.is_processed and not self.is_duplicate
+    
+    def stats_contribution(self):
+        """치과 통계 기여분 (clinic_id, 평점) 또는 None (통계 대상이 아닌 경우)"""
+        if not self.is_counted:
+            return None
+        return (self.clinic_id, self.original_rating)
+    
     def update_search_vector(self):
-        """검색 벡터 업데이트"""
-        self.search_vector = SearchVector('original_text', weight='A') + \
-                           SearchVector('processed_text', weight='B')
-        self.save(update_fields=['search_vector'])
+        """검색 벡터 업데이트 (대량 적재 중이면 종료 시 일괄 갱신)"""
+        batch = current_batch()
+        if batch is not None:
+            batch.review_vector_ids.add(self.pk)
+            return
+        updates = search_vector_updates(review_search_vector())
+        Review.objects.filter(pk=self.pk).update(**updates)
+        self.search_vector = updates['search_vector']
+        self.search_indexed_at = updates['search_indexed_at']
+    
+    @classmethod
+    def refresh_search_vectors(cls, full=False, batch_size=REFRESH_BATCH_SIZE):
+        """
+        오래된 검색 벡터 일괄 갱신 (pk 구간별 UPDATE)
+        
+        Args:
+            full: True면 전체 재색인
+            batch_size: pk 구간 크기
+            
+        Returns:
+            갱신된 리뷰 수
+        """
+        return refresh_search_vectors(cls.objects.all(), review_search_vector(), full, batch_size)
 
     def generate_reviewer_hash(self, reviewer_name):
         """리뷰어 해시 생성"""
@@ -70,14 +127,86 @@ class Review(models.Model):
             hash_input = f"{reviewer_name}_{self.clinic.id}_{self.source}"
             self.reviewer_hash = hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
 
+    @classmethod
+    def backfill_content_hashes(cls, full=False, batch_size=1000):
+        """
+        본문 해시가 비어 있는 리뷰의 해시 계산
+        
+        Args:
+            full: True면 모든 리뷰의 해시를 다시 계산
+            batch_size: 한 번에 읽고 갱신할 행 수
+            
+        Returns:
+            갱신된 리뷰 수
+        """
+        queryset = cls.objects.all() if full else cls.objects.filter(content_hash='')
+        rows = queryset.order_by('pk').values_list('pk', 'original_text', 'content_hash')
+        
+        updated = 0
+        batch = []
+        for pk, original_text, current in rows.iterator(chunk_size=batch_size):
+            content_hash = create_content_hash(original_text)
+            if content_hash != current:
+                batch.append(cls(pk=pk, content_hash=content_hash))
+            if len(batch) >= batch_size:
+                cls.objects.bulk_update(batch, ['content_hash'])
+                updated += len(batch)
+                batch = []
+        if batch:
+            cls.objects.bulk_update(batch, ['content_hash'])
+            updated += len(batch)
+        
+        logger.info(f"리뷰 본문 해시 갱신: {updated}개")
+        return updated
+
     def save(self, *args, **kwargs):
         # 리뷰어 해시가 없으면 생성
         if not self.reviewer_hash and hasattr(self, '_reviewer_name'):
             self.generate_reviewer_hash(self._reviewer_name)
         
+        # 본문 해시는 원본 텍스트와 항상 함께 저장
+        self.content_hash = create_content_hash(self.original_text)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'original_text' in update_fields:
+            kwargs['update_fields'] = set(update_fields) | {'content_hash'}
+        
         super().save(*args, **kwargs)
 
 
+class ReviewSignature(models.Model):
+    """
+    리뷰 MinHash 서명과 LSH 밴드 키 (유사 중복 탐지용, near_duplicates 참고)
+    """
+    review = models.OneToOneField(
+        Review, on_delete=models.CASCADE, primary_key=True,
+        related_name='signature', verbose_name='리뷰'
+    )
+    clinic = models.ForeignKey(
+        Clinic, on_delete=models.CASCADE, related_name='review_signatures', verbose_name='치과'
+    )
+    signature = models.BinaryField(verbose_name='MinHash 서명')
+    bands = ArrayField(models.BigIntegerField(), default=list, blank=True, verbose_name='LSH 밴드 키')
+    
+    # 64비트 SimHash와 16비트 블록 (치과 간 복사 리뷰 탐지용 다중 인덱스)
+    simhash = models.BigIntegerField(null=True, blank=True, verbose_name='SimHash')
+    simhash_0 = models.IntegerField(null=True, blank=True, db_index=True, verbose_name='SimHash 블록 0')
+    simhash_1 = models.IntegerField(null=True, blank=True, db_index=True, verbose_name='SimHash 블록 1')
+    simhash_2 = models.IntegerField(null=True, blank=True, db_index=True, verbose_name='SimHash 블록 2')
+    simhash_3 = models.IntegerField(null=True, blank=True, db_index=True, verbose_name='SimHash 블록 3')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
+    
+    class Meta:
+        db_table = 'reviews_review_signature'
+        verbose_name = '리뷰 서명'
+        verbose_name_plural = '리뷰 서명들'
+        indexes = [
+            GinIndex(fields=['bands']),
+        ]
+    
+    def __str__(self):
+        return f"리뷰 {self.review_id} 서명"
+
+
 @receiver(post_save, sender=Review)
 def update_review_search_vector(sender, instance, created, **kwargs):
     """리뷰 저장 시 검색 벡터 자동 업데이트"""
@@ -85,7 +214,96 @@ def update_review_search_vector(sender, instance, created, **kwargs):
         instance.update_search_vector()
 
 
+def apply_stats_contribution(state, sign):
+    """리뷰 통계 기여분을 치과 통계에 더하거나 뺌"""
+    if state is None:
+        return
+    clinic_id, rating = state
+    Clinic.apply_review_delta(
+        clinic_id,
+        count=sign,
+        rating_sum=sign * (rating or 0),
+        rating_count=sign if rating is not None else 0
+    )
+
+
+@receiver(post_save, sender=Review)
+def update_clinic_stats(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """리뷰 상태 변화(처리 완료/중복/평점/치과)분만 치과 통계에 반영"""
+    if raw:
+        return
+    if update_fields is not None and not STATS_FIELDS & set(update_fields):
+        return
+    
+    current = instance.stats_contribution()
+    batch = current_batch()
+    if batch is not None:
+        # 대량 적재 중에는 대상 치과만 기록하고 종료 시 치과별로 재계산
+        previous = getattr(instance, '_stats_state', None)
+        batch.stats_clinic_ids.add(instance.clinic_id)
+        if previous is not None:
+            batch.stats_clinic_ids.add(previous[0])
+        instance._stats_state = current
+        return
+    
+    if created:
+        previous = None
+    elif hasattr(instance, '_stats_state'):
+        previous = instance._stats_state
+    else:
+        # 이전 상태를 알 수 없으면 해당 치과만 전체 재계산
+        instance._stats_state = current
+        instance.clinic.update_review_stats()
+        return
+    
+    if previous != current:
+        apply_stats_contribution(previous, -1)
+        apply_stats_contribution(current, 1)
+    instance._stats_state = current
+
+
 @receiver([post_save, post_delete], sender=Review)
-def update_clinic_stats(sender, instance, **kwargs):
-    """리뷰 변경 시 치과 통계 업데이트"""
-    instance.clinic.update_review_stats()
\ No newline at end of file
+def invalidate_clinic_response_version(sender, instance, **kwargs):
+    """리뷰 변경 시 치과 조건부 GET 버전 토큰 삭제"""
+    mark_clinics_changed([instance.clinic_id])
+
+
+@receiver(post_delete, sender=Review)
+def remove_review_from_clinic_stats(sender, instance, **kwargs):
+    """리뷰 삭제 시 치과 통계에서 기여분 제외"""
+    state = getattr(instance, '_stats_state', instance.stats_contribution())
+    batch = current_batch()
+    if batch is not None:
+        if state is not None:
+            batch.stats_clinic_ids.add(state[0])
+        return
+    apply_stats_contribution(state, -1)
+
+
+def counted_review_deltas(queryset):
+    """
+    리뷰 쿼리셋의 치과별 통계 기여분 합계 (일괄 상태 변경 전 계산용)
+    
+    Returns:
+        {clinic_id: (리뷰 수, 평점 합계, 평점 있는 리뷰 수)}
+    """
+    rows = queryset.values('clinic_id').annotate(
+        total=models.Count('id'),
+        rating_sum=models.Sum('original_rating'),
+        rating_count=models.Count('original_rating')
+    ).order_by()
+    return {
+        row['clinic_id']: (row['total'], row['rating_sum'] or 0, row['rating_count'])
+        for row in rows
+    }
+
+
+def apply_review_deltas(deltas, sign):
+    """counted_review_deltas 결과를 치과 통계에 반영"""
+    for clinic_id, (count, rating_sum, rating_count) in deltas.items():
+        Clinic.apply_review_delta(
+            clinic_id,
+            count=sign * count,
+            rating_sum=sign * rating_sum,
+            rating_count=sign * rating_count
+        )
@@ -0,0 +1,476 @@
+"""
+MinHash/LSH 기반 유사 중복 리뷰 탐지
+
+리뷰 본문에서 공백과 문장부호를 뺀 문자 n-gram 집합을 만들고(띄어쓰기가 제각각인
+한국어 리뷰에 단어 집합보다 안정적), NUM_PERM개 해시의 최솟값으로 MinHash 서명을 만든다. 서명을
+BANDS개 밴드로 나눈 밴드 키가 하나라도 같은 리뷰(버킷 동료)끼리만 실제 유사도를
+비교하므로, 새 리뷰 하나의 비교 비용은 누적 리뷰 수와 무관하다.
+
+밴드 16개 x 행 4개에서 자카드 유사도 s인 두 리뷰가 후보가 될 확률은
+1 - (1 - s^4)^16 이다 (s=0.5: 0.64, s=0.7: 0.99, s=0.9: 1.00).
+
+리뷰별 서명과 밴드 키는 ReviewSignature에 저장하며, 서명이 없는 리뷰(새로 수집된
+리뷰)만 find_new_duplicates()로 검사한다.
+
+치과를 넘나드는 복사 리뷰(스팸)는 64비트 SimHash로 찾는다. SimHash를 16비트 블록
+4개로 나눠 각각 인덱스를 두면, 해밍 거리 3 이하인 두 값은 비둘기집 원리에 따라
+최소 한 블록이 같으므로 전체 리뷰를 훑지 않고 블록 일치 행만 비교하면 된다.
+'좋아요!'와 '좋아요'처럼 짧고 흔한 리뷰는 서로 다른 손님이 써도 SimHash가 같으므로,
+다른 치과 복사본은 n-gram이 MIN_CROSS_CLINIC_SHINGLES개 이상이거나, SPAM_RING_MIN_CLINICS개
+이상 치과에 걸친 묶음(스팸 링)에 속하면서 n-gram이 MIN_SPAM_RING_SHINGLES개 이상일 때만 자동으로
+중복 표시하고 나머지는 보고만 한다. 짧은 리뷰는 스팸 링에 속해도 표시하지 않는다.
+"""
+import hashlib
+import logging
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from utils.text_processing import normalize_for_hash
+
+logger = logging.getLogger(__name__)
+
+# 문자 n-gram 크기
+SHINGLE_SIZE = 3
+
+# n-gram을 만들기 전에 지우는 공백/문장부호
+NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+# MinHash 해시 수 = 밴드 수 x 밴드당 행 수
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+# 한 번에 서명을 만들고 후보를 조회할 새 리뷰 수
+INDEX_BATCH_SIZE = 500
+
+# SimHash 블록 (블록 수 - 1 까지의 해밍 거리를 놓치지 않음)
+SIMHASH_BITS = 64
+SIMHASH_BLOCKS = 4
+SIMHASH_BLOCK_BITS = SIMHASH_BITS // SIMHASH_BLOCKS
+SIMHASH_BLOCK_FIELDS = tuple(f'simhash_{block}' for block in range(SIMHASH_BLOCKS))
+MAX_HAMMING_DISTANCE = SIMHASH_BLOCKS - 1
+
+# 다른 치과 복사본을 자동 중복 표시할 최소 n-gram 수 (짧은 리뷰는 우연히 겹침)
+MIN_CROSS_CLINIC_SHINGLES = 20
+
+# 스팸 링으로 볼 최소 치과 수
+SPAM_RING_MIN_CLINICS = 3
+
+# 스팸 링에 속한 복사본을 자동 중복 표시할 최소 n-gram 수 ('좋아요'류 짧은 리뷰 제외)
+MIN_SPAM_RING_SHINGLES = 10
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+# 프로세스가 달라도 같은 서명이 나오도록 고정 시드 사용
+_random = np.random.RandomState(1)
+_PERM_A = _random.randint(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _random.randint(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """공백/문장부호를 제거한 정규화 본문의 문자 n-gram 집합"""
+    compact = NON_WORD_PATTERN.sub('', normalize_for_hash(text))
+    if len(compact) <= size:
+        return {compact} if compact else set()
+    return {compact[i:i + size] for i in range(len(compact) - size + 1)}
+
+
+def minhash(shingle_set: Set[str]) -> np.ndarray:
+    """n-gram 집합의 MinHash 서명 (uint32 NUM_PERM개)"""
+    if not shingle_set:
+        return np.full(NUM_PERM, _MAX_HASH, dtype=np.uint32)
+    values = np.array(
+        [zlib.crc32(shingle.encode('utf-8')) for shingle in shingle_set], dtype=np.uint64
+    )
+    hashed = (values[:, None] * _PERM_A + _PERM_B) % _MERSENNE_PRIME & _MAX_HASH
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """밴드별 LSH 버킷 키 (부호 있는 64비트 정수)"""
+    keys = []
+    for band in range(BANDS):
+        digest = hashlib.blake2b(
+            bytes([band]) + signature[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8
+        ).digest()
+        keys.append(int.from_bytes(digest, 'big', signed=True))
+    return keys
+
+
+def fingerprint(text: str) -> Tuple[Set[str], np.ndarray, List[int]]:
+    """
+    리뷰 본문의 (n-gram 집합, MinHash 서명, 밴드 키)
+
+    n-gram이 없는 빈 본문은 모든 빈 본문과 같은 버킷에 들어가지 않도록 밴드 키를 비운다.
+    """
+    shingle_set = shingles(text)
+    signature = minhash(shingle_set)
+    return shingle_set, signature, band_keys(signature) if shingle_set else []
+
+
+def simhash(shingle_set: Set[str]) -> Optional[int]:
+    """n-gram 집합의 64비트 SimHash (부호 있는 정수, 빈 집합이면 None)"""
+    if not shingle_set:
+        return None
+    digests = b''.join(
+        hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest() for shingle in shingle_set
+    )
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8)).reshape(-1, SIMHASH_BITS)
+    # 비트별 다수결 (1이 절반을 넘으면 1)
+    majority = bits.sum(axis=0) * 2 > len(shingle_set)
+    value = int.from_bytes(np.packbits(majority).tobytes(), 'big')
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+
+def simhash_blocks(value: int) -> List[int]:
+    """SimHash를 SIMHASH_BLOCKS개의 블록 값으로 분할"""
+    unsigned = value & ((1 << SIMHASH_BITS) - 1)
+    mask = (1 << SIMHASH_BLOCK_BITS) - 1
+    return [(unsigned >> (block * SIMHASH_BLOCK_BITS)) & mask for block in range(SIMHASH_BLOCKS)]
+
+
+def hamming(a: int, b: int) -> int:
+    """두 SimHash의 해밍 거리"""
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count('1')
+
+
+def signature_fields(shingle_set: Set[str], signature: np.ndarray, bands: List[int]) -> Dict:
+    """ReviewSignature 저장 값 (MinHash 서명, 밴드 키, SimHash와 블록)"""
+    fields = {'signature': signature.tobytes(), 'bands': bands, 'simhash': simhash(shingle_set)}
+    blocks = simhash_blocks(fields['simhash']) if fields['simhash'] is not None else [None] * SIMHASH_BLOCKS
+    fields.update(zip(SIMHASH_BLOCK_FIELDS, blocks))
+    return fields
+
+
+def simhash_block_filter(values: Iterable[int]):
+    """SimHash 블록 중 하나라도 같은 행 조건 (블록별 인덱스 조회)"""
+    from django.db.models import Q
+
+    blocks = [set() for _ in range(SIMHASH_BLOCKS)]
+    for value in values:
+        for block, block_value in enumerate(simhash_blocks(value)):
+            blocks[block].add(block_value)
+    condition = Q()
+    for field, block_values in zip(SIMHASH_BLOCK_FIELDS, blocks):
+        condition |= Q(**{f'{field}__in': block_values})
+    return condition
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """자카드 유사도"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class LSHIndex:
+    """메모리 LSH 인덱스 (밴드 키 -> 리뷰 키 목록)"""
+
+    def __init__(self):
+        self.buckets = defaultdict(list)
+        self.shingles = {}
+
+    def __len__(self):
+        return len(self.shingles)
+
+    def add(self, key, shingle_set: Set[str], bands: Iterable[int]):
+        self.shingles[key] = shingle_set
+        for band_key in bands:
+            self.buckets[band_key].append(key)
+
+    def candidates(self, bands: Iterable[int]) -> Set:
+        result = set()
+        for band_key in bands:
+            result.update(self.buckets.get(band_key, ()))
+        return result
+
+    def best_match(self, shingle_set: Set[str], bands: Iterable[int],
+                   threshold: float) -> Optional[Tuple[object, float]]:
+        """
+        버킷 동료 중 유사도가 threshold 이상인 가장 비슷한 항목
+
+        Returns:
+            (키, 유사도) 또는 None
+        """
+        best = None
+        for key in self.candidates(bands):
+            similarity = jaccard(shingle_set, self.shingles[key])
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+
+def duplicate_pair(original_id: int, original_text: str, duplicate_id: int,
+                   duplicate_text: str, similarity: float, match_type: str = 'clinic',
+                   auto_mark: bool = True) -> Dict:
+    """
+    중복 탐지 결과 항목
+
+    match_type은 같은 치과 안의 중복이면 'clinic', 다른 치과 리뷰의 복사본이면 'cross_clinic'.
+    auto_mark가 False인 항목은 보고만 하고 중복으로 표시하지 않는다.
+    """
+    return {
+        'original_review_id': original_id,
+        'duplicate_review_id': duplicate_id,
+        'similarity_score': similarity,
+        'match_type': match_type,
+        'auto_mark': auto_mark,
+        'original_text': original_text[:100],
+        'duplicate_text': duplicate_text[:100]
+    }
+
+
+def find_new_duplicates(clinic_id: int, similarity_threshold: float,
+                        batch_size: int = INDEX_BATCH_SIZE, cross_clinic: bool = True,
+                        max_distance: int = MAX_HAMMING_DISTANCE,
+                        min_shingles: int = MIN_CROSS_CLINIC_SHINGLES,
+                        min_clinics: int = SPAM_RING_MIN_CLINICS) -> List[Dict]:
+    """
+    서명이 없는 (새로 수집된) 리뷰만 기존 리뷰와 비교하고 서명을 저장
+
+    새 리뷰는 작성 순서대로 자신보다 먼저 색인된 중복 아닌 리뷰 중 버킷 동료와만
+    비교한다. 같은 치과에서 중복을 찾지 못한 리뷰는 다른 치과 리뷰 중 SimHash 해밍
+    거리가 max_distance 이하인 리뷰(복사 리뷰)도 찾는다. 중복으로 판정된 리뷰도 다시
+    검사하지 않도록 서명은 저장하되, 이후 리뷰의 비교 대상에서는 제외한다.
+
+    다른 치과 복사본은 n-gram이 min_shingles개 이상이거나, min_clinics개 이상 치과에 걸친
+    스팸 링에 속하면서 n-gram이 MIN_SPAM_RING_SHINGLES개 이상일 때만 auto_mark가 True다.
+    이때 링에 속한 이전 복사본도 가장 먼저 작성된 리뷰의 중복으로 함께 반환한다.
+
+    Args:
+        clinic_id: 치과 ID
+        similarity_threshold: 문자 n-gram 자카드 유사도 임계값
+        batch_size: 한 번에 처리할 새 리뷰 수
+        cross_clinic: 다른 치과 리뷰와도 비교할지 여부
+        max_distance: 다른 치과 리뷰와 비교할 때의 최대 해밍 거리
+        min_shingles: 다른 치과 복사본을 자동 표시할 최소 n-gram 수
+        min_clinics: 자동 표시할 스팸 링의 최소 치과 수
+
+    Returns:
+        중복 탐지 결과 목록 (detect_duplicates와 같은 형식)
+    """
+    from .models import Review, ReviewSignature
+
+    max_distance = min(max_distance, MAX_HAMMING_DISTANCE)
+
+    # 처리 중 저장하는 서명이 조회 결과를 바꾸므로 대상 id 목록을 먼저 고정
+    new_ids = list(Review.objects.filter(
+        clinic_id=clinic_id, signature__isnull=True
+    ).order_by('created_at', 'id').values_list('id', flat=True))
+
+    duplicates = []
+    duplicate_ids = set()
+    for start in range(0, len(new_ids), batch_size):
+        ids = new_ids[start:start + batch_size]
+        rows = Review.objects.filter(id__in=ids).values_list('id', 'original_text', 'is_duplicate')
+        order = {review_id: position for position, review_id in enumerate(ids)}
+        chunk = sorted(rows, key=lambda row: order[row[0]])
+        prints = {review_id: fingerprint(text) for review_id, text, _ in chunk}
+
+        # 기존 리뷰 중 이번 묶음과 밴드 키가 겹치는 버킷 동료 (GIN 인덱스 조회 한 번)
+        index = LSHIndex()
+        texts = {}
+        all_keys = {key for _, _, bands in prints.values() for key in bands}
+        if all_keys:
+            mates = ReviewSignature.objects.filter(
+                clinic_id=clinic_id, review__is_duplicate=False, bands__overlap=list(all_keys)
+            ).values_list('review_id', 'bands', 'review__original_text')
+            for review_id, bands, text in mates:
+                if review_id in duplicate_ids:
+                    continue
+                index.add(review_id, shingles(text), bands)
+                texts[review_id] = text
+
+        signatures = []
+        unmatched = {}
+        for review_id, text, is_duplicate in chunk:
+            shingle_set, signature, bands = prints[review_id]
+            fields = signature_fields(shingle_set, signature, bands)
+            signatures.append(ReviewSignature(review_id=review_id, clinic_id=clinic_id, **fields))
+            if is_duplicate:
+                continue
+
+            match = index.best_match(shingle_set, bands, similarity_threshold)
+            if match is not None:
+                original_id, similarity = match
+                duplicates.append(duplicate_pair(original_id, texts[original_id], review_id, text, similarity))
+                duplicate_ids.add(review_id)
+                continue
+
+            # 같은 묶음의 이후 리뷰와도 비교되도록 추가
+            index.add(review_id, shingle_set, bands)
+            texts[review_id] = text
+            if fields['simhash'] is not None:
+                unmatched[review_id] = (fields['simhash'], text, len(shingle_set))
+
+        if cross_clinic and unmatched:
+            pairs = _cross_clinic_matches(clinic_id, unmatched, max_distance, min_shingles, min_clinics)
+            for pair in pairs:
+                duplicates.append(pair)
+                if pair['auto_mark']:
+                    duplicate_ids.add(pair['duplicate_review_id'])
+
+        ReviewSignature.objects.bulk_create(signatures, ignore_conflicts=True)
+
+    if new_ids:
+        logger.info(f"리뷰 서명 생성: 치과 ID {clinic_id}, {len(new_ids)}개 (중복 {len(duplicates)}개)")
+    return duplicates
+
+
+def _cross_clinic_matches(clinic_id: int, reviews: Dict[int, Tuple[int, str, int]], max_distance: int,
+                          min_shingles: int, min_clinics: int) -> List[Dict]:
+    """
+    다른 치과 리뷰 중 SimHash가 가까운 리뷰 (블록 인덱스 조회 한 번)
+
+    가장 가까운 중복 아닌 리뷰를 원본으로 보고, n-gram이 min_shingles개 미만이면 보고만 한다.
+    이미 중복 표시된 리뷰까지 포함해 가까운 리뷰가 min_clinics개 이상 치과에 걸쳐 있고 n-gram이
+    MIN_SPAM_RING_SHINGLES개 이상이면 스팸 링으로 보고 가장 먼저 작성된 리뷰를 원본으로,
+    나머지 중복 아닌 리뷰를 모두 중복으로 반환한다. 짧은 리뷰는 링이어도 보고만 한다.
+
+    Args:
+        clinic_id: 새 리뷰의 치과 ID
+        reviews: {리뷰 ID: (SimHash, 본문, n-gram 수)}
+        max_distance: 최대 해밍 거리
+        min_shingles: 스팸 링이 아닌 복사본을 자동 표시할 최소 n-gram 수
+        min_clinics: 스팸 링으로 볼 최소 치과 수
+    """
+    from .models import Review, ReviewSignature
+
+    candidates = ReviewSignature.objects.filter(
+        simhash_block_filter(value for value, _, _ in reviews.values())
+    ).exclude(clinic_id=clinic_id).values_list(
+        'review_id', 'clinic_id', 'simhash', 'review__is_duplicate', 'review__created_at'
+    )
+    buckets = defaultdict(list)
+    for row in candidates:
+        for block in enumerate(simhash_blocks(row[2])):
+            buckets[block].append(row)
+    if not buckets:
+        return []
+
+    # {중복 리뷰 ID: (원본 ID, 해밍 거리, 자동 표시 여부)}
+    matches = {}
+    for review_id, (value, _, shingle_count) in reviews.items():
+        nearby = {
+            row[0]: row for block in enumerate(simhash_blocks(value))
+            for row in buckets.get(block, ()) if hamming(value, row[2]) <= max_distance
+        }
+        originals = [row for row in nearby.values() if not row[3]]
+        if not originals:
+            continue
+
+        ring = len({clinic_id} | {row[1] for row in nearby.values()}) >= min_clinics
+        if ring and shingle_count >= MIN_SPAM_RING_SHINGLES:
+            originals.sort(key=lambda row: (row[4], row[0]))
+            original = originals[0]
+            matches[review_id] = (original[0], hamming(value, original[2]), True)
+            for other in originals[1:]:
+                matches.setdefault(other[0], (original[0], hamming(other[2], original[2]), True))
+            continue
+
+        original = min(originals, key=lambda row: hamming(value, row[2]))
+        matches[review_id] = (original[0], hamming(value, original[2]), shingle_count >= min_shingles)
+
+    texts = dict(Review.objects.filter(
+        id__in={other_id for other_id, _, _ in matches.values()} | (set(matches) - set(reviews))
+    ).values_list('id', 'original_text'))
+    texts.update((review_id, text) for review_id, (_, text, _) in reviews.items())
+    return [
+        duplicate_pair(
+            original_id, texts[original_id], review_id, texts[review_id],
+            1 - distance / SIMHASH_BITS, match_type='cross_clinic', auto_mark=auto_mark
+        )
+        for review_id, (original_id, distance, auto_mark) in matches.items()
+    ]
+
+
+def find_spam_rings(min_clinics: int = SPAM_RING_MIN_CLINICS, max_distance: int = MAX_HAMMING_DISTANCE,
+                    batch_size: int = 5000) -> List[Dict]:
+    """
+    여러 치과에 거의 같은 본문으로 올라온 리뷰 묶음 (스팸 링)
+
+    SimHash가 같은 리뷰를 먼저 묶고, 블록 값이 같은 SimHash끼리만 해밍 거리를
+    비교해 연결 요소를 만든다. 연결 요소에 포함된 치과가 min_clinics개 이상이면
+    스팸 링으로 본다.
+
+    Args:
+        min_clinics: 스팸 링으로 볼 최소 치과 수
+        max_distance: 같은 본문으로 볼 최대 해밍 거리
+        batch_size: 서명을 한 번에 읽을 행 수
+
+    Returns:
+        치과 수가 많은 순의 스팸 링 목록
+    """
+    from .models import Review, ReviewSignature
+
+    max_distance = min(max_distance, MAX_HAMMING_DISTANCE)
+
+    members = defaultdict(list)
+    rows = ReviewSignature.objects.filter(simhash__isnull=False).values_list('review_id', 'clinic_id', 'simhash')
+    for review_id, clinic_id, value in rows.iterator(chunk_size=batch_size):
+        members[value].append((review_id, clinic_id))
+
+    # SimHash 값 단위 union-find
+    parent = {value: value for value in members}
+
+    def find(value):
+        while parent[value] != value:
+            parent[value] = parent[parent[value]]
+            value = parent[value]
+        return value
+
+    if max_distance > 0:
+        buckets = defaultdict(list)
+        for value in members:
+            for block in enumerate(simhash_blocks(value)):
+                buckets[block].append(value)
+        for values in buckets.values():
+            for i, value in enumerate(values):
+                for other in values[i + 1:]:
+                    if hamming(value, other) <= max_distance:
+                        parent[find(value)] = find(other)
+
+    components = defaultdict(list)
+    for value, reviews in members.items():
+        components[find(value)].extend(reviews)
+
+    rings = [
+        reviews for reviews in components.values()
+        if len({clinic_id for _, clinic_id in reviews}) >= min_clinics
+    ]
+    if not rings:
+        return []
+
+    details = {
+        row['id']: row for row in Review.objects.filter(
+            id__in=[review_id for reviews in rings for review_id, _ in reviews]
+        ).values('id', 'source', 'reviewer_hash', 'original_text', 'created_at')
+    }
+
+    report = []
+    for reviews in rings:
+        rows = sorted((details[review_id] for review_id, _ in reviews), key=lambda row: (row['created_at'], row['id']))
+        sources = defaultdict(int)
+        for row in rows:
+            sources[row['source']] += 1
+        clinic_ids = sorted({clinic_id for _, clinic_id in reviews})
+        report.append({
+            'review_ids': [row['id'] for row in rows],
+            'clinic_ids': clinic_ids,
+            'clinic_count': len(clinic_ids),
+            'review_count': len(rows),
+            'sources': dict(sources),
+            'reviewer_count': len({row['reviewer_hash'] for row in rows if row['reviewer_hash']}),
+            'sample_text': rows[0]['original_text'][:100],
+            'first_seen': rows[0]['created_at'],
+            'last_seen': rows[-1]['created_at'],
+        })
+
+    report.sort(key=lambda ring: (-ring['clinic_count'], -ring['review_count']))
+    logger.info(f"스팸 링 탐지: {len(report)}개")
+    return report
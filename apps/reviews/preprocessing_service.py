@@ -13,6 +13,7 @@ from utils.nlp.preprocessing import (
 )
 from utils.nlp.sentiment_analysis import analyze_review_sentiment
 from apps.analysis.models import SentimentAnalysis
+from apps.clinics.ingest import bulk_ingest
 
 logger = logging.getLogger(__name__)
 
@@ -108,7 +109,8 @@ class ReviewPreprocessingService:
         """전처리 결과 저장"""
         processed_count = 0
         
-        with transaction.atomic():
+        # 검색 벡터/치과 통계/감성 분석 요약은 같은 트랜잭션 안에서 일괄 갱신
+        with transaction.atomic(), bulk_ingest():
             for review, preprocessed in zip(reviews, results):
                 try:
                     self._update_review_with_preprocessing(review, preprocessed)
@@ -140,10 +142,10 @@ class ReviewPreprocessingService:
             except Exception as e:
                 logger.error(f"감성 분석 실패 (리뷰 ID: {review.id}): {e}")
         
+        review.save(update_fields=['processed_text', 'is_processed', 'is_flagged'])
+        
         # 검색 벡터 업데이트
         review.update_search_vector()
-        
-        review.save(update_fields=['processed_text', 'is_processed', 'is_flagged', 'search_vector'])
     
     def _perform_sentiment_analysis(self, review: Review) -> None:
         """감성 분석 수행 및 저장"""
@@ -2,11 +2,17 @@
 리뷰 관련 서비스 로직
 """
 from typing import List, Dict, Optional
+from django.db import transaction
 from django.db.models import Q, Count, Avg
 from django.utils import timezone
 from datetime import timedelta
-from .models import Review
+from .models import Review, apply_review_deltas, counted_review_deltas
 from .crawlers.base import crawler_manager
+from .near_duplicates import (
+    INDEX_BATCH_SIZE, MAX_HAMMING_DISTANCE, LSHIndex, duplicate_pair, find_new_duplicates,
+    find_spam_rings, fingerprint
+)
+from apps.clinics.conditional import mark_clinics_changed
 from apps.clinics.models import Clinic
 import logging
 
@@ -62,20 +68,32 @@ class ReviewService:
     
     @staticmethod
     def mark_reviews_as_processed(review_ids: List[int]) -> int:
-        """리뷰들을 처리 완료로 표시"""
-        updated_count = Review.objects.filter(
-            id__in=review_ids
-        ).update(is_processed=True)
+        """리뷰들을 처리 완료로 표시 (새로 통계 대상이 되는 리뷰만 치과 통계에 반영)"""
+        with transaction.atomic():
+            deltas = counted_review_deltas(Review.objects.filter(
+                id__in=review_ids, is_processed=False, is_duplicate=False
+            ))
+            updated_count = Review.objects.filter(
+                id__in=review_ids
+            ).update(is_processed=True)
+            apply_review_deltas(deltas, 1)
         
         logger.info(f"{updated_count}개 리뷰가 처리 완료로 표시됨")
         return updated_count
     
     @staticmethod
     def mark_reviews_as_duplicate(review_ids: List[int]) -> int:
-        """리뷰들을 중복으로 표시"""
-        updated_count = Review.objects.filter(
-            id__in=review_ids
-        ).update(is_duplicate=True)
+        """리뷰들을 중복으로 표시 (통계 대상에서 빠지는 리뷰만 치과 통계에서 제외)"""
+        with transaction.atomic():
+            deltas = counted_review_deltas(Review.objects.filter(
+                id__in=review_ids, is_processed=True, is_duplicate=False
+            ))
+            reviews = Review.objects.filter(id__in=review_ids)
+            clinic_ids = set(reviews.values_list('clinic_id', flat=True))
+            # 다른 치과 리뷰도 포함될 수 있으므로 해당 치과들의 응답 버전을 모두 갱신
+            updated_count = reviews.update(is_duplicate=True, updated_at=timezone.now())
+            apply_review_deltas(deltas, -1)
+            mark_clinics_changed(clinic_ids)
         
         logger.info(f"{updated_count}개 리뷰가 중복으로 표시됨")
         return updated_count
@@ -187,66 +205,68 @@ class DuplicateDetectionService:
     
     @staticmethod
     def detect_duplicates(clinic_id: int, similarity_threshold: float = 0.8) -> List[Dict]:
-        """중복 리뷰 탐지"""
+        """
+        치과 전체 리뷰의 중복 탐지 (저장 없이 결과만 반환)
+        
+        작성 순서대로 앞선 중복 아닌 리뷰 중 LSH 버킷 동료와만 문자 n-gram 자카드
+        유사도를 비교한다.
+        """
         reviews = Review.objects.filter(
             clinic_id=clinic_id,
             is_duplicate=False
-        ).order_by('created_at')
+        ).order_by('created_at', 'id').values_list('id', 'original_text')
         
         duplicates = []
-        processed_reviews = []
+        index = LSHIndex()
+        texts = {}
         
-        for review in reviews:
-            is_duplicate = False
-            
-            for processed_review in processed_reviews:
-                # 간단한 텍스트 유사도 계산 (실제로는 더 정교한 알고리즘 사용)
-                similarity = DuplicateDetectionService._calculate_similarity(
-                    review.original_text, 
-                    processed_review.original_text
-                )
-                
-                if similarity >= similarity_threshold:
-                    duplicates.append({
-                        'original_review_id': processed_review.id,
-                        'duplicate_review_id': review.id,
-                        'similarity_score': similarity,
-                        'original_text': processed_review.original_text[:100],
-                        'duplicate_text': review.original_text[:100]
-                    })
-                    is_duplicate = True
-                    break
+        for review_id, text in reviews.iterator(chunk_size=INDEX_BATCH_SIZE):
+            shingle_set, _, bands = fingerprint(text)
+            match = index.best_match(shingle_set, bands, similarity_threshold)
+            if match is not None:
+                original_id, similarity = match
+                duplicates.append(duplicate_pair(original_id, texts[original_id], review_id, text, similarity))
+                continue
             
-            if not is_duplicate:
-                processed_reviews.append(review)
+            index.add(review_id, shingle_set, bands)
+            texts[review_id] = text
         
         return duplicates
     
     @staticmethod
-    def _calculate_similarity(text1: str, text2: str) -> float:
-        """텍스트 유사도 계산 (간단한 구현)"""
-        if not text1 or not text2:
-            return 0.0
+    def auto_mark_duplicates(clinic_id: int, similarity_threshold: float = 0.9,
+                             cross_clinic: bool = True) -> int:
+        """
+        자동 중복 리뷰 표시 (증분)
         
-        # 단어 집합 기반 Jaccard 유사도
-        words1 = set(text1.split())
-        words2 = set(text2.split())
+        MinHash 서명이 아직 없는 새 리뷰만 기존 리뷰의 LSH 버킷 동료와 비교하므로,
+        크롤링마다 호출해도 비용이 누적 리뷰 수가 아니라 새 리뷰 수에 비례한다.
+        cross_clinic이면 다른 치과 리뷰를 SimHash로 복사한 리뷰도 찾되, 충분히 길거나
+        스팸 링에 속한 복사본만 중복으로 표시하고 나머지는 로그로 보고한다.
+        """
+        duplicates = find_new_duplicates(clinic_id, similarity_threshold, cross_clinic=cross_clinic)
         
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        return intersection / union if union > 0 else 0.0
-    
-    @staticmethod
-    def auto_mark_duplicates(clinic_id: int, similarity_threshold: float = 0.9) -> int:
-        """자동 중복 리뷰 표시"""
-        duplicates = DuplicateDetectionService.detect_duplicates(clinic_id, similarity_threshold)
-        
-        duplicate_ids = [dup['duplicate_review_id'] for dup in duplicates]
+        duplicate_ids = [dup['duplicate_review_id'] for dup in duplicates if dup['auto_mark']]
+        reported_count = len(duplicates) - len(duplicate_ids)
+        if reported_count:
+            logger.info(
+                f"다른 치과와 겹치는 짧은 리뷰 {reported_count}개는 중복으로 표시하지 않음 (치과 ID: {clinic_id})"
+            )
         
         if duplicate_ids:
             marked_count = ReviewService.mark_reviews_as_duplicate(duplicate_ids)
-            logger.info(f"자동으로 {marked_count}개 리뷰가 중복으로 표시됨 (치과 ID: {clinic_id})")
+            cross_count = sum(
+                1 for dup in duplicates if dup['match_type'] == 'cross_clinic' and dup['auto_mark']
+            )
+            logger.info(
+                f"자동으로 {marked_count}개 리뷰가 중복으로 표시됨 "
+                f"(치과 ID: {clinic_id}, 다른 치과 복사 {cross_count}개)"
+            )
             return marked_count
         
-        return 0
\ No newline at end of file
+        return 0
+    
+    @staticmethod
+    def spam_ring_report(min_clinics: int = 3, max_distance: int = MAX_HAMMING_DISTANCE) -> List[Dict]:
+        """여러 치과에 같은 본문으로 올라온 리뷰 묶음 (스팸 링) 보고서"""
+        return find_spam_rings(min_clinics=min_clinics, max_distance=max_distance)
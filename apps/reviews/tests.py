@@ -1,14 +1,24 @@
+import asyncio
+import time
+from decimal import Decimal
+from importlib.util import find_spec
 from django.test import TestCase
 from django.db import IntegrityError
 from django.utils import timezone
-from unittest.mock import patch, MagicMock
+from unittest import skipUnless
+from unittest.mock import patch
 from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from apps.clinics.models import Clinic
-from .models import Review
+from .models import Review, ReviewSignature
+from .near_duplicates import find_new_duplicates, fingerprint, hamming, shingles, simhash, simhash_blocks
+from utils.text_processing import create_content_hash
 from .crawlers.base import BaseCrawler, ReviewData, crawler_manager
+from .crawlers.async_http import AsyncCrawlEngine, CrawlTarget, HostRateLimiter, aiohttp
+from .crawlers.driver_pool import DriverPool, DriverPoolTimeout
+from .crawlers.naver_http import NaverPlaceApiSource, NaverPlaceHttpCrawler, parse_created_date
 from .services import CrawlingService, ReviewService, DuplicateDetectionService
 
 User = get_user_model()
@@ -67,6 +77,30 @@ class ReviewModelTest(TestCase):
         self.assertIsNotNone(review.reviewer_hash)
         self.assertEqual(len(review.reviewer_hash), 64)  # SHA256 해시 길이
     
+    def test_content_hash(self):
+        """저장 시 정규화된 본문 해시 계산"""
+        review = Review.objects.create(**self.review_data)
+        self.assertEqual(len(review.content_hash), 64)
+        self.assertEqual(
+            review.content_hash,
+            create_content_hash('  친절하고  실력있는 치과입니다.\n가격도 합리적이에요. ')
+        )
+        
+        review.original_text = '다른 내용'
+        review.save(update_fields=['original_text'])
+        self.assertEqual(
+            Review.objects.get(pk=review.pk).content_hash, create_content_hash('다른 내용')
+        )
+    
+    def test_backfill_content_hashes(self):
+        """비어 있는 본문 해시 채우기"""
+        review = Review.objects.create(**self.review_data)
+        Review.objects.filter(pk=review.pk).update(content_hash='')
+        
+        self.assertEqual(Review.backfill_content_hashes(batch_size=1), 1)
+        self.assertEqual(Review.objects.get(pk=review.pk).content_hash, review.content_hash)
+        self.assertEqual(Review.backfill_content_hashes(), 0)
+    
     def test_update_search_vector(self):
         """검색 벡터 업데이트 테스트"""
         review = Review.objects.create(**self.review_data)
@@ -162,8 +196,7 @@ class ReviewQueryTest(TestCase):
         results = Review.objects.filter(original_text__icontains='친절')
         self.assertEqual(results.count(), 1)
 
-cla
-ss MockCrawler(BaseCrawler):
+class MockCrawler(BaseCrawler):
     """테스트용 모크 크롤러"""
     
     def get_source_name(self) -> str:
@@ -213,8 +246,8 @@ class CrawlerBaseTest(TestCase):
         crawler_manager.register_crawler('test', self.crawler)
         registered_crawler = crawler_manager.get_crawler('test')
         
-        self.assertIsNotNone(registered_crawler)
-        self.assertEqual(registered_crawler.get_source_name(), 'test')
+        self.assertIs(registered_crawler, self.crawler)
+        self.assertIsNone(crawler_manager.get_crawler('unregistered'))
     
     def test_review_crawling_and_saving(self):
         """리뷰 크롤링 및 저장 테스트"""
@@ -246,6 +279,62 @@ class CrawlerBaseTest(TestCase):
         self.assertEqual(saved_count2, 0)
         self.assertEqual(duplicate_count2, 2)
     
+    def test_bulk_save_query_count(self):
+        """리뷰 수와 무관하게 일정한 쿼리 수로 저장"""
+        review_data_list = [
+            ReviewData(
+                text=f"친절한 치과입니다 {i}", rating=4, date=timezone.now(),
+                reviewer_name=f"테스터{i}", external_id=f"bulk_{i}"
+            )
+            for i in range(50)
+        ]
+        # 목록 안의 중복 (같은 external_id)
+        review_data_list.append(ReviewData(text="다른 내용", rating=3, external_id="bulk_0"))
+        
+        # 조건부 GET용 치과 data_updated_at 갱신 1회 포함
+        with self.assertNumQueries(7):
+            saved_count, duplicate_count = self.crawler.save_reviews(self.clinic, review_data_list)
+        
+        self.assertEqual(saved_count, 50)
+        self.assertEqual(duplicate_count, 1)
+        self.assertFalse(Review.objects.filter(clinic=self.clinic, search_vector__isnull=True).exists())
+        
+        # 기존 리뷰와 본문이 같으면 external_id가 달라도 중복
+        saved_count, duplicate_count = self.crawler.save_reviews(self.clinic, [
+            ReviewData(text="친절한 치과입니다 1", external_id="bulk_new"),
+            ReviewData(text="새로운 리뷰", external_id="bulk_new2"),
+        ])
+        self.assertEqual((saved_count, duplicate_count), (1, 1))
+    
+    def test_concurrent_insert_not_counted(self):
+        """같은 external_id를 먼저 저장한 다른 크롤링의 리뷰는 저장 수에 포함하지 않음"""
+        original_bulk_create = Review.objects.bulk_create
+        
+        def bulk_create_after_concurrent_crawl(objs, **kwargs):
+            # 중복 확인 이후, INSERT 직전에 다른 크롤링이 같은 external_id로 저장
+            Review.objects.create(
+                clinic=self.clinic, source=self.crawler.get_source_name(),
+                original_text='다른 크롤링이 저장한 리뷰', reviewer_hash='other', external_id='race_1'
+            )
+            return original_bulk_create(objs, **kwargs)
+        
+        with patch.object(Review.objects, 'bulk_create', side_effect=bulk_create_after_concurrent_crawl):
+            saved_count, duplicate_count = self.crawler.save_reviews(self.clinic, [
+                ReviewData(text="경합 리뷰", external_id="race_1"),
+                ReviewData(text="새 리뷰", external_id="race_2"),
+            ])
+        
+        self.assertEqual((saved_count, duplicate_count), (1, 1))
+    
+    def test_duplicate_by_normalized_text(self):
+        """공백/대소문자만 다른 본문은 본문 해시 IN 조회 한 번으로 중복 처리"""
+        self.crawler.save_reviews(self.clinic, [ReviewData(text="Great 치과  입니다", external_id="norm_1")])
+        
+        review_data = ReviewData(text=" great 치과 입니다 ", external_id="norm_2")
+        with self.assertNumQueries(2):
+            self.assertTrue(self.crawler.is_duplicate_review(self.clinic, review_data))
+        self.assertEqual(self.crawler.save_reviews(self.clinic, [review_data]), (0, 1))
+    
     def test_text_anonymization(self):
         """텍스트 익명화 테스트"""
         text_with_personal_info = "제 전화번호는 010-1234-5678이고 이메일은 test@example.com입니다."
@@ -279,9 +368,16 @@ class CrawlingServiceTest(TestCase):
         self.assertEqual(result['clinic_id'], self.clinic.id)
         self.assertEqual(result['saved_reviews'], 2)
         
-        # 치과 통계 업데이트 확인
+        # 치과 통계는 처리 완료된 리뷰만 집계
+        self.clinic.refresh_from_db()
+        self.assertEqual(self.clinic.total_reviews, 0)
+        
+        ReviewService.mark_reviews_as_processed(
+            list(Review.objects.filter(clinic=self.clinic).values_list('id', flat=True))
+        )
         self.clinic.refresh_from_db()
         self.assertEqual(self.clinic.total_reviews, 2)
+        self.assertEqual(self.clinic.average_rating, Decimal('4.50'))
     
     def test_get_crawling_status(self):
         """크롤링 상태 조회 테스트"""
@@ -438,6 +534,159 @@ class DuplicateDetectionServiceTest(TestCase):
         # 중복으로 표시된 리뷰 확인
         duplicate_reviews = Review.objects.filter(clinic=self.clinic, is_duplicate=True)
         self.assertEqual(duplicate_reviews.count(), marked_count)
+    
+    def test_auto_mark_is_incremental(self):
+        """서명이 저장된 리뷰는 다시 검사하지 않고 새 리뷰만 버킷 동료와 비교"""
+        DuplicateDetectionService.auto_mark_duplicates(self.clinic.id, 0.5)
+        self.assertEqual(ReviewSignature.objects.filter(clinic=self.clinic).count(), 3)
+        
+        # 띄어쓰기만 다른 재게시 리뷰
+        repost = Review.objects.create(
+            clinic=self.clinic,
+            source='naver',
+            original_text='완전히 다른내용의 리뷰 입니다.',
+            external_id='naver_3'
+        )
+        marked_count = DuplicateDetectionService.auto_mark_duplicates(self.clinic.id)
+        
+        self.assertEqual(marked_count, 1)
+        self.assertTrue(Review.objects.get(pk=repost.pk).is_duplicate)
+        self.assertEqual(DuplicateDetectionService.auto_mark_duplicates(self.clinic.id), 0)
+        
+        # 저장된 서명/밴드 키/SimHash는 본문으로 다시 계산한 값과 같음
+        stored = ReviewSignature.objects.get(review=repost)
+        shingle_set, signature, bands = fingerprint(repost.original_text)
+        self.assertEqual(bytes(stored.signature), signature.tobytes())
+        self.assertEqual(stored.bands, bands)
+        self.assertEqual(stored.simhash, simhash(shingle_set))
+        self.assertEqual(
+            [stored.simhash_0, stored.simhash_1, stored.simhash_2, stored.simhash_3],
+            simhash_blocks(stored.simhash)
+        )
+        
+        # 저장된 밴드 키로 같은 버킷의 기존 리뷰를 찾음
+        self.assertTrue(
+            ReviewSignature.objects.filter(clinic=self.clinic, bands__overlap=bands).exclude(review=repost).exists()
+        )
+    
+    def test_near_duplicate_fingerprint(self):
+        """문자 n-gram MinHash는 띄어쓰기 차이에 영향을 받지 않음"""
+        _, signature1, bands1 = fingerprint('정말 좋은 치과입니다')
+        _, signature2, bands2 = fingerprint('정말좋은 치과 입니다')
+        
+        self.assertEqual(signature1.tobytes(), signature2.tobytes())
+        self.assertEqual(bands1, bands2)
+        self.assertEqual(fingerprint('')[2], [])
+    
+    def test_cross_clinic_copy_marked(self):
+        """다른 치과 리뷰를 문장부호만 바꿔 복사한 리뷰는 SimHash로 중복 표시"""
+        other_clinic = Clinic.objects.create(name='다른 치과', address='서울특별시 서초구', district='서초구')
+        text = '원장님이 정말 친절하시고 설명도 자세히 해주셨어요. 강력 추천합니다!'
+        original = Review.objects.create(
+            clinic=other_clinic, source='google', original_text=text, external_id='google_copy'
+        )
+        DuplicateDetectionService.auto_mark_duplicates(other_clinic.id)
+        DuplicateDetectionService.auto_mark_duplicates(self.clinic.id, 0.5)
+        
+        copy = Review.objects.create(
+            clinic=self.clinic, source='naver',
+            original_text='원장님이 정말 친절하시고 설명도 자세히 해주셨어요 강력추천합니다!!',
+            external_id='naver_copy'
+        )
+        duplicates = find_new_duplicates(self.clinic.id, 0.9)
+        
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(duplicates[0]['match_type'], 'cross_clinic')
+        self.assertEqual(duplicates[0]['original_review_id'], original.id)
+        self.assertEqual(duplicates[0]['duplicate_review_id'], copy.id)
+        self.assertTrue(duplicates[0]['auto_mark'])
+    
+    def test_short_cross_clinic_match_not_marked(self):
+        """다른 치과와 겹치는 짧은 리뷰는 보고만 하고 중복으로 표시하지 않음"""
+        other_clinic = Clinic.objects.create(name='다른 치과', address='서울특별시 서초구', district='서초구')
+        DuplicateDetectionService.auto_mark_duplicates(self.clinic.id, 0.5)
+        for number, (text, copy_text) in enumerate([('좋아요!', '좋아요'), ('친절하고 좋아요', '친절하고 좋아요~')]):
+            Review.objects.create(
+                clinic=other_clinic, source='google', original_text=text, external_id=f'google_short{number}'
+            )
+            Review.objects.create(
+                clinic=self.clinic, source='naver', original_text=copy_text, external_id=f'naver_short{number}'
+            )
+        DuplicateDetectionService.auto_mark_duplicates(other_clinic.id)
+        
+        duplicates = find_new_duplicates(self.clinic.id, 0.9)
+        
+        self.assertEqual(len(duplicates), 2)
+        self.assertTrue(all(dup['match_type'] == 'cross_clinic' for dup in duplicates))
+        self.assertFalse(any(dup['auto_mark'] for dup in duplicates))
+        self.assertFalse(Review.objects.filter(external_id__startswith='naver_short', is_duplicate=True).exists())
+    
+    def test_short_text_in_spam_ring_not_marked(self):
+        """짧은 리뷰는 세 치과 이상에 있어도 보고만 하고 중복으로 표시하지 않음"""
+        for number, text in enumerate(['좋아요', '좋아요!', '좋아요 ^^', '좋아요~']):
+            clinic = Clinic.objects.create(
+                name=f'짧은 리뷰 치과 {number}', address='서울특별시 마포구', district='마포구'
+            )
+            Review.objects.create(
+                clinic=clinic, source='naver', original_text=text, external_id=f'short_ring_{number}'
+            )
+            DuplicateDetectionService.auto_mark_duplicates(clinic.id)
+        
+        self.assertFalse(Review.objects.filter(external_id__startswith='short_ring_', is_duplicate=True).exists())
+        self.assertEqual(len(DuplicateDetectionService.spam_ring_report(min_clinics=3)), 1)
+    
+    def test_spam_ring_updates_other_clinic_stats(self):
+        """스팸 링으로 다른 치과 리뷰를 중복 표시하면 그 치과 통계와 응답 버전도 갱신"""
+        text = '이 치과 최고예요 무조건 가세요 010 연락주세요'
+        clinics = []
+        for number in range(3):
+            clinic = Clinic.objects.create(
+                name=f'스팸 치과 {number}', address='서울특별시 마포구', district='마포구'
+            )
+            clinics.append(clinic)
+            with self.captureOnCommitCallbacks(execute=True):
+                Review.objects.create(
+                    clinic=clinic, source='naver', original_text=text, original_rating=5,
+                    reviewer_hash=f'spammer{number}', external_id=f'spam_{number}', is_processed=True
+                )
+                DuplicateDetectionService.auto_mark_duplicates(clinic.id)
+        
+        # 두 번째 치과 리뷰는 세 번째 치과가 링을 완성할 때 표시됨
+        second = Review.objects.get(external_id='spam_1')
+        self.assertTrue(second.is_duplicate)
+        clinics[1].refresh_from_db()
+        self.assertEqual(clinics[1].total_reviews, 0)
+        clinics[0].refresh_from_db()
+        self.assertEqual(clinics[0].total_reviews, 1)
+    
+    def test_simhash_block_lookup(self):
+        """해밍 거리 3 이하인 SimHash는 최소 한 블록이 같음"""
+        value = simhash(shingles('정말 좋은 치과입니다. 추천합니다.'))
+        nearby = value ^ (1 << 3) ^ (1 << 20) ^ (1 << 40)
+        
+        self.assertEqual(hamming(value, nearby), 3)
+        self.assertTrue(any(a == b for a, b in zip(simhash_blocks(value), simhash_blocks(nearby))))
+    
+    def test_spam_ring_report(self):
+        """세 치과 이상에 같은 본문이 올라오면 스팸 링으로 보고"""
+        text = '이 치과 최고예요 무조건 가세요 010 연락주세요'
+        for number in range(3):
+            clinic = Clinic.objects.create(
+                name=f'스팸 치과 {number}', address='서울특별시 마포구', district='마포구'
+            )
+            Review.objects.create(
+                clinic=clinic, source='naver', original_text=text,
+                reviewer_hash=f'spammer{number}', external_id=f'spam_{number}'
+            )
+            DuplicateDetectionService.auto_mark_duplicates(clinic.id)
+        
+        rings = DuplicateDetectionService.spam_ring_report(min_clinics=3)
+        
+        self.assertEqual(len(rings), 1)
+        self.assertEqual(rings[0]['clinic_count'], 3)
+        self.assertEqual(rings[0]['reviewer_count'], 3)
+        self.assertEqual(Review.objects.filter(original_text=text, is_duplicate=True).count(), 2)
+        self.assertEqual(DuplicateDetectionService.spam_ring_report(min_clinics=4), [])
 
 
 class CrawlingAPITest(APITestCase):
@@ -469,12 +718,14 @@ class CrawlingAPITest(APITestCase):
         mock_crawler = MockCrawler()
         crawler_manager.register_crawler('mock', mock_crawler)
     
-    def test_crawling_trigger_permission(self):
+    @patch('apps.reviews.api_views.CrawlingService.trigger_crawling')
+    def test_crawling_trigger_permission(self, mock_trigger):
         """크롤링 트리거 권한 테스트"""
-        url = reverse('api:reviews:crawl_trigger')
+        mock_trigger.return_value = {'status': 'success', 'clinic_id': self.clinic.id}
+        url = reverse('api:reviews:trigger_crawling')
         data = {
             'clinic_id': self.clinic.id,
-            'source': 'mock',
+            'source': 'naver',
             'max_reviews': 10
         }
         
@@ -492,34 +743,37 @@ class CrawlingAPITest(APITestCase):
         response = self.client.post(url, data)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
-    @patch('apps.reviews.api_views.crawl_all_sources.delay')
-    def test_crawling_trigger_success(self, mock_task):
+    @patch('apps.reviews.api_views.CrawlingService.trigger_crawling')
+    def test_crawling_trigger_success(self, mock_trigger):
         """크롤링 트리거 성공 테스트"""
-        mock_task.return_value = MagicMock(id='test-task-id')
+        mock_trigger.return_value = {'status': 'success', 'clinic_id': self.clinic.id, 'saved_reviews': 3}
         
         self.client.force_authenticate(user=self.admin_user)
         
-        url = reverse('api:reviews:crawl_trigger')
+        url = reverse('api:reviews:trigger_crawling')
         data = {
             'clinic_id': self.clinic.id,
-            'source': 'all',
+            'source': 'naver',
             'max_reviews': 50
         }
         
-        response = self.client.post(url, data)
+        response = self.client.post(url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('task_id', response.data)
-        self.assertEqual(response.data['clinic_id'], self.clinic.id)
+        self.assertEqual(response.data['result']['clinic_id'], self.clinic.id)
+        
+        # 크롤링 서비스가 호출되었는지 확인
+        mock_trigger.assert_called_once_with(self.clinic.id, 'naver', 50)
         
-        # Celery 태스크가 호출되었는지 확인
-        mock_task.assert_called_once_with(self.clinic.id, 50)
+        # 지원하지 않는 소스
+        response = self.client.post(url, dict(data, source='all'), format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
     def test_crawling_status_api(self):
         """크롤링 상태 조회 API 테스트"""
         self.client.force_authenticate(user=self.admin_user)
         
-        url = reverse('api:reviews:crawl_status', kwargs={'clinic_id': self.clinic.id})
+        url = reverse('api:reviews:crawling_status', kwargs={'clinic_id': self.clinic.id})
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -544,11 +798,323 @@ class CrawlingAPITest(APITestCase):
         response = self.client.get(url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['clinic_id'], self.clinic.id)
-        self.assertIn('statistics', response.data)
-        self.assertIn('reviews', response.data)
+        self.assertEqual(response.data['clinic_name'], self.clinic.name)
+        self.assertEqual(response.data['total_count'], 1)
+        self.assertEqual(response.data['reviews'][0]['rating'], 5)
+
+
+class StubDriver:
+    """드라이버 풀 테스트용 가짜 WebDriver"""
+    
+    def __init__(self):
+        self.current_url = 'about:blank'
+        self.cookies = []
+        # (URL, 요청 시점의 쿠키) 목록
+        self.requests = []
+        self.healthy = True
+        self.heap_mb = 10
+        self.quit_called = False
+    
+    def get(self, url):
+        self.current_url = url
+        self.requests.append((url, list(self.cookies)))
+    
+    def execute_script(self, script):
+        if not self.healthy:
+            raise RuntimeError('browser crashed')
+        return 1
+    
+    def get_cookies(self):
+        return list(self.cookies)
+    
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+    
+    def quit(self):
+        self.quit_called = True
+
+
+class DriverPoolTest(TestCase):
+    """드라이버 풀 테스트"""
+    
+    def make_pool(self, **kwargs):
+        self.drivers = []
+        
+        def factory():
+            driver = StubDriver()
+            self.drivers.append(driver)
+            return driver
+        
+        kwargs.setdefault('memory_probe', lambda driver: driver.heap_mb)
+        return DriverPool(factory, **kwargs)
+    
+    def test_driver_reused_across_sessions(self):
+        """반납한 드라이버 재사용"""
+        pool = self.make_pool()
+        
+        for url in ('https://map.naver.com/a', 'https://map.naver.com/b', 'https://map.naver.com/c'):
+            with pool.session() as driver:
+                driver.get(url)
+        
+        self.assertEqual(pool.created_count, 1)
+        self.assertEqual(len(self.drivers), 1)
+        self.assertFalse(self.drivers[0].quit_called)
+    
+    def test_max_size_and_timeout(self):
+        """최대 크기를 넘으면 대기 후 타임아웃"""
+        pool = self.make_pool(max_size=2)
+        
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertEqual(pool.size, 2)
+        
+        with self.assertRaises(DriverPoolTimeout):
+            pool.acquire(timeout=0.01)
+        
+        pool.release(first)
+        self.assertIs(pool.acquire(timeout=0.01), first)
+        pool.release(second)
+    
+    def test_recycle_after_max_pages(self):
+        """최대 페이지 수에 도달하면 교체"""
+        pool = self.make_pool(max_pages=2)
+        
+        with pool.session() as driver:
+            driver.get('https://www.google.com/maps/1')
+            driver.get('https://www.google.com/maps/2')
+        
+        self.assertTrue(self.drivers[0].quit_called)
+        self.assertEqual(pool.recycled_count, 1)
+        
+        with pool.session() as driver:
+            driver.get('https://www.google.com/maps/3')
+        self.assertEqual(pool.created_count, 2)
+    
+    def test_recycle_on_memory_limit(self):
+        """JS 힙 사용량이 상한을 넘으면 교체"""
+        pool = self.make_pool(max_memory_mb=100)
+        
+        with pool.session() as driver:
+            driver.get('https://map.naver.com/a')
+            driver.driver.heap_mb = 300
+        
+        self.assertTrue(self.drivers[0].quit_called)
+        self.assertEqual(pool.size, 0)
+    
+    def test_unhealthy_driver_discarded(self):
+        """쉬는 동안 응답이 없어진 드라이버는 버리고 새로 생성"""
+        pool = self.make_pool(health_check_interval=0)
+        
+        with pool.session() as driver:
+            driver.get('https://map.naver.com/a')
+        self.drivers[0].healthy = False
+        
+        with pool.session() as driver:
+            self.assertIs(driver.driver, self.drivers[1])
+        
+        self.assertTrue(self.drivers[0].quit_called)
+        self.assertEqual(pool.created_count, 2)
+    
+    def test_broken_session_recycled(self):
+        """세션 중 브라우저가 죽으면 반납 시 교체"""
+        pool = self.make_pool()
+        
+        with self.assertRaises(ValueError):
+            with pool.session() as driver:
+                driver.driver.healthy = False
+                raise ValueError('page error')
+        
+        self.assertTrue(self.drivers[0].quit_called)
+        self.assertEqual(pool.size, 0)
+    
+    def test_cookies_restored_after_recycle(self):
+        """교체 전 쿠키를 새 드라이버에 복원"""
+        pool = self.make_pool(max_pages=1)
+        cookie = {'name': 'NID', 'value': 'abc', 'domain': 'map.naver.com'}
+        
+        with pool.session() as driver:
+            driver.get('https://map.naver.com/a')
+            driver.driver.cookies.append(cookie)
+        
+        with pool.session() as driver:
+            driver.get('https://map.naver.com/b')
+            self.assertIn(cookie, driver.get_cookies())
+            # 쿠키 복원 후 같은 페이지를 다시 열어 쿠키가 실린 요청으로 응답 받음
+            self.assertEqual(driver.driver.requests[-1], ('https://map.naver.com/b', [cookie]))
+            
+            # 이미 복원한 도메인은 다시 열지 않음
+            driver.driver.requests.clear()
+            driver.get('https://map.naver.com/c')
+            self.assertEqual(len(driver.driver.requests), 1)
+        
+        self.assertEqual(pool.created_count, 2)
+    
+    def test_close_quits_idle_drivers(self):
+        """풀 종료 시 대기 중인 드라이버 종료"""
+        pool = self.make_pool()
+        with pool.session():
+            pass
+        
+        pool.close()
+        
+        self.assertTrue(self.drivers[0].quit_called)
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+
+
+@skipUnless(aiohttp, 'aiohttp가 설치되지 않음')
+class AsyncHttpCrawlerTest(TestCase):
+    """비동기 HTTP 크롤러 테스트 (로컬 대체 서버 사용)"""
+    
+    def run_server(self, latency=0.0):
+        from .crawlers.fixture_server import running_fixture_server
+        
+        server = self.enterContext(running_fixture_server(latency=latency))
+        self.source = NaverPlaceApiSource(graphql_url=server.graphql_url)
+        return server
+    
+    def test_parse_review_items(self):
+        """GraphQL 응답을 ReviewData로 변환"""
+        source = NaverPlaceApiSource()
+        target = CrawlTarget(1, '123')
+        payload = [{'data': {'visitorReviews': {'total': 12, 'items': [
+            {'id': 'a1', 'body': '원장님이 꼼꼼하게 설명해주셨어요.', 'rating': 5,
+             'created': '24.3.5.화', 'author': {'nickname': '치아요정'}},
+            {'id': 'a2', 'body': '좋아요', 'rating': None, 'created': '3.4.월', 'author': None},
+        ]}}}]
+        
+        page = source.parse(target, 1, payload)
+        
+        self.assertEqual(len(page.reviews), 1)  # 짧은 리뷰 제외
+        self.assertEqual(page.total, 12)
+        self.assertTrue(page.has_next)
+        review = page.reviews[0]
+        self.assertEqual(review.external_id, 'naver_a1')
+        self.assertEqual(review.rating, 5)
+        self.assertEqual(review.reviewer_name, '치아요정')
+        self.assertEqual((review.date.year, review.date.month, review.date.day), (2024, 3, 5))
+    
+    def test_parse_created_date(self):
+        """작성일 표기 변환 (연도 생략 시 올해)"""
+        today = timezone.localdate()
+        self.assertEqual(parse_created_date('23.12.31.일').date().isoformat(), '2023-12-31')
+        self.assertEqual(parse_created_date('1.15.월').year, today.year)
+        self.assertIsNone(parse_created_date('어제'))
+        self.assertIsNone(parse_created_date(None))
+    
+    def test_crawl_many_clinics_concurrently(self):
+        """여러 치과 동시 수집 (호스트별 동시 연결 수 제한)"""
+        server = self.run_server(latency=0.02)
+        engine = AsyncCrawlEngine(self.source, per_host_concurrency=4, per_host_rate=None)
+        
+        results = engine.crawl([CrawlTarget(i, str(1000 + i)) for i in range(10)], max_reviews=100)
+        
+        self.assertEqual(len(results), 10)
+        for clinic_id, result in results.items():
+            self.assertIsNone(result.error)
+            self.assertEqual(len(result.reviews), 14)  # 15개 중 짧은 리뷰 1개 제외
+            self.assertEqual(result.requests, 2)
+            self.assertTrue(result.reviews[0].external_id.startswith(f'naver_{1000 + clinic_id}-'))
+        self.assertEqual(server.request_count, 20)
+        self.assertEqual(server.max_in_flight, 4)
+    
+    def test_max_reviews_limits_pages(self):
+        """필요한 페이지만 요청"""
+        server = self.run_server()
+        engine = AsyncCrawlEngine(self.source, per_host_rate=None)
+        
+        result = engine.crawl([CrawlTarget(1, '1001')], max_reviews=5)[1]
+        
+        self.assertEqual(len(result.reviews), 5)
+        self.assertEqual(server.request_count, 1)
+    
+    def test_concurrent_throughput(self):
+        """동시 수집이 순차 수집보다 빠름"""
+        self.run_server(latency=0.05)
+        targets = [CrawlTarget(i, str(1000 + i)) for i in range(20)]
+        
+        started = time.perf_counter()
+        AsyncCrawlEngine(self.source, per_host_concurrency=1, per_host_rate=None).crawl(targets)
+        sequential_time = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        AsyncCrawlEngine(self.source, per_host_concurrency=10, per_host_rate=None).crawl(targets)
+        concurrent_time = time.perf_counter() - started
+        
+        self.assertLess(concurrent_time * 4, sequential_time)
+    
+    @patch('apps.reviews.crawlers.async_http.RETRY_BACKOFF', 0.01)
+    def test_retry_on_server_error(self):
+        """5xx 응답은 재시도, 재시도 횟수를 넘으면 치과 단위 오류"""
+        server = self.run_server()
+        engine = AsyncCrawlEngine(self.source, per_host_rate=None, retries=1)
+        
+        server.fail_next(503)
+        result = engine.crawl([CrawlTarget(1, '1001')])[1]
+        self.assertIsNone(result.error)
+        self.assertEqual(result.requests, 3)
+        
+        server.fail_next(503, 503)
+        result = engine.crawl([CrawlTarget(2, '1002')])[2]
+        self.assertIsNotNone(result.error)
+        self.assertEqual(result.reviews, [])
+    
+    def test_host_rate_limit(self):
+        """호스트별 요청 간격 유지 (다른 호스트는 독립)"""
+        limiter = HostRateLimiter(rate=20)
+        
+        async def run():
+            started = asyncio.get_running_loop().time()
+            await asyncio.gather(*(limiter.wait('a.example') for _ in range(5)), limiter.wait('b.example'))
+            return asyncio.get_running_loop().time() - started
+        
+        self.assertGreaterEqual(asyncio.run(run()), 0.19)
+    
+    def test_crawl_and_save(self):
+        """수집 결과를 치과별로 저장 (place id가 없는 치과는 오류)"""
+        self.run_server()
+        clinic = Clinic.objects.create(
+            name='HTTP 치과', address='서울특별시 강남구 테스트로 1', district='강남구', naver_place_id='1001'
+        )
+        no_place = Clinic.objects.create(
+            name='미등록 치과', address='서울특별시 강남구 테스트로 2', district='강남구'
+        )
+        crawler = NaverPlaceHttpCrawler(source=self.source, per_host_rate=None)
+        
+        results = crawler.crawl_and_save([clinic, no_place], max_reviews=100)
+        
+        self.assertEqual(results[0]['status'], 'success')
+        self.assertEqual(results[0]['saved_reviews'], 14)
+        self.assertEqual(results[1]['status'], 'error')
+        self.assertEqual(Review.objects.filter(clinic=clinic, source='naver').count(), 14)
+        
+        # 다시 수집하면 모두 중복
+        results = crawler.crawl_and_save([clinic], max_reviews=100)
+        self.assertEqual(results[0]['saved_reviews'], 0)
+        self.assertEqual(results[0]['duplicate_reviews'], 14)
+
+    
+    def test_batch_http_routes_missing_place_id_to_selenium(self):
+        """HTTP 백엔드 일괄 크롤링에서 place id가 없는 치과는 Selenium 청크로 보냄"""
+        from tasks.crawling import batch_crawl_clinics
+        
+        with_place = Clinic.objects.create(
+            name='HTTP 치과', address='서울특별시 강남구 테스트로 1', district='강남구', naver_place_id='1001'
+        )
+        no_place = Clinic.objects.create(
+            name='미등록 치과', address='서울특별시 강남구 테스트로 2', district='강남구'
+        )
+        
+        with patch('tasks.crawling.crawl_naver_reviews_http.delay') as http_delay, \
+                patch('tasks.crawling.crawl_clinic_chunk.delay') as chunk_delay:
+            summary = batch_crawl_clinics([with_place.id, no_place.id], source='naver', backend='http')
+        
+        http_delay.assert_called_once_with([with_place.id], 50)
+        chunk_delay.assert_called_once_with([no_place.id], 'naver', 50)
+        self.assertEqual(summary['queued_tasks'], 2)
 
 
+@skipUnless(find_spec('selenium') and find_spec('bs4'), 'selenium/bs4가 설치되지 않음')
 class CrawlerIntegrationTest(TestCase):
     """크롤러 통합 테스트"""
     
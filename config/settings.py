@@ -278,6 +278,11 @@ LOGGING = {
 # ML Models Directory
 ML_MODELS_DIR = BASE_DIR / 'ml_models'
 
+# 지역구 경계 GeoJSON (없으면 지역구 중심 좌표로 근사)
+DISTRICT_BOUNDARY_FILE = BASE_DIR / 'data' / 'seoul_districts.geojson'
+# 인근 지역구 목록을 미리 계산할 반경 (km)
+DISTRICT_NEIGHBOR_RADII_KM = (5, 10, 20)
+
 # Development Settings
 if DEBUG:
     INSTALLED_APPS += ['debug_toolbar']
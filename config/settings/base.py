@@ -161,6 +161,11 @@ CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 # ML Models Directory
 ML_MODELS_DIR = BASE_DIR / 'ml_models'
 
+# 지역구 경계 GeoJSON (없으면 지역구 중심 좌표로 근사)
+DISTRICT_BOUNDARY_FILE = BASE_DIR / 'data' / 'seoul_districts.geojson'
+# 인근 지역구 목록을 미리 계산할 반경 (km)
+DISTRICT_NEIGHBOR_RADII_KM = (5, 10, 20)
+
 # 로그 디렉토리 생성
 LOGS_DIR = BASE_DIR / 'logs'
 LOGS_DIR.mkdir(exist_ok=True)
@@ -2,15 +2,20 @@
 Celery tasks for review crawling
 """
 from celery import shared_task
+from celery.signals import worker_process_shutdown
 from django.utils import timezone
 from django.db import transaction
 import logging
 from apps.clinics.models import Clinic
 from apps.reviews.services import CrawlingService, DuplicateDetectionService
 from apps.reviews.crawlers.base import crawler_manager
+from apps.reviews.crawlers.driver_pool import close_driver_pools, get_driver_pool
 
 logger = logging.getLogger(__name__)
 
+# batch_crawl_clinics가 태스크 하나에 묶는 치과 수
+BATCH_CHUNK_SIZE = 25
+
 
 @shared_task(bind=True)
 def crawl_naver_reviews(self, clinic_id, max_reviews=100):
@@ -104,40 +109,141 @@ def crawl_all_sources(self, clinic_id, max_reviews_per_source=100):
         raise self.retry(exc=exc, countdown=120, max_retries=2)
 
 
+def _crawl_clinic(clinic_id, source, max_reviews):
+    """치과 하나 크롤링 후 중복 리뷰 자동 처리 (드라이버는 공유 풀에서 재사용)"""
+    if source == 'all':
+        clinic = Clinic.objects.get(id=clinic_id)
+        source_results = crawler_manager.crawl_all_sources(clinic, max_reviews)
+        result = {
+            'status': 'success',
+            'clinic_id': clinic_id,
+            'total_saved_reviews': sum(
+                r.get('saved_reviews', 0) for r in source_results if r.get('status') == 'success'
+            ),
+            'source_results': source_results
+        }
+    else:
+        result = CrawlingService.trigger_crawling(clinic_id, source, max_reviews)
+    
+    if result['status'] == 'success':
+        result['auto_marked_duplicates'] = DuplicateDetectionService.auto_mark_duplicates(clinic_id)
+    return result
+
+
+@shared_task(bind=True)
+def crawl_clinic_chunk(self, clinic_ids, source='all', max_reviews=50):
+    """
+    여러 치과를 한 워커에서 순서대로 크롤링하는 태스크
+    
+    같은 프로세스의 드라이버 풀을 계속 사용하므로 브라우저 기동 비용은 청크가
+    아니라 워커당 한 번만 든다.
+    """
+    results = []
+    for clinic_id in clinic_ids:
+        try:
+            results.append(_crawl_clinic(clinic_id, source, max_reviews))
+        except Exception as e:
+            logger.error(f"치과 ID {clinic_id} 크롤링 실패: {e}")
+            results.append({'status': 'error', 'clinic_id': clinic_id, 'error_message': str(e)})
+    
+    pool = get_driver_pool()
+    logger.info(
+        f"청크 크롤링 완료: {len(clinic_ids)}개 치과, "
+        f"드라이버 생성 {pool.created_count}회 / 교체 {pool.recycled_count}회"
+    )
+    return {
+        'status': 'success',
+        'total_clinics': len(clinic_ids),
+        'succeeded': len([r for r in results if r.get('status') == 'success']),
+        'results': results
+    }
+
+
+@shared_task(bind=True)
+def crawl_naver_reviews_http(self, clinic_ids, max_reviews=100):
+    """
+    네이버 플레이스 리뷰를 비동기 HTTP 엔진으로 크롤링하는 태스크
+    
+    브라우저 없이 여러 치과를 동시에 수집한다. naver_place_id가 없는 치과는
+    오류로 기록되므로, batch_crawl_clinics는 그런 치과를 Selenium 청크로 따로 보낸다.
+    """
+    try:
+        from apps.reviews.crawlers.naver_http import NaverPlaceHttpCrawler
+        
+        logger.info(f"네이버 리뷰 HTTP 크롤링 시작: {len(clinic_ids)}개 치과")
+        
+        clinics = Clinic.objects.filter(id__in=clinic_ids)
+        results = NaverPlaceHttpCrawler().crawl_and_save(clinics, max_reviews)
+        
+        for result in results:
+            if result['status'] == 'success':
+                # 중복 리뷰 자동 탐지 및 처리
+                result['auto_marked_duplicates'] = DuplicateDetectionService.auto_mark_duplicates(result['clinic_id'])
+        
+        succeeded = [r for r in results if r['status'] == 'success']
+        logger.info(
+            f"네이버 리뷰 HTTP 크롤링 완료: {len(succeeded)}/{len(results)}개 치과, "
+            f"수집 {sum(r['saved_reviews'] for r in succeeded)}개"
+        )
+        
+        return {
+            'status': 'success',
+            'total_clinics': len(results),
+            'succeeded': len(succeeded),
+            'results': results
+        }
+        
+    except Exception as exc:
+        logger.error(f"네이버 리뷰 HTTP 크롤링 실패: {exc}")
+        raise self.retry(exc=exc, countdown=60, max_retries=3)
+
+
 @shared_task(bind=True)
-def batch_crawl_clinics(self, clinic_ids, source='all', max_reviews=50):
+def batch_crawl_clinics(self, clinic_ids, source='all', max_reviews=50, chunk_size=BATCH_CHUNK_SIZE,
+                        backend='selenium'):
     """
     여러 치과의 리뷰를 일괄 크롤링하는 태스크
+    
+    치과마다 태스크를 만들지 않고 chunk_size개씩 묶어 crawl_clinic_chunk로 보내,
+    워커가 풀의 브라우저를 여러 치과에 걸쳐 재사용하게 한다. backend='http'이고
+    source='naver'이면 naver_place_id가 있는 치과는 비동기 HTTP 크롤러
+    (crawl_naver_reviews_http)로, 검색이 필요한 나머지는 Selenium 청크로 보낸다.
     """
     try:
         logger.info(f"일괄 크롤링 시작: {len(clinic_ids)}개 치과, 소스: {source}")
         
         results = []
+        targets = clinic_ids if source in ('all', 'naver', 'google') else []
+        
+        # 플레이스 ID가 있는 치과만 HTTP 크롤러로, 나머지는 Selenium 청크로 보냄
+        http_targets = []
+        if backend == 'http' and source == 'naver':
+            http_ids = set(
+                Clinic.objects.filter(id__in=targets).exclude(naver_place_id='').values_list('id', flat=True)
+            )
+            http_targets = [clinic_id for clinic_id in targets if clinic_id in http_ids]
+            targets = [clinic_id for clinic_id in targets if clinic_id not in http_ids]
+        
+        chunks = [(http_targets[start:start + chunk_size], True) for start in range(0, len(http_targets), chunk_size)]
+        chunks += [(targets[start:start + chunk_size], False) for start in range(0, len(targets), chunk_size)]
         
-        for clinic_id in clinic_ids:
+        for chunk, use_http in chunks:
             try:
-                if source == 'all':
-                    result = crawl_all_sources.delay(clinic_id, max_reviews)
-                elif source == 'naver':
-                    result = crawl_naver_reviews.delay(clinic_id, max_reviews)
-                elif source == 'google':
-                    result = crawl_google_reviews.delay(clinic_id, max_reviews)
+                if use_http:
+                    result = crawl_naver_reviews_http.delay(chunk, max_reviews)
                 else:
-                    continue
-                
-                results.append({
-                    'clinic_id': clinic_id,
-                    'task_id': result.id,
-                    'status': 'queued'
-                })
+                    result = crawl_clinic_chunk.delay(chunk, source, max_reviews)
+                results.extend(
+                    {'clinic_id': clinic_id, 'task_id': result.id, 'status': 'queued'}
+                    for clinic_id in chunk
+                )
                 
             except Exception as e:
-                logger.error(f"치과 ID {clinic_id} 크롤링 큐 추가 실패: {e}")
-                results.append({
-                    'clinic_id': clinic_id,
-                    'status': 'error',
-                    'error_message': str(e)
-                })
+                logger.error(f"치과 ID {chunk} 크롤링 큐 추가 실패: {e}")
+                results.extend(
+                    {'clinic_id': clinic_id, 'status': 'error', 'error_message': str(e)}
+                    for clinic_id in chunk
+                )
         
         summary = {
             'status': 'success',
@@ -156,6 +262,12 @@ def batch_crawl_clinics(self, clinic_ids, source='all', max_reviews=50):
         raise self.retry(exc=exc, countdown=60, max_retries=2)
 
 
+@worker_process_shutdown.connect
+def close_crawler_drivers(**kwargs):
+    """워커 프로세스 종료 시 드라이버 풀의 브라우저 종료 (prefork 자식은 atexit을 거치지 않음)"""
+    close_driver_pools()
+
+
 @shared_task
 def cleanup_old_crawling_logs():
     """
@@ -190,29 +302,78 @@ def cleanup_old_crawling_logs():
 
 
 @shared_task(bind=True)
-def update_clinic_search_vectors(self):
+def update_clinic_search_vectors(self, full=False):
     """
-    모든 치과의 검색 벡터 업데이트 태스크
+    치과 검색 벡터 일괄 갱신 태스크 (오래된 행만, full=True면 전체 재색인)
     """
     try:
-        clinics = Clinic.objects.all()
-        updated_count = 0
-        
-        for clinic in clinics:
-            try:
-                clinic.update_search_vector()
-                updated_count += 1
-            except Exception as e:
-                logger.error(f"치과 ID {clinic.id} 검색 벡터 업데이트 실패: {e}")
-        
-        logger.info(f"검색 벡터 업데이트 완료: {updated_count}/{clinics.count()}개")
+        updated_count = Clinic.refresh_search_vectors(full=full)
         
         return {
             'status': 'success',
-            'total_clinics': clinics.count(),
             'updated_clinics': updated_count
         }
         
     except Exception as exc:
         logger.error(f"검색 벡터 업데이트 실패: {exc}")
-        raise self.retry(exc=exc, countdown=300, max_retries=2)
\ No newline at end of file
+        raise self.retry(exc=exc, countdown=300, max_retries=2)
+
+
+@shared_task(bind=True)
+def update_review_search_vectors(self, full=False):
+    """
+    리뷰 검색 벡터 일괄 갱신 태스크 (오래된 행만, full=True면 전체 재색인)
+    """
+    try:
+        from apps.reviews.models import Review
+        
+        updated_count = Review.refresh_search_vectors(full=full)
+        
+        return {
+            'status': 'success',
+            'updated_reviews': updated_count
+        }
+        
+    except Exception as exc:
+        logger.error(f"리뷰 검색 벡터 업데이트 실패: {exc}")
+        raise self.retry(exc=exc, countdown=300, max_retries=2)
+
+
+@shared_task(bind=True)
+def refresh_district_table(self):
+    """
+    지역구 요약 테이블 (중심 좌표, 치과 수, 인근 지역구) 갱신 태스크
+    """
+    try:
+        from apps.clinics.districts import refresh_district_table as refresh
+        
+        district_count = refresh()
+        
+        return {
+            'status': 'success',
+            'districts': district_count
+        }
+        
+    except Exception as exc:
+        logger.error(f"지역구 요약 테이블 갱신 실패: {exc}")
+        raise self.retry(exc=exc, countdown=300, max_retries=2)
+
+
+@shared_task(bind=True)
+def reconcile_clinic_review_stats(self):
+    """
+    증분 갱신된 치과 리뷰 통계 보정 태스크 (주기 실행)
+    """
+    try:
+        corrected = Clinic.reconcile_review_stats()
+        if corrected:
+            logger.warning(f"치과 리뷰 통계 보정: {corrected}개")
+        
+        return {
+            'status': 'success',
+            'corrected_clinics': corrected
+        }
+        
+    except Exception as exc:
+        logger.error(f"치과 리뷰 통계 보정 실패: {exc}")
+        raise self.retry(exc=exc, countdown=300, max_retries=2)
@@ -3,6 +3,7 @@ Text processing utilities for Korean language
 """
 import re
 import hashlib
+import unicodedata
 from typing import List, Optional
 
 
@@ -37,6 +38,26 @@ def create_reviewer_hash(reviewer_name: str, review_date: str = None) -> str:
     return hashlib.sha256(hash_input.encode('utf-8')).hexdigest()
 
 
+def normalize_for_hash(text: str) -> str:
+    """
+    본문 해시용 정규화 (유니코드 NFKC, 소문자, 연속 공백 하나로)
+    """
+    if not text:
+        return ''
+    text = unicodedata.normalize('NFKC', text).lower()
+    return ' '.join(text.split())
+
+
+def create_content_hash(text: str) -> str:
+    """
+    완전 중복 탐지를 위한 정규화된 본문 해시 (빈 본문은 빈 문자열)
+    """
+    normalized = normalize_for_hash(text)
+    if not normalized:
+        return ''
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+
+
 def clean_text(text: str) -> str:
     """
     텍스트 정제 함수